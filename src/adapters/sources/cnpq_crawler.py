@@ -1,9 +1,12 @@
 import re
+from importlib import metadata
 from typing import Any, Dict, List, Optional
 
 from dgp_cnpq_lib import CnpqCrawler
 from loguru import logger
 
+from src.adapters.sources.cnpq_http_cache import CnpqHttpCache
+
 IGNORED_PERSON_NAMES = {"ui-button"}
 
 
@@ -31,20 +34,41 @@ class CnpqCrawlerAdapter:
     Adapter for dgp_cnpq_lib to extract research group data from CNPq DGP.
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[CnpqHttpCache] = None):
         self._crawler = CnpqCrawler()
+        self._cache = cache or CnpqHttpCache()
+
+    @staticmethod
+    def _cache_params() -> Dict[str, str]:
+        # A crawler upgrade may parse pages differently: key entries by it.
+        try:
+            version = metadata.version("dgp-cnpq-lib")
+        except metadata.PackageNotFoundError:
+            version = "unknown"
+        return {"crawler": f"dgp-cnpq-lib/{version}"}
+
+    def fetch_group_data(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Extracts data for a single research group from its mirror URL,
+        through the on-disk cache. Errors are raised so callers can apply
+        their own retry policy.
+        """
+        normalized_url = normalize_cnpq_url(url)
+
+        def crawl() -> Optional[Dict[str, Any]]:
+            logger.info(f"Extracting data from CNPq Mirror: {normalized_url}")
+            return self._crawler.get_data(normalized_url)
+
+        return self._cache.get(normalized_url, crawl, params=self._cache_params())
 
     def get_group_data(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Extracts data for a single research group from its mirror URL.
         """
-        normalized_url = normalize_cnpq_url(url)
         try:
-            logger.info(f"Extracting data from CNPq Mirror: {normalized_url}")
-            data = self._crawler.get_data(normalized_url)
-            return data
+            return self.fetch_group_data(url)
         except Exception as e:
-            logger.error(f"Failed to extract data from {normalized_url}: {e}")
+            logger.error(f"Failed to extract data from {normalize_cnpq_url(url)}: {e}")
             return None
 
     def extract_members(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -0,0 +1,248 @@
+"""
+On-disk cache of CNPq DGP mirror payloads.
+
+Entries are keyed by the SHA-256 of the normalized URL plus the request
+parameters (including the crawler version), and point to payload blobs
+stored under the SHA-256 of their content, so identical payloads are kept
+once. Layout under `cache_dir`::
+
+    entries/<key[:2]>/<key>.json   url, params, fetched_at, validators, payload hash
+    blobs/<hash[:2]>/<hash>.json   parsed group payload
+
+Modes:
+
+- ``read_write`` (default): fresh entries (younger than the TTL) are served
+  from disk; stale ones are revalidated with a conditional GET
+  (``If-None-Match`` / ``If-Modified-Since``, falling back to comparing the
+  hash of the page body without its per-request JSF tokens), and the page
+  is only parsed again when it changed. A page missing from the cache is
+  crawled directly: its validators are recorded by the first revalidation.
+  The default TTL (6 hours) only spares re-running a sync on the same day;
+  the weekly sync always revalidates every page.
+- ``replay``: recorded payloads only, never the network. A missing entry
+  raises CnpqCacheMiss, so a full sync can be reproduced offline.
+- ``off``: no caching.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from loguru import logger
+
+from src.core.logic.atomic_io import atomic_write_bytes
+from src.core.logic.cnpq_crawl_pipeline import RateLimiter
+
+CACHE_MODE_READ_WRITE = "read_write"
+CACHE_MODE_REPLAY = "replay"
+CACHE_MODE_OFF = "off"
+CACHE_MODES = (CACHE_MODE_READ_WRITE, CACHE_MODE_REPLAY, CACHE_MODE_OFF)
+
+DEFAULT_CNPQ_CACHE_DIR = os.getenv("CNPQ_CACHE_DIR", "data/cache/cnpq_http")
+DEFAULT_CNPQ_CACHE_TTL_SECONDS = int(os.getenv("CNPQ_CACHE_TTL_SECONDS", str(6 * 3600)))
+DEFAULT_CNPQ_CACHE_MODE = os.getenv("CNPQ_CACHE_MODE", CACHE_MODE_READ_WRITE)
+REVALIDATION_TIMEOUT_SECONDS = 30
+
+# Parts of a JSF page that change on every request (view state, session id).
+VOLATILE_BODY_PATTERNS = (
+    re.compile(rb"<input[^>]*javax\.faces\.ViewState[^>]*>", re.IGNORECASE),
+    re.compile(rb";jsessionid=[^?#\"'\s>]*", re.IGNORECASE),
+)
+
+
+class CnpqCacheMiss(LookupError):
+    """Raised in replay mode when a URL was never recorded."""
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _body_sha256(body: bytes) -> str:
+    for pattern in VOLATILE_BODY_PATTERNS:
+        body = pattern.sub(b"", body)
+    return _sha256(body)
+
+
+def _canonical_json(value: Any) -> bytes:
+    return json.dumps(
+        value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+class CnpqHttpCache:
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CNPQ_CACHE_DIR,
+        ttl_seconds: int = DEFAULT_CNPQ_CACHE_TTL_SECONDS,
+        mode: str = DEFAULT_CNPQ_CACHE_MODE,
+        http_get: Callable[..., Any] = requests.get,
+        clock: Callable[[], float] = time.time,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(
+                f"Unknown CNPq cache mode {mode!r}; use one of {CACHE_MODES}"
+            )
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.mode = mode
+        self._http_get = http_get
+        self._clock = clock
+        # Shared with the crawl, so conditional GETs count against its rate.
+        self._rate_limiter = rate_limiter or RateLimiter(0)
+        self._lock = threading.Lock()
+        self.stats = {
+            "fresh_hits": 0,
+            "revalidated": 0,
+            "fetched": 0,
+            "replayed": 0,
+            "stale_on_error": 0,
+        }
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        return _sha256(_canonical_json({"url": url, "params": params or {}}))
+
+    def get(
+        self,
+        url: str,
+        fetch_payload: Callable[[], Optional[Dict[str, Any]]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Payload for `url`, calling `fetch_payload` only when the cache
+        cannot serve it. Errors of `fetch_payload` propagate unless a stale
+        entry can be served instead."""
+        if self.mode == CACHE_MODE_OFF:
+            return fetch_payload()
+
+        key = self.key(url, params)
+        entry = self._read_entry(key)
+
+        if self.mode == CACHE_MODE_REPLAY:
+            payload = self._read_payload(entry)
+            if payload is None:
+                raise CnpqCacheMiss(f"No recorded CNPq response for {url}")
+            self._count("replayed")
+            return payload
+
+        cached = self._read_payload(entry)
+        if cached is not None and self._is_fresh(entry):
+            self._count("fresh_hits")
+            return cached
+
+        # Nothing to revalidate without a cached payload: crawl directly.
+        validators = self._revalidate(url, entry) if cached is not None else {}
+        if validators.get("unchanged"):
+            entry.update(validators["headers"], fetched_at=self._clock())
+            self._write_entry(key, entry)
+            self._count("revalidated")
+            return cached
+
+        try:
+            payload = fetch_payload()
+        except Exception:
+            if cached is None:
+                raise
+            logger.warning(f"Serving stale CNPq cache entry for {url}")
+            self._count("stale_on_error")
+            return cached
+
+        if payload:
+            self._store(key, url, params, payload, validators.get("headers", {}))
+            self._count("fetched")
+        return payload
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return self._clock() - float(entry.get("fetched_at", 0)) < self.ttl_seconds
+
+    def _revalidate(self, url: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Conditional GET. Returns the new validators and whether the page
+        is unchanged (HTTP 304, or the same body hash as recorded)."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        self._rate_limiter.wait()
+        try:
+            response = self._http_get(
+                url, headers=headers, timeout=REVALIDATION_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            logger.debug(f"CNPq cache revalidation failed for {url}: {e}")
+            return {}
+
+        new_headers = {
+            "etag": response.headers.get("ETag") or entry.get("etag"),
+            "last_modified": response.headers.get("Last-Modified")
+            or entry.get("last_modified"),
+        }
+        if response.status_code == 304:
+            return {"unchanged": True, "headers": new_headers}
+        if response.status_code != 200:
+            return {}
+
+        new_headers["body_sha256"] = _body_sha256(response.content)
+        return {
+            "unchanged": new_headers["body_sha256"] == entry.get("body_sha256"),
+            "headers": new_headers,
+        }
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / "entries" / key[:2] / f"{key}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.cache_dir / "blobs" / digest[:2] / f"{digest}.json"
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(key)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable CNPq cache entry {path}: {e}")
+            return None
+
+    def _read_payload(self, entry: Optional[Dict[str, Any]]) -> Optional[Dict]:
+        if not entry or not entry.get("payload_sha256"):
+            return None
+        try:
+            data = self._blob_path(entry["payload_sha256"]).read_bytes()
+        except OSError:
+            return None
+        if _sha256(data) != entry["payload_sha256"]:
+            logger.warning(f"Corrupted CNPq cache blob for {entry.get('url')}")
+            return None
+        return json.loads(data.decode("utf-8"))
+
+    def _store(self, key, url, params, payload, headers) -> None:
+        data = _canonical_json(payload)
+        digest = _sha256(data)
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            atomic_write_bytes(str(blob), data)
+        entry = {
+            "url": url,
+            "params": params or {},
+            "fetched_at": self._clock(),
+            "payload_sha256": digest,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last_modified"),
+            "body_sha256": headers.get("body_sha256"),
+        }
+        self._write_entry(key, entry)
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        atomic_write_bytes(str(self._entry_path(key)), _canonical_json(entry))
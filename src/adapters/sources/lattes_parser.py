@@ -1,12 +1,13 @@
 import json
 import re
-import unicodedata
 from dataclasses import dataclass
 from datetime import date
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+from src.core.logic.text_normalization import normalize_title
+
 
 @dataclass
 class LattesProject:
@@ -29,14 +30,7 @@ class LattesParser:
         """
         Normalizes a title for comparison (lowercase, no accents, no special chars).
         """
-        if not title:
-            return ""
-        # Accents and case
-        nfkd_form = unicodedata.normalize("NFKD", title)
-        only_ascii = nfkd_form.encode("ASCII", "ignore").decode("ASCII")
-        # Remove special characters and multiple spaces
-        clean = re.sub(r"[^a-zA-Z0-9\s]", " ", only_ascii).lower()
-        return " ".join(clean.split())
+        return normalize_title(title)
 
     def parse_research_projects(self, data: Dict) -> List[Dict]:
         return self._parse_generic_projects(
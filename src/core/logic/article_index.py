@@ -0,0 +1,152 @@
+"""
+Run-scoped index of the articles already in the database.
+
+Ingesting the articles of a Lattes CV used to call ``get_by_doi`` and then
+``get_by_title_year`` for every article, and the same article shows up in
+the CV of each co-author. An ArticleIndex loads every article (id, DOI,
+title, year) and every article-author pair with two queries, resolves
+articles by normalized DOI and by (normalized title, year) from dicts, and
+is updated as articles and authors are inserted.
+
+Inside ``article_index_scope()`` one index is shared by the whole run;
+outside a scope ``get_article_index()`` returns a fresh index, so each call
+still costs a constant number of queries.
+"""
+
+import os
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import text
+
+from src.core.logic.text_normalization import normalize_title
+
+DEFAULT_ARTICLE_INSERT_BATCH_SIZE = int(os.getenv("ARTICLE_INSERT_BATCH_SIZE", "200"))
+
+ARTICLES_SQL = text("SELECT id, doi, title, year FROM articles")
+ARTICLE_AUTHORS_SQL = text("SELECT article_id, researcher_id FROM article_authors")
+
+_DOI_PREFIX_RE = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)", re.IGNORECASE)
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Lowercased DOI without resolver prefixes; None when blank."""
+    if not doi:
+        return None
+    normalized = _DOI_PREFIX_RE.sub("", str(doi).strip()).strip().lower()
+    return normalized or None
+
+
+def _title_key(title: Optional[str], year: Optional[int]) -> Optional[Tuple[str, Any]]:
+    normalized = normalize_title(title)
+    return (normalized, year) if normalized else None
+
+
+class ArticleIndex:
+    def __init__(self):
+        self.loaded = False
+        self._by_doi: Dict[str, int] = {}
+        self._by_title_year: Dict[Tuple[str, Any], int] = {}
+        self._authors: Set[Tuple[int, int]] = set()
+        self.counts: Counter = Counter()
+
+    def load(self, session: Any) -> "ArticleIndex":
+        """Reads the articles and their authors once; later calls are no-ops."""
+        if self.loaded:
+            return self
+        for article_id, doi, title, year in session.execute(ARTICLES_SQL):
+            self._index(article_id, doi, title, year)
+            self.counts["loaded"] += 1
+        self._authors.update(
+            (article_id, researcher_id)
+            for article_id, researcher_id in session.execute(ARTICLE_AUTHORS_SQL)
+        )
+        self.loaded = True
+        return self
+
+    def _index(self, article_id: int, doi: Optional[str], title, year) -> None:
+        # First row wins, as get_by_doi / get_by_title_year returned the first.
+        doi_key = normalize_doi(doi)
+        if doi_key:
+            self._by_doi.setdefault(doi_key, article_id)
+        title_key = _title_key(title, year)
+        if title_key:
+            self._by_title_year.setdefault(title_key, article_id)
+
+    def find(
+        self, *, doi: Optional[str], title: Optional[str], year: Optional[int]
+    ) -> Optional[int]:
+        """Id of the article with this DOI, else with this title and year."""
+        doi_key = normalize_doi(doi)
+        article_id = self._by_doi.get(doi_key) if doi_key else None
+        if article_id is None:
+            title_key = _title_key(title, year)
+            article_id = self._by_title_year.get(title_key) if title_key else None
+        self.counts["hits" if article_id is not None else "misses"] += 1
+        return article_id
+
+    def add(
+        self,
+        article_id: int,
+        *,
+        doi: Optional[str],
+        title: Optional[str],
+        year: Optional[int],
+    ) -> None:
+        """Registers an article inserted during the run."""
+        self._index(article_id, doi, title, year)
+        self.counts["added"] += 1
+
+    def invalidate(self) -> None:
+        """Drops everything; the next load() reads the tables again."""
+        self.loaded = False
+        self._by_doi.clear()
+        self._by_title_year.clear()
+        self._authors.clear()
+
+    def has_author(self, article_id: int, researcher_id: int) -> bool:
+        return (article_id, researcher_id) in self._authors
+
+    def add_author(self, article_id: int, researcher_id: int) -> None:
+        self._authors.add((article_id, researcher_id))
+
+
+_current_article_index: ContextVar[Optional[ArticleIndex]] = ContextVar(
+    "current_article_index", default=None
+)
+
+
+def get_article_index(session: Any) -> ArticleIndex:
+    """The loaded index of the active scope, or a freshly loaded one."""
+    index = _current_article_index.get() or ArticleIndex()
+    return index.load(session)
+
+
+@contextmanager
+def article_index_scope(label: str = "run") -> Iterator[ArticleIndex]:
+    """Shares one ArticleIndex with everything running inside the block.
+    Nested scopes reuse the outer index."""
+    active = _current_article_index.get()
+    if active is not None:
+        yield active
+        return
+
+    index = ArticleIndex()
+    token = _current_article_index.set(index)
+    try:
+        yield index
+    finally:
+        _current_article_index.reset(token)
+        logger.info(
+            "Article index ({}): {} articles loaded, {} lookups resolved in "
+            "memory, {} new, {} added",
+            label,
+            index.counts["loaded"],
+            index.counts["hits"],
+            index.counts["misses"],
+            index.counts["added"],
+        )
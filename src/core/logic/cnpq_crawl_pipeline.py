@@ -0,0 +1,183 @@
+"""
+Concurrent CNPq group crawl with a single database writer.
+
+Syncing research groups one at a time made the run as long as the sum of the
+DGP mirror latencies. crawl_groups() fetches group pages on a bounded thread
+pool, spacing requests with a shared RateLimiter and retrying failures with
+exponential backoff, and hands parsed payloads through a bounded queue to the
+calling thread, which is the only one that writes to the database.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+DEFAULT_CNPQ_FETCH_WORKERS = int(os.getenv("CNPQ_FETCH_WORKERS", "4"))
+DEFAULT_CNPQ_REQUESTS_PER_SECOND = float(os.getenv("CNPQ_REQUESTS_PER_SECOND", "2"))
+DEFAULT_CNPQ_FETCH_MAX_ATTEMPTS = int(os.getenv("CNPQ_FETCH_MAX_ATTEMPTS", "3"))
+DEFAULT_CNPQ_RETRY_BACKOFF_SECONDS = float(os.getenv("CNPQ_RETRY_BACKOFF_SECONDS", "2"))
+
+GroupFetcher = Callable[[str], Optional[Dict[str, Any]]]
+GroupWriter = Callable[[dict, Optional[Dict[str, Any]]], dict]
+
+
+class RateLimiter:
+    """Spaces calls to `wait()` at least 1 / `requests_per_second` apart
+    across all threads; a non-positive rate disables limiting."""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = DEFAULT_CNPQ_FETCH_MAX_ATTEMPTS
+    backoff_seconds: float = DEFAULT_CNPQ_RETRY_BACKOFF_SECONDS
+    backoff_factor: float = 2.0
+    # Exceptions that will not go away on retry (e.g. a replay cache miss).
+    give_up_on: Tuple[type, ...] = ()
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number `attempt` (1-based)."""
+        return self.backoff_seconds * (self.backoff_factor ** (attempt - 1))
+
+
+def fetch_with_retry(
+    url: str,
+    fetch: GroupFetcher,
+    rate_limiter: RateLimiter,
+    retry_policy: RetryPolicy,
+) -> Optional[Dict[str, Any]]:
+    """Fetches `url`, retrying exceptions and empty payloads. Returns None
+    once every attempt failed."""
+    attempts = max(1, retry_policy.max_attempts)
+    for attempt in range(1, attempts + 1):
+        rate_limiter.wait()
+        try:
+            data = fetch(url)
+            if data:
+                return data
+            error = "empty payload"
+        except retry_policy.give_up_on as e:
+            logger.error(f"CNPq fetch failed for {url}: {e}")
+            return None
+        except Exception as e:
+            error = str(e)
+
+        if attempt < attempts:
+            delay = retry_policy.delay(attempt)
+            logger.warning(
+                f"CNPq fetch failed for {url} (attempt {attempt}/{attempts}): "
+                f"{error}. Retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+        else:
+            logger.error(
+                f"CNPq fetch failed for {url} after {attempts} attempts: {error}"
+            )
+    return None
+
+
+_DONE = object()
+
+
+def crawl_groups(
+    groups: List[dict],
+    fetch: GroupFetcher,
+    write: GroupWriter,
+    *,
+    max_workers: int = DEFAULT_CNPQ_FETCH_WORKERS,
+    requests_per_second: float = DEFAULT_CNPQ_REQUESTS_PER_SECOND,
+    retry_policy: Optional[RetryPolicy] = None,
+    queue_size: Optional[int] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> List[dict]:
+    """
+    Fetches every ``group["url"]`` concurrently and calls
+    ``write(group, data)`` for each one on the calling thread, as payloads
+    arrive; `data` is None when the fetch failed. Returns the writer results
+    in the order of `groups`.
+
+    `fetch` runs on worker threads and must not touch the database. The
+    queue between the stages holds at most `queue_size` payloads (default
+    twice the worker count), so fetching pauses when the writer falls behind.
+    Pass `rate_limiter` to share it with other requests of the run (e.g. the
+    cache's conditional GETs); it then replaces `requests_per_second`.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    if not groups:
+        return []
+
+    retry_policy = retry_policy or RetryPolicy()
+    rate_limiter = rate_limiter or RateLimiter(requests_per_second)
+    worker_count = min(max_workers, len(groups))
+    payloads: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size or worker_count * 2)
+    pending = iter(enumerate(groups))
+    pending_lock = threading.Lock()
+
+    def worker() -> None:
+        try:
+            while True:
+                with pending_lock:
+                    item = next(pending, None)
+                if item is None:
+                    return
+                index, group = item
+                try:
+                    data = fetch_with_retry(
+                        group["url"], fetch, rate_limiter, retry_policy
+                    )
+                except Exception as e:
+                    logger.error(f"CNPq fetch worker failed for {group['url']}: {e}")
+                    data = None
+                payloads.put((index, group, data))
+        finally:
+            payloads.put(_DONE)
+
+    logger.info(
+        f"Crawling {len(groups)} CNPq groups with {worker_count} worker(s) "
+        f"at {requests_per_second or 'unlimited'} requests/s"
+    )
+    results: Dict[int, dict] = {}
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        for _ in range(worker_count):
+            executor.submit(worker)
+
+        finished_workers = 0
+        while finished_workers < worker_count:
+            item = payloads.get()
+            if item is _DONE:
+                finished_workers += 1
+                continue
+            index, group, data = item
+            try:
+                results[index] = write(group, data)
+            except Exception as e:
+                logger.error(f"Failed to write CNPq group {group.get('name')}: {e}")
+                results[index] = {
+                    "success": False,
+                    "group_id": group.get("id"),
+                    "group_name": group.get("name"),
+                    "url": group.get("url"),
+                }
+
+    return [results[index] for index in sorted(results)]
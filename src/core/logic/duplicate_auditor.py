@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import Iterable
 
 from src.core.logic.initiative_identity import normalize_text
+from src.core.logic.person_name_keys import KEY_TEXT, person_name_keys_current
 
 
 @dataclass
@@ -57,9 +58,7 @@ class DuplicateAuditor:
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             results = {
-                "persons_by_canonical_name": self._canonical_duplicates(
-                    conn.execute("SELECT id, name, identification_id FROM persons").fetchall()
-                ),
+                "persons_by_canonical_name": self._person_name_key_duplicates(conn),
                 "teams_by_canonical_name": self._canonical_duplicates(
                     conn.execute("SELECT id, name FROM teams").fetchall()
                 ),
@@ -84,6 +83,43 @@ class DuplicateAuditor:
             }
         return results
 
+    def _person_name_key_duplicates(self, conn: sqlite3.Connection) -> list[dict]:
+        """Same groups as `_canonical_duplicates` over persons, read from the
+        persisted `text` name keys so only colliding rows leave SQLite. The
+        audit is read-only: when the stored keys are missing or stale they
+        are computed in memory instead of being refreshed."""
+        if not person_name_keys_current(conn):
+            return self._canonical_duplicates(
+                conn.execute(
+                    "SELECT id, name, identification_id FROM persons ORDER BY id"
+                ).fetchall()
+            )
+        rows = conn.execute(
+            """
+            SELECT k.key AS canonical, p.id, p.name, p.identification_id
+            FROM person_name_keys k
+            JOIN persons p ON p.id = k.person_id
+            WHERE k.key_type = :key_type
+              AND k.key IN (
+                SELECT key FROM person_name_keys
+                WHERE key_type = :key_type
+                GROUP BY key
+                HAVING COUNT(*) > 1
+              )
+            ORDER BY p.id
+            """,
+            {"key_type": KEY_TEXT},
+        ).fetchall()
+
+        groups: dict[str, list[dict]] = {}
+        for row in rows:
+            row_dict = dict(row)
+            groups.setdefault(row_dict.pop("canonical"), []).append(row_dict)
+        return [
+            {"canonical": canonical, "members": members}
+            for canonical, members in groups.items()
+        ]
+
     def _canonical_duplicates(self, rows: Iterable[sqlite3.Row]) -> list[dict]:
         groups: dict[str, list[dict]] = {}
         for row in rows:
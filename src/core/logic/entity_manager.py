@@ -1,11 +1,7 @@
 import unicodedata
 from typing import Any, Dict, Optional
 
-from eo_lib import (
-    InitiativeController,
-    PersonController,
-    OrganizationController
-)
+from eo_lib import InitiativeController, PersonController, OrganizationController
 from eo_lib.domain import Role
 from eo_lib.infrastructure.database.postgres_client import PostgresClient
 from loguru import logger
@@ -16,10 +12,16 @@ from research_domain.controllers import (
     CampusController,
     KnowledgeAreaController,
     RoleController,
-    ArticleController
+    ArticleController,
 )
 from research_domain.domain.entities.academic_education import EducationType
 from src.core.logic.initiative_identity import normalize_text
+from src.core.logic.reference_data_cache import (
+    CAMPUSES,
+    KNOWLEDGE_AREAS,
+    ORGANIZATIONS,
+    get_reference_data,
+)
 
 
 class EntityManager:
@@ -54,35 +56,25 @@ class EntityManager:
         """Ensure an organization exists and return its ID."""
         if not name:
             return None
-        
+
         # If using the default name and short_name is not provided, default it to IFES
         if name == "Instituto Federal do Espírito Santo" and short_name is None:
             short_name = "IFES"
 
         try:
-
-            target_norm = normalize_text(name)
-            target_short_norm = normalize_text(short_name) if short_name else ""
-
-            orgs = self.uni_controller.get_all()
-            for o in orgs:
-                o_name = o.name if hasattr(o, "name") else o.get("name", "")
-                o_short_name = (
-                    o.short_name
-                    if hasattr(o, "short_name")
-                    else o.get("short_name", "")
-                )
-
-                if normalize_text(o_name) == target_norm or (
-                    target_short_norm and normalize_text(o_short_name) == target_short_norm
-                ):
-                    return o.id if hasattr(o, "id") else o.get("id")
+            reference_data = get_reference_data()
+            o = reference_data.find(
+                ORGANIZATIONS, self.uni_controller, name=name, short_name=short_name
+            )
+            if o is not None:
+                return o.id if hasattr(o, "id") else o.get("id")
 
             # If not found, create one
             logger.info(f"Creating Organization: {name}...")
             new_org = self.uni_controller.create_university(
                 name=name, short_name=short_name
             )
+            reference_data.add(ORGANIZATIONS, new_org)
             return new_org.id if hasattr(new_org, "id") else new_org.get("id")
         except Exception as e:
             logger.warning(f"Failed to ensure organization '{name}': {e}")
@@ -185,35 +177,39 @@ class EntityManager:
 
         return initiative_type
 
-    def resolve_campus(self, campus_name: Optional[str], org_id: Optional[int]) -> Optional[int]:
+    def resolve_campus(
+        self, campus_name: Optional[str], org_id: Optional[int]
+    ) -> Optional[int]:
         """Resolve a campus name to an ID, creating it if necessary."""
         if not campus_name or not isinstance(campus_name, str):
             campus_name = "Reitoria"
 
         try:
-            campuses = self.campus_controller.get_all()
-
-            target_norm = normalize_text(campus_name)
+            reference_data = get_reference_data()
 
-            for c in campuses:
-                c_name = c.name if hasattr(c, "name") else c.get("name")
+            def _same_organization(c: Any) -> bool:
                 c_org = (
                     c.organization_id
                     if hasattr(c, "organization_id")
-                    else c.get("organization_id")
-                    if isinstance(c, dict)
-                    else None
+                    else c.get("organization_id") if isinstance(c, dict) else None
                 )
-                if c_name and normalize_text(c_name) == target_norm and (
-                    org_id is None or c_org is None or c_org == org_id
-                ):
-                    return c.id if hasattr(c, "id") else c.get("id")
+                return org_id is None or c_org is None or c_org == org_id
+
+            c = reference_data.find(
+                CAMPUSES,
+                self.campus_controller,
+                name=campus_name,
+                where=_same_organization,
+            )
+            if c is not None:
+                return c.id if hasattr(c, "id") else c.get("id")
 
             if org_id and len(campus_name) > 3:
                 logger.info(f"Creating missing Campus: {campus_name}")
                 new_campus = self.campus_controller.create_campus(
                     name=campus_name, organization_id=org_id
                 )
+                reference_data.add(CAMPUSES, new_campus)
                 return (
                     new_campus.id if hasattr(new_campus, "id") else new_campus.get("id")
                 )
@@ -229,24 +225,14 @@ class EntityManager:
             return None
 
         try:
-            norm_name = normalize_text(name)
-        except Exception:
-            return None
-
-        try:
-            all_kas = self.ka_controller.get_all()
-            for ka in all_kas:
-                k_name = ka.name if hasattr(ka, "name") else ka.get("name")
-                if k_name:
-                    try:
-                        k_norm = normalize_text(k_name)
-                        if k_norm == norm_name:
-                            return ka.id if hasattr(ka, "id") else ka.get("id")
-                    except Exception:
-                        continue
+            reference_data = get_reference_data()
+            ka = reference_data.find(KNOWLEDGE_AREAS, self.ka_controller, name=name)
+            if ka is not None:
+                return ka.id if hasattr(ka, "id") else ka.get("id")
 
             logger.info(f"Creating Knowledge Area: {name}")
             new_ka = self.ka_controller.create_knowledge_area(name=name)
+            reference_data.add(KNOWLEDGE_AREAS, new_ka)
             return new_ka.id if hasattr(new_ka, "id") else new_ka.get("id")
 
         except Exception as e:
@@ -269,7 +255,7 @@ class EntityManager:
             # Create
             logger.info(f"Creating Education Type: {name}")
             new_type = self.edu_type_controller.create_education_type(name=name)
-            
+
             # The controller returns the object or a dict depending on implementation
             # In v0.12.7 it returns the object directly
             return new_type.id if hasattr(new_type, "id") else new_type.get("id")
@@ -20,6 +20,11 @@ from research_domain.controllers.controllers import (
 )
 from sqlalchemy import text
 
+from src.core.logic.initiative_name_index import (
+    InitiativeNameIndex,
+    active_initiative_name_index,
+)
+from src.core.logic.unit_of_work import controller_session
 from src.research_domain_compat import (
     Advisorship,
     AdvisorshipRole,
@@ -47,6 +52,19 @@ class BaseInitiativeHandler(ABC):
         """Creates or updates the initiative entity."""
         pass
 
+    def _name_index(self) -> Optional[InitiativeNameIndex]:
+        """The run's initiative name index, or None outside a scope."""
+        return active_initiative_name_index(
+            controller_session(self.initiative_controller)
+        )
+
+    def _remember_name(
+        self, initiative: Any, old_name: Optional[str], new_name: str
+    ) -> None:
+        index = self._name_index()
+        if index is not None:
+            index.rename(getattr(initiative, "id", None), old_name, new_name)
+
 
 class StandardProjectHandler(BaseInitiativeHandler):
     """Handler for standard research projects."""
@@ -67,6 +85,7 @@ class StandardProjectHandler(BaseInitiativeHandler):
 
         if existing_initiative:
             logger.debug(f"Updating existing initiative: {title[:50]}...")
+            old_name = getattr(existing_initiative, "name", None)
             self.initiative_controller.update_initiative(
                 initiative_id=existing_initiative.id,
                 name=title,
@@ -86,6 +105,7 @@ class StandardProjectHandler(BaseInitiativeHandler):
                 self.initiative_controller.update(existing_initiative)
             except Exception:
                 pass
+            self._remember_name(existing_initiative, old_name, title)
             return existing_initiative
         else:
             logger.debug(f"Creating new initiative: {title[:50]}...")
@@ -103,6 +123,9 @@ class StandardProjectHandler(BaseInitiativeHandler):
                 initiative.metadata = metadata
 
             self.initiative_controller.create(initiative)
+            index = self._name_index()
+            if index is not None:
+                index.add(getattr(initiative, "id", None), title)
             return initiative
 
 
@@ -170,6 +193,7 @@ class AdvisorshipHandler(BaseInitiativeHandler):
         if existing_initiative:
             # Advisorship update logic (using standard initiative update as base)
             logger.debug(f"Updating existing advisorship: {title[:50]}...")
+            old_name = getattr(existing_initiative, "name", None)
             self.initiative_controller.update_initiative(
                 initiative_id=existing_initiative.id,
                 name=persisted_title,
@@ -189,6 +213,7 @@ class AdvisorshipHandler(BaseInitiativeHandler):
                 self.initiative_controller.update(existing_initiative)
             except Exception:
                 pass
+            self._remember_name(existing_initiative, old_name, persisted_title)
 
             # Update specialized fields
             # If it's a base Initiative, we MUST fetch it as Advisorship to access specialized fields
@@ -255,6 +280,11 @@ class AdvisorshipHandler(BaseInitiativeHandler):
                 fellowship=fellowship,
             )
             self.adv_controller.create(initiative)
+            index = self._name_index()
+            if index is not None:
+                index.add(
+                    getattr(initiative, "id", None), persisted_title, advisorship=True
+                )
             return initiative
 
     def _get_or_create_advisorship_role(self, role_name: str) -> Role:
@@ -502,6 +532,10 @@ class AdvisorshipHandler(BaseInitiativeHandler):
         if not title:
             return False
 
+        index = self._name_index()
+        if index is not None:
+            return index.name_in_use(title, current_id)
+
         session = self.initiative_controller._service._repository._session
         params = {"name": title, "current_id": current_id or -1}
         result = session.execute(
@@ -553,20 +587,27 @@ class AdvisorshipHandler(BaseInitiativeHandler):
         if not title:
             return None
 
-        session = self.initiative_controller._service._repository._session
-        initiative_id = session.execute(
-            text(
-                """
-                SELECT id
-                FROM initiatives
-                WHERE name = :name
-                LIMIT 1
-                """
-            ),
-            {"name": title},
-        ).scalar()
-        if not initiative_id:
-            return None
+        index = self._name_index()
+        if index is not None:
+            initiative_id = index.first_id(title)
+            # Only advisorships are fetched; other initiatives resolve to None.
+            if not initiative_id or not index.is_advisorship(initiative_id):
+                return None
+        else:
+            session = self.initiative_controller._service._repository._session
+            initiative_id = session.execute(
+                text(
+                    """
+                    SELECT id
+                    FROM initiatives
+                    WHERE name = :name
+                    LIMIT 1
+                    """
+                ),
+                {"name": title},
+            ).scalar()
+            if not initiative_id:
+                return None
 
         try:
             return self.adv_controller.get_by_id(initiative_id)
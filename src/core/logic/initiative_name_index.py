@@ -0,0 +1,135 @@
+"""
+Run-scoped index of initiative names and advisorship ids.
+
+AdvisorshipHandler checked for every incoming row whether its title was
+already used by another initiative and looked the title up again to find an
+existing advisorship, each with its own ``initiatives`` query. An
+InitiativeNameIndex loads every (id, name) pair and the advisorship ids with
+two queries and answers both checks from dicts. The handlers register the
+initiatives they create or rename, so the index stays current for the run.
+
+Names are compared exactly, as the ``WHERE name = :name`` queries did. The
+index is only used inside ``initiative_name_index_scope()`` (opened by
+ProjectLoader.process_records and the advisorship flows); outside a scope
+``active_initiative_name_index()`` returns None and the handlers query the
+database as before.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Set
+
+from loguru import logger
+from sqlalchemy import text
+
+INITIATIVE_NAMES_SQL = text("SELECT id, name FROM initiatives")
+ADVISORSHIP_IDS_SQL = text("SELECT id FROM advisorships")
+
+
+class InitiativeNameIndex:
+    def __init__(self):
+        self.loaded = False
+        self._ids_by_name: Dict[str, Set[int]] = {}
+        self._advisorship_ids: Set[int] = set()
+        self.counts: Counter = Counter()
+
+    def load(self, session: Any) -> "InitiativeNameIndex":
+        """Reads the names and advisorship ids once; later calls are no-ops."""
+        if self.loaded:
+            return self
+        for initiative_id, name in session.execute(INITIATIVE_NAMES_SQL):
+            if name:
+                self._ids_by_name.setdefault(name, set()).add(initiative_id)
+                self.counts["loaded"] += 1
+        self._advisorship_ids.update(
+            advisorship_id for (advisorship_id,) in session.execute(ADVISORSHIP_IDS_SQL)
+        )
+        self.loaded = True
+        return self
+
+    def name_in_use(self, name: str, current_id: Optional[int] = None) -> bool:
+        """Whether an initiative other than `current_id` is named `name`."""
+        self.counts["lookups"] += 1
+        return bool(self._ids_by_name.get(name, set()) - {current_id})
+
+    def first_id(self, name: str) -> Optional[int]:
+        self.counts["lookups"] += 1
+        ids = self._ids_by_name.get(name)
+        return min(ids) if ids else None
+
+    def is_advisorship(self, initiative_id: int) -> bool:
+        return initiative_id in self._advisorship_ids
+
+    def add(
+        self,
+        initiative_id: Optional[int],
+        name: Optional[str],
+        *,
+        advisorship: bool = False,
+    ) -> None:
+        """Registers an initiative created during the run."""
+        if initiative_id is None:
+            return
+        if name:
+            self._ids_by_name.setdefault(name, set()).add(initiative_id)
+        if advisorship:
+            self._advisorship_ids.add(initiative_id)
+        self.counts["added"] += 1
+
+    def invalidate(self) -> None:
+        """Drops everything; the next load() reads the tables again."""
+        self.loaded = False
+        self._ids_by_name.clear()
+        self._advisorship_ids.clear()
+
+    def rename(
+        self, initiative_id: Optional[int], old_name: Optional[str], new_name: str
+    ) -> None:
+        if initiative_id is None or old_name == new_name:
+            return
+        if old_name in self._ids_by_name:
+            self._ids_by_name[old_name].discard(initiative_id)
+            if not self._ids_by_name[old_name]:
+                del self._ids_by_name[old_name]
+        if new_name:
+            self._ids_by_name.setdefault(new_name, set()).add(initiative_id)
+
+
+_current_initiative_name_index: ContextVar[Optional[InitiativeNameIndex]] = ContextVar(
+    "current_initiative_name_index", default=None
+)
+
+
+def active_initiative_name_index(session: Any) -> Optional[InitiativeNameIndex]:
+    """The loaded index of the active scope; None outside a scope."""
+    index = _current_initiative_name_index.get()
+    if index is None or session is None:
+        return None
+    return index.load(session)
+
+
+@contextmanager
+def initiative_name_index_scope(label: str = "run") -> Iterator[InitiativeNameIndex]:
+    """Shares one InitiativeNameIndex with everything running inside the
+    block. Nested scopes reuse the outer index."""
+    active = _current_initiative_name_index.get()
+    if active is not None:
+        yield active
+        return
+
+    index = InitiativeNameIndex()
+    token = _current_initiative_name_index.set(index)
+    try:
+        yield index
+    finally:
+        _current_initiative_name_index.reset(token)
+        if index.loaded:
+            logger.info(
+                "Initiative name index ({}): {} names loaded, {} lookups "
+                "answered in memory, {} initiatives added",
+                label,
+                index.counts["loaded"],
+                index.counts["lookups"],
+                index.counts["added"],
+            )
@@ -0,0 +1,197 @@
+"""
+Incremental ingest manifest for the Lattes JSON files.
+
+Most CVs in data/lattes_json are unchanged from one weekly run to the next,
+yet every flow used to ingest all of them. The manifest remembers, per flow
+and per CV (keyed by Lattes ID), the SHA-256 of the file, the CV's own
+update date (``data_atualizacao``) and the ingestion run that applied it::
+
+    {"format_version": 1,
+     "flows": {"lattes_projects": {"<lattes_id>": {"file_hash": ...,
+                                                   "cv_updated_at": ...,
+                                                   "ingestion_run_id": ...,
+                                                   "ingested_at": ...,
+                                                   "file": ...}}}}
+
+A file is selected when its CV is new or its hash changed. A rewritten file
+whose CV update date equals the recorded one is not selected (scriptLattes
+output may differ between downloads of the same CV); its new hash is
+recorded instead. Entries are only written for CVs a flow ingested
+successfully, so failures are retried on the next run. ``force_full``
+(or LATTES_FORCE_FULL=1) selects every file.
+
+The manifest lives outside the database, so it is tied to it through the
+ingestion runs: ``forget_unknown_runs()`` drops entries whose run is not in
+``ingestion_runs``, and a fresh or reset database selects every file again.
+``make db-clean`` also deletes the manifest.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+
+from src.core.logic.atomic_io import atomic_write_json
+
+DEFAULT_LATTES_INGEST_MANIFEST = os.getenv(
+    "LATTES_INGEST_MANIFEST", "data/cache/lattes_ingest_manifest.json"
+)
+DEFAULT_LATTES_FORCE_FULL = os.getenv("LATTES_FORCE_FULL", "0") not in {
+    "0",
+    "false",
+    "FALSE",
+}
+MANIFEST_FORMAT_VERSION = 1
+INGESTION_RUN_IDS_SQL = text("SELECT id FROM ingestion_runs")
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cv_updated_at(data: Dict[str, Any]) -> Optional[str]:
+    """The CV's last update date as exported by scriptLattes, if present."""
+    info = data.get("informacoes_pessoais") or {}
+    for container in (info, data):
+        for key in ("data_atualizacao", "ultima_atualizacao"):
+            value = container.get(key)
+            if value:
+                return str(value)
+    return None
+
+
+def _manifest_key(file_path: str) -> str:
+    stem = os.path.basename(file_path).replace(".json", "")
+    lattes_id = stem.split("_")[-1]
+    return lattes_id if lattes_id.isdigit() else stem
+
+
+class LattesIngestManifest:
+    def __init__(self, flow_name: str, path: str = DEFAULT_LATTES_INGEST_MANIFEST):
+        self.flow_name = flow_name
+        self.path = path
+        self._data = self._load()
+        self._entries: Dict[str, Dict[str, Any]] = self._data["flows"].setdefault(
+            flow_name, {}
+        )
+        self._file_hashes: Dict[str, str] = {}
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Any]:
+        empty = {"format_version": MANIFEST_FORMAT_VERSION, "flows": {}}
+        if not os.path.exists(self.path):
+            return empty
+        try:
+            with open(self.path, "r", encoding="utf-8") as file_handle:
+                data = json.load(file_handle)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(
+                f"Ignoring unreadable Lattes ingest manifest {self.path}: {e}"
+            )
+            return empty
+        if data.get("format_version") != MANIFEST_FORMAT_VERSION:
+            logger.warning(
+                f"Ignoring Lattes ingest manifest {self.path}: unsupported version"
+            )
+            return empty
+        data.setdefault("flows", {})
+        return data
+
+    def _is_current(self, file_path: str) -> bool:
+        entry = self._entries.get(_manifest_key(file_path))
+        if not entry:
+            return False
+        file_hash = self._file_hashes[file_path]
+        if entry.get("file_hash") == file_hash:
+            return True
+        if not entry.get("cv_updated_at"):
+            return False
+        try:
+            with open(file_path, "r", encoding="utf-8") as file_handle:
+                updated_at = cv_updated_at(json.load(file_handle))
+        except (OSError, json.JSONDecodeError):
+            return False
+        if updated_at != entry["cv_updated_at"]:
+            return False
+        entry["file_hash"] = file_hash
+        self._dirty = True
+        return True
+
+    def forget_unknown_runs(self, session: Any) -> int:
+        """Drops the entries whose ingestion run does not exist in the
+        database of `session` (e.g. after ``make db-reset``) and returns how
+        many were dropped. Without a session the entries are kept."""
+        if session is None or not self._entries:
+            return 0
+        try:
+            run_ids = {run_id for (run_id,) in session.execute(INGESTION_RUN_IDS_SQL)}
+            # Reads only; do not hold a transaction open for the whole run.
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"Could not read ingestion runs ({e}); assuming none")
+            run_ids = set()
+
+        unknown = [
+            key
+            for key, entry in self._entries.items()
+            if entry.get("ingestion_run_id") not in run_ids
+        ]
+        for key in unknown:
+            del self._entries[key]
+        if unknown:
+            self._dirty = True
+            logger.info(
+                f"{self.flow_name}: forgot {len(unknown)} Lattes manifest entries "
+                "whose ingestion run is not in the database"
+            )
+        return len(unknown)
+
+    def select(self, file_paths: List[str], force_full: bool = False) -> List[str]:
+        """The files of `file_paths` this flow still has to ingest, in order."""
+        selected = []
+        for file_path in file_paths:
+            try:
+                self._file_hashes[file_path] = file_sha256(file_path)
+            except OSError as e:
+                logger.warning(f"Could not hash Lattes file {file_path}: {e}")
+                selected.append(file_path)
+                continue
+            if force_full or not self._is_current(file_path):
+                selected.append(file_path)
+        logger.info(
+            f"{self.flow_name}: {len(selected)} of {len(file_paths)} Lattes files "
+            f"{'selected (full run)' if force_full else 'new or changed'}"
+        )
+        return selected
+
+    def mark_ingested(
+        self,
+        file_path: str,
+        *,
+        cv_updated_at: Optional[str] = None,
+        ingestion_run_id: Optional[int] = None,
+    ) -> None:
+        file_hash = self._file_hashes.get(file_path) or file_sha256(file_path)
+        self._entries[_manifest_key(file_path)] = {
+            "file_hash": file_hash,
+            "cv_updated_at": cv_updated_at,
+            "ingestion_run_id": ingestion_run_id,
+            "ingested_at": datetime.now().isoformat(timespec="seconds"),
+            "file": os.path.basename(file_path),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        if self._dirty:
+            atomic_write_json(self.path, self._data, indent=2)
+            self._dirty = False
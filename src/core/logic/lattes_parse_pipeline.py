@@ -0,0 +1,201 @@
+"""
+Parallel Lattes CV parsing with a single database writer.
+
+Loading a Lattes JSON and running LattesParser over it is CPU-bound and
+independent for each file, while the writes all go through one SQLite
+session. parse_lattes_files() parses the files on a process pool and yields
+the normalized ParsedLattesCV batches, in the order of the input files, to
+the calling process, which is the only one that writes to the database.
+With a single worker everything runs in the calling process.
+
+CVs whose fingerprint equals the latest applied one (see
+src.tracking.change_gate) are only hashed, never parsed.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+from src.adapters.sources.lattes_parser import LattesParser
+from src.core.logic.lattes_ingest_manifest import cv_updated_at
+from src.tracking.fingerprint import stable_hash
+
+DEFAULT_LATTES_PARSE_WORKERS = int(
+    os.getenv("LATTES_PARSE_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+# Sections ingested by a per-section task, isolated from each other.
+LATTES_SECTION_PARSERS = {
+    "awards": "parse_awards",
+    "languages": "parse_languages",
+    "professional_activities": "parse_professional_activities",
+    "technical_productions": "parse_technical_productions",
+}
+
+
+@dataclass
+class ParsedLattesCV:
+    file_path: str
+    lattes_id: str
+    payload_hash: str
+    cv_updated_at: Optional[str] = None
+    # True when the CV matched a known fingerprint and was not parsed.
+    unchanged: bool = False
+    personal_info: Dict[str, Any] = field(default_factory=dict)
+    json_name: Optional[str] = None
+    projects: List[Dict[str, Any]] = field(default_factory=list)
+    articles: List[Dict[str, Any]] = field(default_factory=list)
+    education: List[Dict[str, Any]] = field(default_factory=list)
+    # Section name -> parsed items, or None when that section failed to parse.
+    sections: Dict[str, Optional[List[Dict[str, Any]]]] = field(default_factory=dict)
+
+
+def _unique_projects(projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Deduplicates projects by (stripped) name, keeping the first one."""
+    seen_names = set()
+    unique_projects = []
+    for p in projects:
+        p_name = (p.get("name") or "").strip()
+        if p_name and p_name not in seen_names:
+            p["name"] = p_name
+            unique_projects.append(p)
+            seen_names.add(p_name)
+    return unique_projects
+
+
+def parse_lattes_file(
+    file_path: str,
+    parser: LattesParser,
+    known_fingerprints: Optional[Dict[str, str]] = None,
+) -> Optional[ParsedLattesCV]:
+    """
+    Loads and parses one Lattes JSON. Returns None when the file is skipped
+    (no Lattes ID in its name) or cannot be parsed. When the payload hash
+    equals ``known_fingerprints[lattes_id]`` the sections are not parsed and
+    the result is flagged ``unchanged``.
+    """
+    try:
+        filename = os.path.basename(file_path)
+        lattes_id = filename.replace(".json", "").split("_")[-1]
+
+        if not lattes_id or not lattes_id.isdigit():
+            logger.info(f"Skipping file {filename}: Could not extract Lattes ID.")
+            return None
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load JSON {file_path}: {e}")
+            return None
+
+        parsed = ParsedLattesCV(
+            file_path=file_path,
+            lattes_id=lattes_id,
+            payload_hash=stable_hash(data),
+            cv_updated_at=cv_updated_at(data),
+        )
+        if (known_fingerprints or {}).get(lattes_id) == parsed.payload_hash:
+            parsed.unchanged = True
+            return parsed
+
+        parsed.personal_info = parser.parse_personal_info(data)
+        json_name = data.get("nome") or data.get("name")
+        if not json_name:
+            info = data.get("informacoes_pessoais", {})
+            json_name = info.get("nome_completo")
+        parsed.json_name = parsed.personal_info.get("name") or json_name
+
+        projects = []
+        projects.extend(parser.parse_research_projects(data))
+        projects.extend(parser.parse_extension_projects(data))
+        projects.extend(parser.parse_development_projects(data))
+        parsed.projects = _unique_projects(projects)
+
+        parsed.articles.extend(parser.parse_articles(data))
+        parsed.articles.extend(parser.parse_conference_papers(data))
+        parsed.education = parser.parse_academic_education(data)
+
+        for section_name, method_name in LATTES_SECTION_PARSERS.items():
+            try:
+                parsed.sections[section_name] = getattr(parser, method_name)(data)
+            except Exception as exc:
+                logger.warning(
+                    f"Failed to parse {section_name} for Lattes {lattes_id}: {exc}"
+                )
+                parsed.sections[section_name] = None
+        return parsed
+    except Exception as e:
+        logger.error(f"Failed to process file {file_path}: {e}")
+        return None
+
+
+# Per-process state of the pool workers, set once by _init_worker.
+_worker_parser: Optional[LattesParser] = None
+_worker_fingerprints: Optional[Dict[str, str]] = None
+
+
+def _init_worker(known_fingerprints: Optional[Dict[str, str]]) -> None:
+    global _worker_parser, _worker_fingerprints
+    _worker_parser = LattesParser()
+    _worker_fingerprints = known_fingerprints
+
+
+def _parse_in_worker(file_path: str) -> Optional[ParsedLattesCV]:
+    return parse_lattes_file(file_path, _worker_parser, _worker_fingerprints)
+
+
+def parse_lattes_files(
+    file_paths: List[str],
+    *,
+    max_workers: int = DEFAULT_LATTES_PARSE_WORKERS,
+    parser: Optional[LattesParser] = None,
+    known_fingerprints: Optional[Dict[str, str]] = None,
+    prefetch: Optional[int] = None,
+) -> Iterator[ParsedLattesCV]:
+    """
+    Yields the ParsedLattesCV of every parseable file, in the order of
+    `file_paths`, so writing them gives the same result as the sequential
+    loop. At most `prefetch` files (default twice the worker count) are
+    parsed ahead of the consumer. `parser` is only used in-process
+    (``max_workers == 1``); pool workers build their own LattesParser.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+
+    worker_count = min(max_workers, len(file_paths))
+    if worker_count <= 1:
+        parser = parser or LattesParser()
+        for file_path in file_paths:
+            parsed = parse_lattes_file(file_path, parser, known_fingerprints)
+            if parsed is not None:
+                yield parsed
+        return
+
+    logger.info(
+        f"Parsing {len(file_paths)} Lattes files with {worker_count} worker process(es)"
+    )
+    window = max(prefetch or worker_count * 2, worker_count)
+    pending_paths = iter(file_paths)
+    with ProcessPoolExecutor(
+        max_workers=worker_count,
+        initializer=_init_worker,
+        initargs=(known_fingerprints,),
+    ) as executor:
+        futures: deque = deque()
+        for file_path in pending_paths:
+            futures.append(executor.submit(_parse_in_worker, file_path))
+            if len(futures) >= window:
+                break
+        while futures:
+            parsed = futures.popleft().result()
+            next_path = next(pending_paths, None)
+            if next_path is not None:
+                futures.append(executor.submit(_parse_in_worker, next_path))
+            if parsed is not None:
+                yield parsed
@@ -10,6 +10,7 @@ from loguru import logger
 from networkx.readwrite import json_graph
 
 from src.core.logic.atomic_io import atomic_write_json
+from src.core.logic.relationship_graph_index import write_relationship_graph_index
 
 RELATION_DESCRIPTIONS = {
     "initiative": "People who appear together in the same initiative team.",
@@ -121,6 +122,8 @@ class PeopleRelationshipGraphGenerator:
         if not os.path.exists(membership_alias):
             os.symlink(RESEARCH_GROUP_GRAPH_DIRECTORY, membership_alias)
 
+        adjacency_index = write_relationship_graph_index(graph, output_dir)
+
         logger.info(
             "People Relationship Graph bundle generated with {} classification graphs and {} research-group graphs",
             len(classification_exports),
@@ -131,6 +134,7 @@ class PeopleRelationshipGraphGenerator:
             "full_graph_path": full_output_path,
             "classification_exports": classification_exports,
             "research_group_exports": research_group_manifest,
+            "adjacency_index": adjacency_index,
         }
 
     def _build_graph_from_paths(
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 from loguru import logger
 
 from src.core.logic.person_matcher import PersonMatcher
+from src.core.logic.person_name_keys import KEY_CANONICAL, sync_person_name_keys
 
 
 @dataclass
@@ -25,6 +26,7 @@ class PersonConsolidator:
     def find_duplicate_groups(self) -> List[DuplicateGroup]:
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
+            sync_person_name_keys(conn)
             advisorship_count_sql = """
                 (
                     SELECT COUNT(*) FROM advisorship_members am
@@ -38,9 +40,12 @@ class PersonConsolidator:
                         WHERE a.supervisor_id = p.id OR a.student_id = p.id
                     ) AS advisorship_count,
                 """
+            # Only persons whose canonical name key collides with another
+            # person are loaded; the link counts are computed for them alone.
             people = conn.execute(
                 f"""
                 SELECT
+                    k.key AS canonical_name,
                     p.id,
                     p.name,
                     p.identification_id,
@@ -66,17 +71,26 @@ class PersonConsolidator:
                            OR ae.advisor_id = p.id
                            OR ae.co_advisor_id = p.id
                     ) AS education_count
-                FROM persons p
+                FROM person_name_keys k
+                JOIN persons p ON p.id = k.person_id
                 LEFT JOIN researchers r ON r.id = p.id
-                """
+                WHERE k.key_type = :key_type
+                  AND k.key IN (
+                    SELECT key FROM person_name_keys
+                    WHERE key_type = :key_type
+                    GROUP BY key
+                    HAVING COUNT(*) > 1
+                  )
+                ORDER BY p.id
+                """,
+                {"key_type": KEY_CANONICAL},
             ).fetchall()
 
         groups: Dict[str, List[Dict[str, Any]]] = {}
         for row in people:
             record = dict(row)
-            canonical = self._matcher.canonicalize_name(record.get("name") or "")
-            if canonical:
-                groups.setdefault(canonical, []).append(record)
+            canonical = record.pop("canonical_name")
+            groups.setdefault(canonical, []).append(record)
 
         duplicate_groups: List[DuplicateGroup] = []
         for canonical_name, members in groups.items():
@@ -143,125 +157,141 @@ class PersonConsolidator:
         """Consolidate every currently detected duplicate group."""
         merged = 0
         for group in self.find_duplicate_groups():
-            for loser_id in group.loser_ids:
-                self.consolidate_pair(group.winner_id, loser_id)
-                merged += 1
+            merged += self.consolidate_cluster(group.winner_id, group.loser_ids)
         return merged
 
     def consolidate_pair(self, winner_id: int, loser_id: int) -> None:
-        if winner_id == loser_id:
-            return
+        self.consolidate_cluster(winner_id, [loser_id])
+
+    def consolidate_cluster(self, winner_id: int, loser_ids: List[int]) -> int:
+        """Merges every loser into `winner_id` inside a single transaction.
+
+        Returns the number of merged persons; a failure rolls the whole
+        cluster back.
+        """
+        loser_ids = [loser_id for loser_id in loser_ids if loser_id != winner_id]
+        if not loser_ids:
+            return 0
 
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA foreign_keys = ON")
+            with conn:
+                for loser_id in loser_ids:
+                    self._merge_pair(conn, winner_id, loser_id)
+        return len(loser_ids)
 
-            winner = conn.execute(
-                "SELECT id, name, identification_id FROM persons WHERE id = ?",
-                (winner_id,),
-            ).fetchone()
-            loser = conn.execute(
-                "SELECT id, name, identification_id FROM persons WHERE id = ?",
-                (loser_id,),
-            ).fetchone()
+    def _merge_pair(
+        self, conn: sqlite3.Connection, winner_id: int, loser_id: int
+    ) -> None:
+        winner = conn.execute(
+            "SELECT id, name, identification_id FROM persons WHERE id = ?",
+            (winner_id,),
+        ).fetchone()
+        loser = conn.execute(
+            "SELECT id, name, identification_id FROM persons WHERE id = ?",
+            (loser_id,),
+        ).fetchone()
 
-            if not winner or not loser:
-                raise ValueError("Winner or loser person was not found.")
+        if not winner or not loser:
+            raise ValueError("Winner or loser person was not found.")
+
+        logger.info(
+            "Consolidating duplicate person {} ('{}') into {} ('{}').",
+            loser_id,
+            loser["name"],
+            winner_id,
+            winner["name"],
+        )
 
-            logger.info(
-                "Consolidating duplicate person {} ('{}') into {} ('{}').",
-                loser_id,
-                loser["name"],
+        self._merge_person_record(conn, winner_id, loser_id)
+        self._merge_researcher_record(conn, winner_id, loser_id)
+        self._merge_person_emails(conn, winner_id, loser_id)
+        self._merge_simple_link_table(
+            conn,
+            table="initiative_persons",
+            key_columns=("initiative_id", "person_id"),
+            static_values=("initiative_id",),
+            winner_id=winner_id,
+            loser_id=loser_id,
+            target_column="person_id",
+        )
+        self._merge_simple_link_table(
+            conn,
+            table="organization_persons",
+            key_columns=("organization_id", "person_id"),
+            static_values=("organization_id",),
+            winner_id=winner_id,
+            loser_id=loser_id,
+            target_column="person_id",
+        )
+        self._merge_simple_link_table(
+            conn,
+            table="article_authors",
+            key_columns=("article_id", "researcher_id"),
+            static_values=("article_id",),
+            winner_id=winner_id,
+            loser_id=loser_id,
+            target_column="researcher_id",
+        )
+        self._merge_simple_link_table(
+            conn,
+            table="researcher_knowledge_areas",
+            key_columns=("researcher_id", "area_id"),
+            static_values=("area_id",),
+            winner_id=winner_id,
+            loser_id=loser_id,
+            target_column="researcher_id",
+        )
+        self._merge_team_members(conn, winner_id, loser_id)
+        if self._table_exists(conn, "advisorship_members"):
+            self._merge_advisorship_members(conn, winner_id, loser_id)
+        else:
+            self._update_fk_column(
+                conn, "advisorships", "supervisor_id", winner_id, loser_id
+            )
+            self._update_fk_column(
+                conn, "advisorships", "student_id", winner_id, loser_id
+            )
+        self._update_fk_column(
+            conn, "academic_educations", "researcher_id", winner_id, loser_id
+        )
+        self._update_fk_column(
+            conn, "academic_educations", "advisor_id", winner_id, loser_id
+        )
+        self._update_fk_column(
+            conn, "academic_educations", "co_advisor_id", winner_id, loser_id
+        )
+        if self._table_exists(conn, "production_authors"):
+            self._merge_simple_link_table(
+                conn,
+                table="production_authors",
+                key_columns=("production_id", "researcher_id"),
+                static_values=("production_id",),
+                winner_id=winner_id,
+                loser_id=loser_id,
+                target_column="researcher_id",
+            )
+        if self._table_exists(conn, "awards"):
+            self._update_fk_column(conn, "awards", "researcher_id", winner_id, loser_id)
+        if self._table_exists(conn, "professional_activities"):
+            self._update_fk_column(
+                conn,
+                "professional_activities",
+                "researcher_id",
                 winner_id,
-                winner["name"],
+                loser_id,
             )
-
-            with conn:
-                self._merge_person_record(conn, winner_id, loser_id)
-                self._merge_researcher_record(conn, winner_id, loser_id)
-                self._merge_person_emails(conn, winner_id, loser_id)
-                self._merge_simple_link_table(
-                    conn,
-                    table="initiative_persons",
-                    key_columns=("initiative_id", "person_id"),
-                    static_values=("initiative_id",),
-                    winner_id=winner_id,
-                    loser_id=loser_id,
-                    target_column="person_id",
-                )
-                self._merge_simple_link_table(
-                    conn,
-                    table="organization_persons",
-                    key_columns=("organization_id", "person_id"),
-                    static_values=("organization_id",),
-                    winner_id=winner_id,
-                    loser_id=loser_id,
-                    target_column="person_id",
-                )
-                self._merge_simple_link_table(
-                    conn,
-                    table="article_authors",
-                    key_columns=("article_id", "researcher_id"),
-                    static_values=("article_id",),
-                    winner_id=winner_id,
-                    loser_id=loser_id,
-                    target_column="researcher_id",
-                )
-                self._merge_simple_link_table(
-                    conn,
-                    table="researcher_knowledge_areas",
-                    key_columns=("researcher_id", "area_id"),
-                    static_values=("area_id",),
-                    winner_id=winner_id,
-                    loser_id=loser_id,
-                    target_column="researcher_id",
-                )
-                self._merge_team_members(conn, winner_id, loser_id)
-                if self._table_exists(conn, "advisorship_members"):
-                    self._merge_advisorship_members(conn, winner_id, loser_id)
-                else:
-                    self._update_fk_column(
-                        conn, "advisorships", "supervisor_id", winner_id, loser_id
-                    )
-                    self._update_fk_column(
-                        conn, "advisorships", "student_id", winner_id, loser_id
-                    )
-                self._update_fk_column(
-                    conn, "academic_educations", "researcher_id", winner_id, loser_id
-                )
-                self._update_fk_column(
-                    conn, "academic_educations", "advisor_id", winner_id, loser_id
-                )
-                self._update_fk_column(
-                    conn, "academic_educations", "co_advisor_id", winner_id, loser_id
-                )
-                if self._table_exists(conn, "production_authors"):
-                    self._merge_simple_link_table(
-                        conn,
-                        table="production_authors",
-                        key_columns=("production_id", "researcher_id"),
-                        static_values=("production_id",),
-                        winner_id=winner_id,
-                        loser_id=loser_id,
-                        target_column="researcher_id",
-                    )
-                if self._table_exists(conn, "awards"):
-                    self._update_fk_column(
-                        conn, "awards", "researcher_id", winner_id, loser_id
-                    )
-                if self._table_exists(conn, "professional_activities"):
-                    self._update_fk_column(
-                        conn,
-                        "professional_activities",
-                        "researcher_id",
-                        winner_id,
-                        loser_id,
-                    )
-                if self._table_exists(conn, "proficiencies"):
-                    self._merge_proficiencies(conn, winner_id, loser_id)
-                self._remap_lineage(conn, winner_id, loser_id)
-                conn.execute("DELETE FROM researchers WHERE id = ?", (loser_id,))
-                conn.execute("DELETE FROM persons WHERE id = ?", (loser_id,))
+        if self._table_exists(conn, "proficiencies"):
+            self._merge_proficiencies(conn, winner_id, loser_id)
+        self._remap_lineage(conn, winner_id, loser_id)
+        if self._table_exists(conn, "person_name_keys"):
+            conn.execute(
+                "DELETE FROM person_name_keys WHERE person_id = ?",
+                (loser_id,),
+            )
+        conn.execute("DELETE FROM researchers WHERE id = ?", (loser_id,))
+        conn.execute("DELETE FROM persons WHERE id = ?", (loser_id,))
 
     def _merge_person_record(
         self, conn: sqlite3.Connection, winner_id: int, loser_id: int
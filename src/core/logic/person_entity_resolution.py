@@ -0,0 +1,393 @@
+"""
+Batch entity resolution for persons.
+
+`PersonConsolidator` only merges persons whose canonical names are identical.
+This job resolves the whole ``persons`` table in one pass:
+
+1. names are read from ``person_name_keys`` (refreshed first; a dry run only
+   reads them when current and normalizes in memory otherwise) and grouped into
+   blocks with the same keys `PersonMatcher` uses for fuzzy lookups;
+2. each block is scored at once with ``rapidfuzz.process.cdist`` and pairs
+   reaching the matcher's fuzzy cutoff become candidate links;
+3. links are applied best-score first to a union-find that refuses to join
+   components carrying different Lattes ids or strong identifications, so a
+   chain of similar names cannot merge known homonyms;
+4. every resulting cluster is merged into its best-scored member in one
+   transaction through `PersonConsolidator.consolidate_cluster`.
+"""
+
+import sqlite3
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+from rapidfuzz import fuzz, process
+
+from src.core.logic.person_consolidator import PersonConsolidator
+from src.core.logic.person_matcher import FUZZY_SCORE_CUTOFF, PersonMatcher
+from src.core.logic.person_name_keys import (
+    KEY_NORMALIZED,
+    person_name_keys_current,
+    sync_person_name_keys,
+)
+
+DEFAULT_MAX_BLOCK_SIZE = 2000
+
+
+class _UnionFind:
+    """Union-find over person positions that tracks the strong identifiers of
+    every component and refuses unions that would mix two of them."""
+
+    def __init__(self, lattes_ids: List[set], identifications: List[set]):
+        self._parent = list(range(len(lattes_ids)))
+        self._lattes_ids = lattes_ids
+        self._identifications = identifications
+
+    def find(self, position: int) -> int:
+        root = position
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[position] != root:
+            self._parent[position], position = root, self._parent[position]
+        return root
+
+    def union(self, left: int, right: int) -> Optional[bool]:
+        """Joins both components. Returns None when they were already joined
+        and False when their identifiers conflict."""
+        left_root, right_root = self.find(left), self.find(right)
+        if left_root == right_root:
+            return None
+        lattes_ids = self._lattes_ids[left_root] | self._lattes_ids[right_root]
+        identifications = (
+            self._identifications[left_root] | self._identifications[right_root]
+        )
+        if len(lattes_ids) > 1 or len(identifications) > 1:
+            return False
+        self._parent[right_root] = left_root
+        self._lattes_ids[left_root] = lattes_ids
+        self._identifications[left_root] = identifications
+        return True
+
+
+class PersonEntityResolver:
+    """Finds and merges clusters of duplicate persons in the SQLite database."""
+
+    def __init__(
+        self,
+        db_path: str = "db/horizon.db",
+        score_cutoff: float = FUZZY_SCORE_CUTOFF,
+        max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+    ):
+        self.db_path = db_path
+        self.score_cutoff = score_cutoff
+        self.max_block_size = max_block_size
+        self._consolidator = PersonConsolidator(db_path)
+
+    def run(self, dry_run: bool = False) -> Dict[str, Any]:
+        """Resolves the persons table and returns the job report.
+
+        With `dry_run` the clusters are reported but nothing is merged.
+        """
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+
+        step = time.perf_counter()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            # A dry run never writes, not even the derived name keys.
+            if not dry_run:
+                sync_person_name_keys(conn)
+            people = self._load_people(conn, person_name_keys_current(conn))
+        timings["load"] = time.perf_counter() - step
+
+        step = time.perf_counter()
+        blocks, oversized_blocks = self._build_blocks(people)
+        timings["blocking"] = time.perf_counter() - step
+
+        step = time.perf_counter()
+        links, candidate_pairs = self._score_blocks(people, blocks)
+        timings["scoring"] = time.perf_counter() - step
+
+        step = time.perf_counter()
+        clusters, rejected_links = self._cluster(people, links)
+        timings["clustering"] = time.perf_counter() - step
+
+        step = time.perf_counter()
+        with sqlite3.connect(self.db_path) as conn:
+            link_counts = self._load_link_counts(conn)
+        plans = [self._plan_cluster(cluster, link_counts) for cluster in clusters]
+        merged_records = 0
+        failed_clusters = 0
+        if not dry_run:
+            for plan in plans:
+                try:
+                    merged_records += self._consolidator.consolidate_cluster(
+                        plan["winner_id"], plan["loser_ids"]
+                    )
+                except Exception as e:
+                    failed_clusters += 1
+                    logger.warning(
+                        "Failed to merge cluster {} into {}: {}",
+                        plan["loser_ids"],
+                        plan["winner_id"],
+                        e,
+                    )
+        timings["merge"] = time.perf_counter() - step
+        timings["total"] = time.perf_counter() - started
+
+        cluster_sizes = Counter(len(plan["members"]) for plan in plans)
+        report = {
+            "db_path": self.db_path,
+            "dry_run": dry_run,
+            "persons": len(people),
+            "blocks": len(blocks),
+            "oversized_blocks": oversized_blocks,
+            "candidate_pairs": candidate_pairs,
+            "matched_pairs": len(links),
+            "rejected_links": rejected_links,
+            "clusters": len(plans),
+            "cluster_sizes": {
+                str(size): count for size, count in sorted(cluster_sizes.items())
+            },
+            "duplicate_records": sum(len(plan["loser_ids"]) for plan in plans),
+            "merged_records": merged_records,
+            "failed_clusters": failed_clusters,
+            "largest_clusters": sorted(
+                plans, key=lambda plan: (-len(plan["members"]), plan["winner_id"])
+            )[:20],
+            "timings_seconds": {
+                name: round(seconds, 3) for name, seconds in timings.items()
+            },
+        }
+        logger.info(
+            "Entity resolution: {} persons, {} clusters, {} duplicates in {:.2f}s",
+            report["persons"],
+            report["clusters"],
+            report["duplicate_records"],
+            timings["total"],
+        )
+        return report
+
+    def _load_people(
+        self, conn: sqlite3.Connection, stored_keys: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Persons with a normalized name, read from `person_name_keys` when
+        `stored_keys`, otherwise normalized in memory."""
+        if not stored_keys:
+            matcher = PersonMatcher(person_controller=None)
+            rows = conn.execute(
+                """
+                SELECT p.id, p.name, p.identification_id,
+                       r.cnpq_url, r.resume, r.citation_names
+                FROM persons p
+                LEFT JOIN researchers r ON r.id = p.id
+                ORDER BY p.id
+                """
+            ).fetchall()
+            people = []
+            for row in rows:
+                person = dict(row)
+                person["normalized_name"] = matcher.normalize_name(person["name"])
+                if person["normalized_name"]:
+                    people.append(person)
+            return people
+
+        rows = conn.execute(
+            """
+            SELECT p.id, p.name, p.identification_id, k.key AS normalized_name,
+                   r.cnpq_url, r.resume, r.citation_names
+            FROM persons p
+            LEFT JOIN person_name_keys k
+              ON k.person_id = p.id AND k.key_type = ?
+            LEFT JOIN researchers r ON r.id = p.id
+            ORDER BY p.id
+            """,
+            (KEY_NORMALIZED,),
+        ).fetchall()
+        return [dict(row) for row in rows if row["normalized_name"]]
+
+    def _build_blocks(
+        self, people: List[Dict[str, Any]]
+    ) -> Tuple[List[List[int]], int]:
+        """Groups person positions by `PersonMatcher` block keys.
+
+        Blocks larger than `max_block_size` (very common first names) are
+        split by first and last token; what is still too large is skipped.
+        """
+        blocks: Dict[str, List[int]] = {}
+        for position, person in enumerate(people):
+            for block_key in PersonMatcher._block_keys(person["normalized_name"]):
+                blocks.setdefault(block_key, []).append(position)
+
+        kept: List[List[int]] = []
+        oversized = 0
+        for block_key, positions in blocks.items():
+            if len(positions) < 2:
+                continue
+            if len(positions) <= self.max_block_size:
+                kept.append(positions)
+                continue
+            sub_blocks: Dict[Tuple[str, str], List[int]] = {}
+            for position in positions:
+                tokens = people[position]["normalized_name"].split()
+                sub_blocks.setdefault((tokens[0], tokens[-1]), []).append(position)
+            for sub_positions in sub_blocks.values():
+                if len(sub_positions) > self.max_block_size:
+                    oversized += 1
+                    logger.warning(
+                        "Skipping block '{}' with {} persons",
+                        block_key,
+                        len(sub_positions),
+                    )
+                elif len(sub_positions) > 1:
+                    kept.append(sub_positions)
+        return kept, oversized
+
+    def _score_blocks(
+        self, people: List[Dict[str, Any]], blocks: List[List[int]]
+    ) -> Tuple[List[Tuple[float, int, int]], int]:
+        """Scores every block with one `cdist` call.
+
+        Returns the distinct links as ``(score, left, right)`` sorted best
+        first, and the number of pairs that were scored.
+        """
+        links: Dict[Tuple[int, int], float] = {}
+        candidate_pairs = 0
+        for positions in blocks:
+            names = [people[position]["normalized_name"] for position in positions]
+            candidate_pairs += len(names) * (len(names) - 1) // 2
+            scores = process.cdist(
+                names,
+                names,
+                scorer=fuzz.token_sort_ratio,
+                score_cutoff=self.score_cutoff,
+                dtype=np.float32,
+                workers=-1,
+            )
+            rows, columns = np.nonzero(np.triu(scores >= self.score_cutoff, k=1))
+            for row, column in zip(rows.tolist(), columns.tolist()):
+                pair = (positions[row], positions[column])
+                if pair[0] > pair[1]:
+                    pair = (pair[1], pair[0])
+                links[pair] = float(scores[row, column])
+        ordered = sorted(
+            ((score, left, right) for (left, right), score in links.items()),
+            key=lambda link: (-link[0], link[1], link[2]),
+        )
+        return ordered, candidate_pairs
+
+    def _cluster(
+        self, people: List[Dict[str, Any]], links: List[Tuple[float, int, int]]
+    ) -> Tuple[List[List[int]], int]:
+        lattes_ids = []
+        identifications = []
+        for person in people:
+            lattes_ids.append(self._lattes_ids([person]))
+            identifications.append(
+                {(person.get("identification_id") or "").strip()}
+                if self._consolidator._has_strong_identification(person)
+                else set()
+            )
+
+        union_find = _UnionFind(lattes_ids, identifications)
+        rejected = 0
+        for _score, left, right in links:
+            if union_find.union(left, right) is False:
+                rejected += 1
+
+        components: Dict[int, List[int]] = {}
+        for position in range(len(people)):
+            components.setdefault(union_find.find(position), []).append(position)
+        clusters = [
+            [people[position] for position in positions]
+            for positions in components.values()
+            if len(positions) > 1
+        ]
+        return clusters, rejected
+
+    @staticmethod
+    def _lattes_ids(members: List[Dict[str, Any]]) -> set:
+        lattes_ids = set()
+        for member in members:
+            url = member.get("cnpq_url")
+            if url:
+                lattes_id = url.rstrip("/").rsplit("/", 1)[-1].strip()
+                if lattes_id:
+                    lattes_ids.add(lattes_id)
+        return lattes_ids
+
+    def _load_link_counts(self, conn: sqlite3.Connection) -> Dict[str, Dict[int, int]]:
+        """Per-person link counts used by the winner choice, one grouped
+        query per table instead of correlated subqueries per person."""
+        if self._consolidator._table_exists(conn, "advisorship_members"):
+            advisorship_sql = (
+                "SELECT person_id, COUNT(*) FROM advisorship_members GROUP BY person_id"
+            )
+        else:
+            advisorship_sql = """
+                SELECT person_id, COUNT(*) FROM (
+                    SELECT id, supervisor_id AS person_id FROM advisorships
+                    UNION SELECT id, student_id FROM advisorships
+                ) GROUP BY person_id
+            """
+        queries = {
+            "email_count": (
+                "SELECT person_id, COUNT(*) FROM person_emails GROUP BY person_id"
+            ),
+            "advisorship_count": advisorship_sql,
+            "team_member_count": (
+                "SELECT person_id, COUNT(*) FROM team_members GROUP BY person_id"
+            ),
+            "article_count": (
+                "SELECT researcher_id, COUNT(*) FROM article_authors "
+                "GROUP BY researcher_id"
+            ),
+            "education_count": """
+                SELECT person_id, COUNT(*) FROM (
+                    SELECT id, researcher_id AS person_id FROM academic_educations
+                    UNION SELECT id, advisor_id FROM academic_educations
+                    UNION SELECT id, co_advisor_id FROM academic_educations
+                ) GROUP BY person_id
+            """,
+        }
+        counts: Dict[str, Dict[int, int]] = {}
+        for field, sql in queries.items():
+            try:
+                counts[field] = {
+                    row[0]: row[1]
+                    for row in conn.execute(sql).fetchall()
+                    if row[0] is not None
+                }
+            except sqlite3.OperationalError as e:
+                logger.debug(f"Link count '{field}' unavailable: {e}")
+                counts[field] = {}
+        return counts
+
+    def _plan_cluster(
+        self, members: List[Dict[str, Any]], link_counts: Dict[str, Dict[int, int]]
+    ) -> Dict[str, Any]:
+        scored = []
+        for member in members:
+            record = {
+                key: value for key, value in member.items() if key != "normalized_name"
+            }
+            for field, counts in link_counts.items():
+                record[field] = counts.get(member["id"], 0)
+            scored.append(record)
+        ordered = sorted(
+            scored,
+            key=lambda item: (
+                self._consolidator._quality_score(item),
+                -int(item["id"]),
+            ),
+            reverse=True,
+        )
+        return {
+            "winner_id": int(ordered[0]["id"]),
+            "loser_ids": [int(item["id"]) for item in ordered[1:]],
+            "members": [
+                {"id": int(item["id"]), "name": item["name"]} for item in ordered
+            ],
+        }
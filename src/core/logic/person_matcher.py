@@ -1,12 +1,23 @@
-import re
-import unicodedata
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 from eo_lib import Person, PersonController
 from loguru import logger
-from thefuzz import fuzz, process
-
+from rapidfuzz import fuzz, process
+
+from src.core.logic.person_name_keys import (
+    KEY_CANONICAL,
+    KEY_NAME,
+    KEY_NORMALIZED,
+    load_person_name_keys,
+)
 from src.core.logic.pii_anonymizer import anonymize_email, is_anonymized_email
+from src.core.logic.text_normalization import normalize_person_name
+
+# token_sort_ratio scores are rounded before the >= 90 threshold, as thefuzz did.
+FUZZY_SCORE_CUTOFF = 89.5
+
+NAME_PARTICLES = {"DA", "DE", "DI", "DO", "DOS", "DAS", "DU", "DEL", "DELA"}
 
 
 class PersonMatcher:
@@ -28,20 +39,84 @@ class PersonMatcher:
         self._persons_cache: Dict[str, Person] = {}
         self._emails_cache: Dict[str, Person] = {}
         self._canonical_cache: Dict[str, Person] = {}
+        # Email keys involve two sha256 digests; memoized per raw email.
+        self._email_keys_memo: Dict[str, List[str]] = {}
+        self._reset_name_index()
+
+    def _reset_name_index(self) -> None:
+        # Normalized names are computed once per cached name: `_normalized_names`
+        # is the array scored by the fuzzy step, `_normalized_to_name` maps each
+        # normalized form back to the first raw name that produced it, and
+        # `_name_blocks` groups array positions by first/last token so a query
+        # is only scored against names sharing one of those tokens.
+        self._normalized_names: List[str] = []
+        self._normalized_to_name: Dict[str, str] = {}
+        self._name_blocks: Dict[str, List[int]] = {}
+
+    def _cache_name(
+        self, name: str, person: Person, normalized: Optional[str] = None
+    ) -> None:
+        """Registers `name` in the persons cache and the normalized-name index.
+
+        `normalized` may carry a precomputed `normalize_name(name)`.
+        """
+        is_new_name = name not in self._persons_cache
+        self._set_cached(self._persons_cache, name, person)
+        if not is_new_name:
+            return
+
+        if normalized is None:
+            normalized = self.normalize_name(name)
+        if normalized in self._normalized_to_name:
+            return
+        self._normalized_to_name[normalized] = name
+        if not normalized:
+            return
+
+        position = len(self._normalized_names)
+        self._normalized_names.append(normalized)
+        for block_key in self._block_keys(normalized):
+            self._name_blocks.setdefault(block_key, []).append(position)
+
+    @staticmethod
+    def _block_keys(normalized_name: str) -> set:
+        """Blocking keys for a normalized name.
+
+        The first and last tokens catch the usual "same name, small typo"
+        case; the first and last tokens of the sorted signature (particles
+        excluded) catch reordered surnames, which `token_sort_ratio` ignores.
+        """
+        tokens = normalized_name.split()
+        signature = sorted(token for token in tokens if token not in NAME_PARTICLES)
+        keys = {tokens[0], tokens[-1]}
+        if signature:
+            keys.update((signature[0], signature[-1]))
+        return keys
+
+    def _fuzzy_candidates(self, normalized_name: str) -> List[int]:
+        """Positions in `_normalized_names` that share a block with the input."""
+        positions = set()
+        for block_key in self._block_keys(normalized_name):
+            positions.update(self._name_blocks.get(block_key, ()))
+        return sorted(positions)
 
     def preload_cache(self):
         """
         Preloads the internal persons cache from the database.
 
         Fetches all persons and populates _persons_cache using their names
-        and _emails_cache using their emails.
+        and _emails_cache using their emails. Normalized and canonical names
+        are read from `person_name_keys` when the stored keys are current,
+        and computed otherwise.
         """
         logger.info("Pre-loading persons cache...")
         try:
             all_persons = self.person_controller.get_all()
+            name_keys = self._load_name_keys()
             self._persons_cache = {}
             self._emails_cache = {}
             self._canonical_cache = {}
+            self._reset_name_index()
             for p in all_persons:
                 if isinstance(p, dict):
                     name = p.get("name")
@@ -54,8 +129,13 @@ class PersonMatcher:
                         for e in (getattr(p, "emails", None) or [])
                     ]
                 if name:
-                    self._persons_cache[name] = p
-                    canonical_name = self.canonicalize_name(name)
+                    keys = name_keys.get(self._person_id(p), {})
+                    if keys.get(KEY_NAME) != name:
+                        keys = {}
+                    self._cache_name(name, p, keys.get(KEY_NORMALIZED))
+                    canonical_name = keys.get(KEY_CANONICAL)
+                    if canonical_name is None:
+                        canonical_name = self.canonicalize_name(name)
                     if canonical_name:
                         current = self._canonical_cache.get(canonical_name)
                         if current is None or self._person_quality_score(
@@ -71,6 +151,19 @@ class PersonMatcher:
         except Exception as e:
             logger.warning(f"Failed to preload persons cache: {e}")
 
+    def _load_name_keys(self) -> Dict[int, Dict[str, str]]:
+        try:
+            session = self.person_controller._service._repository._session
+        except AttributeError:
+            return {}
+        return load_person_name_keys(session, (KEY_NAME, KEY_NORMALIZED, KEY_CANONICAL))
+
+    @staticmethod
+    def _person_id(person: Any) -> Optional[int]:
+        if isinstance(person, dict):
+            return person.get("id")
+        return getattr(person, "id", None)
+
     def normalize_name(self, name: str) -> str:
         """
         Normalizes a name for consistent comparison.
@@ -85,21 +178,10 @@ class PersonMatcher:
 
         Returns:
             str: The normalized name string.
-        """
-        if not name:
-            return ""
-        # 1. Normalize Unicode (NFD) and remove accents
-        name_str = "".join(
-            c
-            for c in unicodedata.normalize("NFD", name)
-            if unicodedata.category(c) != "Mn"
-        )
-
-        # 2. Replace special characters with spaces and Uppercase
-        name_str = re.sub(r"[^A-Z\s]", " ", name_str.upper())
 
-        # 3. Trim and remove double spaces
-        return " ".join(name_str.split())
+        Results are memoized by `text_normalization.normalize_person_name`.
+        """
+        return normalize_person_name(name)
 
     def canonicalize_name(self, name: str) -> str:
         """Builds a stable comparison key for names."""
@@ -108,9 +190,8 @@ class PersonMatcher:
             return ""
 
         # Particles are preserved but normalized to a single representation
-        particles = {"DA", "DE", "DI", "DO", "DOS", "DAS", "DU", "DEL", "DELA"}
         tokens = [
-            token if token not in particles else token.lower()
+            token if token not in NAME_PARTICLES else token.lower()
             for token in normalized.split()
         ]
         return " ".join(tokens)
@@ -122,6 +203,10 @@ class PersonMatcher:
         raw email must also be looked up by its anonymized forms (hashed
         as-written and lowercased, since the hook does not normalize case).
         """
+        cached_keys = self._email_keys_memo.get(email)
+        if cached_keys is not None:
+            return cached_keys
+
         stripped = email.strip()
         keys = [stripped.lower()]
         if not is_anonymized_email(stripped):
@@ -131,13 +216,14 @@ class PersonMatcher:
             ):
                 if candidate and candidate not in keys:
                     keys.append(candidate)
+        self._email_keys_memo[email] = keys
         return keys
 
     def _register_email(self, email: Optional[str], person: Person) -> None:
         if not email:
             return
         for key in self._email_keys(email):
-            self._emails_cache[key] = person
+            self._set_cached(self._emails_cache, key, person)
 
     def _person_quality_score(self, person: Person) -> int:
         """Prefers the richer record when duplicates share the same canonical name."""
@@ -180,6 +266,101 @@ class PersonMatcher:
             if not email:
                 return None
 
+        person = self._match_cached(name, email, strict_match)
+        if person is not None:
+            return person
+
+        # 4. Create new person (if no match found)
+        name = name.strip() if name else ""
+        try:
+            emails = [email] if email else []
+            person = self.person_controller.create_person(name=name, emails=emails)
+            self._remember_created(name, email, person)
+            logger.debug(f"Created person: {name} (emails: {emails})")
+            return person
+        except Exception as e:
+            logger.warning(f"Failed to create person '{name}': {e}")
+            return None
+
+    def match_many(
+        self,
+        records: Iterable[Union[Dict[str, Any], Tuple[str, Optional[str]]]],
+        strict_match: bool = False,
+    ) -> List[Optional[Person]]:
+        """
+        Resolves a batch of people, returning the same matches as calling
+        `match_or_create` for each record in order.
+
+        Identical records are resolved once, the fuzzy step scores every
+        distinct unmatched name against the cache in a single
+        `rapidfuzz.process.cdist` call, and persons missing from the cache are
+        created at the end of the batch.
+
+        Args:
+            records: `{"name": ..., "email": ...}` dicts or `(name, email)` tuples.
+            strict_match (bool): Same policy as in `match_or_create`.
+
+        Returns:
+            List[Optional[Person]]: One entry per record, in input order.
+        """
+        keys = []
+        for record in records:
+            if isinstance(record, dict):
+                name, email = record.get("name"), record.get("email")
+            else:
+                name, email = record
+            keys.append(((name or "").strip(), email or None))
+
+        unique_keys = list(dict.fromkeys(keys))
+        cache_size = len(self._normalized_names)
+        precomputed = self._score_batch_against_cache(
+            [name for name, _email in unique_keys]
+        )
+
+        resolved: Dict[Tuple[str, Optional[str]], Any] = {}
+        pending: List[_PendingPerson] = []
+        for name, email in unique_keys:
+            if not name and not email:
+                resolved[(name, email)] = None
+                continue
+
+            normalized = self.normalize_name(name)
+            person = self._match_cached(
+                name,
+                email,
+                strict_match,
+                fuzzy_start=cache_size,
+                cached_best=precomputed.get(normalized),
+            )
+            if person is None:
+                person = _PendingPerson(name, [email] if email else [])
+                self._remember_created(name, email, person)
+                pending.append(person)
+            resolved[(name, email)] = person
+
+        created = self._create_persons(pending)
+        for placeholder, person in zip(pending, created):
+            placeholder.resolve(person)
+        for key, person in resolved.items():
+            if isinstance(person, _PendingPerson):
+                resolved[key] = person.person
+
+        return [resolved[key] for key in keys]
+
+    def _match_cached(
+        self,
+        name: Optional[str],
+        email: Optional[str],
+        strict_match: bool,
+        fuzzy_start: int = 0,
+        cached_best: Optional[Tuple[int, float]] = None,
+    ) -> Optional[Person]:
+        """Runs the lookup steps of `match_or_create` without creating anyone.
+
+        `match_many` scores names against the pre-batch cache up front; it
+        passes that result as `cached_best` and only names registered from
+        position `fuzzy_start` onwards are scored here.
+        """
         # 1. Match by Email first (highest priority)
         if email:
             for email_key in self._email_keys(email):
@@ -196,7 +377,7 @@ class PersonMatcher:
         if canonical_input and canonical_input in self._canonical_cache:
             person = self._canonical_cache[canonical_input]
             self._register_email(email, person)
-            self._persons_cache[name] = person
+            self._cache_name(name, person)
             return person
 
         # 1.6 Exact raw-name match.
@@ -206,54 +387,153 @@ class PersonMatcher:
             return person
 
         # 2. Exact Match in Cache (Normalized)
-        for cached_name, person in self._persons_cache.items():
-            norm_cached = self.normalize_name(cached_name)
-            if norm_cached == normalized_input:
-                self._persons_cache[name] = person
-                self._register_email(email, person)
-                return person
-
-        # 3. Fuzzy Matching in Cache
-        names_in_cache = list(self._persons_cache.keys())
-        if names_in_cache and normalized_input:
-            normalized_to_original = {self.normalize_name(n): n for n in names_in_cache}
-            normalized_list = list(normalized_to_original.keys())
-
-            best_norm_match, score = process.extractOne(
-                normalized_input, normalized_list, scorer=fuzz.token_sort_ratio
-            )
-
-            # Threshold of 90%
-            if score >= 90:
-                # If strict match is enabled, we only accept 100% score (same tokens)
-                if strict_match and score < 100:
-                    logger.debug(
-                        f"Fuzzy match '{best_norm_match}' ignored due to strict matching policy (score: {score})"
-                    )
-                else:
-                    original_name = normalized_to_original[best_norm_match]
-                    logger.info(
-                        f"Fuzzy match found: '{name}' matches '{original_name}' (score: {score})"
-                    )
-                    person = self._persons_cache[original_name]
-                    self._persons_cache[name] = person
-                    self._register_email(email, person)
-                    return person
-
-        # 4. Create new person (if no match found)
-        try:
-            emails = [email] if email else []
-            person = self.person_controller.create_person(name=name, emails=emails)
-            self._persons_cache[name] = person
-            if canonical_input:
-                current = self._canonical_cache.get(canonical_input)
-                if current is None or self._person_quality_score(
-                    person
-                ) > self._person_quality_score(current):
-                    self._canonical_cache[canonical_input] = person
+        if normalized_input in self._normalized_to_name:
+            person = self._persons_cache[self._normalized_to_name[normalized_input]]
+            self._cache_name(name, person)
             self._register_email(email, person)
-            logger.debug(f"Created person: {name} (emails: {emails})")
             return person
-        except Exception as e:
-            logger.warning(f"Failed to create person '{name}': {e}")
+
+        # 3. Fuzzy Matching in Cache, restricted to the input's blocks
+        if not normalized_input:
             return None
+        best = cached_best
+        candidates = [
+            position
+            for position in self._fuzzy_candidates(normalized_input)
+            if position >= fuzzy_start
+        ]
+        if candidates:
+            match = process.extractOne(
+                normalized_input,
+                [self._normalized_names[position] for position in candidates],
+                scorer=fuzz.token_sort_ratio,
+                score_cutoff=FUZZY_SCORE_CUTOFF,
+            )
+            # Earlier positions win ties, as in a single extractOne call.
+            if match is not None and (best is None or match[1] > best[1]):
+                best = (candidates[match[2]], match[1])
+
+        # Threshold of 90% (scores are rounded like thefuzz did)
+        if best is None:
+            return None
+        best_norm_match = self._normalized_names[best[0]]
+        score = int(round(best[1]))
+        # If strict match is enabled, we only accept 100% score (same tokens)
+        if strict_match and score < 100:
+            logger.debug(
+                f"Fuzzy match '{best_norm_match}' ignored due to strict matching policy (score: {score})"
+            )
+            return None
+
+        original_name = self._normalized_to_name[best_norm_match]
+        logger.info(
+            f"Fuzzy match found: '{name}' matches '{original_name}' (score: {score})"
+        )
+        person = self._persons_cache[original_name]
+        self._cache_name(name, person)
+        self._register_email(email, person)
+        return person
+
+    def _score_batch_against_cache(
+        self, names: List[str]
+    ) -> Dict[str, Tuple[int, float]]:
+        """Best blocked fuzzy candidate in the current cache for each name.
+
+        All distinct names that no exact lookup can resolve are scored in one
+        `cdist` call against the union of their blocks; each row is then
+        restricted to the name's own blocks so the result matches what
+        `match_or_create` would pick.
+        """
+        queries: Dict[str, List[int]] = {}
+        for name in names:
+            normalized = self.normalize_name(name)
+            if (
+                not normalized
+                or normalized in queries
+                or normalized in self._normalized_to_name
+                or self.canonicalize_name(name) in self._canonical_cache
+            ):
+                continue
+            candidates = self._fuzzy_candidates(normalized)
+            if candidates:
+                queries[normalized] = candidates
+        if not queries:
+            return {}
+
+        columns = sorted({position for cands in queries.values() for position in cands})
+        column_of = {position: column for column, position in enumerate(columns)}
+        scores = process.cdist(
+            list(queries),
+            [self._normalized_names[position] for position in columns],
+            scorer=fuzz.token_sort_ratio,
+            score_cutoff=FUZZY_SCORE_CUTOFF,
+            dtype=np.float64,
+            workers=-1,
+        )
+
+        best: Dict[str, Tuple[int, float]] = {}
+        for row, (normalized, candidates) in enumerate(queries.items()):
+            row_scores = scores[row, [column_of[position] for position in candidates]]
+            index = int(np.argmax(row_scores))
+            if row_scores[index] >= FUZZY_SCORE_CUTOFF:
+                best[normalized] = (candidates[index], float(row_scores[index]))
+        return best
+
+    def _remember_created(
+        self, name: str, email: Optional[str], person: Person
+    ) -> None:
+        self._cache_name(name, person)
+        canonical_input = self.canonicalize_name(name)
+        if canonical_input:
+            current = self._canonical_cache.get(canonical_input)
+            if current is None or self._person_quality_score(
+                person
+            ) > self._person_quality_score(current):
+                self._set_cached(self._canonical_cache, canonical_input, person)
+        self._register_email(email, person)
+
+    @staticmethod
+    def _set_cached(cache: Dict[str, Any], key: str, person: Any) -> None:
+        cache[key] = person
+        if isinstance(person, _PendingPerson):
+            person.cache_refs.append((cache, key))
+
+    def _create_persons(
+        self, pending: List["_PendingPerson"]
+    ) -> List[Optional[Person]]:
+        """Creates the pending persons through the controller, as
+        `match_or_create` does, so emails are stored and anonymized the
+        same way; None for a person whose creation fails."""
+        created = []
+        for item in pending:
+            try:
+                created.append(
+                    self.person_controller.create_person(
+                        name=item.name, emails=item.emails
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Failed to create person '{item.name}': {e}")
+                created.append(None)
+        return created
+
+
+class _PendingPerson:
+    """Placeholder cached by `match_many` until its person is created."""
+
+    def __init__(self, name: str, emails: List[str]):
+        self.name = name
+        self.emails = emails
+        self.person: Optional[Person] = None
+        self.cache_refs: List[Tuple[Dict[str, Any], str]] = []
+
+    def resolve(self, person: Optional[Person]) -> None:
+        """Swaps the placeholder for the created person in every cache entry."""
+        self.person = person
+        for cache, key in self.cache_refs:
+            if cache.get(key) is not self:
+                continue
+            if person is None:
+                del cache[key]
+            else:
+                cache[key] = person
@@ -0,0 +1,244 @@
+"""
+Persisted name keys for persons.
+
+Every consumer that groups or matches people by name (matcher preload,
+duplicate consolidation, duplicate audit) used to recompute the same
+normalizations for the whole ``persons`` table on every run. The
+``person_name_keys`` table stores them once per person:
+
+- ``name``: the raw name the other keys were derived from, so stale rows are
+  found in SQL by comparing it with ``persons.name``;
+- ``normalized``: ``PersonMatcher.normalize_name``;
+- ``canonical``: ``PersonMatcher.canonicalize_name`` (consolidation groups);
+- ``text``: ``initiative_identity.normalize_text`` (duplicate audit groups);
+- ``version``: PERSON_NAME_KEYS_VERSION when the keys were computed. Bump it
+  whenever one of the normalizations above changes, so every stored key is
+  treated as stale and recomputed.
+
+The schema migrations fill the table for the persons already stored. ORM
+writes keep it current through an after_flush hook registered via
+install_person_name_key_hooks(); writes made outside the ORM are picked up by
+sync_person_name_keys(). Read-only consumers check
+person_name_keys_current() and compute the keys in memory when it is False.
+"""
+
+import sqlite3
+import weakref
+from typing import Dict, Iterable, List, Tuple
+
+from loguru import logger
+from sqlalchemy import bindparam, event, inspect, text
+from sqlalchemy.orm import Session
+
+from src.core.logic.initiative_identity import normalize_text
+
+PERSON_NAME_KEYS_TABLE = "person_name_keys"
+
+KEY_NAME = "name"
+KEY_NORMALIZED = "normalized"
+KEY_CANONICAL = "canonical"
+KEY_TEXT = "text"
+KEY_VERSION = "version"
+
+PERSON_NAME_KEYS_VERSION = "1"
+
+CREATE_TABLE_SQL = (
+    "CREATE TABLE IF NOT EXISTS person_name_keys ("
+    "person_id INTEGER NOT NULL REFERENCES persons(id) ON DELETE CASCADE, "
+    "key_type TEXT NOT NULL, "
+    "key TEXT NOT NULL, "
+    "PRIMARY KEY (person_id, key_type))"
+)
+CREATE_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS ix_person_name_keys_type_key "
+    "ON person_name_keys (key_type, key)"
+)
+INSERT_SQL = (
+    "INSERT INTO person_name_keys (person_id, key_type, key) "
+    "VALUES (:person_id, :key_type, :key)"
+)
+DELETE_SQL = "DELETE FROM person_name_keys WHERE person_id = :person_id"
+# Persons whose keys are missing, were derived from another name or by
+# another normalization version.
+STALE_PERSONS_SQL = """
+    SELECT p.id, p.name
+    FROM persons p
+    LEFT JOIN person_name_keys k
+      ON k.person_id = p.id AND k.key_type = 'name'
+    LEFT JOIN person_name_keys v
+      ON v.person_id = p.id AND v.key_type = 'version'
+    WHERE k.key IS NULL
+       OR k.key IS NOT COALESCE(p.name, '')
+       OR v.key IS NOT :version
+"""
+
+_installed = False
+_matcher = None
+# Engine -> whether it has the person_name_keys table, checked once.
+_table_present: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _person_matcher():
+    # Imported lazily: person_matcher reads this table in preload_cache.
+    global _matcher
+    if _matcher is None:
+        from src.core.logic.person_matcher import PersonMatcher
+
+        _matcher = PersonMatcher(person_controller=None)
+    return _matcher
+
+
+def compute_person_name_keys(name: str) -> Dict[str, str]:
+    """Returns every persisted key type for `name`; empty keys are omitted."""
+    matcher = _person_matcher()
+    keys = {
+        KEY_NAME: name or "",
+        KEY_NORMALIZED: matcher.normalize_name(name),
+        KEY_CANONICAL: matcher.canonicalize_name(name),
+        KEY_TEXT: normalize_text(name),
+        KEY_VERSION: PERSON_NAME_KEYS_VERSION,
+    }
+    return {
+        key_type: key for key_type, key in keys.items() if key or key_type == KEY_NAME
+    }
+
+
+def _key_rows(people: Iterable[Tuple[int, str]]) -> List[dict]:
+    return [
+        {"person_id": person_id, "key_type": key_type, "key": key}
+        for person_id, name in people
+        for key_type, key in compute_person_name_keys(name).items()
+    ]
+
+
+def load_person_name_keys(
+    session, key_types: Iterable[str]
+) -> Dict[int, Dict[str, str]]:
+    """Loads persisted keys as ``{person_id: {key_type: key}}``.
+
+    Returns an empty mapping when the table does not exist yet or cannot be
+    read, so callers fall back to computing keys themselves. Persons whose
+    keys were computed by another normalization version are left out.
+    """
+    try:
+        if not inspect(session.get_bind()).has_table(PERSON_NAME_KEYS_TABLE):
+            return {}
+        rows = session.execute(
+            text(
+                "SELECT person_id, key_type, key FROM person_name_keys "
+                "WHERE key_type IN :key_types"
+            ).bindparams(bindparam("key_types", expanding=True)),
+            {"key_types": list(set(key_types) | {KEY_VERSION})},
+        ).fetchall()
+    except Exception as e:
+        logger.debug(f"Person name keys unavailable: {e}")
+        return {}
+
+    keys: Dict[int, Dict[str, str]] = {}
+    for person_id, key_type, key in rows:
+        keys.setdefault(int(person_id), {})[key_type] = key
+    return {
+        person_id: person_keys
+        for person_id, person_keys in keys.items()
+        if person_keys.get(KEY_VERSION) == PERSON_NAME_KEYS_VERSION
+    }
+
+
+def person_name_keys_current(conn: sqlite3.Connection) -> bool:
+    """Whether the table exists and holds current keys for every person.
+    Read-only: nothing is created or refreshed."""
+    has_table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (PERSON_NAME_KEYS_TABLE,),
+    ).fetchone()
+    if not has_table:
+        return False
+    stale = conn.execute(
+        f"SELECT EXISTS ({STALE_PERSONS_SQL})",
+        {"version": PERSON_NAME_KEYS_VERSION},
+    ).fetchone()[0]
+    return not stale
+
+
+def sync_person_name_keys(conn: sqlite3.Connection) -> int:
+    """Creates the table if needed and refreshes keys of persons whose stored
+    ``name`` key is missing or differs from ``persons.name``, or whose keys
+    were computed by another normalization version. Returns the number of
+    persons refreshed. Commits its own work."""
+    with conn:
+        conn.execute(CREATE_TABLE_SQL)
+        conn.execute(CREATE_INDEX_SQL)
+        return refresh_person_name_keys(conn)
+
+
+def refresh_person_name_keys(conn: sqlite3.Connection) -> int:
+    """The refresh of sync_person_name_keys() on an existing table, inside
+    the caller's transaction. Returns the number of persons refreshed."""
+    conn.execute(
+        "DELETE FROM person_name_keys WHERE person_id NOT IN (SELECT id FROM persons)"
+    )
+    stale = conn.execute(
+        STALE_PERSONS_SQL, {"version": PERSON_NAME_KEYS_VERSION}
+    ).fetchall()
+    if stale:
+        conn.executemany(DELETE_SQL, [{"person_id": row[0]} for row in stale])
+        conn.executemany(INSERT_SQL, _key_rows((row[0], row[1]) for row in stale))
+        logger.info(f"Refreshed name keys for {len(stale)} persons")
+    return len(stale)
+
+
+def _is_person(obj: object) -> bool:
+    mapper = getattr(inspect(obj, raiseerr=False), "mapper", None)
+    return mapper is not None and any(
+        getattr(table, "name", None) == "persons" for table in mapper.tables
+    )
+
+
+def _name_changed(obj: object) -> bool:
+    return inspect(obj).attrs.name.history.has_changes()
+
+
+def _has_table(connection) -> bool:
+    engine = connection.engine
+    present = _table_present.get(engine)
+    if present is None:
+        try:
+            present = inspect(connection).has_table(PERSON_NAME_KEYS_TABLE)
+        except Exception:
+            present = False
+        _table_present[engine] = present
+    return present
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    changed = [
+        obj
+        for obj in list(session.new) + list(session.dirty)
+        if _is_person(obj) and _name_changed(obj)
+    ]
+    deleted = [obj for obj in session.deleted if _is_person(obj)]
+    if not changed and not deleted:
+        return
+
+    connection = session.connection()
+    if not _has_table(connection):
+        return
+
+    stale_ids = [
+        {"person_id": obj.id}
+        for obj in changed + deleted
+        if getattr(obj, "id", None) is not None
+    ]
+    if stale_ids:
+        connection.execute(text(DELETE_SQL), stale_ids)
+    rows = _key_rows((obj.id, obj.name) for obj in changed if obj.id is not None)
+    if rows:
+        connection.execute(text(INSERT_SQL), rows)
+
+
+def install_person_name_key_hooks() -> None:
+    global _installed
+    if _installed:
+        return
+    event.listen(Session, "after_flush", _after_flush)
+    _installed = True
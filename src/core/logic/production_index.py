@@ -0,0 +1,132 @@
+"""
+Run-scoped natural-key index of the research productions in the database.
+
+Lattes technical productions and patents used to be deduplicated with one
+``research_productions`` query per item and linked to their author with one
+controller call (and commit) per item. A ProductionIndex loads every
+production by its natural key (production type, title, year), every
+production-author pair and the production types once, so the ingestion
+only inserts what is new, in bulk, and counts per production type how
+many items were inserted and how many were already present.
+
+Inside ``production_index_scope()`` one index is shared by the whole run
+and its counters are logged at the end; outside a scope
+``get_production_index()`` returns a fresh index.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import text
+
+PRODUCTIONS_SQL = text(
+    "SELECT id, production_type_id, title, year FROM research_productions"
+)
+PRODUCTION_AUTHORS_SQL = text(
+    "SELECT production_id, researcher_id FROM production_authors"
+)
+
+ProductionKey = Tuple[Any, str, Optional[int]]
+
+
+class ProductionIndex:
+    def __init__(self):
+        self.loaded = False
+        self._by_key: Dict[ProductionKey, int] = {}
+        self._authors: Set[Tuple[int, int]] = set()
+        self._type_ids: Optional[Dict[str, Any]] = None
+        # (production_type, "inserted" | "deduplicated") -> items
+        self.counts: Counter = Counter()
+        self.authors_linked = 0
+
+    def load(self, session: Any) -> "ProductionIndex":
+        """Reads the productions and their authors once; later calls are no-ops."""
+        if self.loaded:
+            return self
+        for production_id, type_id, title, year in session.execute(PRODUCTIONS_SQL):
+            self._by_key.setdefault((type_id, title, year), production_id)
+        self._authors.update(
+            (production_id, researcher_id)
+            for production_id, researcher_id in session.execute(PRODUCTION_AUTHORS_SQL)
+        )
+        self.loaded = True
+        return self
+
+    def production_type_ids(self, type_ctrl: Any) -> Dict[str, Any]:
+        """Production type name -> id, read with `type_ctrl` on first use.
+        Callers add the types they create."""
+        if self._type_ids is None:
+            self._type_ids = {}
+            for production_type in type_ctrl.get_all():
+                name = getattr(production_type, "name", None)
+                if name:
+                    self._type_ids[name] = production_type.id
+        return self._type_ids
+
+    def find(self, key: ProductionKey) -> Optional[int]:
+        return self._by_key.get(key)
+
+    def add(self, production_id: int, key: ProductionKey) -> None:
+        self._by_key.setdefault(key, production_id)
+
+    def has_author(self, production_id: int, researcher_id: int) -> bool:
+        return (production_id, researcher_id) in self._authors
+
+    def add_author(self, production_id: int, researcher_id: int) -> None:
+        self._authors.add((production_id, researcher_id))
+        self.authors_linked += 1
+
+    def count(self, production_type: str, outcome: str, items: int = 1) -> None:
+        self.counts[(production_type, outcome)] += items
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Per production type: items inserted and items already present."""
+        types = sorted({production_type for production_type, _ in self.counts})
+        return {
+            production_type: {
+                "inserted": self.counts[(production_type, "inserted")],
+                "deduplicated": self.counts[(production_type, "deduplicated")],
+            }
+            for production_type in types
+        }
+
+
+_current_production_index: ContextVar[Optional[ProductionIndex]] = ContextVar(
+    "current_production_index", default=None
+)
+
+
+def get_production_index(session: Any) -> ProductionIndex:
+    """The loaded index of the active scope, or a freshly loaded one."""
+    index = _current_production_index.get() or ProductionIndex()
+    return index.load(session)
+
+
+@contextmanager
+def production_index_scope(label: str = "run") -> Iterator[ProductionIndex]:
+    """Shares one ProductionIndex with everything running inside the block
+    and logs its counters. Nested scopes reuse the outer index."""
+    active = _current_production_index.get()
+    if active is not None:
+        yield active
+        return
+
+    index = ProductionIndex()
+    token = _current_production_index.set(index)
+    try:
+        yield index
+    finally:
+        _current_production_index.reset(token)
+        summary = index.summary()
+        logger.info(
+            "Production index ({}): {} inserted, {} deduplicated, {} author "
+            "links added {}",
+            label,
+            sum(item["inserted"] for item in summary.values()),
+            sum(item["deduplicated"] for item in summary.values()),
+            index.authors_linked,
+            summary,
+        )
@@ -1,34 +1,116 @@
-from typing import Any, Dict, Optional
-import pandas as pd
-from loguru import logger
-from sqlalchemy import text
+import os
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
 
-from eo_lib import (
-    Initiative,
-    InitiativeController,
-    PersonController,
-    TeamController,
-)
+from eo_lib import Initiative, InitiativeController, PersonController, TeamController
+from loguru import logger
 from research_domain import (
     CampusController,
     KnowledgeAreaController,
     ResearchGroupController,
 )
+
 # Workaround: Import directly from controllers module since not exported in __init__
 from research_domain.controllers.controllers import (
     AdvisorshipController,
     FellowshipController,
 )
 from research_domain.domain.entities import Advisorship
+from sqlalchemy import DateTime, bindparam, text
 
-from src.core.logic.person_matcher import PersonMatcher
-from src.core.logic.team_synchronizer import TeamSynchronizer
 from src.core.logic.entity_manager import EntityManager
+from src.core.logic.initiative_handlers import (
+    AdvisorshipHandler,
+    StandardProjectHandler,
+)
 from src.core.logic.initiative_identity import get_existing_initiative_identity
-from src.core.logic.initiative_handlers import StandardProjectHandler, AdvisorshipHandler
 from src.core.logic.initiative_linker import InitiativeLinker
+from src.core.logic.initiative_name_index import initiative_name_index_scope
+from src.core.logic.person_matcher import PersonMatcher
+from src.core.logic.sigpesq_sheet_cache import read_sigpesq_excel
+from src.core.logic.team_synchronizer import TeamSynchronizer
+from src.core.logic.unit_of_work import UnitOfWork, controller_session
 from src.tracking.recorder import tracking_recorder
 
+# Rows committed together by process_records. Opt-in: 0 (the default) keeps
+# the controllers' commit per write; both modes log their rows/s.
+DEFAULT_PROJECT_LOADER_BATCH_SIZE = int(os.getenv("PROJECT_LOADER_BATCH_SIZE", "0"))
+
+# Parent statuses derived from dates; others (e.g. "Recusado", "Salvo") are kept.
+DATE_DERIVED_STATUSES = ("Unknown", "Active", "Concluded", "Aprovado")
+
+# Every parent initiative with the date range of its advisorships.
+PARENT_CHILD_DATES_SQL = text(
+    """
+    SELECT
+        p.id AS parent_id,
+        p.start_date,
+        p.end_date,
+        p.status,
+        MIN(i.start_date) AS min_start,
+        MAX(i.end_date) AS max_end
+    FROM advisorships a
+    JOIN initiatives i ON a.id = i.id
+    JOIN initiatives p ON p.id = i.parent_id
+    GROUP BY p.id, p.start_date, p.end_date, p.status
+"""
+)
+
+UPDATE_PARENT_DATES_SQL = text(
+    """
+    UPDATE initiatives
+    SET start_date = :start_date, end_date = :end_date, status = :status
+    WHERE id = :parent_id
+"""
+).bindparams(
+    bindparam("start_date", type_=DateTime()),
+    bindparam("end_date", type_=DateTime()),
+)
+
+
+def _as_datetime(value: Any) -> Optional[Any]:
+    """Dates as read from the database (SQLite returns raw strings)."""
+    if not value:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value
+    if isinstance(value, str):
+        for parse in (
+            datetime.fromisoformat,
+            lambda v: datetime.strptime(v, "%Y-%m-%d %H:%M:%S.%f"),
+            lambda v: datetime.strptime(v, "%Y-%m-%d %H:%M:%S"),
+        ):
+            try:
+                return parse(value)
+            except ValueError:
+                pass
+    return None
+
+
+def recalculate_parent_dates_and_status(
+    start_date: Optional[Any],
+    end_date: Optional[Any],
+    status: Optional[str],
+    min_start: Optional[Any],
+    max_end: Optional[Any],
+    now: datetime,
+) -> tuple:
+    """
+    (start_date, end_date, status) of a parent given its children's range.
+    Dates only widen (earliest start, latest end); a date-derived status
+    becomes "Concluded" once the resulting end date is past, else "Active".
+    """
+    if min_start and (not start_date or min_start < start_date):
+        start_date = min_start
+    if max_end and (not end_date or max_end > end_date):
+        end_date = max_end
+    if end_date and status in DATE_DERIVED_STATUSES:
+        past = (
+            end_date < now if isinstance(end_date, datetime) else end_date < now.date()
+        )
+        status = "Concluded" if past else "Active"
+    return start_date, end_date, status
+
 
 class ProjectLoader:
     """
@@ -36,34 +118,48 @@ class ProjectLoader:
     Delegates specific tasks to specialized handlers, managers, and linkers.
     """
 
-    def __init__(self, mapping_strategy):
+    def __init__(
+        self,
+        mapping_strategy=None,
+        batch_size: Optional[int] = None,
+        reuse_caches: bool = False,
+    ):
         self.mapping_strategy = mapping_strategy
-        
+        self.batch_size = (
+            DEFAULT_PROJECT_LOADER_BATCH_SIZE if batch_size is None else batch_size
+        )
+        # With reuse_caches, one loader serves a whole run (e.g. one Lattes
+        # CV per process_records call): initiatives and persons are loaded
+        # on the first call and kept current as rows are created.
+        self.reuse_caches = reuse_caches
+        self._existing_initiatives: Optional[tuple] = None
+        self._persons_preloaded = False
+
         # Controllers
         self.controller = InitiativeController()
         self.person_controller = PersonController()
         self.team_controller = TeamController()
         self.rg_controller = ResearchGroupController()
         self.adv_controller = AdvisorshipController()
-        
+
         # Service/Logic Classes
         self.entity_manager = EntityManager(self.controller, self.person_controller)
         self.person_matcher = PersonMatcher(self.person_controller)
-        
+
         # Initialize Roles and Cache
         roles_cache = self.entity_manager.ensure_roles()
-        
+
         self.team_synchronizer = TeamSynchronizer(self.team_controller, roles_cache)
-        
+
         self.linker = InitiativeLinker(
             initiative_controller=self.controller,
             rg_controller=self.rg_controller,
             team_controller=self.team_controller,
             person_matcher=self.person_matcher,
             team_synchronizer=self.team_synchronizer,
-            entity_manager=self.entity_manager
+            entity_manager=self.entity_manager,
         )
-        
+
         # Handlers registry
         self.handlers = {
             Initiative: StandardProjectHandler(self.controller),
@@ -71,9 +167,11 @@ class ProjectLoader:
                 self.controller, self.person_matcher, self.entity_manager
             ),
         }
-        
+
         # Ensure base environment
-        self.initiative_type = self.entity_manager.ensure_initiative_type("Research Project")
+        self.initiative_type = self.entity_manager.ensure_initiative_type(
+            "Research Project"
+        )
         self.org_id = self.entity_manager.ensure_organization()
 
     def process_file(self, file_path: str) -> None:
@@ -83,178 +181,170 @@ class ProjectLoader:
         logger.info(f"Processing Projects from: {file_path}")
 
         try:
-            df = pd.read_excel(file_path)
+            df = read_sigpesq_excel(file_path)
             df = df.fillna("")
         except Exception as e:
             logger.error(f"Failed to read Excel file {file_path}: {e}")
             return
-            
-        records = df.to_dict('records')
+
+        records = df.to_dict("records")
         self.process_records(records, source_file=file_path)
 
     def process_records(
-        self, records: list[Dict[str, Any]], source_file: Optional[str] = None
-    ) -> None:
+        self,
+        records: list[Dict[str, Any]],
+        source_file: Optional[str] = None,
+        mapping_strategy=None,
+    ) -> Dict[str, int]:
         """
         Maps a list of raw dictionary records and orchestrates the UPSERT logic across handlers and linkers.
+        `mapping_strategy`, when given, replaces the loader's strategy from this call on.
+        Returns the row stats; "failed" counts the rows skipped because of an error.
         """
-        logger.info("Fetching existing initiatives for UPSERT...")
-        existing_initiatives = self.controller.get_all()
-        existing_by_name = {init.name: init for init in existing_initiatives if getattr(init, "name", None)}
-        existing_by_identity = {}
-        for init in existing_initiatives:
-            identity = get_existing_initiative_identity(init)
-            if identity:
-                existing_by_identity[identity] = init
+        if mapping_strategy is not None:
+            self.mapping_strategy = mapping_strategy
+        existing_by_name, existing_by_identity = self._load_existing_initiatives()
 
-        self.person_matcher.preload_cache()
+        if not (self.reuse_caches and self._persons_preloaded):
+            self.person_matcher.preload_cache()
+            self._persons_preloaded = True
         initial_persons_count = len(self.person_matcher._persons_cache)
 
-        stats = {"created": 0, "updated": 0, "skipped": 0, "teams": 0}
-
-        for row_dict in records:
-            try:
-                self._process_row(
-                    row_dict,
-                    existing_by_name,
-                    existing_by_identity,
-                    stats,
-                    source_file=source_file,
-                )
-            except Exception as e:
-                logger.warning(f"Skipping row due to error: {e}")
-                stats["skipped"] += 1
-                self._rollback_session()
+        stats = {
+            "created": 0,
+            "updated": 0,
+            "skipped": 0,
+            "failed": 0,
+            "unchanged": 0,
+            "teams": 0,
+        }
 
-        new_persons_count = len(self.person_matcher._persons_cache) - initial_persons_count
+        # Rows are committed in batches, with a savepoint per row. Team
+        # memberships are applied before every batch commit when they share
+        # the staged session, else in one flush for the whole file; a failed
+        # membership flush raises, so no row of it is tracked as applied.
+        uow = UnitOfWork(self._staged_sessions(), max(self.batch_size, 1))
+        name_scope = initiative_name_index_scope(source_file or "records")
+        with (
+            name_scope as name_index,
+            uow,
+            self.team_synchronizer.batch() as memberships,
+        ):
+            if uow.session is not None and memberships.session is uow.session:
+                uow.join(memberships)
+            for row_dict in records:
+                if self.reuse_caches and not self._persons_preloaded:
+                    existing_by_name, existing_by_identity = (
+                        self._load_existing_initiatives()
+                    )
+                    self.person_matcher.preload_cache()
+                    self._persons_preloaded = True
+                membership_checkpoint = memberships.checkpoint()
+                try:
+                    with uow.row():
+                        self._process_row(
+                            row_dict,
+                            existing_by_name,
+                            existing_by_identity,
+                            stats,
+                            source_file=source_file,
+                        )
+                except Exception as e:
+                    logger.warning(f"Skipping row due to error: {e}")
+                    stats["skipped"] += 1
+                    stats["failed"] += 1
+                    self._rollback_session()
+                    memberships.rollback_to(membership_checkpoint)
+                    # The rolled back row may have registered names, and
+                    # initiatives or persons in the run-wide caches.
+                    name_index.invalidate()
+                    if self.reuse_caches:
+                        self._existing_initiatives = None
+                        self._persons_preloaded = False
+        uow.log_summary(f"Loaded {source_file or 'records'}")
+
+        new_persons_count = (
+            len(self.person_matcher._persons_cache) - initial_persons_count
+        )
         logger.info(
             f"Ingestion complete: {stats['created']} created, {stats['updated']} updated, "
-            f"{stats['skipped']} skipped | {stats['teams']} teams, {new_persons_count} new persons"
+            f"{stats['skipped']} skipped, {stats['unchanged']} unchanged | "
+            f"{stats['teams']} teams, {new_persons_count} new persons"
         )
+        return stats
+
+    def _load_existing_initiatives(self) -> tuple:
+        """(existing_by_name, existing_by_identity); read once per loader
+        when caches are reused, since _process_row registers what it creates."""
+        if self.reuse_caches and self._existing_initiatives is not None:
+            return self._existing_initiatives
+
+        logger.info("Fetching existing initiatives for UPSERT...")
+        existing_initiatives = self.controller.get_all()
+        existing_by_name = {
+            init.name: init
+            for init in existing_initiatives
+            if getattr(init, "name", None)
+        }
+        existing_by_identity = {}
+        for init in existing_initiatives:
+            identity = get_existing_initiative_identity(init)
+            if identity:
+                existing_by_identity[identity] = init
+        if self.reuse_caches:
+            self._existing_initiatives = (existing_by_name, existing_by_identity)
+        return existing_by_name, existing_by_identity
 
     def recalculate_all_parent_statuses(self) -> None:
         """
         Recalculates start_date, end_date, and status for ALL parent research projects
         based on the persisted advisorships in the database.
         This fixes orphans and ensures consistency across all years.
+
+        Set-based: one GROUP BY reads every parent with its children's date
+        range, the rules run in memory, and the changed parents are written
+        with a single executemany UPDATE.
         """
-        logger.info("Recalculating dates and status for all parent projects from Database...")
-        
-        from sqlalchemy import text
-        from datetime import datetime, date
-        
-        session = self.controller._service._repository._session
-        
-        # Aggregate dates for all parents that have advisorships
-        query = text("""
-            SELECT 
-                i.parent_id,
-                MIN(i.start_date) as min_start,
-                MAX(i.end_date) as max_end
-            FROM advisorships a
-            JOIN initiatives i ON a.id = i.id
-            WHERE i.parent_id IS NOT NULL
-            GROUP BY i.parent_id
-        """)
-        
-        results = session.execute(query).fetchall()
-        
-        processed_count = 0
-        updated_count = 0
-        
-        def ensure_datetime(val):
-            if not val:
-                 return None
-            if isinstance(val, (datetime, date)):
-                 return val
-            if isinstance(val, str):
-                 try:
-                     # Attempt generic ISO
-                     return datetime.fromisoformat(val)
-                 except ValueError:
-                     pass
-                 try:
-                     # Attempt common SQL format
-                     return datetime.strptime(val, "%Y-%m-%d %H:%M:%S.%f")
-                 except ValueError:
-                     pass
-                 try:
-                     return datetime.strptime(val, "%Y-%m-%d %H:%M:%S")
-                 except ValueError:
-                     pass
-            return None
-        
-        for row in results:
-            parent_id = row.parent_id
-            min_start = ensure_datetime(row.min_start)
-            max_end = ensure_datetime(row.max_end)
-            
-            if not parent_id:
-                continue
-                
-            processed_count += 1
-            
-            # Determine status
-            status = "Unknown"
-            new_status = "Active"
-            if max_end:
-                 # Check if max_end is in the past
-                 # Ensure max_end is comparable (datetime)
-                 target_date = max_end
-                 if hasattr(max_end, 'date'): # datetime object
-                     target_date = max_end
-                 elif isinstance(max_end, str):
-                     try:
-                         target_date = datetime.fromisoformat(max_end)
-                     except:
-                         pass
-                 
-                 if isinstance(target_date, datetime):
-                     if target_date < datetime.now():
-                         new_status = "Concluded"
-                 elif hasattr(target_date, 'year'): # date object
-                     if target_date < datetime.now().date():
-                         new_status = "Concluded"
-
-            # Fetch parent initiative to check if update is needed
-            parent = self.controller.get_by_id(parent_id)
-            if not parent:
-                continue
-                
-            # Check if any change is needed
-            # Note: We need to handle potential None/types mismatch for comparison or just update
-            # Since this is a bulk fix operation, we can just update if distinct
-            
-            needs_update = False
-            
-            # Non-destructive update for start_date: only if earlier than current
-            if min_start and (not parent.start_date or min_start < parent.start_date):
-                 parent.start_date = min_start
-                 needs_update = True
-                 
-            # Non-destructive update for end_date: only if later than current
-            if max_end and (not parent.end_date or max_end > parent.end_date):
-                 parent.end_date = max_end
-                 needs_update = True
-            
-            # Recalculate status based on the RESULTING end_date (if it was "Unknown" or "Active/Concluded")
-            if parent.end_date:
-                # Map Concluded/Active based on time
-                # We skip updating status if it's something like "Recusado" or "Salvo"
-                if parent.status in ["Unknown", "Active", "Concluded", "Aprovado"]:
-                    calculated_status = "Active"
-                    if parent.end_date < datetime.now():
-                        calculated_status = "Concluded"
-                    
-                    if parent.status != calculated_status:
-                        parent.status = calculated_status
-                        needs_update = True
-            
-            if needs_update:
-                self.controller.update(parent)
-                updated_count += 1
-        
-        logger.info(f"Recalculation complete. Processed {processed_count} parents, updated {updated_count}.")
+        logger.info(
+            "Recalculating dates and status for all parent projects from Database..."
+        )
+
+        session = controller_session(self.controller)
+        if session is None:
+            logger.warning(
+                "No database session available; parent statuses not recalculated."
+            )
+            return
+
+        rows = session.execute(PARENT_CHILD_DATES_SQL).fetchall()
+        now = datetime.now()
+        changes = []
+        for row in rows:
+            current = (
+                _as_datetime(row.start_date),
+                _as_datetime(row.end_date),
+                row.status,
+            )
+            recalculated = recalculate_parent_dates_and_status(
+                *current, _as_datetime(row.min_start), _as_datetime(row.max_end), now
+            )
+            if recalculated != current:
+                start_date, end_date, status = recalculated
+                changes.append(
+                    {
+                        "parent_id": row.parent_id,
+                        "start_date": start_date,
+                        "end_date": end_date,
+                        "status": status,
+                    }
+                )
+
+        if changes:
+            session.execute(UPDATE_PARENT_DATES_SQL, changes)
+        session.commit()
+        logger.info(
+            f"Recalculation complete. Processed {len(rows)} parents, updated {len(changes)}."
+        )
 
     def _process_row(
         self,
@@ -276,12 +366,26 @@ class ProjectLoader:
         identity_key = project_data.get("identity_key")
         model_class = project_data.get("model_class", Initiative)
         handler = self.handlers.get(model_class, self.handlers[Initiative])
+        source_entity_type = (
+            "advisorship" if model_class is Advisorship else "initiative"
+        )
+        # The same project read from another researcher's CV maps to other
+        # members, so the context is part of the key.
+        source_key = identity_key or title
+        tracking_context = self.mapping_strategy.tracking_context()
+        if tracking_context:
+            source_key = f"{source_key}|{tracking_context}"
+        if tracking_recorder.is_unchanged(
+            source_entity_type=source_entity_type,
+            source_record_id=source_key,
+            payload=row_dict,
+        ):
+            stats["unchanged"] += 1
+            return
         source_record = tracking_recorder.record_source_record(
-            source_entity_type=(
-                "advisorship" if model_class is Advisorship else "initiative"
-            ),
+            source_entity_type=source_entity_type,
             payload=row_dict,
-            source_record_id=identity_key or title,
+            source_record_id=source_key,
             source_file=source_file,
             source_path=source_file,
         )
@@ -299,24 +403,26 @@ class ProjectLoader:
                 identity_key=parent_identity,
                 title=parent_title,
             )
-            
+
             if not parent_initiative:
                 # Create parent via Standard Handler
                 logger.info(f"Creating parent Research Project: {parent_title}")
-                
+
                 # Ensure we have the "Research Project" type for the parent
-                res_proj_type = self.entity_manager.ensure_initiative_type("Research Project")
-                
+                res_proj_type = self.entity_manager.ensure_initiative_type(
+                    "Research Project"
+                )
+
                 # Initial creation without dates - will be fixed by recalculate_all_parent_statuses
                 parent_initiative = self.handlers[Initiative].create_or_update(
                     project_data={
                         "title": parent_title,
-                        "status": "Unknown" # Temporary
+                        "status": "Unknown",  # Temporary
                     },
                     existing_initiative=None,
                     initiative_type_name="Research Project",
                     initiative_type_id=res_proj_type.id,
-                    organization_id=self.org_id
+                    organization_id=self.org_id,
                 )
                 self._register_existing_initiative(
                     existing_by_name=existing_by_name,
@@ -324,10 +430,12 @@ class ProjectLoader:
                     initiative=parent_initiative,
                     model_class=Initiative,
                 )
-                parent_identity_resolved = get_existing_initiative_identity(parent_initiative)
+                parent_identity_resolved = get_existing_initiative_identity(
+                    parent_initiative
+                )
                 if parent_identity_resolved:
                     existing_by_identity[parent_identity_resolved] = parent_initiative
-            
+
             parent_id = parent_initiative.id
 
         # 3. UPSERT Initiative
@@ -344,19 +452,21 @@ class ProjectLoader:
             initiative_type_name=self.initiative_type.name,
             initiative_type_id=self.initiative_type.id,
             organization_id=self.org_id,
-            parent_id=parent_id
+            parent_id=parent_id,
         )
 
         if not existing:
             stats["created"] += 1
-            if initiative: 
+            if initiative:
                 self._register_existing_initiative(
                     existing_by_name=existing_by_name,
                     title=title,
                     initiative=initiative,
                     model_class=model_class,
                 )
-                resolved_identity = get_existing_initiative_identity(initiative) or identity_key
+                resolved_identity = (
+                    get_existing_initiative_identity(initiative) or identity_key
+                )
                 if resolved_identity:
                     existing_by_identity[resolved_identity] = initiative
         else:
@@ -368,14 +478,42 @@ class ProjectLoader:
                     initiative=initiative,
                     model_class=model_class,
                 )
-                resolved_identity = get_existing_initiative_identity(initiative) or identity_key
+                resolved_identity = (
+                    get_existing_initiative_identity(initiative) or identity_key
+                )
                 if resolved_identity:
                     existing_by_identity[resolved_identity] = initiative
 
+        # 3.5 Link Advisorship members to Parent Project
+        if parent_id and parent_initiative:
+            self.linker.add_members_to_initiative_team(parent_initiative, project_data)
+
+        # 4. Linkages
         if initiative:
-            canonical_entity_type = (
-                "advisorship" if model_class is Advisorship else "initiative"
+            # Team synchronization
+            self.linker.create_initiative_team(initiative, project_data)
+            stats["teams"] += 1
+
+            # Research Group linkage
+            rg_name = project_data.get("research_group_name")
+            if rg_name and isinstance(rg_name, str) and rg_name.strip():
+                self.linker.link_research_group(
+                    initiative,
+                    rg_name,
+                    project_data,
+                    project_data.get("campus_name"),
+                    self.org_id,
+                )
+
+            # Knowledge Areas / Keywords
+            self.linker.associate_keyword_knowledge_areas(
+                initiative, project_data, rg_name
             )
+
+        # Tracked once the row is fully applied: the match is what lets the
+        # change gate skip an unchanged row on later runs.
+        if initiative:
+            canonical_entity_type = source_entity_type
             tracking_recorder.record_entity_match(
                 source_record_id=getattr(source_record, "id", None),
                 canonical_entity_type=canonical_entity_type,
@@ -405,33 +543,20 @@ class ProjectLoader:
                 canonical_entity_type=canonical_entity_type,
                 canonical_entity_id=initiative.id,
                 operation="create" if not existing else "update",
-                changed_fields=[key for key, value in tracked_attrs.items() if value not in (None, [], "")],
-                before={"existing_initiative_id": getattr(existing, "id", None)} if existing else None,
+                changed_fields=[
+                    key
+                    for key, value in tracked_attrs.items()
+                    if value not in (None, [], "")
+                ],
+                before=(
+                    {"existing_initiative_id": getattr(existing, "id", None)}
+                    if existing
+                    else None
+                ),
                 after={"initiative_id": initiative.id, **tracked_attrs},
                 reason=f"{self.mapping_strategy.__class__.__name__} applied",
             )
 
-        # 3.5 Link Advisorship members to Parent Project
-        if parent_id and parent_initiative:
-            self.linker.add_members_to_initiative_team(parent_initiative, project_data)
-
-        # 4. Linkages
-        if initiative:
-            # Team synchronization
-            self.linker.create_initiative_team(initiative, project_data)
-            stats["teams"] += 1
-
-            # Research Group linkage
-            rg_name = project_data.get("research_group_name")
-            if rg_name and isinstance(rg_name, str) and rg_name.strip():
-                self.linker.link_research_group(
-                    initiative, rg_name, project_data, 
-                    project_data.get("campus_name"), self.org_id
-                )
-
-            # Knowledge Areas / Keywords
-            self.linker.associate_keyword_knowledge_areas(initiative, project_data, rg_name)
-
     def _resolve_existing_initiative(
         self,
         *,
@@ -523,11 +648,39 @@ class ProjectLoader:
 
     def _is_approved(self, row_dict: Dict[str, Any]) -> bool:
         parecer = row_dict.get("ParecerDiretoria", "Aprovado")
-        if isinstance(parecer, str) and parecer.strip() and "aprovado" not in parecer.lower():
-            logger.info(f"Skipping project '{row_dict.get('Título', 'Unknown')}' - Not Approved")
+        if (
+            isinstance(parecer, str)
+            and parecer.strip()
+            and "aprovado" not in parecer.lower()
+        ):
+            logger.info(
+                f"Skipping project '{row_dict.get('Título', 'Unknown')}' - Not Approved"
+            )
             return False
         return True
 
+    def _staged_sessions(self) -> List[Any]:
+        """Sessions process_records stages; none (commit per write) when
+        batching is disabled or the controllers do not share one session,
+        since rows staged in one session are invisible to the others."""
+        if self.batch_size <= 0:
+            return []
+        sessions = []
+        for ctrl in (
+            self.controller,
+            self.person_controller,
+            self.team_controller,
+            self.rg_controller,
+            self.adv_controller,
+        ):
+            session = controller_session(ctrl)
+            if session is not None and all(session is not s for s in sessions):
+                sessions.append(session)
+        if len(sessions) > 1:
+            logger.warning("Controllers use separate sessions; committing every write")
+            return []
+        return sessions
+
     def _rollback_session(self):
         try:
             self.controller._service._repository._session.rollback()
@@ -0,0 +1,216 @@
+"""
+Run-scoped cache of small reference tables.
+
+Ingestion resolves organizations, campuses, knowledge areas, roles, teams and
+research groups by name for every source row, and each lookup used to call
+``controller.get_all()``. Inside ``reference_data_scope()`` every table is
+loaded once per run; lookups by id or normalized name are served from dicts
+and rows created by the pipeline are added with ``ReferenceDataCache.add``.
+
+Outside a scope ``get_reference_data()`` returns a throwaway cache, so every
+lookup reads the table again exactly as before.
+"""
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.logic.initiative_identity import normalize_text
+
+ORGANIZATIONS = "organizations"
+CAMPUSES = "campuses"
+KNOWLEDGE_AREAS = "knowledge_areas"
+ROLES = "roles"
+TEAMS = "teams"
+RESEARCH_GROUPS = "research_groups"
+
+KeyFunction = Callable[[Any], str]
+
+
+def _field(entity: Any, field: str) -> Any:
+    if isinstance(entity, dict):
+        return entity.get(field)
+    return getattr(entity, field, None)
+
+
+class _ReferenceTable:
+    def __init__(self, entities: List[Any]):
+        self.entities = list(entities)
+        self._indexes: Dict[Tuple[str, KeyFunction], Dict[str, List[int]]] = {}
+
+    def index(self, field: str, key: KeyFunction) -> Dict[str, List[int]]:
+        index = self._indexes.get((field, key))
+        if index is None:
+            index = {}
+            for position, entity in enumerate(self.entities):
+                self._index_entity(index, position, entity, field, key)
+            self._indexes[(field, key)] = index
+        return index
+
+    def add(self, entity: Any) -> None:
+        position = len(self.entities)
+        self.entities.append(entity)
+        for (field, key), index in self._indexes.items():
+            self._index_entity(index, position, entity, field, key)
+
+    @staticmethod
+    def _index_entity(index, position, entity, field, key) -> None:
+        value = _field(entity, field)
+        if not value:
+            return
+        try:
+            normalized = key(value)
+        except Exception:
+            return
+        index.setdefault(normalized, []).append(position)
+
+
+class ReferenceDataCache:
+    """In-memory copy of reference tables, loaded on first use per kind."""
+
+    def __init__(self):
+        self._tables: Dict[str, _ReferenceTable] = {}
+        self.loads: Counter = Counter()
+        self.hits: Counter = Counter()
+        self.added: Counter = Counter()
+
+    def _table(self, kind: str, controller: Any) -> _ReferenceTable:
+        table = self._tables.get(kind)
+        if table is None:
+            table = _ReferenceTable(controller.get_all() or [])
+            self._tables[kind] = table
+            self.loads[kind] += 1
+        else:
+            self.hits[kind] += 1
+        return table
+
+    def all(self, kind: str, controller: Any) -> List[Any]:
+        """Every cached row of `kind`, in `get_all()` order."""
+        return list(self._table(kind, controller).entities)
+
+    def find(
+        self,
+        kind: str,
+        controller: Any,
+        *,
+        key: KeyFunction = normalize_text,
+        where: Optional[Callable[[Any], bool]] = None,
+        **field_values: Any,
+    ) -> Optional[Any]:
+        """First row (in `get_all()` order) whose `key`-normalized field equals
+        the normalized value for any of `field_values` and satisfies `where`.
+
+        ``find(CAMPUSES, ctrl, name="Serra")`` matches ``normalize_text``
+        names; a tuple of values matches any of them, and `key` selects
+        another normalization.
+        """
+        table = self._table(kind, controller)
+        positions = set()
+        for field, values in field_values.items():
+            if not isinstance(values, (list, tuple, set)):
+                values = (values,)
+            index = table.index(field, key)
+            for value in values:
+                if value:
+                    positions.update(index.get(key(value), ()))
+        for position in sorted(positions):
+            entity = table.entities[position]
+            if where is None or where(entity):
+                return entity
+        return None
+
+    def get_by_id(self, kind: str, controller: Any, entity_id: Any) -> Optional[Any]:
+        table = self._table(kind, controller)
+        positions = table.index("id", str).get(str(entity_id), ())
+        return table.entities[positions[0]] if positions else None
+
+    def add(self, kind: str, entity: Any) -> None:
+        """Registers a row created by the pipeline; ignored until `kind` is loaded."""
+        table = self._tables.get(kind)
+        if table is not None and entity is not None:
+            table.add(entity)
+            self.added[kind] += 1
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        if kind is None:
+            self._tables.clear()
+        else:
+            self._tables.pop(kind, None)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per kind: tables loaded, lookups served from memory, rows added."""
+        kinds = set(self.loads) | set(self.hits) | set(self.added)
+        return {
+            kind: {
+                "loads": self.loads[kind],
+                "cached_lookups": self.hits[kind],
+                "added": self.added[kind],
+            }
+            for kind in sorted(kinds)
+        }
+
+
+_current_reference_data: ContextVar[Optional[ReferenceDataCache]] = ContextVar(
+    "current_reference_data", default=None
+)
+
+
+def get_reference_data() -> ReferenceDataCache:
+    """The cache of the active scope, or a throwaway one outside any scope."""
+    return _current_reference_data.get() or ReferenceDataCache()
+
+
+class QueryCounter:
+    """Counts SQL statements sent by any SQLAlchemy engine while active."""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _before_cursor_execute(self, *_args, **_kwargs) -> None:
+        with self._lock:
+            self.count += 1
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        event.remove(Engine, "before_cursor_execute", self._before_cursor_execute)
+
+
+@contextmanager
+def reference_data_scope(label: str = "run") -> Iterator[ReferenceDataCache]:
+    """Shares one ReferenceDataCache with everything running inside the block
+    and logs how many table reads it saved and how many SQL statements ran.
+
+    Nested scopes reuse the outer cache.
+    """
+    active = _current_reference_data.get()
+    if active is not None:
+        yield active
+        return
+
+    cache = ReferenceDataCache()
+    token = _current_reference_data.set(cache)
+    try:
+        with QueryCounter() as queries:
+            yield cache
+    finally:
+        _current_reference_data.reset(token)
+        stats = cache.stats()
+        logger.info(
+            "Reference data cache ({}): {} SQL statements, {} table loads, "
+            "{} get_all() calls avoided {}",
+            label,
+            queries.count,
+            sum(item["loads"] for item in stats.values()),
+            sum(item["cached_lookups"] for item in stats.values()),
+            stats,
+        )
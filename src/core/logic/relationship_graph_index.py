@@ -0,0 +1,243 @@
+"""On-disk adjacency index for the people relationship graph.
+
+The full ``people_relationship_graph.json`` has to be parsed entirely before a
+single neighbourhood can be inspected. This module writes a CSR-style
+(compressed sparse row) copy of the same graph next to it, made of flat
+fixed-width binary arrays that are memory-mapped at query time:
+
+- ``node_ids.bin``: person ids sorted ascending (int64);
+- ``offsets.bin``: ``node_count + 1`` offsets into the neighbour arrays (int64);
+- ``neighbors.bin``: neighbour positions in ``node_ids``, sorted per row (int64);
+- ``edge_weights.bin``: edge weight aligned with ``neighbors.bin`` (int64);
+- ``edge_relations.bin``: relation-type bitmask aligned with ``neighbors.bin``
+  (uint8, see ``RELATION_BITS``).
+
+Looking a person up is a binary search over ``node_ids`` and expanding one hop
+reads a contiguous slice of the neighbour arrays, so k-hop ego networks only
+touch the pages they need.
+"""
+
+import json
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import networkx as nx
+
+from src.core.logic.atomic_io import atomic_write_bytes, atomic_write_json
+
+INDEX_DIRECTORY = "people_relationship_graph_index"
+INDEX_FORMAT_VERSION = 1
+
+RELATION_BITS = {
+    "initiative": 1,
+    "research_group": 2,
+    "advisorship": 4,
+}
+
+_ARRAY_FILES = {
+    "node_ids": ("node_ids.bin", "q"),
+    "offsets": ("offsets.bin", "q"),
+    "neighbors": ("neighbors.bin", "q"),
+    "edge_weights": ("edge_weights.bin", "q"),
+    "edge_relations": ("edge_relations.bin", "B"),
+}
+
+
+def write_relationship_graph_index(graph: nx.Graph, output_dir: str) -> dict[str, Any]:
+    """Write the adjacency index of `graph` into `output_dir/INDEX_DIRECTORY`."""
+    index_dir = os.path.join(output_dir, INDEX_DIRECTORY)
+
+    node_ids = sorted(int(node_id) for node_id in graph.nodes)
+    position_by_id = {node_id: position for position, node_id in enumerate(node_ids)}
+
+    arrays = {name: array(typecode) for name, (_f, typecode) in _ARRAY_FILES.items()}
+    arrays["node_ids"].extend(node_ids)
+    arrays["offsets"].append(0)
+
+    for node_id in node_ids:
+        for neighbor_id in sorted(int(neighbor) for neighbor in graph.adj[node_id]):
+            attrs = graph[node_id][neighbor_id]
+            relation_mask = 0
+            for relation_type, bit in RELATION_BITS.items():
+                if attrs.get(f"{relation_type}_count", 0) > 0:
+                    relation_mask |= bit
+            arrays["neighbors"].append(position_by_id[neighbor_id])
+            arrays["edge_weights"].append(int(attrs.get("weight", 0)))
+            arrays["edge_relations"].append(relation_mask)
+        arrays["offsets"].append(len(arrays["neighbors"]))
+
+    for name, (filename, _typecode) in _ARRAY_FILES.items():
+        atomic_write_bytes(os.path.join(index_dir, filename), arrays[name].tobytes())
+
+    manifest = {
+        "format_version": INDEX_FORMAT_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "byteorder": sys.byteorder,
+        "node_count": len(node_ids),
+        "edge_count": graph.number_of_edges(),
+        "relation_bits": RELATION_BITS,
+        "arrays": {
+            name: {"file": filename, "typecode": typecode}
+            for name, (filename, typecode) in _ARRAY_FILES.items()
+        },
+    }
+    manifest_path = os.path.join(index_dir, "manifest.json")
+    atomic_write_json(manifest_path, manifest)
+
+    return {
+        "index_directory": index_dir,
+        "manifest_path": manifest_path,
+        "nodes": manifest["node_count"],
+        "edges": manifest["edge_count"],
+    }
+
+
+class RelationshipGraphIndex:
+    """Read-only, memory-mapped view over an index written by
+    `write_relationship_graph_index`."""
+
+    def __init__(self, index_dir: str):
+        manifest_path = os.path.join(index_dir, "manifest.json")
+        with open(manifest_path, "r", encoding="utf-8") as file_handle:
+            self.manifest = json.load(file_handle)
+
+        if self.manifest.get("format_version") != INDEX_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported relationship graph index version in {manifest_path}"
+            )
+        if self.manifest.get("byteorder") != sys.byteorder:
+            raise ValueError(
+                f"Relationship graph index {index_dir} was written with "
+                f"{self.manifest.get('byteorder')} byte order"
+            )
+
+        self._mmaps: list[mmap.mmap] = []
+        self._arrays: dict[str, memoryview] = {}
+        for name, spec in self.manifest["arrays"].items():
+            self._arrays[name] = self._map_array(
+                os.path.join(index_dir, spec["file"]), spec["typecode"]
+            )
+
+    def close(self) -> None:
+        for view in self._arrays.values():
+            view.release()
+        self._arrays = {}
+        for mapped in self._mmaps:
+            mapped.close()
+        self._mmaps = []
+
+    def __enter__(self) -> "RelationshipGraphIndex":
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def _map_array(self, path: str, typecode: str) -> memoryview:
+        with open(path, "rb") as file_handle:
+            if os.fstat(file_handle.fileno()).st_size == 0:
+                return memoryview(b"").cast(typecode)
+            mapped = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mmaps.append(mapped)
+        return memoryview(mapped).cast(typecode)
+
+    def _position(self, person_id: int) -> Optional[int]:
+        node_ids = self._arrays["node_ids"]
+        position = bisect_left(node_ids, person_id)
+        if position < len(node_ids) and node_ids[position] == person_id:
+            return position
+        return None
+
+    def _relation_types(self, relation_mask: int) -> list[str]:
+        return [
+            relation_type
+            for relation_type, bit in RELATION_BITS.items()
+            if relation_mask & bit
+        ]
+
+    def neighbors(self, person_id: int) -> list[dict[str, Any]]:
+        """Return the direct neighbours of `person_id` with edge attributes."""
+        position = self._position(person_id)
+        if position is None:
+            return []
+        node_ids = self._arrays["node_ids"]
+        start, end = self._arrays["offsets"][position : position + 2]
+        return [
+            {
+                "id": node_ids[self._arrays["neighbors"][slot]],
+                "weight": self._arrays["edge_weights"][slot],
+                "relation_types": self._relation_types(
+                    self._arrays["edge_relations"][slot]
+                ),
+            }
+            for slot in range(start, end)
+        ]
+
+    def ego_network(self, person_id: int, hops: int = 2) -> dict[str, Any]:
+        """Return the `hops`-hop ego network around `person_id`.
+
+        Nodes carry their hop distance from the centre; edges are every edge
+        between two nodes of the ego network, each reported once.
+        """
+        if hops < 0:
+            raise ValueError("hops must be non-negative")
+
+        center = self._position(person_id)
+        if center is None:
+            return {"center": person_id, "hops": hops, "nodes": [], "edges": []}
+
+        offsets = self._arrays["offsets"]
+        neighbors = self._arrays["neighbors"]
+        distances = {center: 0}
+        frontier = [center]
+        for hop in range(1, hops + 1):
+            next_frontier = []
+            for position in frontier:
+                for slot in range(offsets[position], offsets[position + 1]):
+                    neighbor = neighbors[slot]
+                    if neighbor not in distances:
+                        distances[neighbor] = hop
+                        next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        node_ids = self._arrays["node_ids"]
+        weights = self._arrays["edge_weights"]
+        relations = self._arrays["edge_relations"]
+        edges = []
+        for position in sorted(distances):
+            for slot in range(offsets[position], offsets[position + 1]):
+                neighbor = neighbors[slot]
+                if neighbor <= position or neighbor not in distances:
+                    continue
+                edges.append(
+                    {
+                        "source": node_ids[position],
+                        "target": node_ids[neighbor],
+                        "weight": weights[slot],
+                        "relation_types": self._relation_types(relations[slot]),
+                    }
+                )
+
+        return {
+            "center": person_id,
+            "hops": hops,
+            "nodes": [
+                {"id": node_ids[position], "hop": distance}
+                for position, distance in sorted(
+                    distances.items(), key=lambda item: (item[1], node_ids[item[0]])
+                )
+            ],
+            "edges": edges,
+        }
+
+
+def query_ego_network(index_dir: str, person_id: int, hops: int = 2) -> dict[str, Any]:
+    """Open the index at `index_dir` and return the ego network of `person_id`."""
+    with RelationshipGraphIndex(index_dir) as index:
+        return index.ego_network(person_id, hops=hops)
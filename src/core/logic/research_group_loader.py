@@ -10,6 +10,7 @@ from research_domain import (
 )
 from src.core.logic.initiative_identity import normalize_text
 from src.core.logic.pii_anonymizer import anonymize_person_data
+from src.core.logic.sigpesq_sheet_cache import read_sigpesq_excel
 from src.tracking.recorder import tracking_recorder
 
 from .strategies.base import (
@@ -125,7 +126,7 @@ class ResearchGroupLoader:
         logger.info(f"Processing Research Groups from: {file_path}")
 
         try:
-            df = pd.read_excel(file_path)
+            df = read_sigpesq_excel(file_path)
         except Exception as e:
             logger.error(f"Failed to read Excel: {e}")
             return
@@ -1,15 +1,156 @@
-from typing import Any, Iterable, Optional
+import re
+from collections import defaultdict
+from typing import Any, Iterable, Optional, Union
 
 from loguru import logger
 from sqlalchemy import text
 
 from src.adapters.sources.lattes_parser import LattesParser
+from src.core.logic.pii_anonymizer import anonymize_email
 from src.core.logic.researcher_creation import create_researcher_with_resume_fallback
 from src.research_domain_compat import AdvisorshipRole
 
+_DIGIT_RUN_RE = re.compile(r"\d+")
+
+
+class ResearcherResolutionIndex:
+    """Per-run lookup index over the researcher table.
+
+    Researchers are bucketed by Lattes identifiers (``brand_id``,
+    ``identification_id`` and digit runs of ``cnpq_url``), casefolded name,
+    normalized name key and anonymized email, so resolving a curriculum only
+    scores the researchers sharing one of its keys. Linked-data counts used as
+    tie-breakers are loaded for every researcher in one grouped query the first
+    time they are needed, so a whole Lattes directory resolves with a constant
+    number of queries.
+    """
+
+    def __init__(self, researchers: Iterable[Any] = (), session: Any = None):
+        self.session = session
+        self.researchers: list[Any] = []
+        self._positions: dict[int, int] = {}
+        self._parser = LattesParser()
+        self._by_lattes_id: dict[str, list[Any]] = defaultdict(list)
+        self._by_casefold_name: dict[str, list[Any]] = defaultdict(list)
+        self._by_name_key: dict[str, list[Any]] = defaultdict(list)
+        self._by_email: dict[str, list[Any]] = defaultdict(list)
+        self._linked_data_counts: Optional[dict[int, int]] = None
+        for researcher in researchers:
+            self.add(researcher)
+
+    @classmethod
+    def ensure(
+        cls,
+        researchers: Union["ResearcherResolutionIndex", Iterable[Any]],
+        session=None,
+    ) -> "ResearcherResolutionIndex":
+        if isinstance(researchers, cls):
+            if session is not None and researchers.session is None:
+                researchers.session = session
+            return researchers
+        return cls(researchers, session=session)
+
+    def add(self, researcher: Any) -> None:
+        """Registers a researcher created or loaded after the index was built."""
+        self._positions[id(researcher)] = len(self.researchers)
+        self.researchers.append(researcher)
+        self._index_keys(researcher)
+
+    def reindex(self, researcher: Any) -> None:
+        """Re-buckets a researcher whose name, identifiers or e-mails changed,
+        keeping its position; unknown researchers are added."""
+        if id(researcher) not in self._positions:
+            self.add(researcher)
+            return
+        for buckets in (
+            self._by_lattes_id,
+            self._by_casefold_name,
+            self._by_name_key,
+            self._by_email,
+        ):
+            for key in list(buckets):
+                kept = [item for item in buckets[key] if item is not researcher]
+                if kept:
+                    buckets[key] = kept
+                else:
+                    del buckets[key]
+        self._index_keys(researcher)
+
+    def _index_keys(self, researcher: Any) -> None:
+        lattes_keys = set()
+        for attr in ("brand_id", "identification_id"):
+            value = getattr(researcher, attr, None)
+            if value:
+                lattes_keys.add(str(value).casefold())
+        lattes_keys.update(_cnpq_url_digit_runs(getattr(researcher, "cnpq_url", None)))
+        for key in lattes_keys:
+            self._by_lattes_id[key].append(researcher)
+
+        name = getattr(researcher, "name", None) or ""
+        if name:
+            self._by_casefold_name[name.casefold()].append(researcher)
+            self._by_name_key[self._parser.normalize_title(name)].append(researcher)
+
+        for email in self._emails_of(researcher):
+            self._by_email[email].append(researcher)
+
+    def __iter__(self):
+        return iter(self.researchers)
+
+    def __len__(self) -> int:
+        return len(self.researchers)
+
+    @staticmethod
+    def _emails_of(researcher: Any) -> list[str]:
+        emails = []
+        for item in getattr(researcher, "emails", None) or []:
+            email = getattr(item, "email", item)
+            if isinstance(email, str) and email.strip():
+                emails.append(anonymize_email(email.strip()))
+        return emails
+
+    def candidates(
+        self,
+        *,
+        lattes_id: Optional[str] = None,
+        name: Optional[str] = None,
+        emails: Optional[Iterable[str]] = None,
+    ) -> list[Any]:
+        """Researchers sharing at least one key, in insertion order."""
+        buckets = []
+        if lattes_id:
+            buckets.append(self._by_lattes_id.get(str(lattes_id).casefold(), []))
+        if name:
+            buckets.append(self._by_casefold_name.get(name.casefold(), []))
+            buckets.append(
+                self._by_name_key.get(self._parser.normalize_title(name), [])
+            )
+        for email in emails or []:
+            if not email or not email.strip():
+                continue
+            stripped = email.strip()
+            for key in {anonymize_email(stripped), anonymize_email(stripped.lower())}:
+                buckets.append(self._by_email.get(key, []))
+
+        seen = set()
+        found = []
+        for bucket in buckets:
+            for researcher in bucket:
+                if id(researcher) not in seen:
+                    seen.add(id(researcher))
+                    found.append(researcher)
+        return sorted(found, key=lambda researcher: self._positions[id(researcher)])
+
+    def linked_data_score(self, person_id: Optional[int]) -> int:
+        if not person_id or self.session is None:
+            return 0
+        if self._linked_data_counts is None:
+            self._linked_data_counts = _load_linked_data_counts(self.session)
+        return self._linked_data_counts.get(person_id, 0) * 20
+
 
 def resolve_researcher_from_lattes(
-    all_researchers: Iterable[Any],
+    all_researchers: Union[ResearcherResolutionIndex, Iterable[Any]],
     *,
     lattes_id: Optional[str] = None,
     json_name: Optional[str] = None,
@@ -22,19 +163,20 @@ def resolve_researcher_from_lattes(
     and finally prefer the record that already has linked data in the DB.
     """
 
-    parser = LattesParser()
+    index = ResearcherResolutionIndex.ensure(all_researchers, session=session)
+    parser = index._parser
     json_name_norm = parser.normalize_title(json_name) if json_name else ""
 
     best = None
     best_score = float("-inf")
 
-    for researcher in all_researchers:
+    for researcher in index.candidates(lattes_id=lattes_id, name=json_name):
         score = _score_candidate(
             researcher,
             lattes_id=lattes_id,
             json_name=json_name,
             json_name_norm=json_name_norm,
-            session=session,
+            index=index,
         )
         if score > best_score:
             best = researcher
@@ -54,25 +196,31 @@ def resolve_researcher_from_lattes(
 
 
 def resolve_researcher_by_name(
-    all_researchers: Iterable[Any],
+    all_researchers: Union[ResearcherResolutionIndex, Iterable[Any]],
     *,
     name: Optional[str],
     identification_id: Optional[str] = None,
+    emails: Optional[list[str]] = None,
 ) -> Optional[Any]:
     if not name:
         return None
 
-    parser = LattesParser()
+    index = ResearcherResolutionIndex.ensure(all_researchers)
+    parser = index._parser
     target_norm = parser.normalize_title(name)
 
     best = None
     best_score = float("-inf")
-    for researcher in all_researchers:
+    for researcher in index.candidates(lattes_id=identification_id, name=name):
         score = 0
         res_name = getattr(researcher, "name", None) or ""
         res_identification = getattr(researcher, "identification_id", None) or ""
 
-        if identification_id and res_identification and str(res_identification).casefold() == str(identification_id).casefold():
+        if (
+            identification_id
+            and res_identification
+            and str(res_identification).casefold() == str(identification_id).casefold()
+        ):
             score += 200
         if res_name and res_name.casefold() == name.casefold():
             score += 150
@@ -83,12 +231,18 @@ def resolve_researcher_by_name(
             best = researcher
             best_score = score
 
-    return best if best_score > 0 else None
+    if best_score > 0:
+        return best
+
+    # Same person registered under a different spelling: fall back to the
+    # anonymized email, when the caller has one.
+    email_matches = index.candidates(emails=emails)
+    return email_matches[0] if email_matches else None
 
 
 def resolve_or_create_researcher(
     researcher_ctrl: Any,
-    all_researchers: list[Any],
+    all_researchers: Union[ResearcherResolutionIndex, list[Any]],
     *,
     name: Optional[str],
     identification_id: Optional[str] = None,
@@ -98,6 +252,7 @@ def resolve_or_create_researcher(
         all_researchers,
         name=name,
         identification_id=identification_id,
+        emails=emails,
     )
     if researcher:
         return researcher
@@ -112,7 +267,10 @@ def resolve_or_create_researcher(
         emails=emails,
     )
     if researcher:
-        all_researchers.append(researcher)
+        if isinstance(all_researchers, ResearcherResolutionIndex):
+            all_researchers.add(researcher)
+        else:
+            all_researchers.append(researcher)
     return researcher
 
 
@@ -122,9 +280,9 @@ def _score_candidate(
     lattes_id: Optional[str],
     json_name: Optional[str],
     json_name_norm: str,
-    session: Any,
+    index: ResearcherResolutionIndex,
 ) -> int:
-    parser = LattesParser()
+    parser = index._parser
 
     score = 0
     matched = False
@@ -140,7 +298,7 @@ def _score_candidate(
         if str(identification_id) == lattes_id:
             score += 400
             matched = True
-        if lattes_id in str(cnpq_url):
+        if lattes_id in _cnpq_url_digit_runs(cnpq_url):
             score += 350
             matched = True
 
@@ -155,7 +313,7 @@ def _score_candidate(
     if not matched:
         return 0
 
-    score += _linked_data_score(getattr(researcher, "id", None), session)
+    score += index.linked_data_score(getattr(researcher, "id", None))
 
     if getattr(researcher, "resume", None):
         score += 25
@@ -165,48 +323,59 @@ def _score_candidate(
     return score
 
 
-def _linked_data_score(person_id: Optional[int], session: Any) -> int:
-    if not person_id or session is None:
-        return 0
+def _cnpq_url_digit_runs(cnpq_url: Any) -> list[str]:
+    return _DIGIT_RUN_RE.findall(str(cnpq_url)) if cnpq_url else []
+
 
+def _load_linked_data_counts(session: Any) -> dict[int, int]:
+    """Linked advisorships, educations and articles per person, in one query."""
     try:
-        row = session.execute(
+        rows = session.execute(
             text(
                 """
-                SELECT
-                    (
-                        SELECT COUNT(*)
-                        FROM advisorship_members
-                        WHERE role_name = :supervisor_role
-                          AND person_id = :pid
-                    ) +
-                    (SELECT COUNT(*) FROM academic_educations WHERE researcher_id = :pid) +
-                    (SELECT COUNT(*) FROM article_authors WHERE researcher_id = :pid)
+                SELECT pid, SUM(n)
+                FROM (
+                    SELECT person_id AS pid, COUNT(*) AS n
+                    FROM advisorship_members
+                    WHERE role_name = :supervisor_role
+                    GROUP BY person_id
+                    UNION ALL
+                    SELECT researcher_id, COUNT(*) FROM academic_educations
+                    GROUP BY researcher_id
+                    UNION ALL
+                    SELECT researcher_id, COUNT(*) FROM article_authors
+                    GROUP BY researcher_id
+                ) AS linked
+                GROUP BY pid
                 """
             ),
-            {
-                "pid": person_id,
-                "supervisor_role": AdvisorshipRole.SUPERVISOR.value,
-            },
-        ).fetchone()
-        return int(row[0] or 0) * 20 if row else 0
+            {"supervisor_role": AdvisorshipRole.SUPERVISOR.value},
+        ).fetchall()
     except Exception:
         try:
-            row = session.execute(
+            session.rollback()
+        except Exception:
+            pass
+        try:
+            rows = session.execute(
                 text(
                     """
-                    SELECT
-                        (
-                            SELECT COUNT(*)
-                            FROM advisorships
-                            WHERE supervisor_id = :pid
-                        ) +
-                        (SELECT COUNT(*) FROM academic_educations WHERE researcher_id = :pid) +
-                        (SELECT COUNT(*) FROM article_authors WHERE researcher_id = :pid)
+                    SELECT pid, SUM(n)
+                    FROM (
+                        SELECT supervisor_id AS pid, COUNT(*) AS n
+                        FROM advisorships
+                        GROUP BY supervisor_id
+                        UNION ALL
+                        SELECT researcher_id, COUNT(*) FROM academic_educations
+                        GROUP BY researcher_id
+                        UNION ALL
+                        SELECT researcher_id, COUNT(*) FROM article_authors
+                        GROUP BY researcher_id
+                    ) AS linked
+                    GROUP BY pid
                     """
-                ),
-                {"pid": person_id},
-            ).fetchone()
-            return int(row[0] or 0) * 20 if row else 0
+                )
+            ).fetchall()
         except Exception:
-            return 0
+            return {}
+    return {int(pid): int(total or 0) for pid, total in rows if pid is not None}
@@ -0,0 +1,92 @@
+"""
+Parallel parsing of the yearly SigPesq workbooks with a single database writer.
+
+The advisorships report is downloaded as one workbook per year
+(``data/raw/sigpesq/advisorships/<year>/*.xlsx``). Reading a workbook is
+CPU-bound and independent per file, while the writes all go through one
+ProjectLoader. parse_sigpesq_workbooks() reads the workbooks on a process
+pool and yields their records in year order to the calling process, which
+maps and writes them exactly as the sequential loop did. With a single
+worker everything runs in the calling process.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+from src.core.logic.sigpesq_sheet_cache import read_sigpesq_excel
+
+DEFAULT_SIGPESQ_PARSE_WORKERS = int(
+    os.getenv("SIGPESQ_PARSE_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+_YEAR_RE = re.compile(r"^(19|20)\d{2}$")
+
+
+@dataclass
+class ParsedWorkbook:
+    file_path: str
+    year: Optional[int] = None
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    # Set when the workbook could not be read; records is then empty.
+    error: Optional[str] = None
+
+
+def sigpesq_workbook_year(file_path: str) -> Optional[int]:
+    """The report year, taken from the innermost directory named like a year."""
+    parts = os.path.normpath(os.path.dirname(file_path)).split(os.sep)
+    for part in reversed(parts):
+        if _YEAR_RE.match(part):
+            return int(part)
+    return None
+
+
+def order_by_year(file_paths: List[str]) -> List[str]:
+    """Workbooks by year, then path; workbooks without a year come last."""
+    return sorted(
+        file_paths,
+        key=lambda path: (
+            sigpesq_workbook_year(path) is None,
+            sigpesq_workbook_year(path) or 0,
+            path,
+        ),
+    )
+
+
+def parse_sigpesq_workbook(file_path: str) -> ParsedWorkbook:
+    """Reads the first sheet of a workbook into records, blanks as ""."""
+    parsed = ParsedWorkbook(file_path, year=sigpesq_workbook_year(file_path))
+    try:
+        parsed.records = read_sigpesq_excel(file_path).fillna("").to_dict("records")
+    except Exception as e:
+        parsed.error = str(e)
+    return parsed
+
+
+def parse_sigpesq_workbooks(
+    file_paths: List[str], *, max_workers: int = DEFAULT_SIGPESQ_PARSE_WORKERS
+) -> Iterator[ParsedWorkbook]:
+    """
+    Yields a ParsedWorkbook per file in the order of `file_paths` (see
+    order_by_year()), so writing them gives the same result as reading the
+    files one after another.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+
+    worker_count = min(max_workers, len(file_paths))
+    if worker_count <= 1:
+        for file_path in file_paths:
+            yield parse_sigpesq_workbook(file_path)
+        return
+
+    logger.info(
+        f"Parsing {len(file_paths)} SigPesq workbooks with {worker_count} "
+        "worker process(es)"
+    )
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        yield from executor.map(parse_sigpesq_workbook, file_paths)
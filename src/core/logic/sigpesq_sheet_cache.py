@@ -0,0 +1,113 @@
+"""
+Parquet cache of parsed SigPesq Excel sheets.
+
+The SigPesq loaders read every yearly ``.xlsx`` with ``pd.read_excel`` on
+every run, and openpyxl is by far the slowest step for the large project
+and advisorship workbooks. ``read_sigpesq_excel()`` stores each parsed sheet
+as Parquet under ``data/cache/sigpesq_sheets``, keyed by the SHA-256 of the
+workbook, the sheet and SIGPESQ_SHEET_PARSER_VERSION::
+
+    <sha256>.<sheet>.v<parser version>.parquet
+
+and reads the Parquet file while the workbook is unchanged. Bump the parser
+version when the way sheets are read changes, so older entries are ignored.
+Sheets that Parquet cannot represent (e.g. a column mixing dates and text)
+are returned uncached. SIGPESQ_SHEET_CACHE=0 disables the cache;
+``clear_sigpesq_sheet_cache()`` (``make clear-sigpesq-cache``) removes it.
+"""
+
+import glob
+import io
+import os
+import re
+from typing import Optional, Union
+
+import pandas as pd
+from loguru import logger
+
+from src.core.logic.atomic_io import atomic_write_bytes
+from src.core.logic.lattes_ingest_manifest import file_sha256
+
+DEFAULT_SIGPESQ_SHEET_CACHE_DIR = os.getenv(
+    "SIGPESQ_SHEET_CACHE_DIR", "data/cache/sigpesq_sheets"
+)
+DEFAULT_SIGPESQ_SHEET_CACHE = os.getenv("SIGPESQ_SHEET_CACHE", "1") not in {
+    "0",
+    "false",
+    "FALSE",
+}
+SIGPESQ_SHEET_PARSER_VERSION = 1
+
+SheetName = Union[int, str]
+
+
+def _sheet_key(sheet_name: SheetName) -> str:
+    return re.sub(r"[^0-9A-Za-z_-]+", "_", str(sheet_name)) or "_"
+
+
+def sheet_cache_path(
+    workbook_hash: str,
+    sheet_name: SheetName = 0,
+    cache_dir: str = DEFAULT_SIGPESQ_SHEET_CACHE_DIR,
+) -> str:
+    return os.path.join(
+        cache_dir,
+        f"{workbook_hash}.{_sheet_key(sheet_name)}"
+        f".v{SIGPESQ_SHEET_PARSER_VERSION}.parquet",
+    )
+
+
+def read_sigpesq_excel(
+    file_path: str,
+    sheet_name: SheetName = 0,
+    cache_dir: Optional[str] = None,
+    use_cache: Optional[bool] = None,
+) -> pd.DataFrame:
+    """``pd.read_excel(file_path, sheet_name=sheet_name)``, served from the
+    Parquet cache while the workbook's content is unchanged."""
+    if use_cache is None:
+        use_cache = DEFAULT_SIGPESQ_SHEET_CACHE
+    cache_dir = cache_dir or DEFAULT_SIGPESQ_SHEET_CACHE_DIR
+    if not use_cache:
+        return pd.read_excel(file_path, sheet_name=sheet_name)
+
+    cache_path = sheet_cache_path(file_sha256(file_path), sheet_name, cache_dir)
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_parquet(cache_path)
+            logger.info(f"Read {os.path.basename(file_path)} from the sheet cache")
+            return df
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable sheet cache {cache_path}: {e}")
+
+    df = pd.read_excel(file_path, sheet_name=sheet_name)
+    try:
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False)
+        atomic_write_bytes(cache_path, buffer.getvalue())
+    except Exception as e:
+        logger.warning(
+            f"Could not cache sheet {sheet_name!r} of {file_path} as Parquet: {e}"
+        )
+    return df
+
+
+def clear_sigpesq_sheet_cache(
+    cache_dir: Optional[str] = None,
+    file_path: Optional[str] = None,
+    stale_only: bool = False,
+) -> int:
+    """Deletes cached sheets and returns how many were removed: all of them,
+    only those of the workbook `file_path`, or with `stale_only` only those
+    written by another parser version."""
+    cache_dir = cache_dir or DEFAULT_SIGPESQ_SHEET_CACHE_DIR
+    pattern = f"{file_sha256(file_path)}.*" if file_path else "*"
+    current_suffix = f".v{SIGPESQ_SHEET_PARSER_VERSION}.parquet"
+    removed = 0
+    for cache_path in glob.glob(os.path.join(cache_dir, f"{pattern}.parquet")):
+        if stale_only and cache_path.endswith(current_suffix):
+            continue
+        os.remove(cache_path)
+        removed += 1
+    logger.info(f"Removed {removed} cached SigPesq sheets from {cache_dir}")
+    return removed
@@ -75,6 +75,14 @@ class ProjectMappingStrategy(ABC):
         """
         pass
 
+    def tracking_context(self) -> Optional[str]:
+        """
+        What map_row() depends on besides the row itself (e.g. the owner of
+        the CV the row came from). It is part of the row's tracking key, so
+        the change gate does not skip the same row read in another context.
+        """
+        return None
+
     def _parse_names(self, names_str: Any) -> List[str]:
         """Separates names by semicolon and cleans whitespace."""
         import pandas as pd
@@ -9,7 +9,13 @@ from research_domain import (
     RoleController,
 )
 
+from src.core.logic.reference_data_cache import (
+    KNOWLEDGE_AREAS,
+    ROLES,
+    get_reference_data,
+)
 from src.core.logic.researcher_resolution import resolve_or_create_researcher
+from src.core.logic.team_membership_sync import MembershipDelta, TeamMembershipBatch
 from src.tracking.recorder import tracking_recorder
 
 
@@ -248,6 +254,7 @@ class CnpqSyncLogic:
 
         # Fetch all once to avoid N+1 and many session calls
         all_res = self.res_ctrl.get_all()
+        memberships = TeamMembershipBatch(self.rg_ctrl._service._repository._session)
 
         for m_data in members_data:
             name = m_data.get("name")
@@ -261,6 +268,7 @@ class CnpqSyncLogic:
                 source_path=source_file,
             )
 
+            membership_checkpoint = memberships.checkpoint()
             try:
                 # 1. Ensure Researcher exists.
                 # identification_id must stay None: it is a CPF-like identity
@@ -326,16 +334,15 @@ class CnpqSyncLogic:
                 # 2. Get/Create Role
                 role_name = m_data.get("role", "Pesquisador")
                 # Try to find existing role
-                role = None
-                all_roles = self.role_ctrl.get_all()
-                for r in all_roles:
-                    if r.name.lower() == role_name.lower():
-                        role = r
-                        break
+                reference_data = get_reference_data()
+                role = reference_data.find(
+                    ROLES, self.role_ctrl, key=str.lower, name=role_name
+                )
 
                 if not role:
                     logger.info(f"Creating new role: {role_name}")
                     role = self.role_ctrl.create_role(name=role_name)
+                    reference_data.add(ROLES, role)
 
                 # 3. Associate with group using the service's add_member
                 start_date = self._parse_date(m_data.get("data_inicio"))
@@ -345,136 +352,74 @@ class CnpqSyncLogic:
                     else None
                 )
 
-                try:
-                    # Accessing service directly as controller doesn't expose generic add_member
-                    # Check for existing membership to avoid duplicates
-                    existing_members = self.rg_ctrl._service.get_members(group_id)
-                    already_associated = False
-                    for em in existing_members:
-                        if em.person_id == researcher.id:
-                            # Already associated. We could check role/dates here if needed.
-                            # For now, let's just skip to avoid duplicates.
-                            already_associated = True
-                            break
-
-                    if not already_associated:
-                        self.rg_ctrl._service.add_member(
-                            team_id=group_id,
-                            person_id=researcher.id,
-                            role_id=role.id,
-                            start_date=start_date,
-                            end_date=end_date,
-                        )
-                        logger.info(
-                            f"Member {name} ({role_name}) associated to group {group_id}"
-                        )
-                        tracking_recorder.record_change(
-                            source_record_id=getattr(source_record, "id", None),
-                            canonical_entity_type="research_group",
-                            canonical_entity_id=group_id,
-                            operation="update",
-                            changed_fields=["member_association"],
-                            after={
-                                "person_id": researcher.id,
-                                "role_id": role.id,
-                                "start_date": start_date,
-                                "end_date": end_date,
-                            },
-                            reason="Associated member from CNPq sync",
-                        )
-                    else:
-                        # UPDATE LOGIC for Egressos
-                        # If the member is already associated, check if we need to update the end_date
-                        # This handles Active -> Egresso transition
-                        try:
-                            # We need to find the specific association to check dates
-                            target_member = next(
-                                (
-                                    em
-                                    for em in existing_members
-                                    if em.person_id == researcher.id
-                                ),
-                                None,
-                            )
-
-                            if target_member:
-                                current_end_date = target_member.end_date
-                                # Check if end_date provided by CNPq is 'new' (we have it, DB doesn't)
-                                # or different (CNPq has date, DB has different date)
-
-                                should_update = False
-                                if end_date and current_end_date != end_date:
-                                    should_update = True
-
-                                if should_update:
-                                    before_end_date = current_end_date
-                                    logger.info(
-                                        f"Updating member {name} dates: End {current_end_date} -> {end_date}"
-                                    )
-
-                                    # Use direct SQL update for safety and to avoid ORM complexity with composite keys/relationships
-                                    upd_query = text(
-                                        """
-                                        UPDATE team_members 
-                                        SET end_date = :end_dt 
-                                        WHERE team_id = :gid AND person_id = :pid
-                                    """
-                                    )
-                                    session = self.rg_ctrl._service._repository._session
-                                    session.execute(
-                                        upd_query,
-                                        {
-                                            "end_dt": end_date,
-                                            "gid": group_id,
-                                            "pid": researcher.id,
-                                        },
-                                    )
-                                    session.commit()
-                                    tracking_recorder.record_change(
-                                        source_record_id=getattr(
-                                            source_record, "id", None
-                                        ),
-                                        canonical_entity_type="research_group",
-                                        canonical_entity_id=group_id,
-                                        operation="update",
-                                        changed_fields=["member_end_date"],
-                                        before={
-                                            "person_id": researcher.id,
-                                            "end_date": before_end_date,
-                                        },
-                                        after={
-                                            "person_id": researcher.id,
-                                            "end_date": end_date,
-                                        },
-                                        reason="Updated group member end_date from CNPq sync",
-                                    )
-                                else:
-                                    logger.debug(f"Member {name} up to date.")
-
-                        except Exception as inner_e:
-                            logger.warning(f"Failed to update member {name}: {inner_e}")
-
-                except Exception as e:
-                    logger.warning(f"Could not associate member {name}: {e}")
-                    # Rollback for this specific association failure
-                    try:
-                        self.rg_ctrl._service._repository._session.rollback()
-                    except Exception:
-                        pass
+                # Staged: the membership delta of the whole group is applied
+                # in one transaction after the loop.
+                memberships.associate(
+                    group_id,
+                    researcher.id,
+                    role.id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    tag=(getattr(source_record, "id", None), name, role_name),
+                )
 
             except Exception as e:
                 logger.error(f"Error syncing member {name}: {e}")
+                memberships.rollback_to(membership_checkpoint)
                 try:
                     self.rg_ctrl._service._repository._session.rollback()
                 except Exception:
                     pass
 
+        delta = memberships.flush()
+        self._record_membership_changes(group_id, delta)
+
         # Final commit for the whole group batch to be extra sure
         try:
             self.rg_ctrl._service._repository._session.commit()
         except Exception:
             pass
 
+    def _record_membership_changes(self, group_id: Any, delta: MembershipDelta):
+        for member in delta.inserted:
+            source_record_id, name, role_name = member.tag
+            logger.info(f"Member {name} ({role_name}) associated to group {group_id}")
+            tracking_recorder.record_change(
+                source_record_id=source_record_id,
+                canonical_entity_type="research_group",
+                canonical_entity_id=group_id,
+                operation="update",
+                changed_fields=["member_association"],
+                after={
+                    "person_id": member.person_id,
+                    "role_id": member.role_id,
+                    "start_date": member.start_date,
+                    "end_date": member.end_date,
+                },
+                reason="Associated member from CNPq sync",
+            )
+        for member in delta.end_dated:
+            source_record_id, name, _role_name = member.tag
+            logger.info(
+                f"Updating member {name} dates: End {member.before_end_date} -> {member.end_date}"
+            )
+            tracking_recorder.record_change(
+                source_record_id=source_record_id,
+                canonical_entity_type="research_group",
+                canonical_entity_id=group_id,
+                operation="update",
+                changed_fields=["member_end_date"],
+                before={
+                    "person_id": member.person_id,
+                    "end_date": member.before_end_date,
+                },
+                after={
+                    "person_id": member.person_id,
+                    "end_date": member.end_date,
+                },
+                reason="Updated group member end_date from CNPq sync",
+            )
+
     def sync_knowledge_areas(
         self,
         group_id: Any,
@@ -499,9 +444,9 @@ class CnpqSyncLogic:
 
         try:
             # 1. Fetch/Create Knowledge Areas
+            reference_data = get_reference_data()
             ka_map = {}
-            all_kas = self.ka_ctrl.get_all()
-            for ka in all_kas:
+            for ka in reference_data.all(KNOWLEDGE_AREAS, self.ka_ctrl):
                 if ka.name:
                     ka_map[normalize(ka.name).lower()] = ka
 
@@ -529,6 +474,7 @@ class CnpqSyncLogic:
                     try:
                         ka = self.ka_ctrl.create_knowledge_area(name=norm_name)
                         ka_map[key] = ka  # Update map
+                        reference_data.add(KNOWLEDGE_AREAS, ka)
                         tracking_recorder.record_change(
                             source_record_id=getattr(source_record, "id", None),
                             canonical_entity_type="knowledge_area",
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from .base import ProjectMappingStrategy
@@ -15,6 +15,9 @@ class LattesAdvisorshipMappingStrategy(ProjectMappingStrategy):
         super().__init__()
         self.advisor_name = advisor_name
 
+    def tracking_context(self) -> Optional[str]:
+        return self.advisor_name
+
     def map_row(self, row: dict) -> Dict[str, Any]:
         """
         Maps a Single Lattes parsed dictionary to a standardized dictionary for AdvisorshipHandler.
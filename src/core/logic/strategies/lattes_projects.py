@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from .base import ProjectMappingStrategy
@@ -21,6 +21,9 @@ class LattesProjectMappingStrategy(ProjectMappingStrategy):
         # Roles from raw_members
         self.researcher_roles = researcher_roles or {}
 
+    def tracking_context(self) -> Optional[str]:
+        return self.target_researcher_name
+
     def map_row(self, row: dict) -> Dict[str, Any]:
         """
         Maps a Single Lattes parsed dictionary to a standardized dictionary.
@@ -4,7 +4,12 @@ from typing import List, Optional, Tuple
 import pandas as pd
 from loguru import logger
 
-from src.core.logic.initiative_identity import normalize_text
+from src.core.logic.reference_data_cache import (
+    CAMPUSES,
+    KNOWLEDGE_AREAS,
+    ORGANIZATIONS,
+    get_reference_data,
+)
 from src.core.logic.researcher_resolution import resolve_or_create_researcher
 
 from .base import (
@@ -20,16 +25,17 @@ from .base import (
 class SigPesqOrganizationStrategy(OrganizationStrategy):
     def ensure(self, uni_ctrl) -> int:
         """Ensures IFES exists."""
+        reference_data = get_reference_data()
         try:
-            all_orgs = uni_ctrl.get_all()
-            for org in all_orgs:
-                if normalize_text(org.name) in {
-                    normalize_text("IFES"),
-                    normalize_text("Instituto Federal do Espirito Santo"),
-                    normalize_text("Instituto Federal do Espírito Santo"),
-                }:
-                    logger.info(f"Organization found: {org.name} (ID: {org.id})")
-                    return org.id
+            # "Espírito" and "Espirito" share the same normalized key.
+            org = reference_data.find(
+                ORGANIZATIONS,
+                uni_ctrl,
+                name=("IFES", "Instituto Federal do Espirito Santo"),
+            )
+            if org:
+                logger.info(f"Organization found: {org.name} (ID: {org.id})")
+                return org.id
         except Exception as e:
             logger.error(f"Error fetching organizations: {e}")
 
@@ -37,6 +43,7 @@ class SigPesqOrganizationStrategy(OrganizationStrategy):
             ufsc = uni_ctrl.create_university(
                 name="IFES", short_name="Instituto Federal do Espirito Santo"
             )
+            reference_data.add(ORGANIZATIONS, ufsc)
             logger.info(f"Organization created: {ufsc.name} (ID: {ufsc.id})")
             return ufsc.id
         except Exception as e:
@@ -47,21 +54,23 @@ class SigPesqOrganizationStrategy(OrganizationStrategy):
 class SigPesqCampusStrategy(CampusStrategy):
     def ensure(self, campus_ctrl, campus_name: str, org_id: int) -> int:
         """Ensures Campus exists."""
+        reference_data = get_reference_data()
         try:
-            all_campuses = campus_ctrl.get_all()
-            target_name = normalize_text(campus_name)
-            for campus in all_campuses:
-                c_org = getattr(campus, "organization_id", None)
-                if normalize_text(campus.name) == target_name and (
-                    c_org is None or c_org == org_id
-                ):
-                    logger.debug(f"Campus found: {campus.name}")
-                    return campus.id
+            campus = reference_data.find(
+                CAMPUSES,
+                campus_ctrl,
+                name=campus_name,
+                where=lambda c: getattr(c, "organization_id", None) in (None, org_id),
+            )
+            if campus:
+                logger.debug(f"Campus found: {campus.name}")
+                return campus.id
         except Exception as e:
             logger.error(f"Error fetching campuses: {e}")
 
         try:
             campus = campus_ctrl.create_campus(name=campus_name, organization_id=org_id)
+            reference_data.add(CAMPUSES, campus)
             logger.info(f"Campus created: {campus.name} (ID: {campus.id})")
             return campus.id
         except Exception as e:
@@ -75,17 +84,17 @@ class SigPesqKnowledgeAreaStrategy(KnowledgeAreaStrategy):
         if not area_name or pd.isna(area_name):
             return None
 
+        reference_data = get_reference_data()
         try:
-            all_areas = area_ctrl.get_all()
-            target_name = normalize_text(area_name)
-            for area in all_areas:
-                if normalize_text(area.name) == target_name:
-                    return area.id
+            area = reference_data.find(KNOWLEDGE_AREAS, area_ctrl, name=area_name)
+            if area:
+                return area.id
         except Exception as e:
             logger.error(f"Error fetching areas: {e}")
 
         try:
             area = area_ctrl.create_knowledge_area(name=area_name)
+            reference_data.add(KNOWLEDGE_AREAS, area)
             logger.info(f"Knowledge Area created: {area.name}")
             return area.id
         except Exception as e:
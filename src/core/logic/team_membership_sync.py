@@ -0,0 +1,352 @@
+"""
+Set-based synchronization of ``team_members``.
+
+Team and research-group syncs used to call ``get_members(team_id)`` and check
+for an existing membership once per incoming member, inserting or updating
+one row at a time. TeamMembershipBatch collects the operations of a whole
+source file instead, reads the current membership of every affected team with
+one query, replays the operations against that snapshot in memory and applies
+the resulting inserts, role changes, end dates and removals as bulk ORM
+statements on the mapped TeamMember entity in a single transaction.
+
+Loaders that roll back a failed source row take a checkpoint() before the
+row and call rollback_to() when it fails, so the row's staged operations
+are dropped with the rest of its work. Inside a unit of work the batch joins
+it (see UnitOfWork.join) and is applied before every batch commit, in the
+same transaction as the rows and tracking records that staged it. A failed
+flush raises: the rows are then neither committed nor tracked as applied.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import delete, insert, select, update
+
+FETCH_CHUNK_SIZE = 500
+
+# Operation kinds, replayed in staging order per team.
+_ADD = "add"
+_REPLACE = "replace"
+_ASSOCIATE = "associate"
+
+
+def date_key(value: Any) -> Optional[str]:
+    """Comparable ISO form of a membership date (datetime, date, pandas
+    Timestamp or the string stored by the database); None when empty."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None).isoformat()
+    if isinstance(value, date):
+        return datetime.combine(value, time()).isoformat()
+    raw = str(value).strip()
+    try:
+        return datetime.fromisoformat(raw).replace(tzinfo=None).isoformat()
+    except ValueError:
+        return raw
+
+
+def _team_member_entity() -> Any:
+    from eo_lib.domain.entities import TeamMember
+
+    return TeamMember
+
+
+def _db_value(value: Any) -> Any:
+    if value == "":
+        return None
+    to_pydatetime = getattr(value, "to_pydatetime", None)
+    return to_pydatetime() if callable(to_pydatetime) else value
+
+
+@dataclass
+class MemberRow:
+    team_id: Any
+    person_id: Any
+    role_id: Any
+    start_date: Any = None
+    end_date: Any = None
+    id: Optional[int] = None
+    tag: Any = None
+    before_end_date: Any = None
+    removed: bool = False
+    end_date_changed: bool = False
+
+
+@dataclass
+class MembershipDelta:
+    """Rows written by TeamMembershipBatch.flush, per kind of change."""
+
+    inserted: List[MemberRow] = field(default_factory=list)
+    role_changed: List[MemberRow] = field(default_factory=list)
+    end_dated: List[MemberRow] = field(default_factory=list)
+    removed: List[MemberRow] = field(default_factory=list)
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "inserted": len(self.inserted),
+            "role_changed": len(self.role_changed),
+            "end_dated": len(self.end_dated),
+            "removed": len(self.removed),
+        }
+
+
+class TeamMembershipBatch:
+    """
+    Stages membership operations and applies their net effect in one flush.
+
+    - add(): additive; skipped when the team already has the same person,
+      role and start date (TeamSynchronizer.add_members).
+    - replace(): add() for every member, then removes rows whose
+      (person, role) is not in the source (TeamSynchronizer.synchronize_members).
+    - associate(): inserts the person when absent from the team, otherwise
+      records a new end date on the person's rows (CNPq group members).
+    """
+
+    def __init__(self, session: Any, member_entity: Any = None):
+        self.session = session
+        # The mapped TeamMember class; resolved on the first flush.
+        self._member_entity = member_entity
+        # (team_id, kind, payload) in staging order.
+        self._operations: List[Tuple[Any, str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def checkpoint(self) -> int:
+        """Marks the operations staged so far, for rollback_to()."""
+        return len(self._operations)
+
+    def rollback_to(self, checkpoint: int) -> None:
+        """Drops the operations staged after `checkpoint` (a failed row)."""
+        del self._operations[checkpoint:]
+
+    def add(
+        self,
+        team_id: Any,
+        person_id: Any,
+        role_id: Any,
+        start_date: Any = None,
+        end_date: Any = None,
+        tag: Any = None,
+    ) -> None:
+        row = MemberRow(team_id, person_id, role_id, start_date, end_date, tag=tag)
+        self._operations.append((team_id, _ADD, row))
+
+    def replace(
+        self, team_id: Any, members: Iterable[Tuple[Any, Any, Any]], tag: Any = None
+    ) -> None:
+        """`members` are ``(person_id, role_id, start_date)`` tuples."""
+        rows = [
+            MemberRow(team_id, person_id, role_id, start_date, tag=tag)
+            for person_id, role_id, start_date in members
+        ]
+        self._operations.append((team_id, _REPLACE, rows))
+
+    def associate(
+        self,
+        team_id: Any,
+        person_id: Any,
+        role_id: Any,
+        start_date: Any = None,
+        end_date: Any = None,
+        tag: Any = None,
+    ) -> None:
+        row = MemberRow(team_id, person_id, role_id, start_date, end_date, tag=tag)
+        self._operations.append((team_id, _ASSOCIATE, row))
+
+    def flush(self) -> MembershipDelta:
+        """Applies every staged operation in one transaction and clears the
+        batch. On failure the transaction is rolled back, the operations stay
+        staged and the error is raised, so callers do not treat the rows that
+        staged them as applied."""
+        if not self._operations:
+            return MembershipDelta()
+        try:
+            delta = self._apply()
+            self.session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to synchronize team memberships: {e}")
+            try:
+                self.session.rollback()
+            except Exception:
+                pass
+            raise
+        self._operations = []
+        return delta
+
+    def before_commit(self, session: Any) -> None:
+        """Applies the staged operations on the session of a unit of work
+        that is about to commit it (see UnitOfWork.join). Errors are raised,
+        so the batch is not committed without its memberships."""
+        if self._operations:
+            self._apply()
+            self._operations = []
+
+    def _apply(self) -> MembershipDelta:
+        operations: Dict[Any, List[Tuple[str, Any]]] = {}
+        for team_id, kind, payload in self._operations:
+            operations.setdefault(team_id, []).append((kind, payload))
+
+        if self._member_entity is None:
+            self._member_entity = _team_member_entity()
+        current = self._fetch_members(list(operations))
+        delta = MembershipDelta()
+        for team_id, team_operations in operations.items():
+            rows = current.get(team_id, [])
+            for kind, payload in team_operations:
+                if kind == _ADD:
+                    self._apply_add(rows, payload)
+                elif kind == _REPLACE:
+                    self._apply_replace(rows, payload)
+                else:
+                    self._apply_associate(rows, payload)
+            self._collect_delta(rows, delta)
+        self._write(delta)
+        logger.info(
+            f"Team memberships synchronized for {len(operations)} teams: "
+            f"{delta.counts()}"
+        )
+        return delta
+
+    def _fetch_members(self, team_ids: List[Any]) -> Dict[Any, List[MemberRow]]:
+        member = self._member_entity
+        members: Dict[Any, List[MemberRow]] = {}
+        for start in range(0, len(team_ids), FETCH_CHUNK_SIZE):
+            chunk = team_ids[start : start + FETCH_CHUNK_SIZE]
+            result = self.session.execute(
+                select(
+                    member.id,
+                    member.team_id,
+                    member.person_id,
+                    member.role_id,
+                    member.start_date,
+                    member.end_date,
+                )
+                .where(member.team_id.in_(chunk))
+                .order_by(member.id)
+            )
+            for member_id, team_id, person_id, role_id, start_dt, end_dt in result:
+                members.setdefault(team_id, []).append(
+                    MemberRow(
+                        team_id,
+                        person_id,
+                        role_id,
+                        start_dt,
+                        end_dt,
+                        id=member_id,
+                        before_end_date=end_dt,
+                    )
+                )
+        return members
+
+    @staticmethod
+    def _live(rows: List[MemberRow]) -> Iterable[MemberRow]:
+        return (row for row in rows if not row.removed)
+
+    def _apply_add(self, rows: List[MemberRow], new: MemberRow) -> None:
+        start = date_key(new.start_date)
+        for row in self._live(rows):
+            if (
+                row.person_id == new.person_id
+                and row.role_id == new.role_id
+                and date_key(row.start_date) == start
+            ):
+                return
+        rows.append(new)
+
+    def _apply_replace(self, rows: List[MemberRow], members: List[MemberRow]) -> None:
+        for member in members:
+            self._apply_add(rows, member)
+        source = {(m.person_id, m.role_id) for m in members if m.role_id}
+        for row in self._live(rows):
+            if (row.person_id, row.role_id) not in source:
+                row.removed = True
+
+    def _apply_associate(self, rows: List[MemberRow], new: MemberRow) -> None:
+        existing = [row for row in self._live(rows) if row.person_id == new.person_id]
+        if not existing:
+            rows.append(new)
+            return
+        if new.end_date and date_key(existing[0].end_date) != date_key(new.end_date):
+            for row in existing:
+                row.end_date = new.end_date
+                row.end_date_changed = True
+                row.tag = new.tag
+
+    @staticmethod
+    def _collect_delta(rows: List[MemberRow], delta: MembershipDelta) -> None:
+        inserted = [row for row in rows if row.id is None and not row.removed]
+        removed = [row for row in rows if row.id is not None and row.removed]
+
+        # A person whose role changed keeps their row: the obsolete row is
+        # rewritten with the new role instead of deleted and re-inserted.
+        obsolete_by_person: Dict[Any, List[MemberRow]] = {}
+        for row in removed:
+            obsolete_by_person.setdefault(row.person_id, []).append(row)
+        for row in inserted:
+            candidates = obsolete_by_person.get(row.person_id)
+            if candidates:
+                target = candidates.pop(0)
+                target.removed = False
+                target.role_id = row.role_id
+                target.start_date = row.start_date
+                target.end_date = row.end_date
+                target.tag = row.tag
+                delta.role_changed.append(target)
+            else:
+                delta.inserted.append(row)
+        delta.removed.extend(
+            row for rows_left in obsolete_by_person.values() for row in rows_left
+        )
+        delta.end_dated.extend(
+            row
+            for row in rows
+            if row.id is not None and row.end_date_changed and not row.removed
+        )
+
+    def _write(self, delta: MembershipDelta) -> None:
+        member = self._member_entity
+        if delta.inserted:
+            self.session.execute(
+                insert(member),
+                [
+                    {
+                        "team_id": row.team_id,
+                        "person_id": row.person_id,
+                        "role_id": row.role_id,
+                        "start_date": _db_value(row.start_date),
+                        "end_date": _db_value(row.end_date),
+                    }
+                    for row in delta.inserted
+                ],
+            )
+        if delta.role_changed:
+            self.session.execute(
+                update(member),
+                [
+                    {
+                        "id": row.id,
+                        "role_id": row.role_id,
+                        "start_date": _db_value(row.start_date),
+                        "end_date": _db_value(row.end_date),
+                    }
+                    for row in delta.role_changed
+                ],
+            )
+        rewritten = {id(row) for row in delta.role_changed}
+        end_dated = [row for row in delta.end_dated if id(row) not in rewritten]
+        if end_dated:
+            self.session.execute(
+                update(member),
+                [
+                    {"id": row.id, "end_date": _db_value(row.end_date)}
+                    for row in end_dated
+                ],
+            )
+        if delta.removed:
+            self.session.execute(
+                delete(member).where(member.id.in_([row.id for row in delta.removed]))
+            )
@@ -1,8 +1,10 @@
-from typing import Any, Dict, List, Optional, Set, Tuple
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from eo_lib import TeamController
 from loguru import logger
-from src.core.logic.initiative_identity import normalize_text
+from src.core.logic.reference_data_cache import TEAMS, get_reference_data
+from src.core.logic.team_membership_sync import TeamMembershipBatch
 
 
 class TeamSynchronizer:
@@ -23,6 +25,28 @@ class TeamSynchronizer:
         """
         self.team_controller = team_controller
         self.roles_cache = roles_cache
+        self._batch: Optional[TeamMembershipBatch] = None
+
+    @contextmanager
+    def batch(self) -> Iterator[TeamMembershipBatch]:
+        """
+        Stages membership changes made inside the block and applies them with
+        one membership query and bulk statements when the block exits.
+
+        Nested blocks share the outer batch.
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        self._batch = TeamMembershipBatch(
+            self.team_controller._service._repository._session
+        )
+        try:
+            yield self._batch
+        finally:
+            batch, self._batch = self._batch, None
+            batch.flush()
 
     def ensure_team(self, team_name: str, description: str) -> Optional[Any]:
         """
@@ -36,33 +60,49 @@ class TeamSynchronizer:
             Optional[Any]: The existing or newly created Team object, or None if error.
         """
         try:
-            existing_teams = self.team_controller.get_all()
-            team_name_key = normalize_text(team_name)
-            for t in existing_teams:
-                t_name = (
-                    t.name
-                    if hasattr(t, "name")
-                    else (t.get("name") if isinstance(t, dict) else "")
-                )
-                if t_name == team_name or normalize_text(t_name) == team_name_key:
-                    logger.debug(f"Team already exists: {team_name[:50]}...")
-                    return t
+            reference_data = get_reference_data()
+            t = reference_data.find(TEAMS, self.team_controller, name=team_name)
+            if t is None:
+                # The cached rows miss teams created elsewhere during the run:
+                # look the exact name up in the table before creating one.
+                t = self._find_team_by_exact_name(team_name)
+                reference_data.add(TEAMS, t)
+            if t is not None:
+                logger.debug(f"Team already exists: {team_name[:50]}...")
+                return t
 
             team = self.team_controller.create_team(
                 name=team_name, description=description
             )
+            reference_data.add(TEAMS, team)
             logger.info(f"Created team: {team_name[:50]}...")
             return team
         except Exception as e:
             logger.warning(f"Failed to manage team '{team_name[:50]}': {e}")
             return None
 
+    def _find_team_by_exact_name(self, team_name: str) -> Optional[Any]:
+        for t in self.team_controller.get_all() or []:
+            t_name = (
+                t.name
+                if hasattr(t, "name")
+                else (t.get("name") if isinstance(t, dict) else "")
+            )
+            if t_name == team_name:
+                return t
+        return None
+
     def synchronize_members(
         self, team_id: int, members_to_sync: List[Tuple[Any, str, Optional[Any]]]
     ):
         """
         Synchronizes team members: adds new ones and removes obsolete ones.
         """
+        if self._batch is not None:
+            self._batch.replace(team_id, self._stage_resolved(members_to_sync))
+            self._add_unresolved_members(team_id, members_to_sync)
+            return
+
         current_source_memberships: Set[Tuple[int, int]] = set()
 
         for person, role_name, start_date in members_to_sync:
@@ -92,6 +132,12 @@ class TeamSynchronizer:
         Adds members to the team without removing existing ones.
         Idempotent: only adds if (person, role, start_date) is missing.
         """
+        if self._batch is not None:
+            for person_id, role_id, start_date in self._stage_resolved(members_to_add):
+                self._batch.add(team_id, person_id, role_id, start_date)
+            self._add_unresolved_members(team_id, members_to_add)
+            return
+
         for person, role_name, start_date in members_to_add:
             if not person:
                 continue
@@ -106,6 +152,34 @@ class TeamSynchronizer:
                 team_id, person, role_obj, role_name, role_id, start_date
             )
 
+    def _role_id(self, role_name: str) -> Optional[Any]:
+        role_obj = self.roles_cache.get(role_name)
+        return getattr(role_obj, "id", None) or (
+            role_obj.get("id") if isinstance(role_obj, dict) else None
+        )
+
+    def _stage_resolved(
+        self, members: List[Tuple[Any, str, Optional[Any]]]
+    ) -> List[Tuple[Any, Any, Optional[Any]]]:
+        """`(person_id, role_id, start_date)` of members whose role is cached;
+        the others keep going through the controller one by one."""
+        staged = []
+        for person, role_name, start_date in members:
+            role_id = self._role_id(role_name) if person else None
+            if role_id:
+                staged.append((person.id, role_id, start_date))
+        return staged
+
+    def _add_unresolved_members(
+        self, team_id: int, members: List[Tuple[Any, str, Optional[Any]]]
+    ) -> None:
+        for person, role_name, start_date in members:
+            if person and not self._role_id(role_name):
+                role_obj = self.roles_cache.get(role_name)
+                self._add_member_if_new(
+                    team_id, person, role_obj, role_name, None, start_date
+                )
+
     def _add_member_if_new(
         self, team_id, person, role_obj, role_name, role_id, start_date
     ):
@@ -184,7 +258,9 @@ class TeamSynchronizer:
                         if m_id:
                             self.team_controller.remove_member(m_id)
                         else:
-                            logger.warning(f"Could not find member ID for obsolete membership (Person {m_person_id})")
+                            logger.warning(
+                                f"Could not find member ID for obsolete membership (Person {m_person_id})"
+                            )
                     except Exception as e:
                         logger.warning(f"Failed to remove obsolete member: {e}")
         except Exception as e:
@@ -0,0 +1,142 @@
+"""
+Shared, cached text normalization for names and titles.
+
+Person matching, Lattes parsing, research-group linking and the reporting
+scripts all compare names and titles through accent-insensitive keys, and the
+same few thousand strings are normalized millions of times per pipeline run.
+This module keeps one implementation of each key behind a bounded LRU cache.
+
+Accent folding goes through ``str.translate`` with lazily filled per-code-point
+tables instead of normalizing and filtering the whole string character by
+character; ASCII input skips the table entirely.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Optional
+
+NAME_CACHE_SIZE = 1 << 16
+TITLE_CACHE_SIZE = 1 << 17
+
+_NON_NAME_CHARS = re.compile(r"[^A-Z\s]")
+_NON_TITLE_CHARS = re.compile(r"[^a-zA-Z0-9\s]")
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+
+class _FoldTable(dict):
+    """Translation table computing the folded form of each code point on
+    first use. `fold` receives the character and returns its replacement."""
+
+    def __init__(self, fold):
+        super().__init__()
+        self._fold = fold
+
+    def __missing__(self, code_point: int) -> str:
+        folded = self._fold(chr(code_point))
+        self[code_point] = folded
+        return folded
+
+
+def _strip_marks(char: str) -> str:
+    return "".join(
+        c for c in unicodedata.normalize("NFD", char) if unicodedata.category(c) != "Mn"
+    )
+
+
+def _ascii_nfkd(char: str) -> str:
+    return unicodedata.normalize("NFKD", char).encode("ascii", "ignore").decode("ascii")
+
+
+def _ascii_nfd(char: str) -> str:
+    return unicodedata.normalize("NFD", char).encode("ascii", "ignore").decode("ascii")
+
+
+_STRIP_MARKS_TABLE = _FoldTable(_strip_marks)
+_ASCII_TABLES: Dict[str, _FoldTable] = {
+    "NFKD": _FoldTable(_ascii_nfkd),
+    "NFD": _FoldTable(_ascii_nfd),
+}
+
+
+def strip_accents(value: str) -> str:
+    """Removes combining marks (NFD decomposition minus category ``Mn``)."""
+    if value.isascii():
+        return value
+    return value.translate(_STRIP_MARKS_TABLE)
+
+
+def fold_to_ascii(value: str, form: str = "NFKD") -> str:
+    """Equivalent to ``unicodedata.normalize(form, value)`` encoded to ASCII
+    with errors ignored; `form` is ``"NFKD"`` or ``"NFD"``."""
+    if value.isascii():
+        return value
+    return value.translate(_ASCII_TABLES[form])
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def normalize_person_name(name: Optional[str]) -> str:
+    """Uppercase, accent-free name with non-letters turned into spaces.
+
+    Key used by `PersonMatcher` (e.g. "José da Silva-Júnior" becomes
+    "JOSE DA SILVA JUNIOR").
+    """
+    if not name:
+        return ""
+    return " ".join(_NON_NAME_CHARS.sub(" ", strip_accents(name).upper()).split())
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def normalize_title(title: Optional[str]) -> str:
+    """Lowercase ASCII title with special characters turned into spaces."""
+    if not title:
+        return ""
+    return " ".join(_NON_TITLE_CHARS.sub(" ", fold_to_ascii(title)).lower().split())
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def match_key(name: Optional[str]) -> str:
+    """Accent- and case-insensitive key with whitespace runs collapsed."""
+    return _WHITESPACE_RUN.sub(" ", strip_accents((name or "").lower().strip()))
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def normalize_ascii_lower(value: Optional[str]) -> str:
+    """Lowercase ASCII form (NFKD folding) with whitespace collapsed."""
+    return _WHITESPACE_RUN.sub(" ", fold_to_ascii(value or "")).strip().lower()
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def normalize_group_name(name: str) -> str:
+    """Uppercase ASCII form (NFD folding) used to compare research group names."""
+    return fold_to_ascii(name, "NFD").upper().strip()
+
+
+_CACHED_FUNCTIONS = {
+    "normalize_person_name": normalize_person_name,
+    "normalize_title": normalize_title,
+    "match_key": match_key,
+    "normalize_ascii_lower": normalize_ascii_lower,
+    "normalize_group_name": normalize_group_name,
+}
+
+
+def cache_stats() -> Dict[str, Dict[str, float]]:
+    """Hits, misses, size and hit rate of every cached normalizer."""
+    stats = {}
+    for name, function in _CACHED_FUNCTIONS.items():
+        info = function.cache_info()
+        calls = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+            "hit_rate": round(info.hits / calls, 4) if calls else 0.0,
+        }
+    return stats
+
+
+def clear_caches() -> None:
+    for function in _CACHED_FUNCTIONS.values():
+        function.cache_clear()
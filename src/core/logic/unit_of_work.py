@@ -0,0 +1,254 @@
+"""
+Batched unit of work over the sessions of domain controllers.
+
+The eo_lib / research_domain controllers commit after every write, so loading
+a workbook paid one database commit (and one expiry of every loaded object)
+per created initiative, team, member and link. Inside a UnitOfWork the
+controllers' ``session.commit()`` only flushes and marks a savepoint, and
+``session.rollback()`` returns to the last savepoint. Work is committed for
+real once every `batch_size` rows and when the unit of work ends.
+
+Each row runs in a savepoint of its own, so a failing row discards all of
+its writes (and the rows participants staged for it) while the rest of the
+batch survives. A controller rolling back after a failed write only
+discards the work done since its last commit, as it would outside.
+
+While a unit of work holds its transaction open, writes on another
+connection wait for it (SQLite locks the whole database). Writers that stage
+rows of their own, such as the tracking buffer, join the unit of work found
+with active_unit_of_work(): their rows are written on the staged session
+right before each commit and dropped with a failing row.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from loguru import logger
+
+_current_unit_of_work: ContextVar[Optional["UnitOfWork"]] = ContextVar(
+    "current_unit_of_work", default=None
+)
+
+
+def active_unit_of_work() -> Optional["UnitOfWork"]:
+    """The innermost unit of work that stages a session; None outside one."""
+    uow = _current_unit_of_work.get()
+    if uow is None or uow.session is None:
+        return None
+    return uow
+
+
+def controller_session(controller: Any) -> Optional[Any]:
+    """SQLAlchemy session behind a controller, if it exposes one."""
+    try:
+        return controller._service._repository._session
+    except AttributeError:
+        return None
+
+
+class _StagedSession:
+    def __init__(self, session: Any):
+        self.session = session
+        self.savepoint = None
+        self.row_savepoint = None
+
+    def install(self) -> None:
+        self.session.commit = self.checkpoint
+        self.session.rollback = self.rollback_to_checkpoint
+        self._begin_outer()
+        self._begin()
+
+    def _begin_outer(self) -> None:
+        # pysqlite only opens a transaction before DML, so a SAVEPOINT issued
+        # first would become the outermost one and RELEASE would commit it.
+        connection = self.session.connection()
+        if connection.dialect.name != "sqlite":
+            return
+        if not connection.connection.driver_connection.in_transaction:
+            connection.exec_driver_sql("BEGIN")
+
+    def uninstall(self) -> None:
+        for name in ("commit", "rollback"):
+            try:
+                delattr(self.session, name)
+            except AttributeError:
+                pass
+
+    def _begin(self) -> None:
+        self.savepoint = self.session.begin_nested()
+
+    def checkpoint(self) -> None:
+        """Stands in for ``session.commit()`` inside the unit of work."""
+        self.session.flush()
+        if self.savepoint is not None and self.savepoint.is_active:
+            self.savepoint.commit()
+        self._begin()
+
+    def rollback_to_checkpoint(self) -> None:
+        """Stands in for ``session.rollback()`` inside the unit of work."""
+        if self.savepoint is not None:
+            # Also valid after a failed flush deactivated the savepoint.
+            self.savepoint.rollback()
+        self._begin()
+
+    def begin_row(self) -> None:
+        self.session.flush()
+        if self.savepoint is not None and self.savepoint.is_active:
+            self.savepoint.commit()
+        self.row_savepoint = self.session.begin_nested()
+        self._begin()
+
+    def end_row(self) -> None:
+        """Releases the row's savepoint with the checkpoints nested in it."""
+        self.row_savepoint.commit()
+        self.row_savepoint = None
+        self._begin()
+
+    def rollback_row(self) -> None:
+        """Discards everything written since begin_row()."""
+        self.row_savepoint.rollback()
+        self.row_savepoint = None
+        self._begin()
+
+    def commit(self) -> None:
+        self.uninstall()
+        try:
+            self.session.commit()
+        finally:
+            self.savepoint = None
+            self.row_savepoint = None
+
+    def rollback(self) -> None:
+        self.uninstall()
+        self.savepoint = None
+        self.row_savepoint = None
+        self.session.rollback()
+
+
+class UnitOfWork:
+    """
+    Stages the writes of several sessions and commits them every
+    `batch_size` rows::
+
+        with UnitOfWork(sessions, batch_size=200) as uow:
+            for row in rows:
+                with uow.row():
+                    process(row)
+
+    Participants (see join()) provide ``checkpoint()``,
+    ``rollback_to(checkpoint)`` and ``before_commit(session)``.
+    """
+
+    def __init__(self, sessions: Iterable[Any], batch_size: int):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        unique: List[Any] = []
+        for session in sessions:
+            if session is not None and all(session is not s for s in unique):
+                unique.append(session)
+        self._sessions = [_StagedSession(session) for session in unique]
+        # The session participants write on; None when nothing is staged.
+        self.session = unique[0] if unique else None
+        self.participants: List[Any] = []
+        self._row_checkpoints: Optional[Dict[int, Any]] = None
+        self._commit_checkpoints: Dict[int, Any] = {}
+        self._token = None
+        self.batch_size = batch_size
+        self.rows = 0
+        self.failed_rows = 0
+        self.commits = 0
+        self._pending_rows = 0
+        self._started_at = 0.0
+
+    def __enter__(self) -> "UnitOfWork":
+        self._started_at = time.perf_counter()
+        for staged in self._sessions:
+            staged.install()
+        self._token = _current_unit_of_work.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self._commit_all()
+            else:
+                for participant in self.participants:
+                    participant.rollback_to(self._commit_checkpoints[id(participant)])
+                for staged in self._sessions:
+                    staged.rollback()
+        finally:
+            _current_unit_of_work.reset(self._token)
+
+    def join(self, participant: Any) -> None:
+        """Stages `participant`'s rows with this unit of work: the rows of a
+        failing row are dropped, the others written before every commit."""
+        if any(joined is participant for joined in self.participants):
+            return
+        self.participants.append(participant)
+        checkpoint = participant.checkpoint()
+        self._commit_checkpoints[id(participant)] = checkpoint
+        if self._row_checkpoints is not None:
+            self._row_checkpoints[id(participant)] = checkpoint
+
+    @contextmanager
+    def row(self) -> Iterator[None]:
+        """Processes one source row. An exception rolls the sessions and the
+        participants back to the start of the row and propagates; the batch
+        is kept."""
+        for staged in self._sessions:
+            staged.begin_row()
+        self._row_checkpoints = {
+            id(participant): participant.checkpoint()
+            for participant in self.participants
+        }
+        try:
+            yield
+            for staged in self._sessions:
+                staged.session.flush()
+            for staged in self._sessions:
+                staged.end_row()
+        except Exception:
+            self.failed_rows += 1
+            for staged in self._sessions:
+                if staged.row_savepoint is not None:
+                    staged.rollback_row()
+            for participant in self.participants:
+                participant.rollback_to(self._row_checkpoints[id(participant)])
+            raise
+        finally:
+            self._row_checkpoints = None
+            self.rows += 1
+            self._pending_rows += 1
+            if self._pending_rows >= self.batch_size:
+                self.commit()
+
+    def commit(self) -> None:
+        """Commits everything staged so far and keeps the unit of work open."""
+        self._commit_all()
+        for staged in self._sessions:
+            staged.install()
+
+    def _commit_all(self) -> None:
+        if self.session is not None:
+            for participant in self.participants:
+                participant.before_commit(self.session)
+        for staged in self._sessions:
+            staged.commit()
+        self._commit_checkpoints = {
+            id(participant): participant.checkpoint()
+            for participant in self.participants
+        }
+        self.commits += 1
+        self._pending_rows = 0
+
+    def rows_per_second(self) -> float:
+        elapsed = time.perf_counter() - self._started_at
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def log_summary(self, label: str) -> None:
+        logger.info(
+            f"{label}: {self.rows} rows ({self.failed_rows} failed) in "
+            f"{self.commits} commit(s), {self.rows_per_second():.1f} rows/s"
+        )
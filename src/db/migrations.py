@@ -9,18 +9,35 @@ previous runtime-DDL stopgap.
 Run at pipeline/app start, or lazily via ``ProjectEnrichmentLoader.ensure_schema``.
 """
 
-from typing import List, Tuple
+from typing import Any, Callable, List, Tuple, Union
 
 from loguru import logger
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
-# (id, SQL). Order matters; ids are immutable once shipped.
-MIGRATIONS: List[Tuple[str, str]] = [
+from src.core.logic.person_name_keys import (
+    CREATE_INDEX_SQL,
+    CREATE_TABLE_SQL,
+    refresh_person_name_keys,
+)
+
+
+def _backfill_person_name_keys(session) -> None:
+    # Keys of persons written before the table existed; later ORM writes are
+    # kept current by the person name key hook.
+    refresh_person_name_keys(session.connection().connection.driver_connection)
+
+
+# (id, SQL or a callable taking the session). Order matters; ids are
+# immutable once shipped.
+MIGRATIONS: List[Tuple[str, Union[str, Callable[[Any], None]]]] = [
     (
         "0001_initiatives_enrichment_json",
         "ALTER TABLE initiatives ADD COLUMN enrichment_json TEXT",
     ),
+    ("0002_person_name_keys", CREATE_TABLE_SQL),
+    ("0003_person_name_keys_index", CREATE_INDEX_SQL),
+    ("0004_person_name_keys_backfill", _backfill_person_name_keys),
 ]
 
 
@@ -42,7 +59,10 @@ def run_migrations(session) -> int:
         if migration_id in applied:
             continue
         try:
-            session.execute(text(sql))
+            if callable(sql):
+                sql(session)
+            else:
+                session.execute(text(sql))
         except OperationalError as exc:
             # ADD COLUMN on an already-migrated DB (legacy runtime DDL) is fine.
             if "duplicate column" not in str(exc).lower():
@@ -1,3 +1,4 @@
+import threading
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -5,6 +6,20 @@ from prefect import flow, get_run_logger, task
 from research_domain import CampusController, ResearchGroupController
 
 from src.adapters.sources.cnpq_crawler import CnpqCrawlerAdapter
+from src.adapters.sources.cnpq_http_cache import (
+    CACHE_MODE_REPLAY,
+    DEFAULT_CNPQ_CACHE_MODE,
+    CnpqCacheMiss,
+    CnpqHttpCache,
+)
+from src.core.logic.cnpq_crawl_pipeline import (
+    DEFAULT_CNPQ_FETCH_WORKERS,
+    DEFAULT_CNPQ_REQUESTS_PER_SECOND,
+    RateLimiter,
+    RetryPolicy,
+    crawl_groups,
+)
+from src.core.logic.reference_data_cache import reference_data_scope
 from src.core.logic.strategies.cnpq_sync import CnpqSyncLogic
 from src.notifications.telegram import telegram_flow_state_handlers
 from src.tracking.recorder import tracking_recorder
@@ -75,6 +90,20 @@ def sync_single_group(group_info: dict):
     """
     Synchronizes a single research group.
     """
+    adapter = CnpqCrawlerAdapter()
+    return write_group_data(group_info, adapter.get_group_data(group_info["url"]))
+
+
+def write_group_data(
+    group_info: dict,
+    data: Optional[dict],
+    adapter: Optional[CnpqCrawlerAdapter] = None,
+    sync_logic: Optional[CnpqSyncLogic] = None,
+) -> dict:
+    """
+    Persists an already fetched group payload. Runs on the writer side of
+    the crawl: every database write of the CNPq sync goes through here.
+    """
     logger = get_run_logger()
     url = group_info["url"]
     group_id = group_info["id"]
@@ -82,11 +111,10 @@ def sync_single_group(group_info: dict):
 
     logger.info(f"Synchronizing group: {group_name} ({url})")
 
-    adapter = CnpqCrawlerAdapter()
-    sync_logic = CnpqSyncLogic()
+    adapter = adapter or CnpqCrawlerAdapter()
+    sync_logic = sync_logic or CnpqSyncLogic()
 
-    # 1. Extract data
-    data = adapter.get_group_data(url)
+    # 1. Extracted data
     if not data:
         logger.error(f"Failed to extract data for {group_name}")
         return {
@@ -95,6 +123,19 @@ def sync_single_group(group_info: dict):
             "group_name": group_name,
             "url": url,
         }
+    if tracking_recorder.is_unchanged(
+        source_entity_type="cnpq_group_payload",
+        source_record_id=str(group_id),
+        payload=data,
+    ):
+        logger.info(f"Group {group_name} unchanged since the last sync, skipping")
+        return {
+            "success": True,
+            "unchanged": True,
+            "group_id": group_id,
+            "group_name": group_name,
+            "url": url,
+        }
     source_record = tracking_recorder.record_source_record(
         source_entity_type="cnpq_group_payload",
         payload=data,
@@ -143,6 +184,15 @@ def sync_single_group(group_info: dict):
     logger.info(f"Extracted {len(lines)} research lines for {group_name}")
     sync_logic.sync_knowledge_areas(group_id, lines, source_file=url)
 
+    # Marks the payload as applied for the change gate of later runs.
+    tracking_recorder.record_entity_match(
+        source_record_id=getattr(source_record, "id", None),
+        canonical_entity_type="research_group",
+        canonical_entity_id=group_id,
+        match_strategy="cnpq_group_id",
+        match_confidence=1.0,
+    )
+
     return {
         "success": True,
         "group_id": group_id,
@@ -187,20 +237,58 @@ def build_cnpq_sync_summary(results: list[dict]) -> dict:
     }
 
 
+def _thread_local_fetcher(cache: CnpqHttpCache):
+    """Fetch function giving each crawl worker thread its own adapter."""
+    local = threading.local()
+
+    def fetch(url: str) -> Optional[dict]:
+        if not hasattr(local, "adapter"):
+            local.adapter = CnpqCrawlerAdapter(cache=cache)
+        return local.adapter.fetch_group_data(url)
+
+    return fetch
+
+
 @flow(name="Sync CNPq Research Groups", **telegram_flow_state_handlers())
-def sync_cnpq_groups_flow(campus_name: Optional[str] = None):
+def sync_cnpq_groups_flow(
+    campus_name: Optional[str] = None,
+    max_workers: int = DEFAULT_CNPQ_FETCH_WORKERS,
+    requests_per_second: float = DEFAULT_CNPQ_REQUESTS_PER_SECOND,
+    cache_mode: str = DEFAULT_CNPQ_CACHE_MODE,
+):
     """
     Prefect flow to synchronize research groups with CNPq DGP mirror.
+
+    Group pages are fetched concurrently (bounded by `max_workers` and
+    `requests_per_second`) while this flow's thread writes each parsed
+    payload to the database as it arrives. Pages go through the on-disk
+    CNPq cache; ``cache_mode="replay"`` serves recorded pages only.
     """
     logger = get_run_logger()
     logger.info(f"Starting CNPq Synchronization Flow (Filter: {campus_name or 'None'})")
 
     groups = get_groups_to_sync(campus_name=campus_name)
 
-    results = []
-    for g_info in groups:
-        res = sync_single_group(g_info)
-        results.append(res)
+    if cache_mode == CACHE_MODE_REPLAY:
+        # Recorded pages only: nothing to rate-limit.
+        requests_per_second = 0
+    rate_limiter = RateLimiter(requests_per_second)
+    cache = CnpqHttpCache(mode=cache_mode, rate_limiter=rate_limiter)
+    adapter = CnpqCrawlerAdapter(cache=cache)
+    sync_logic = CnpqSyncLogic()
+    with reference_data_scope("cnpq groups"):
+        results = crawl_groups(
+            groups,
+            fetch=_thread_local_fetcher(cache),
+            write=lambda g_info, data: write_group_data(
+                g_info, data, adapter=adapter, sync_logic=sync_logic
+            ),
+            max_workers=max_workers,
+            requests_per_second=requests_per_second,
+            rate_limiter=rate_limiter,
+            retry_policy=RetryPolicy(give_up_on=(CnpqCacheMiss,)),
+        )
+    logger.info(f"CNPq cache ({cache_mode}): {cache.stats}")
 
     success_count = sum(1 for r in results if r.get("success"))
     summary = build_cnpq_sync_summary(results)
@@ -1,6 +1,8 @@
 import glob
 import json
 import os
+import time
+from typing import Optional
 
 from loguru import logger as fallback_logger
 from prefect import flow, get_run_logger, task
@@ -8,16 +10,35 @@ from prefect.cache_policies import NO_CACHE
 from research_domain.controllers import ResearcherController
 
 from src.adapters.sources.lattes_parser import LattesParser
+from src.core.logic.initiative_name_index import initiative_name_index_scope
+from src.core.logic.lattes_ingest_manifest import (
+    DEFAULT_LATTES_FORCE_FULL,
+    LattesIngestManifest,
+    cv_updated_at,
+)
 from src.core.logic.project_loader import ProjectLoader
-from src.core.logic.researcher_resolution import resolve_researcher_from_lattes
+from src.core.logic.researcher_resolution import (
+    ResearcherResolutionIndex,
+    resolve_researcher_from_lattes,
+)
 from src.core.logic.strategies.lattes_advisorships import (
     LattesAdvisorshipMappingStrategy,
 )
+from src.core.logic.unit_of_work import controller_session
 from src.notifications.telegram import telegram_flow_state_handlers
+from src.tracking.recorder import tracking_recorder
 
 
 @task(name="Ingest Lattes Advisorships for File", cache_policy=NO_CACHE)
-def ingest_advisorships_file_task(file_path: str):
+def ingest_advisorships_file_task(
+    file_path: str,
+    manifest: Optional[LattesIngestManifest] = None,
+    resolution_index: Optional[ResearcherResolutionIndex] = None,
+    loader: Optional[ProjectLoader] = None,
+):
+    """Ingests the advisorships of one CV. The flow passes one researcher
+    index and one ProjectLoader (reuse_caches=True) for the whole run;
+    without them both are built for this file."""
     try:
         logger = get_run_logger()
     except Exception:
@@ -37,20 +58,19 @@ def ingest_advisorships_file_task(file_path: str):
         return
 
     # 1. Identify Supervisor (Owner of CV)
-    researcher_ctrl = ResearcherController()
-    all_researchers = researcher_ctrl.get_all()
+    if resolution_index is not None:
+        all_researchers = resolution_index
+        session = resolution_index.session
+    else:
+        researcher_ctrl = ResearcherController()
+        all_researchers = researcher_ctrl.get_all()
+        session = controller_session(researcher_ctrl)
 
     json_name = (
         data.get("nome")
         or data.get("name")
         or data.get("informacoes_pessoais", {}).get("nome_completo")
     )
-    session = None
-    try:
-        session = researcher_ctrl._service._repository._session
-    except Exception:
-        pass
-
     supervisor = resolve_researcher_from_lattes(
         all_researchers,
         lattes_id=lattes_id,
@@ -71,32 +91,88 @@ def ingest_advisorships_file_task(file_path: str):
     advisorships = parser.parse_advisorships(data)
 
     if not advisorships:
+        _mark_ingested(manifest, file_path, data)
         return
 
     logger.info(f"Processing {len(advisorships)} advisorships for {json_name}...")
 
     # 3. Ingest with Strategy & ProjectLoader
     mapping_strategy = LattesAdvisorshipMappingStrategy(json_name)
-    loader = ProjectLoader(mapping_strategy=mapping_strategy)
-
-    loader.process_records(advisorships, source_file=file_path)
+    if loader is None:
+        loader = ProjectLoader(mapping_strategy=mapping_strategy)
+        stats = loader.process_records(advisorships, source_file=file_path)
+    else:
+        stats = loader.process_records(
+            advisorships, source_file=file_path, mapping_strategy=mapping_strategy
+        )
+    if stats["failed"]:
+        # Rows that failed are retried on the next run.
+        logger.warning(
+            f"{stats['failed']} advisorships of {lattes_id} failed; "
+            "the CV is not marked as ingested."
+        )
+        return
+    _mark_ingested(manifest, file_path, data)
+
+
+def _mark_ingested(
+    manifest: Optional[LattesIngestManifest], file_path: str, data: dict
+) -> None:
+    # A CV whose supervisor is not in the DB yet is not marked: it is
+    # retried once the projects flow has created the researcher.
+    if manifest is not None:
+        manifest.mark_ingested(
+            file_path,
+            cv_updated_at=cv_updated_at(data),
+            ingestion_run_id=tracking_recorder.current_run_id(),
+        )
 
 
 @flow(name="Ingest Lattes Advisorships Flow", **telegram_flow_state_handlers())
-def ingest_lattes_advisorships_flow():
+def ingest_lattes_advisorships_flow(force_full: Optional[bool] = None):
     base_dir = "data/lattes_json"
     if not os.path.isabs(base_dir):
         base_dir = os.path.join(os.getcwd(), base_dir)
 
-    json_files = glob.glob(os.path.join(base_dir, "*.json"))
+    json_files = sorted(glob.glob(os.path.join(base_dir, "*.json")))
 
     logger = get_run_logger()
     if not json_files:
         logger.warning(f"No JSON files found in {base_dir}")
         return
 
-    for json_file in json_files:
-        ingest_advisorships_file_task(json_file)
+    if force_full is None:
+        force_full = DEFAULT_LATTES_FORCE_FULL
+    researcher_ctrl = ResearcherController()
+    manifest = LattesIngestManifest("lattes_advisorships")
+    manifest.forget_unknown_runs(controller_session(researcher_ctrl))
+    selected_files = manifest.select(json_files, force_full=force_full)
+    if not selected_files:
+        return
+
+    # One researcher index and one loader (initiative cache, person matcher)
+    # for the whole run instead of one per CV.
+    started = time.perf_counter()
+    resolution_index = ResearcherResolutionIndex(
+        researcher_ctrl.get_all(), session=controller_session(researcher_ctrl)
+    )
+    loader = ProjectLoader(reuse_caches=True)
+    try:
+        with initiative_name_index_scope("lattes advisorships"):
+            for json_file in selected_files:
+                ingest_advisorships_file_task(
+                    json_file,
+                    manifest,
+                    resolution_index=resolution_index,
+                    loader=loader,
+                )
+    finally:
+        manifest.save()
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"Lattes advisorships: {len(selected_files)} files in {elapsed:.1f}s "
+        f"({len(selected_files) / elapsed if elapsed else 0:.2f} files/s)"
+    )
 
 
 if __name__ == "__main__":
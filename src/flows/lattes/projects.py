@@ -1,12 +1,10 @@
 import faulthandler
 import gc
 import glob
-import json
 import os
 import re
-from typing import Any, Dict, List
-
-faulthandler.enable()
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
 from eo_lib import InitiativeController, PersonController, TeamController
 from loguru import logger
@@ -21,20 +19,41 @@ from research_domain.controllers import (
     ResearchProductionController,
 )
 from research_domain.domain.entities.researcher import Researcher
-from sqlalchemy import text
+from sqlalchemy import insert, text
 from sqlalchemy.engine import Engine
 
 from src.adapters.sources.lattes_parser import LattesParser
+from src.core.logic.article_index import (
+    DEFAULT_ARTICLE_INSERT_BATCH_SIZE,
+    ArticleIndex,
+    article_index_scope,
+    get_article_index,
+)
 from src.core.logic.entity_manager import EntityManager
+from src.core.logic.lattes_ingest_manifest import (
+    DEFAULT_LATTES_FORCE_FULL,
+    LattesIngestManifest,
+)
+from src.core.logic.lattes_parse_pipeline import (
+    DEFAULT_LATTES_PARSE_WORKERS,
+    ParsedLattesCV,
+    parse_lattes_file,
+    parse_lattes_files,
+)
+from src.core.logic.production_index import get_production_index, production_index_scope
 from src.core.logic.project_loader import ProjectLoader
 from src.core.logic.researcher_resolution import (
+    ResearcherResolutionIndex,
     resolve_or_create_researcher,
     resolve_researcher_from_lattes,
 )
 from src.core.logic.strategies.lattes_projects import LattesProjectMappingStrategy
+from src.core.logic.unit_of_work import UnitOfWork, controller_session
 from src.notifications.telegram import telegram_flow_state_handlers
 from src.tracking.recorder import tracking_recorder
 
+faulthandler.enable()
+
 
 def _resolve_sqlalchemy_engine(init_ctrl: InitiativeController) -> Engine:
     """Resolve the SQLAlchemy engine across eo-lib client variants."""
@@ -69,39 +88,69 @@ def _resolve_sqlalchemy_engine(init_ctrl: InitiativeController) -> Engine:
     raise RuntimeError("Could not resolve SQLAlchemy engine for Lattes ingestion")
 
 
-def _ingest_researcher_file(
-    file_path: str, entity_manager: EntityManager, parser: LattesParser
-):
+def _build_resolution_index(
+    researcher_ctrl: ResearcherController,
+) -> ResearcherResolutionIndex:
+    session = None
     try:
-        filename = os.path.basename(file_path)
-        lattes_id = filename.replace(".json", "").split("_")[-1]
+        session = researcher_ctrl._service._repository._session
+    except Exception:
+        pass
+    return ResearcherResolutionIndex(researcher_ctrl.get_all(), session=session)
 
-        if not lattes_id or not lattes_id.isdigit():
-            logger.info(f"Skipping file {filename}: Could not extract Lattes ID.")
-            return
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load JSON {file_path}: {e}")
-            return
+def _ingest_researcher_file(
+    file_path: str,
+    entity_manager: EntityManager,
+    parser: LattesParser,
+    researcher_ctrl: Optional[ResearcherController] = None,
+    resolution_index: Optional[ResearcherResolutionIndex] = None,
+):
+    parsed_cv = parse_lattes_file(
+        file_path,
+        parser,
+        known_fingerprints=tracking_recorder.applied_fingerprints("lattes_cv"),
+    )
+    if parsed_cv is not None:
+        _write_researcher_cv(
+            parsed_cv, entity_manager, parser, researcher_ctrl, resolution_index
+        )
 
-        personal_info = parser.parse_personal_info(data)
 
-        json_name = data.get("nome") or data.get("name")
-        if not json_name:
-            info = data.get("informacoes_pessoais", {})
-            json_name = info.get("nome_completo")
-        json_name = personal_info.get("name") or json_name
+def _write_researcher_cv(
+    parsed_cv: ParsedLattesCV,
+    entity_manager: EntityManager,
+    parser: LattesParser,
+    researcher_ctrl: Optional[ResearcherController] = None,
+    resolution_index: Optional[ResearcherResolutionIndex] = None,
+    force_full: bool = False,
+) -> bool:
+    """Writes one parsed CV; runs in the process that owns the session.
+    Returns False when the CV, or any row or section of it, could not be
+    ingested: the CV is then neither fingerprinted nor marked as ingested,
+    so the next run retries it."""
+    file_path = parsed_cv.file_path
+    lattes_id = parsed_cv.lattes_id
+    try:
+        if not force_full and tracking_recorder.is_unchanged(
+            source_entity_type="lattes_cv",
+            source_record_id=lattes_id,
+            payload_hash=parsed_cv.payload_hash,
+        ):
+            logger.info(
+                f"Skipping unchanged Lattes CV {lattes_id} "
+                f"({os.path.basename(file_path)})"
+            )
+            return True
 
-        researcher_ctrl = ResearcherController()
-        all_researchers = researcher_ctrl.get_all()
-        session = None
-        try:
-            session = researcher_ctrl._service._repository._session
-        except Exception:
-            pass
+        personal_info = parsed_cv.personal_info
+        json_name = parsed_cv.json_name
+
+        if researcher_ctrl is None or resolution_index is None:
+            researcher_ctrl = ResearcherController()
+            resolution_index = _build_resolution_index(researcher_ctrl)
+        all_researchers = resolution_index
+        session = resolution_index.session
 
         target_researcher = resolve_researcher_from_lattes(
             all_researchers,
@@ -128,6 +177,9 @@ def _ingest_researcher_file(
         if lattes_id and not personal_info.get("cnpq_url"):
             personal_info["cnpq_url"] = f"http://lattes.cnpq.br/{lattes_id}"
 
+        # Failed rows per section; any failure keeps the CV for the next run.
+        failures = Counter()
+
         # 1. Update Personal Info
         needs_update = False
         if personal_info.get("citation_names"):
@@ -143,6 +195,7 @@ def _ingest_researcher_file(
         if needs_update:
             try:
                 researcher_ctrl.update(target_researcher)
+                all_researchers.reindex(target_researcher)
                 source_record = tracking_recorder.record_source_record(
                     source_entity_type="researcher_profile",
                     payload=personal_info,
@@ -187,27 +240,14 @@ def _ingest_researcher_file(
                 )
             except Exception as e:
                 logger.warning(f"Failed to update researcher data for {lattes_id}: {e}")
+                failures["personal_info"] += 1
 
         logger.info(
             f"Processing data for researcher: {target_researcher.name} (Lattes: {lattes_id})"
         )
 
-        # 2. Extract Projects
-        projects = []
-        projects.extend(parser.parse_research_projects(data))
-        projects.extend(parser.parse_extension_projects(data))
-        projects.extend(parser.parse_development_projects(data))
-
-        # Deduplicate projects by name
-        seen_names = set()
-        unique_projects = []
-        for p in projects:
-            p_name = (p.get("name") or "").strip()
-            if p_name and p_name not in seen_names:
-                p["name"] = p_name
-                unique_projects.append(p)
-                seen_names.add(p_name)
-
+        # 2. Projects (deduplicated by name while parsing)
+        unique_projects = parsed_cv.projects
         if unique_projects:
             logger.info(
                 f"Ingesting {len(unique_projects)} projects with ProjectLoader for {target_researcher.name}"
@@ -220,21 +260,20 @@ def _ingest_researcher_file(
             )
             loader = ProjectLoader(mapping_strategy=mapping_strategy)
 
-            loader.process_records(unique_projects, source_file=file_path)
+            stats = loader.process_records(unique_projects, source_file=file_path)
+            failures["projects"] += stats["failed"]
 
         # 3. Handle Articles
-        articles = []
-        articles.extend(parser.parse_articles(data))
-        articles.extend(parser.parse_conference_papers(data))
+        articles = parsed_cv.articles
         if articles:
-            ingest_articles_task(
+            failures["articles"] += ingest_articles_task(
                 articles, target_researcher, all_researchers, parser, file_path
             )
 
         # 4. Handle Academic Education
-        education_list = parser.parse_academic_education(data)
+        education_list = parsed_cv.education
         if education_list:
-            ingest_education_task(
+            failures["education"] += ingest_education_task(
                 education_list,
                 target_researcher,
                 all_researchers,
@@ -246,38 +285,86 @@ def _ingest_researcher_file(
         # 5. Awards, languages, professional activities, technical productions.
         # Idempotent: each is deduped by natural key so re-runs don't duplicate.
         # Each section is isolated so one failure never aborts the others.
-        for section_name, parse_fn, ingest_fn in (
-            ("awards", parser.parse_awards, ingest_awards_task),
-            ("languages", parser.parse_languages, ingest_languages_task),
-            (
-                "professional_activities",
-                parser.parse_professional_activities,
-                ingest_professional_activities_task,
-            ),
-            (
-                "technical_productions",
-                parser.parse_technical_productions,
-                ingest_technical_productions_task,
-            ),
+        for section_name, ingest_fn in (
+            ("awards", ingest_awards_task),
+            ("languages", ingest_languages_task),
+            ("professional_activities", ingest_professional_activities_task),
+            ("technical_productions", ingest_technical_productions_task),
         ):
             try:
-                items = parse_fn(data)
+                items = parsed_cv.sections.get(section_name)
                 if items:
-                    ingest_fn(items, target_researcher, session)
+                    failures[section_name] += ingest_fn(
+                        items, target_researcher, session
+                    )
             except Exception as exc:
                 logger.warning(
                     f"Failed to ingest {section_name} for {target_researcher.name}: {exc}"
                 )
+                failures[section_name] += 1
+
+        if sum(failures.values()):
+            logger.warning(
+                f"Lattes CV {lattes_id} is not marked as ingested; failed rows: "
+                f"{dict(+failures)}"
+            )
+            return False
+
+        # Fingerprint of the whole CV, matched to its owner once ingested, so
+        # the change gate skips it while it stays unchanged.
+        cv_record = tracking_recorder.record_source_record(
+            source_entity_type="lattes_cv",
+            payload=None,
+            payload_hash=parsed_cv.payload_hash,
+            source_record_id=lattes_id,
+            source_file=file_path,
+            source_path=file_path,
+            store_payload=False,
+        )
+        tracking_recorder.record_entity_match(
+            source_record_id=getattr(cv_record, "id", None),
+            canonical_entity_type="researcher",
+            canonical_entity_id=target_researcher.id,
+            match_strategy="lattes_id_exact",
+            match_confidence=1.0,
+        )
+        return True
 
     except Exception as e:
         logger.error(f"Failed to process file {file_path}: {e}")
+        return False
 
 
 @task(name="Ingest Lattes Researcher Data", cache_policy=NO_CACHE)
 def ingest_researcher_data(
-    file_path: str, entity_manager: EntityManager, parser: LattesParser
+    file_path: str,
+    entity_manager: EntityManager,
+    parser: LattesParser,
+    researcher_ctrl: Optional[ResearcherController] = None,
+    resolution_index: Optional[ResearcherResolutionIndex] = None,
 ):
-    _ingest_researcher_file(file_path, entity_manager, parser)
+    _ingest_researcher_file(
+        file_path, entity_manager, parser, researcher_ctrl, resolution_index
+    )
+
+
+@task(name="Write Lattes Researcher Data", cache_policy=NO_CACHE)
+def write_researcher_data(
+    parsed_cv: ParsedLattesCV,
+    entity_manager: EntityManager,
+    parser: LattesParser,
+    researcher_ctrl: Optional[ResearcherController] = None,
+    resolution_index: Optional[ResearcherResolutionIndex] = None,
+    force_full: bool = False,
+) -> bool:
+    return _write_researcher_cv(
+        parsed_cv,
+        entity_manager,
+        parser,
+        researcher_ctrl,
+        resolution_index,
+        force_full=force_full,
+    )
 
 
 @task(name="Ingest Lattes Researcher File", cache_policy=NO_CACHE)
@@ -290,7 +377,7 @@ def ingest_file_task(file_path: str, entity_manager: EntityManager):
 def ingest_articles_task(
     articles: List[Dict],
     target_researcher: Researcher,
-    all_researchers: List[Researcher],
+    all_researchers: ResearcherResolutionIndex,
     parser: LattesParser,
     source_file: str,
 ):
@@ -298,99 +385,162 @@ def ingest_articles_task(
     article_ctrl = ArticleController()
     researcher_ctrl = ResearcherController()
 
-    for art in articles:
-        try:
-            title = art["title"]
-            year = art["year"]
-            doi = art.get("doi")
-            source_record = tracking_recorder.record_source_record(
-                source_entity_type="article",
-                payload=art,
-                source_record_id=(doi or f"{parser.normalize_title(title)}|{year}"),
-                source_file=source_file,
-                source_path=source_file,
-            )
+    # Existing articles and authorships come from the run's ArticleIndex;
+    # inserts are committed once per batch instead of once per article.
+    session = controller_session(article_ctrl)
+    article_index = get_article_index(session) if session is not None else None
+    staged = [session] if article_index is not None else []
+    failed = 0
+    try:
+        with UnitOfWork(staged, DEFAULT_ARTICLE_INSERT_BATCH_SIZE) as uow:
+            for art in articles:
+                try:
+                    with uow.row():
+                        paper_id, created, linked = _ingest_article(
+                            art,
+                            target_researcher,
+                            parser,
+                            source_file,
+                            article_ctrl,
+                            researcher_ctrl,
+                            article_index,
+                        )
+                except Exception as art_err:
+                    logger.error(
+                        f"Failed to ingest article {art.get('title')}: {art_err}"
+                    )
+                    failed += 1
+                    continue
+                # Indexed once the row is kept (a failed row is rolled back).
+                if article_index is not None:
+                    if created:
+                        article_index.add(
+                            paper_id,
+                            doi=art.get("doi"),
+                            title=art["title"],
+                            year=art["year"],
+                        )
+                    if linked:
+                        article_index.add_author(paper_id, target_researcher.id)
+    except Exception:
+        if article_index is not None:
+            article_index.invalidate()
+        raise
+    return failed
 
-            existing_art = None
-            if doi:
-                existing_art = article_ctrl.get_by_doi(doi)
-            if not existing_art:
-                existing_art = article_ctrl.get_by_title_year(title, year)
 
-            if existing_art:
-                paper = existing_art
-            else:
-                paper = article_ctrl.create_article(
-                    title=title,
-                    year=year,
-                    type=art["type"],
-                    doi=doi,
-                    journal_conference=art.get("journal_conference"),
-                    volume=art.get("volume"),
-                    pages=art.get("pages"),
-                )
-                tracking_recorder.record_change(
-                    source_record_id=getattr(source_record, "id", None),
-                    canonical_entity_type="article",
-                    canonical_entity_id=paper.id,
-                    operation="create",
-                    changed_fields=[
-                        "title",
-                        "year",
-                        "doi",
-                        "journal_conference",
-                        "volume",
-                        "pages",
-                    ],
-                    after={
-                        "title": title,
-                        "year": year,
-                        "doi": doi,
-                        "journal_conference": art.get("journal_conference"),
-                        "volume": art.get("volume"),
-                        "pages": art.get("pages"),
-                    },
-                    reason="Created article from Lattes",
-                )
+def _ingest_article(
+    art: Dict,
+    target_researcher: Researcher,
+    parser: LattesParser,
+    source_file: str,
+    article_ctrl: ArticleController,
+    researcher_ctrl: ResearcherController,
+    article_index: Optional[ArticleIndex],
+) -> Tuple[int, bool, bool]:
+    """Resolves or creates one article and links the CV owner as author.
+    Returns (article id, created, author linked)."""
+    title = art["title"]
+    year = art["year"]
+    doi = art.get("doi")
+    source_record = tracking_recorder.record_source_record(
+        source_entity_type="article",
+        payload=art,
+        source_record_id=(doi or f"{parser.normalize_title(title)}|{year}"),
+        source_file=source_file,
+        source_path=source_file,
+    )
 
-            tracking_recorder.record_entity_match(
-                source_record_id=getattr(source_record, "id", None),
-                canonical_entity_type="article",
-                canonical_entity_id=paper.id,
-                match_strategy="doi_exact" if doi else "title_year",
-                match_confidence=1.0 if doi else 0.8,
-            )
-            tracking_recorder.record_attribute_assertions(
-                source_record_id=getattr(source_record, "id", None),
-                canonical_entity_type="article",
-                canonical_entity_id=paper.id,
-                selected_attributes={
-                    "title": title,
-                    "year": year,
-                    "doi": doi,
-                    "journal_conference": art.get("journal_conference"),
-                    "volume": art.get("volume"),
-                    "pages": art.get("pages"),
-                },
-                selection_reason="lattes_article_selected_values",
-            )
+    if article_index is not None:
+        paper_id = article_index.find(doi=doi, title=title, year=year)
+        current_author_ids = (
+            [target_researcher.id]
+            if paper_id is not None
+            and article_index.has_author(paper_id, target_researcher.id)
+            else []
+        )
+    else:
+        existing_art = None
+        if doi:
+            existing_art = article_ctrl.get_by_doi(doi)
+        if not existing_art:
+            existing_art = article_ctrl.get_by_title_year(title, year)
+        paper_id = existing_art.id if existing_art else None
+        current_author_ids = [
+            getattr(auth, "id") for auth in getattr(existing_art, "authors", [])
+        ]
+
+    created = paper_id is None
+    if created:
+        paper = article_ctrl.create_article(
+            title=title,
+            year=year,
+            type=art["type"],
+            doi=doi,
+            journal_conference=art.get("journal_conference"),
+            volume=art.get("volume"),
+            pages=art.get("pages"),
+        )
+        paper_id = paper.id
+        tracking_recorder.record_change(
+            source_record_id=getattr(source_record, "id", None),
+            canonical_entity_type="article",
+            canonical_entity_id=paper_id,
+            operation="create",
+            changed_fields=[
+                "title",
+                "year",
+                "doi",
+                "journal_conference",
+                "volume",
+                "pages",
+            ],
+            after={
+                "title": title,
+                "year": year,
+                "doi": doi,
+                "journal_conference": art.get("journal_conference"),
+                "volume": art.get("volume"),
+                "pages": art.get("pages"),
+            },
+            reason="Created article from Lattes",
+        )
 
-            # Link primary author
-            current_author_ids = [
-                getattr(auth, "id") for auth in getattr(paper, "authors", [])
-            ]
-            if target_researcher.id not in current_author_ids:
-                try:
-                    _attach_article_author(
-                        article_ctrl, researcher_ctrl, paper.id, target_researcher.id
-                    )
-                except Exception as link_err:
-                    logger.warning(
-                        f"Failed to link article '{title}' to researcher {target_researcher.id}: {link_err}"
-                    )
+    tracking_recorder.record_entity_match(
+        source_record_id=getattr(source_record, "id", None),
+        canonical_entity_type="article",
+        canonical_entity_id=paper_id,
+        match_strategy="doi_exact" if doi else "title_year",
+        match_confidence=1.0 if doi else 0.8,
+    )
+    tracking_recorder.record_attribute_assertions(
+        source_record_id=getattr(source_record, "id", None),
+        canonical_entity_type="article",
+        canonical_entity_id=paper_id,
+        selected_attributes={
+            "title": title,
+            "year": year,
+            "doi": doi,
+            "journal_conference": art.get("journal_conference"),
+            "volume": art.get("volume"),
+            "pages": art.get("pages"),
+        },
+        selection_reason="lattes_article_selected_values",
+    )
 
-        except Exception as art_err:
-            logger.error(f"Failed to ingest article {art.get('title')}: {art_err}")
+    # Link primary author
+    linked = False
+    if target_researcher.id not in current_author_ids:
+        try:
+            _attach_article_author(
+                article_ctrl, researcher_ctrl, paper_id, target_researcher.id
+            )
+            linked = True
+        except Exception as link_err:
+            logger.warning(
+                f"Failed to link article '{title}' to researcher {target_researcher.id}: {link_err}"
+            )
+    return paper_id, created, linked
 
 
 def _attach_article_author(
@@ -425,7 +575,7 @@ def _attach_article_author(
 def ingest_education_task(
     education_list: List[Dict],
     target_researcher: Researcher,
-    all_researchers: List[Researcher],
+    all_researchers: ResearcherResolutionIndex,
     entity_manager: EntityManager,
     researcher_ctrl: ResearcherController,
     source_file: str,
@@ -435,6 +585,7 @@ def ingest_education_task(
     )
     session = researcher_ctrl._service._repository._session
 
+    failed = 0
     for edu_data in education_list:
         try:
             source_record = tracking_recorder.record_source_record(
@@ -603,6 +754,8 @@ def ingest_education_task(
             )
         except Exception as e:
             logger.warning(f"Failed to ingest education item: {e}")
+            failed += 1
+    return failed
 
 
 def ingest_awards_task(awards, target_researcher, session):
@@ -615,7 +768,7 @@ def ingest_awards_task(awards, target_researcher, session):
         logger.warning(
             f"No DB session available; skipping {len(awards)} awards for {target_researcher.name}"
         )
-        return
+        return 0
     from research_domain.domain.entities.award import Award
 
     created = 0
@@ -633,6 +786,7 @@ def ingest_awards_task(awards, target_researcher, session):
     if created:
         session.commit()
     logger.info(f"Awards: {created} created for {target_researcher.name}")
+    return 0
 
 
 def _proficiency_level(value):
@@ -660,7 +814,7 @@ def ingest_languages_task(languages, target_researcher, session):
         logger.warning(
             f"No DB session available; skipping {len(languages)} languages for {target_researcher.name}"
         )
-        return
+        return 0
     from research_domain.domain.entities.language import Language
     from research_domain.domain.entities.proficiency import (
         Proficiency,
@@ -696,6 +850,7 @@ def ingest_languages_task(languages, target_researcher, session):
     if created:
         session.commit()
     logger.info(f"Proficiencies: {created} created for {target_researcher.name}")
+    return 0
 
 
 def ingest_professional_activities_task(activities, target_researcher, session):
@@ -717,7 +872,7 @@ def ingest_professional_activities_task(activities, target_researcher, session):
         ):
             seen.add((e.institution, e.start_year, e.activity_type))
 
-    created = 0
+    created = failed = 0
     for act in activities:
         key = (act["institution"], act["start_year"], act["activity_type"])
         if key in seen:
@@ -728,9 +883,11 @@ def ingest_professional_activities_task(activities, target_researcher, session):
             created += 1
         except Exception as e:
             logger.warning(f"Failed to ingest professional activity: {e}")
+            failed += 1
     logger.info(
         f"Professional activities: {created} created for {target_researcher.name}"
     )
+    return failed
 
 
 def ingest_technical_productions_task(productions, target_researcher, session):
@@ -738,70 +895,114 @@ def ingest_technical_productions_task(productions, target_researcher, session):
     patentes_registros) into `research_productions`.
 
     Production type is get-or-created by category name; production deduped by
-    (title, year, production_type_id) for this researcher.
+    (title, year, production_type_id) against the run's ProductionIndex. New
+    productions and author links are inserted in bulk, with one commit.
     """
+    if session is None:
+        logger.warning(
+            f"No DB session available; skipping {len(productions)} technical productions for {target_researcher.name}"
+        )
+        return 0
+    from research_domain.domain.entities.research_production import ResearchProduction
+
     type_ctrl = ProductionTypeController()
     prod_ctrl = ResearchProductionController()
+    index = get_production_index(session)
+    type_ids = index.production_type_ids(type_ctrl)
 
-    type_cache = {}
-    for t in type_ctrl.get_all():
-        name = getattr(t, "name", None)
-        if name:
-            type_cache[name] = t.id
-
-    created = 0
+    new_productions = {}
+    author_keys = []
+    outcomes = Counter()
+    failed = 0
     for prod in productions:
         title = prod["title"]
         year = prod.get("year")
         category = prod["production_type"]
 
-        type_id = type_cache.get(category)
+        type_id = type_ids.get(category)
         if type_id is None:
             try:
                 pt = type_ctrl.create_production_type(name=category)
                 type_id = pt.id
-                type_cache[category] = type_id
+                type_ids[category] = type_id
             except Exception as e:
                 logger.warning(f"Failed to ensure production type '{category}': {e}")
+                failed += 1
                 continue
 
-        existing_id = None
-        if session is not None:
-            from research_domain.domain.entities.research_production import (
-                ResearchProduction,
+        key = (type_id, title, year)
+        if index.find(key) is None and key not in new_productions:
+            new_productions[key] = ResearchProduction(
+                title=title, year=year, production_type_id=type_id
             )
+            outcomes[(category, "inserted")] += 1
+        else:
+            outcomes[(category, "deduplicated")] += 1
+        author_keys.append(key)
 
-            row = (
-                session.query(ResearchProduction)
-                .filter_by(title=title, year=year, production_type_id=type_id)
-                .first()
-            )
-            existing_id = row.id if row else None
-
-        try:
-            if existing_id is None:
-                production = prod_ctrl.create_production(
-                    title=title, year=year, production_type_id=type_id
-                )
-                existing_id = production.id
-                created += 1
-            prod_ctrl.add_author(existing_id, target_researcher.id)
-        except Exception as e:
-            logger.warning(f"Failed to ingest technical production '{title}': {e}")
+    try:
+        session.add_all(new_productions.values())
+        session.flush()
+        production_ids = {key: p.id for key, p in new_productions.items()}
+        for key in author_keys:
+            production_ids.setdefault(key, index.find(key))
+        author_rows = [
+            {"production_id": production_id, "researcher_id": target_researcher.id}
+            for production_id in dict.fromkeys(production_ids[k] for k in author_keys)
+            if not index.has_author(production_id, target_researcher.id)
+        ]
+        authors_table = ResearchProduction.__table__.metadata.tables.get(
+            "production_authors"
+        )
+        if author_rows and authors_table is not None:
+            session.execute(insert(authors_table), author_rows)
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        logger.warning(
+            f"Failed to ingest technical productions for {target_researcher.name}: {e}"
+        )
+        return len(productions)
+
+    for key in new_productions:
+        index.add(production_ids[key], key)
+    for (category, outcome), items in outcomes.items():
+        index.count(category, outcome, items)
+    for row in author_rows:
+        if authors_table is None:
+            try:
+                prod_ctrl.add_author(row["production_id"], row["researcher_id"])
+            except Exception as e:
+                logger.warning(f"Failed to link technical production: {e}")
+                failed += 1
+                continue
+        index.add_author(row["production_id"], row["researcher_id"])
     logger.info(
-        f"Technical productions: {created} created for {target_researcher.name}"
+        f"Technical productions: {len(new_productions)} created, "
+        f"{len(author_rows)} author links for {target_researcher.name}"
     )
+    return failed
 
 
 @flow(name="Ingest Lattes Projects Flow", **telegram_flow_state_handlers())
-def ingest_lattes_projects_flow():
+def ingest_lattes_projects_flow(
+    parse_workers: Optional[int] = None, force_full: Optional[bool] = None
+):
     base_dir = "data/lattes_json"
     if not os.path.isabs(base_dir):
         base_dir = os.path.join(os.getcwd(), base_dir)
 
-    json_files = glob.glob(os.path.join(base_dir, "*.json"))
+    json_files = sorted(glob.glob(os.path.join(base_dir, "*.json")))
     logger.info(f"Found {len(json_files)} files in {base_dir}")
 
+    if force_full is None:
+        force_full = DEFAULT_LATTES_FORCE_FULL
+    # Only CVs that are new or changed since this flow last ingested them.
+    researcher_ctrl = ResearcherController()
+    manifest = LattesIngestManifest("lattes_projects")
+    manifest.forget_unknown_runs(controller_session(researcher_ctrl))
+    json_files = manifest.select(json_files, force_full=force_full)
+
     if not json_files:
         return
 
@@ -819,9 +1020,42 @@ def ingest_lattes_projects_flow():
     # destroy data ingested for researchers whose JSONs are absent from disk.
     Base.metadata.create_all(engine)
 
-    for json_file in json_files:
-        ingest_researcher_data(json_file, entity_manager, parser)
-        gc.collect()
+    # One researcher index per run: CV owners, advisors and co-advisors are
+    # resolved by key lookups instead of rescanning the researcher table.
+    resolution_index = _build_resolution_index(researcher_ctrl)
+
+    # CPU-bound parsing runs on a process pool (LATTES_PARSE_WORKERS); this
+    # process stays the only writer and applies the CVs in file order.
+    known_fingerprints = (
+        {} if force_full else tracking_recorder.applied_fingerprints("lattes_cv")
+    )
+    try:
+        with (
+            article_index_scope("lattes projects"),
+            production_index_scope("lattes projects"),
+        ):
+            for parsed_cv in parse_lattes_files(
+                json_files,
+                max_workers=parse_workers or DEFAULT_LATTES_PARSE_WORKERS,
+                parser=parser,
+                known_fingerprints=known_fingerprints,
+            ):
+                if write_researcher_data(
+                    parsed_cv,
+                    entity_manager,
+                    parser,
+                    researcher_ctrl,
+                    resolution_index,
+                    force_full=force_full,
+                ):
+                    manifest.mark_ingested(
+                        parsed_cv.file_path,
+                        cv_updated_at=parsed_cv.cv_updated_at,
+                        ingestion_run_id=tracking_recorder.current_run_id(),
+                    )
+                gc.collect()
+    finally:
+        manifest.save()
 
 
 if __name__ == "__main__":
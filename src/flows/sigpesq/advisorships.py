@@ -1,11 +1,13 @@
 import glob
-import os
 
 from dotenv import load_dotenv
 from prefect import flow, get_run_logger, task
 
 from src.adapters.sources.sigpesq.adapter import SigPesqAdapter
+from src.core.logic.initiative_name_index import initiative_name_index_scope
 from src.core.logic.project_loader import ProjectLoader
+from src.core.logic.reference_data_cache import reference_data_scope
+from src.core.logic.sigpesq_parse_pipeline import order_by_year, parse_sigpesq_workbooks
 from src.core.logic.strategies.sigpesq_advisorships import (
     SigPesqAdvisorshipMappingStrategy,
 )
@@ -35,8 +37,8 @@ def persist_advisorships():
         logger.warning("No Advisorship Excel files found.")
         return
 
-    # Sort by mtime (optional, but good for logs)
-    files.sort(key=os.path.getmtime)
+    # Workbooks are parsed concurrently but written in year order.
+    files = order_by_year(files)
 
     loader = ProjectLoader(mapping_strategy=SigPesqAdvisorshipMappingStrategy())
 
@@ -70,9 +72,18 @@ def persist_advisorships():
     else:
         loader.initiative_type = raw_type
 
-    for file_path in files:
-        logger.info(f"Loading Advisorships from {file_path}")
-        loader.process_file(file_path)
+    with (
+        reference_data_scope("sigpesq advisorships"),
+        initiative_name_index_scope("sigpesq advisorships"),
+    ):
+        for workbook in parse_sigpesq_workbooks(files):
+            if workbook.error:
+                logger.error(
+                    f"Failed to read Excel file {workbook.file_path}: {workbook.error}"
+                )
+                continue
+            logger.info(f"Loading Advisorships from {workbook.file_path}")
+            loader.process_records(workbook.records, source_file=workbook.file_path)
 
     # Final pass: Recalculate parent project dates and status from DB
     loader.recalculate_all_parent_statuses()
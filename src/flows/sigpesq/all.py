@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 from prefect import flow, get_run_logger
 
 from src.adapters.sources.sigpesq.adapter import SigPesqAdapter
+from src.core.logic.reference_data_cache import reference_data_scope
 from src.flows.sigpesq.advisorships import (
     ingest_advisorships_flow,
     persist_advisorships,
@@ -48,14 +49,16 @@ def ingest_sigpesq_flow() -> None:
     logger.info("Extracting all SigPesq reports with a single login...")
     adapter.extract(download_strategies=_download_strategies())
 
-    logger.info("Persisting SigPesq research groups...")
-    persist_research_groups()
+    # One reference data cache for all datasets (nested task scopes reuse it).
+    with reference_data_scope("sigpesq full"):
+        logger.info("Persisting SigPesq research groups...")
+        persist_research_groups()
 
-    logger.info("Persisting SigPesq projects...")
-    persist_projects()
+        logger.info("Persisting SigPesq projects...")
+        persist_projects()
 
-    logger.info("Persisting SigPesq advisorships...")
-    persist_advisorships()
+        logger.info("Persisting SigPesq advisorships...")
+        persist_advisorships()
 
     logger.info("Flow finished successfully.")
 
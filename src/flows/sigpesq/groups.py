@@ -4,6 +4,7 @@ from dotenv import load_dotenv
 from prefect import flow, get_run_logger, task
 
 from src.adapters.sources.sigpesq.adapter import SigPesqAdapter
+from src.core.logic.reference_data_cache import reference_data_scope
 from src.core.logic.research_group_loader import ResearchGroupLoader
 from src.core.logic.strategies.sigpesq_excel import (
     SigPesqCampusStrategy,
@@ -45,7 +46,8 @@ def persist_research_groups():
         researcher_strategy=SigPesqResearcherStrategy(),
         role_strategy=SigPesqRoleStrategy(),
     )
-    loader.process_file(latest_file)
+    with reference_data_scope("sigpesq research groups"):
+        loader.process_file(latest_file)
 
 
 @flow(name="Ingest SigPesq Research Groups", **telegram_flow_state_handlers())
@@ -5,6 +5,7 @@ from prefect import flow, get_run_logger, task
 
 from src.adapters.sources.sigpesq.adapter import SigPesqAdapter
 from src.core.logic.project_loader import ProjectLoader
+from src.core.logic.reference_data_cache import reference_data_scope
 from src.core.logic.strategies.sigpesq_projects import SigPesqProjectMappingStrategy
 from src.notifications.telegram import telegram_flow_state_handlers
 
@@ -37,7 +38,8 @@ def persist_projects():
     logger.info(f"Loading Projects from {latest_file}")
 
     loader = ProjectLoader(mapping_strategy=SigPesqProjectMappingStrategy())
-    loader.process_file(latest_file)
+    with reference_data_scope("sigpesq projects"):
+        loader.process_file(latest_file)
 
 
 @flow(name="Ingest SigPesq Projects", **telegram_flow_state_handlers())
@@ -33,7 +33,6 @@ import glob
 import json
 import re
 import sys
-import unicodedata
 from collections import Counter, defaultdict
 from datetime import datetime
 from difflib import SequenceMatcher
@@ -42,6 +41,10 @@ from urllib.request import Request, urlopen
 
 BASE = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(BASE))
+from src.core.logic.text_normalization import (  # noqa: E402
+    fold_to_ascii,
+    normalize_ascii_lower,
+)
 from src.scripts.didatica import MOBILE_CSS, bloco_metrica  # noqa: E402
 
 LATTES_DIR = BASE / "data" / "lattes_json"
@@ -77,8 +80,7 @@ def norm_issn(s: str) -> str:
 
 
 def norm_name(s: str) -> str:
-    s = unicodedata.normalize("NFKD", s or "").encode("ascii", "ignore").decode()
-    return re.sub(r"\s+", " ", s).strip().lower()
+    return normalize_ascii_lower(s)
 
 
 def normalize_conf(name: str) -> str:
@@ -112,8 +114,7 @@ def conf_key(clean: str) -> str:
     evento — ex.: "Congresso Brasileiro de Automática" e "… (CBA)" agrupam juntos.
     """
     s = re.sub(r"\([^)]*\)?", " ", clean or "")  # parêntese pode estar sem fechar
-    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode().lower()
-    return re.sub(r"[^a-z0-9]+", "", s)
+    return re.sub(r"[^a-z0-9]+", "", fold_to_ascii(s).lower())
 
 
 # Peso por estrato Qualis (A1 = topo) — usado no ranking de docentes por impacto.
@@ -457,12 +458,7 @@ def load_qualis(path: Path | None, area: str | None = None) -> dict[str, str]:
 
 
 def _ckey(s: str) -> str:
-    s = (
-        unicodedata.normalize("NFKD", s or "")
-        .encode("ascii", "ignore")
-        .decode()
-        .lower()
-    )
+    s = fold_to_ascii(s or "").lower()
     return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9 ]", " ", s)).strip()
 
 
@@ -0,0 +1,188 @@
+"""
+Microbenchmark for src.core.logic.text_normalization.
+
+Replays every name and title found in a Lattes JSON corpus through the
+previous per-call implementations and through the shared cached normalizers,
+then prints the per-call cost of each and the cache hit rates.
+
+Uso:
+  python -m src.scripts.benchmark_text_normalization
+  python -m src.scripts.benchmark_text_normalization --lattes-dir data/lattes_json --repeat 3
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from typing import Any, Callable, Dict, Iterator, List
+
+sys.path.append(os.getcwd())
+
+from src.core.logic import text_normalization  # noqa: E402
+
+NAME_FIELDS = {
+    "nome",
+    "nome_completo",
+    "nome_citacoes",
+    "nome_do_orientado",
+    "orientando",
+    "autores",
+}
+TITLE_FIELDS = {"titulo", "revista", "nome_evento", "nome_instituicao"}
+
+
+def _legacy_person_name(name: str) -> str:
+    if not name:
+        return ""
+    name_str = "".join(
+        c for c in unicodedata.normalize("NFD", name) if unicodedata.category(c) != "Mn"
+    )
+    name_str = re.sub(r"[^A-Z\s]", " ", name_str.upper())
+    return " ".join(name_str.split())
+
+
+def _legacy_title(title: str) -> str:
+    if not title:
+        return ""
+    only_ascii = (
+        unicodedata.normalize("NFKD", title).encode("ASCII", "ignore").decode("ASCII")
+    )
+    return " ".join(re.sub(r"[^a-zA-Z0-9\s]", " ", only_ascii).lower().split())
+
+
+def _legacy_match_key(name: str) -> str:
+    s = (name or "").lower().strip()
+    s = "".join(
+        c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn"
+    )
+    return re.sub(r"\s+", " ", s)
+
+
+def _legacy_ascii_lower(value: str) -> str:
+    s = unicodedata.normalize("NFKD", value or "").encode("ascii", "ignore").decode()
+    return re.sub(r"\s+", " ", s).strip().lower()
+
+
+def _walk_strings(node: Any, key: str = "") -> Iterator[tuple]:
+    if isinstance(node, dict):
+        for child_key, value in node.items():
+            yield from _walk_strings(value, child_key)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _walk_strings(item, key)
+    elif isinstance(node, str) and node.strip():
+        yield key, node
+
+
+def load_corpus(lattes_dir: str) -> Dict[str, List[str]]:
+    """Collects name and title fields from every Lattes JSON file, in file
+    order and with repetitions, as a pipeline run would see them."""
+    names: List[str] = []
+    titles: List[str] = []
+    for path in sorted(glob.glob(os.path.join(lattes_dir, "*.json"))):
+        with open(path, "r", encoding="utf-8") as file_handle:
+            try:
+                data = json.load(file_handle)
+            except json.JSONDecodeError:
+                continue
+        for key, value in _walk_strings(data):
+            if key in NAME_FIELDS:
+                names.extend(part.strip() for part in value.split(";") if part.strip())
+            elif key in TITLE_FIELDS:
+                titles.append(value)
+    return {"names": names, "titles": titles}
+
+
+def _time_calls(
+    function: Callable[[str], str], values: List[str], repeat: int
+) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for value in values:
+            function(value)
+    calls = len(values) * repeat
+    return (time.perf_counter() - started) / calls * 1e9 if calls else 0.0
+
+
+def run_benchmark(corpus: Dict[str, List[str]], repeat: int) -> Dict[str, Any]:
+    cases = [
+        (
+            "normalize_person_name",
+            corpus["names"],
+            _legacy_person_name,
+            text_normalization.normalize_person_name,
+        ),
+        ("match_key", corpus["names"], _legacy_match_key, text_normalization.match_key),
+        (
+            "normalize_title",
+            corpus["titles"],
+            _legacy_title,
+            text_normalization.normalize_title,
+        ),
+        (
+            "normalize_ascii_lower",
+            corpus["titles"],
+            _legacy_ascii_lower,
+            text_normalization.normalize_ascii_lower,
+        ),
+    ]
+
+    text_normalization.clear_caches()
+    results: Dict[str, Any] = {}
+    for name, values, legacy, shared in cases:
+        mismatches = sum(1 for value in set(values) if legacy(value) != shared(value))
+        text_normalization.clear_caches()
+        legacy_ns = _time_calls(legacy, values, repeat)
+        shared_ns = _time_calls(shared, values, repeat)
+        results[name] = {
+            "calls": len(values) * repeat,
+            "distinct_inputs": len(set(values)),
+            "legacy_ns_per_call": round(legacy_ns, 1),
+            "cached_ns_per_call": round(shared_ns, 1),
+            "speedup": round(legacy_ns / shared_ns, 2) if shared_ns else None,
+            "mismatches": mismatches,
+            "cache": text_normalization.cache_stats()[name],
+        }
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the shared cached name/title normalizers."
+    )
+    parser.add_argument(
+        "--lattes-dir",
+        default="data/lattes_json",
+        help="Directory with Lattes JSON files. Default: data/lattes_json",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Times the whole corpus is replayed. Default: 1",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    corpus = load_corpus(args.lattes_dir)
+    if not corpus["names"] and not corpus["titles"]:
+        print(f"No Lattes JSON names or titles found in {args.lattes_dir}")
+        sys.exit(1)
+    report = {
+        "lattes_dir": args.lattes_dir,
+        "names": len(corpus["names"]),
+        "titles": len(corpus["titles"]),
+        "repeat": args.repeat,
+        "results": run_benchmark(corpus, args.repeat),
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Benchmark of tracking writes when an unchanged Lattes corpus is ingested again.
+
+Records every Lattes file (profile) and every production with a title as a
+source record with one match and its attribute assertions, once to populate
+a scratch SQLite database and then again, as a re-ingestion, with:
+
+- ``integrity_error``: the previous insert / catch IntegrityError / rollback
+  path, one statement and one rollback per existing row;
+- ``upsert``: per-row ``INSERT ... ON CONFLICT DO NOTHING``;
+- ``upsert_buffered``: the buffered recorder, bulk ON CONFLICT inserts.
+
+Uso:
+  python -m src.scripts.benchmark_tracking_upserts
+  python -m src.scripts.benchmark_tracking_upserts --lattes-dir data/lattes_json --limit 50
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterator, List
+
+sys.path.append(os.getcwd())
+
+from libbase.infrastructure.sql_repository import GenericSqlRepository  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.exc import IntegrityError  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.tracking.controllers import (  # noqa: E402
+    AttributeAssertionController,
+    EntityChangeLogController,
+    EntityMatchController,
+    IngestionRunController,
+    SourceRecordController,
+)
+from src.tracking.entities import (  # noqa: E402
+    AttributeAssertion,
+    EntityChangeLog,
+    EntityMatch,
+    IngestionRun,
+    SourceRecord,
+)
+from src.tracking.recorder import TrackingRecorder, stable_hash  # noqa: E402
+from src.tracking.services import (  # noqa: E402
+    AttributeAssertionService,
+    EntityChangeLogService,
+    EntityMatchService,
+    IngestionRunService,
+    SourceRecordService,
+)
+
+TRACKING_TABLES = [
+    entity.__table__
+    for entity in (
+        IngestionRun,
+        SourceRecord,
+        EntityMatch,
+        AttributeAssertion,
+        EntityChangeLog,
+    )
+]
+
+
+def _productions(node: Any) -> Iterator[Dict[str, Any]]:
+    if isinstance(node, dict):
+        if node.get("titulo") or node.get("title"):
+            yield node
+        for value in node.values():
+            yield from _productions(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _productions(item)
+
+
+def load_corpus(lattes_dir: str, limit: int = 0) -> List[Dict[str, Any]]:
+    """One tracking record per Lattes profile and per titled production."""
+    records: List[Dict[str, Any]] = []
+    paths = sorted(glob.glob(os.path.join(lattes_dir, "*.json")))
+    for path in paths[:limit] if limit else paths:
+        with open(path, "r", encoding="utf-8") as file_handle:
+            try:
+                data = json.load(file_handle)
+            except json.JSONDecodeError:
+                continue
+        file_id = os.path.splitext(os.path.basename(path))[0]
+        records.append(
+            {
+                "type": "researcher_profile",
+                "id": file_id,
+                "file": path,
+                "payload": data.get("informacoes_pessoais") or {"file": file_id},
+            }
+        )
+        for index, production in enumerate(_productions(data)):
+            title = production.get("titulo") or production.get("title")
+            records.append(
+                {
+                    "type": "production",
+                    "id": f"{file_id}|{index}|{title}",
+                    "file": path,
+                    "payload": production,
+                }
+            )
+    return records
+
+
+def _build_recorder(session) -> TrackingRecorder:
+    recorder = TrackingRecorder.__new__(TrackingRecorder)
+    recorder.ingestion_run_ctrl = IngestionRunController(
+        IngestionRunService(GenericSqlRepository(session, IngestionRun))
+    )
+    recorder.source_record_ctrl = SourceRecordController(
+        SourceRecordService(GenericSqlRepository(session, SourceRecord))
+    )
+    recorder.entity_match_ctrl = EntityMatchController(
+        EntityMatchService(GenericSqlRepository(session, EntityMatch))
+    )
+    recorder.attribute_assertion_ctrl = AttributeAssertionController(
+        AttributeAssertionService(GenericSqlRepository(session, AttributeAssertion))
+    )
+    recorder.entity_change_log_ctrl = EntityChangeLogController(
+        EntityChangeLogService(GenericSqlRepository(session, EntityChangeLog))
+    )
+    return recorder
+
+
+def _record(recorder: TrackingRecorder, index: int, record: Dict[str, Any]) -> None:
+    source_record = recorder.record_source_record(
+        source_entity_type=record["type"],
+        payload=record["payload"],
+        source_record_id=record["id"],
+        source_file=record["file"],
+    )
+    source_record_id = getattr(source_record, "id", None)
+    recorder.record_entity_match(
+        source_record_id=source_record_id,
+        canonical_entity_type=record["type"],
+        canonical_entity_id=index,
+        match_strategy="benchmark",
+    )
+    recorder.record_attribute_assertions(
+        source_record_id=source_record_id,
+        canonical_entity_type=record["type"],
+        canonical_entity_id=index,
+        selected_attributes={
+            key: value
+            for key, value in record["payload"].items()
+            if isinstance(value, (str, int, float))
+        },
+        selection_reason="benchmark",
+    )
+
+
+def _record_with_integrity_errors(
+    recorder: TrackingRecorder, run_id: int, index: int, record: Dict[str, Any]
+) -> None:
+    """The insert / IntegrityError / rollback path the recorder used before."""
+    session = recorder.source_record_ctrl._service._repository._session
+    payload_hash = stable_hash(record["payload"])
+    try:
+        source_record = recorder.source_record_ctrl.create_source_record(
+            ingestion_run_id=run_id,
+            source_system="lattes",
+            source_entity_type=record["type"],
+            source_record_id=record["id"],
+            source_file=record["file"],
+            payload_hash=payload_hash,
+        )
+    except IntegrityError:
+        session.rollback()
+        source_record = (
+            session.query(SourceRecord)
+            .filter_by(
+                ingestion_run_id=run_id,
+                source_system="lattes",
+                source_entity_type=record["type"],
+                source_record_id=record["id"],
+                payload_hash=payload_hash,
+            )
+            .first()
+        )
+    source_record_id = getattr(source_record, "id", None)
+    if not source_record_id:
+        return
+    try:
+        recorder.entity_match_ctrl.create_match(
+            source_record_id=source_record_id,
+            canonical_entity_type=record["type"],
+            canonical_entity_id=index,
+            match_strategy="benchmark",
+        )
+    except IntegrityError:
+        session.rollback()
+    for name, value in record["payload"].items():
+        if not isinstance(value, (str, int, float)):
+            continue
+        try:
+            recorder.attribute_assertion_ctrl.create_assertion(
+                source_record_id=source_record_id,
+                canonical_entity_type=record["type"],
+                canonical_entity_id=index,
+                attribute_name=name,
+                value_hash=stable_hash(value),
+                value_json=value,
+                is_selected=True,
+                selection_reason="benchmark",
+            )
+        except IntegrityError:
+            session.rollback()
+
+
+def _timed_run(recorder, records, mode: str) -> float:
+    started = time.perf_counter()
+    with recorder.run_context(
+        source_system="lattes",
+        flow_name=f"benchmark {mode}",
+        buffered=mode == "upsert_buffered",
+    ) as run:
+        for index, record in enumerate(records):
+            if mode == "integrity_error":
+                _record_with_integrity_errors(recorder, run.id, index, record)
+            else:
+                _record(recorder, index, record)
+    return time.perf_counter() - started
+
+
+def run_benchmark(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'tracking.db')}")
+        TRACKING_TABLES[0].metadata.create_all(engine, tables=TRACKING_TABLES)
+        session = sessionmaker(bind=engine, expire_on_commit=False)()
+        recorder = _build_recorder(session)
+
+        initial_seconds = _timed_run(recorder, records, "upsert_buffered")
+        results: Dict[str, Any] = {"initial_ingest_seconds": round(initial_seconds, 3)}
+        for mode in ("integrity_error", "upsert", "upsert_buffered"):
+            seconds = _timed_run(recorder, records, mode)
+            results[mode] = {
+                "reingest_seconds": round(seconds, 3),
+                "records_per_second": (
+                    round(len(records) / seconds, 1) if seconds else None
+                ),
+            }
+        baseline = results["integrity_error"]["reingest_seconds"]
+        for mode in ("upsert", "upsert_buffered"):
+            seconds = results[mode]["reingest_seconds"]
+            results[mode]["speedup"] = round(baseline / seconds, 2) if seconds else None
+        results["rows"] = {
+            entity.__tablename__: session.query(entity).count()
+            for entity in (SourceRecord, EntityMatch, AttributeAssertion)
+        }
+        session.close()
+        engine.dispose()
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark tracking re-ingestion with ON CONFLICT upserts."
+    )
+    parser.add_argument(
+        "--lattes-dir",
+        default="data/lattes_json",
+        help="Directory with Lattes JSON files. Default: data/lattes_json",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=0,
+        help="Only the first N files (0 = all). Default: 0",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    records = load_corpus(args.lattes_dir, args.limit)
+    if not records:
+        print(f"No Lattes JSON files found in {args.lattes_dir}")
+        sys.exit(1)
+    report = {
+        "lattes_dir": args.lattes_dir,
+        "records": len(records),
+        "results": run_benchmark(records),
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.getcwd())
+
+from src.core.logic.sigpesq_sheet_cache import (
+    DEFAULT_SIGPESQ_SHEET_CACHE_DIR,
+    clear_sigpesq_sheet_cache,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Remove cached (Parquet) parses of the SigPesq Excel workbooks."
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_SIGPESQ_SHEET_CACHE_DIR,
+        help=f"Sheet cache directory. Default: {DEFAULT_SIGPESQ_SHEET_CACHE_DIR}",
+    )
+    parser.add_argument(
+        "--file",
+        help="Only remove the cached sheets of this workbook.",
+    )
+    parser.add_argument(
+        "--stale-only",
+        action="store_true",
+        help="Only remove sheets cached by an older parser version.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    removed = clear_sigpesq_sheet_cache(
+        args.cache_dir, file_path=args.file, stale_only=args.stale_only
+    )
+    print(f"Removed {removed} cached sheets from {args.cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,6 @@ from __future__ import annotations
 import argparse
 import json
 import sys as _sys
-import unicodedata
 from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
@@ -31,6 +30,10 @@ _sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 import re
 from typing import Any
 
+from src.core.logic.text_normalization import (  # noqa: E402
+    match_key,
+    normalize_ascii_lower,
+)
 from src.scripts.didatica import MOBILE_CSS  # noqa: E402
 
 
@@ -42,11 +45,7 @@ def _match_key(name: str | None) -> str:
     inconsistentes; comparar por ``lower().strip()`` perde casamentos legítimos
     (ex.: 'João' vs 'Joao'). Esta chave remove acentos e normaliza espaços.
     """
-    s = (name or "").lower().strip()
-    s = "".join(
-        c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn"
-    )
-    return re.sub(r"\s+", " ", s)
+    return match_key(name)
 
 
 def _token_set(name: str | None) -> set[str]:
@@ -423,10 +422,7 @@ def _xkey(name: str | None) -> str:
     Junta nomes grafados de forma divergente entre SigPesq, FAPES e FACTO
     (acentos, caixa, espaços duplos).
     """
-    if not name:
-        return ""
-    s = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
-    return re.sub(r"\s+", " ", s).strip().lower()
+    return normalize_ascii_lower(name)
 
 
 # Coordenadores excluídos da análise de projetos de pesquisa (recorte da gestão).
@@ -0,0 +1,30 @@
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.getcwd())
+
+from src.core.logic.relationship_graph_index import INDEX_DIRECTORY, query_ego_network
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Query k-hop ego networks from the people relationship graph index."
+    )
+    parser.add_argument("person_id", type=int)
+    parser.add_argument("--hops", type=int, default=2)
+    parser.add_argument(
+        "--index-dir", default=os.path.join("data/exports", INDEX_DIRECTORY)
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    result = query_ego_network(args.index_dir, args.person_id, hops=args.hops)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.getcwd())
+
+from src.core.logic.atomic_io import atomic_write_json
+from src.core.logic.person_entity_resolution import (
+    DEFAULT_MAX_BLOCK_SIZE,
+    PersonEntityResolver,
+)
+from src.core.logic.person_matcher import FUZZY_SCORE_CUTOFF
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Cluster duplicate persons with blocked fuzzy matching and merge "
+            "each cluster in one transaction."
+        )
+    )
+    parser.add_argument(
+        "--db-path",
+        default="db/horizon.db",
+        help="Path to the SQLite database. Default: db/horizon.db",
+    )
+    parser.add_argument(
+        "--score-cutoff",
+        type=float,
+        default=FUZZY_SCORE_CUTOFF,
+        help=f"Minimum token_sort_ratio for a link. Default: {FUZZY_SCORE_CUTOFF}",
+    )
+    parser.add_argument(
+        "--max-block-size",
+        type=int,
+        default=DEFAULT_MAX_BLOCK_SIZE,
+        help=f"Largest block scored at once. Default: {DEFAULT_MAX_BLOCK_SIZE}",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report the clusters, without changing the database.",
+    )
+    parser.add_argument(
+        "--output",
+        help="Optional path of a JSON file receiving the report.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    report = PersonEntityResolver(
+        args.db_path,
+        score_cutoff=args.score_cutoff,
+        max_block_size=args.max_block_size,
+    ).run(dry_run=args.dry_run)
+    if args.output:
+        atomic_write_json(args.output, report)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+In-memory buffer of the tracking rows of one ingestion run.
+
+Recording every source record, match, assertion and change log through its
+own controller costs a session, an INSERT and a commit per row. While a
+buffered run is active the recorder hands the rows to a TrackingBuffer
+instead, which writes them with one executemany INSERT per table on a
+single session and commits once per flush. A flush happens whenever
+`flush_threshold` rows are pending and when the run ends. Rows whose flush
+fails stay pending for the next one.
+
+Source record ids are needed before the rows are written (matches,
+assertions and change logs reference them), so add_source_record() returns
+a handle whose ``id`` is a provisional negative number until the next
+flush, when the handle is updated in place. Provisional ids passed to the
+other add_* methods are resolved during the flush.
+
+Rows are inserted in the order they were recorded, table by table (source
+records first), and the uniqueness rules of the per-row recorder are kept
+with ON CONFLICT DO NOTHING inserts: a source record already recorded in
+the run is returned again, one that conflicts with a record of an earlier
+run resolves to that record's id (so a record stored but never matched can
+still be matched), and duplicate matches and assertions are skipped.
+
+Inside a unit of work (src.core.logic.unit_of_work) the recorder joins the
+buffer to it: the rows of a failing row are dropped with the row's canonical
+writes and the pending rows are written on the staged session right before
+each batch commit, so they commit (or roll back) with the canonical rows.
+The threshold does not apply there: flushing on the buffer's own connection
+would wait for the unit of work's open transaction.
+"""
+
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import insert
+
+from src.core.logic.unit_of_work import active_unit_of_work
+from src.tracking.entities import (
+    AttributeAssertion,
+    EntityChangeLog,
+    EntityMatch,
+    SourceRecord,
+)
+from src.tracking.upsert import existing_ids, insert_many_if_absent, unique_columns
+
+SOURCE_RECORD_KEY = unique_columns(SourceRecord)
+
+
+class TrackingBuffer:
+    def __init__(self, session: Any, *, ingestion_run_id: int, flush_threshold: int):
+        self._session = session
+        self.ingestion_run_id = ingestion_run_id
+        self.flush_threshold = max(1, flush_threshold)
+        self._source_records: List[Tuple[SimpleNamespace, Dict[str, Any]]] = []
+        self._entity_matches: List[Dict[str, Any]] = []
+        self._attribute_assertions: List[Dict[str, Any]] = []
+        self._change_logs: List[Dict[str, Any]] = []
+        # Provisional (negative) id -> persisted id, for the whole run.
+        self._resolved_ids: Dict[int, Optional[int]] = {}
+        self._handles_by_key: Dict[Tuple, SimpleNamespace] = {}
+        self._next_provisional_id = -1
+        # Pending rows that trigger the next threshold flush.
+        self._next_flush_at = self.flush_threshold
+        self.stats = {
+            "source_records": 0,
+            "entity_matches": 0,
+            "attribute_assertions": 0,
+            "change_logs": 0,
+            "flushes": 0,
+        }
+
+    def pending(self) -> int:
+        return (
+            len(self._source_records)
+            + len(self._entity_matches)
+            + len(self._attribute_assertions)
+            + len(self._change_logs)
+        )
+
+    def checkpoint(self) -> Tuple[int, int, int, int]:
+        return (
+            len(self._source_records),
+            len(self._entity_matches),
+            len(self._attribute_assertions),
+            len(self._change_logs),
+        )
+
+    def rollback_to(self, checkpoint: Tuple[int, int, int, int]) -> None:
+        """Drops the rows added after `checkpoint` (those of a failed row)."""
+        source_records, matches, assertions, change_logs = checkpoint
+        for handle, values in self._source_records[source_records:]:
+            key = tuple(values[column] for column in SOURCE_RECORD_KEY)
+            if self._handles_by_key.get(key) is handle:
+                del self._handles_by_key[key]
+        del self._source_records[source_records:]
+        del self._entity_matches[matches:]
+        del self._attribute_assertions[assertions:]
+        del self._change_logs[change_logs:]
+
+    def before_commit(self, session: Any) -> None:
+        """Writes the pending rows on `session`, which a unit of work is about
+        to commit, so they are committed together with its rows."""
+        if not self.pending():
+            return
+        snapshot = self._snapshot()
+        savepoint = session.begin_nested()
+        try:
+            self._write(session)
+            savepoint.commit()
+        except Exception as e:
+            savepoint.rollback()
+            self._restore(snapshot)
+            logger.warning(
+                f"Could not write {self.pending()} buffered tracking rows; "
+                f"keeping them for the next commit: {e}"
+            )
+            return
+        self._clear()
+        self.stats["flushes"] += 1
+
+    def add_source_record(self, values: Dict[str, Any]) -> SimpleNamespace:
+        key = tuple(values[column] for column in SOURCE_RECORD_KEY)
+        # NULL source ids never conflict, as in the unique constraint.
+        if values["source_record_id"] is not None and key in self._handles_by_key:
+            return self._handles_by_key[key]
+
+        handle = SimpleNamespace(id=self._next_provisional_id, **values)
+        self._next_provisional_id -= 1
+        self._source_records.append((handle, values))
+        if values["source_record_id"] is not None:
+            self._handles_by_key[key] = handle
+        self._flush_if_full()
+        return handle
+
+    def add_entity_match(self, values: Dict[str, Any]) -> None:
+        self._entity_matches.append(values)
+        self._flush_if_full()
+
+    def add_attribute_assertions(self, rows: List[Dict[str, Any]]) -> None:
+        self._attribute_assertions.extend(rows)
+        self._flush_if_full()
+
+    def add_change_log(self, values: Dict[str, Any]) -> None:
+        self._change_logs.append(values)
+        self._flush_if_full()
+
+    def _flush_if_full(self) -> None:
+        if self.pending() < self._next_flush_at:
+            return
+        uow = active_unit_of_work()
+        if uow is not None and any(joined is self for joined in uow.participants):
+            return
+        try:
+            self.flush()
+        except Exception as e:
+            self._next_flush_at = self.pending() + self.flush_threshold
+            logger.warning(f"Could not flush buffered tracking rows: {e}")
+
+    def flush(self) -> None:
+        """Writes every pending row and commits; on failure the rows stay
+        pending and the error is raised."""
+        if not self.pending():
+            return
+        snapshot = self._snapshot()
+        try:
+            self._write(self._session)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            self._restore(snapshot)
+            raise
+        self._clear()
+        self.stats["flushes"] += 1
+
+    def _snapshot(self) -> Tuple[List[int], Dict[str, int]]:
+        provisional_ids = [handle.id for handle, _values in self._source_records]
+        return provisional_ids, dict(self.stats)
+
+    def _restore(self, snapshot: Tuple[List[int], Dict[str, int]]) -> None:
+        """Undoes what a failed write resolved, so the rows can be written
+        again."""
+        provisional_ids, stats = snapshot
+        for (handle, _values), provisional_id in zip(
+            self._source_records, provisional_ids
+        ):
+            self._resolved_ids.pop(provisional_id, None)
+            handle.id = provisional_id
+        self.stats.update(stats)
+
+    def _write(self, session: Any) -> None:
+        self._write_source_records(session)
+        self._write_unique(session, EntityMatch, self._entity_matches, "entity_matches")
+        self._write_unique(
+            session,
+            AttributeAssertion,
+            self._attribute_assertions,
+            "attribute_assertions",
+        )
+        self._write_change_logs(session)
+
+    def _clear(self) -> None:
+        self._next_flush_at = self.flush_threshold
+        self._source_records = []
+        self._entity_matches = []
+        self._attribute_assertions = []
+        self._change_logs = []
+
+    def _resolve(self, source_record_id: Optional[int]) -> Optional[int]:
+        if source_record_id is not None and source_record_id < 0:
+            return self._resolved_ids.get(source_record_id)
+        return source_record_id
+
+    def _write_source_records(self, session: Any) -> None:
+        if not self._source_records:
+            return
+        table = SourceRecord.__table__
+
+        # Rows without a source id never conflict and keep their order.
+        anonymous = [
+            (handle, values)
+            for handle, values in self._source_records
+            if values["source_record_id"] is None
+        ]
+        if anonymous:
+            result = session.execute(
+                insert(table).returning(table.c.id, sort_by_parameter_order=True),
+                [values for _handle, values in anonymous],
+            )
+            for (handle, _values), record_id in zip(anonymous, result.scalars()):
+                self._resolve_handle(handle, record_id)
+
+        identified = [
+            (handle, values)
+            for handle, values in self._source_records
+            if values["source_record_id"] is not None
+        ]
+        inserted = insert_many_if_absent(
+            session,
+            SourceRecord,
+            [values for _handle, values in identified],
+            returning=("id",) + SOURCE_RECORD_KEY,
+        )
+        ids_by_key = {tuple(row[1:]): row.id for row in inserted}
+        # Repeats within the run share a handle, so a conflict comes from
+        # an earlier run: the handle resolves to that run's record.
+        conflicting = [
+            values
+            for _handle, values in identified
+            if tuple(values[column] for column in SOURCE_RECORD_KEY) not in ids_by_key
+        ]
+        if conflicting:
+            ids_by_key.update(existing_ids(session, SourceRecord, conflicting))
+        for handle, values in identified:
+            key = tuple(values[column] for column in SOURCE_RECORD_KEY)
+            self._resolve_handle(handle, ids_by_key.get(key))
+        self.stats["source_records"] += len(anonymous) + len(inserted)
+
+    def _resolve_handle(self, handle: SimpleNamespace, record_id: Optional[int]):
+        self._resolved_ids[handle.id] = record_id
+        handle.id = record_id
+
+    def _write_unique(
+        self, session: Any, entity: Any, rows: List[Dict[str, Any]], stat: str
+    ) -> None:
+        key_columns = unique_columns(entity)
+        seen = set()
+        to_insert = []
+        for values in rows:
+            source_record_id = self._resolve(values["source_record_id"])
+            if not source_record_id:
+                continue
+            values = {**values, "source_record_id": source_record_id}
+            key = tuple(values[column] for column in key_columns)
+            if key not in seen:
+                seen.add(key)
+                to_insert.append(values)
+        inserted = insert_many_if_absent(session, entity, to_insert)
+        self.stats[stat] += len(inserted)
+
+    def _write_change_logs(self, session: Any) -> None:
+        if not self._change_logs:
+            return
+        rows = [
+            {**values, "source_record_id": self._resolve(values["source_record_id"])}
+            for values in self._change_logs
+        ]
+        session.execute(insert(EntityChangeLog.__table__), rows)
+        self.stats["change_logs"] += len(rows)
@@ -0,0 +1,149 @@
+"""
+Change-data-capture gate for ingestion runs.
+
+Weekly runs re-ingest every Lattes CV, SigPesq row and CNPq group even when
+nothing changed since the last run. At the start of a run the gate loads,
+per (source_system, source_entity_type), the latest payload fingerprint
+stored for each source record key, and whether that record was applied
+(matched to a canonical entity that still exists). A payload whose
+fingerprint equals the latest applied one is unchanged: the caller skips
+parsing, matching and writes for it. The comparison is always against the
+state before the run.
+
+A match can outlive its canonical row (a batch rolled back after the match
+was written, or the row was deleted), so for the entity types listed in
+CANONICAL_TABLES the matched entity must exist in its table. Types without
+a table in the database count as applied by the match alone.
+
+Skipped payloads are counted per run, logged and written to the notes of
+the current ingestion run.
+"""
+
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import inspect, text
+
+CANONICAL_TABLES = {
+    "academic_education": "academic_educations",
+    "advisorship": "advisorships",
+    "article": "articles",
+    "initiative": "initiatives",
+    "research_group": "research_groups",
+    "researcher": "researchers",
+}
+
+LATEST_FINGERPRINTS_SQL = """
+    SELECT sr.source_record_id,
+           sr.payload_hash,
+           EXISTS (
+               SELECT 1 FROM entity_matches em
+               WHERE em.source_record_id = sr.id AND ({canonical_entity_exists})
+           ) AS applied
+    FROM source_records sr
+    WHERE sr.source_system = :source_system
+      AND sr.source_entity_type = :source_entity_type
+      AND sr.source_record_id IS NOT NULL
+    ORDER BY sr.id
+    """
+
+
+def latest_fingerprints_sql(canonical_tables: Dict[str, str]) -> Any:
+    """LATEST_FINGERPRINTS_SQL where a match of a type in `canonical_tables`
+    only counts while its entity is in the type's table."""
+    if not canonical_tables:
+        return text(LATEST_FINGERPRINTS_SQL.format(canonical_entity_exists="1 = 1"))
+    checks = [
+        f"(em.canonical_entity_type = '{entity_type}' AND EXISTS ("
+        f"SELECT 1 FROM {table} c WHERE c.id = em.canonical_entity_id))"
+        for entity_type, table in sorted(canonical_tables.items())
+    ]
+    checked_types = ", ".join(
+        f"'{entity_type}'" for entity_type in sorted(canonical_tables)
+    )
+    checks.append(f"em.canonical_entity_type NOT IN ({checked_types})")
+    return text(
+        LATEST_FINGERPRINTS_SQL.format(canonical_entity_exists=" OR ".join(checks))
+    )
+
+
+class ChangeGate:
+    def __init__(self, session: Any, *, source_system: str):
+        self._session = session
+        self.source_system = source_system
+        # source_entity_type -> source_record_id -> (payload_hash, applied)
+        self._latest: Dict[str, Dict[str, Tuple[str, bool]]] = {}
+        self._sql: Optional[Any] = None
+        self.counts: Counter = Counter()
+
+    def _fingerprints(self, source_entity_type: str) -> Dict[str, Tuple[str, bool]]:
+        if source_entity_type not in self._latest:
+            latest: Dict[str, Tuple[str, bool]] = {}
+            rows = self._session.execute(
+                self._latest_fingerprints_sql(),
+                {
+                    "source_system": self.source_system,
+                    "source_entity_type": source_entity_type,
+                },
+            )
+            for source_record_id, payload_hash, applied in rows:
+                latest[source_record_id] = (payload_hash, bool(applied))
+            # Reads only; do not hold a transaction open for the whole run.
+            self._session.commit()
+            self._latest[source_entity_type] = latest
+        return self._latest[source_entity_type]
+
+    def _latest_fingerprints_sql(self) -> Any:
+        if self._sql is None:
+            inspector = inspect(self._session.connection())
+            self._sql = latest_fingerprints_sql(
+                {
+                    entity_type: table
+                    for entity_type, table in CANONICAL_TABLES.items()
+                    if inspector.has_table(table)
+                }
+            )
+        return self._sql
+
+    def applied_fingerprints(self, source_entity_type: str) -> Dict[str, str]:
+        """source_record_id -> payload hash of the latest applied records,
+        for callers that decide before parsing (e.g. parser processes)."""
+        return {
+            source_record_id: payload_hash
+            for source_record_id, (payload_hash, applied) in self._fingerprints(
+                source_entity_type
+            ).items()
+            if applied
+        }
+
+    def is_unchanged(
+        self, source_entity_type: str, source_record_id: str, payload_hash: str
+    ) -> bool:
+        stored = self._fingerprints(source_entity_type).get(source_record_id)
+        if stored is None:
+            self.counts[(source_entity_type, "new")] += 1
+            return False
+        if stored == (payload_hash, True):
+            self.counts[(source_entity_type, "unchanged")] += 1
+            return True
+        self.counts[(source_entity_type, "changed")] += 1
+        return False
+
+    def summary(self) -> Optional[str]:
+        if not self.counts:
+            return None
+        parts = []
+        for source_entity_type in sorted({key[0] for key in self.counts}):
+            parts.append(
+                f"{source_entity_type}: "
+                f"{self.counts[(source_entity_type, 'unchanged')]} unchanged, "
+                f"{self.counts[(source_entity_type, 'changed')]} changed, "
+                f"{self.counts[(source_entity_type, 'new')]} new"
+            )
+        return "cdc " + "; ".join(parts)
+
+    def log_summary(self) -> None:
+        summary = self.summary()
+        if summary:
+            logger.info(f"{self.source_system} {summary}")
@@ -1,4 +1,5 @@
 from contextvars import ContextVar
+from typing import Any
 
 
 current_ingestion_run_id: ContextVar[int | None] = ContextVar(
@@ -7,3 +8,9 @@ current_ingestion_run_id: ContextVar[int | None] = ContextVar(
 current_source_system: ContextVar[str | None] = ContextVar(
     "current_source_system", default=None
 )
+# TrackingBuffer of the current run when it records in bulk.
+current_tracking_buffer: ContextVar[Any] = ContextVar(
+    "current_tracking_buffer", default=None
+)
+# ChangeGate of the current run when unchanged payloads are skipped.
+current_change_gate: ContextVar[Any] = ContextVar("current_change_gate", default=None)
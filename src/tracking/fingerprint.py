@@ -0,0 +1,95 @@
+"""
+Canonical fingerprints of tracking payloads and attribute values.
+
+Payload and value hashes are persisted (source_records.payload_hash,
+attribute_assertions.value_hash) and compared across runs, so the hash of a
+value must not change between releases. Two modes are available, chosen
+with TRACKING_HASH_MODE:
+
+- ``compat`` (default): SHA-256 of ``json.dumps(sort_keys=True,
+  ensure_ascii=False)``, byte-for-byte the hashes already stored. The
+  encoder is built once instead of on every call.
+- ``fast``: BLAKE2b-256 of the orjson canonical encoding (sorted keys),
+  several times faster on large Lattes payloads. The hashes carry a
+  ``blake2b:`` prefix so they never collide with compat ones, but switching
+  modes makes every payload look new once.
+
+Scalar values (most attribute assertions) are memoized in both modes.
+"""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson comes with prefect; fall back to json.
+    orjson = None
+
+HASH_MODE_COMPAT = "compat"
+HASH_MODE_FAST = "fast"
+HASH_MODES = (HASH_MODE_COMPAT, HASH_MODE_FAST)
+FAST_HASH_PREFIX = "blake2b:"
+
+DEFAULT_TRACKING_HASH_MODE = os.getenv("TRACKING_HASH_MODE", HASH_MODE_COMPAT)
+SCALAR_CACHE_SIZE = 65536
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+_COMPAT_ENCODER = json.JSONEncoder(
+    sort_keys=True, ensure_ascii=False, default=_json_default
+)
+_FAST_ENCODER = json.JSONEncoder(
+    sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=_json_default
+)
+
+
+def _compat_hash(value: Any) -> str:
+    return hashlib.sha256(_COMPAT_ENCODER.encode(value).encode("utf-8")).hexdigest()
+
+
+def _fast_canonical(value: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                default=_json_default,
+            )
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return _FAST_ENCODER.encode(value).encode("utf-8")
+
+
+def _fast_hash(value: Any) -> str:
+    digest = hashlib.blake2b(_fast_canonical(value), digest_size=32).hexdigest()
+    return FAST_HASH_PREFIX + digest
+
+
+_HASHERS = {HASH_MODE_COMPAT: _compat_hash, HASH_MODE_FAST: _fast_hash}
+
+
+@lru_cache(maxsize=SCALAR_CACHE_SIZE)
+def _scalar_hash(mode: str, value_type: type, value: Any) -> str:
+    # value_type keeps 1, 1.0 and True apart (equal keys otherwise).
+    return _HASHERS[mode](value)
+
+
+def stable_hash(value: Any, mode: Optional[str] = None) -> str:
+    mode = mode or DEFAULT_TRACKING_HASH_MODE
+    if mode not in _HASHERS:
+        raise ValueError(
+            f"Unknown tracking hash mode {mode!r}; use one of {HASH_MODES}"
+        )
+    if isinstance(value, _SCALAR_TYPES):
+        return _scalar_hash(mode, type(value), value)
+    return _HASHERS[mode](value)
@@ -1,13 +1,20 @@
-import hashlib
-import json
+import os
 from contextlib import contextmanager
 from types import SimpleNamespace
-from typing import Any, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional
 
-from sqlalchemy.exc import IntegrityError
+from loguru import logger
 
 from src.core.logic.pii_anonymizer import scrub_source_record_payload
-from src.tracking.context import current_ingestion_run_id, current_source_system
+from src.core.logic.unit_of_work import active_unit_of_work
+from src.tracking.buffer import TrackingBuffer
+from src.tracking.change_gate import ChangeGate
+from src.tracking.context import (
+    current_change_gate,
+    current_ingestion_run_id,
+    current_source_system,
+    current_tracking_buffer,
+)
 from src.tracking.controllers import (
     AttributeAssertionController,
     EntityChangeLogController,
@@ -15,12 +22,22 @@ from src.tracking.controllers import (
     IngestionRunController,
     SourceRecordController,
 )
+from src.tracking.entities import AttributeAssertion, EntityMatch, SourceRecord
+from src.tracking.fingerprint import stable_hash
+from src.tracking.service_factory import TrackingServiceFactory
+from src.tracking.upsert import insert_if_absent, insert_many_if_absent
 
-
-def _json_default(value: Any) -> Any:
-    if hasattr(value, "isoformat"):
-        return value.isoformat()
-    return str(value)
+# Buffered runs write tracking rows in bulk; TRACKING_BUFFERED=0 records
+# every row through its controller as it happens.
+DEFAULT_TRACKING_BUFFERED = os.getenv("TRACKING_BUFFERED", "1") not in {
+    "0",
+    "false",
+    "FALSE",
+}
+DEFAULT_TRACKING_FLUSH_THRESHOLD = int(os.getenv("TRACKING_FLUSH_THRESHOLD", "1000"))
+# Skip payloads identical to the last applied ones; TRACKING_CDC=0 forces a
+# full re-ingestion.
+DEFAULT_TRACKING_CDC = os.getenv("TRACKING_CDC", "1") not in {"0", "false", "FALSE"}
 
 
 def _json_safe(value: Any) -> Any:
@@ -33,13 +50,6 @@ def _json_safe(value: Any) -> Any:
     return value
 
 
-def stable_hash(value: Any) -> str:
-    payload = json.dumps(
-        value, sort_keys=True, ensure_ascii=False, default=_json_default
-    )
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
-
-
 class TrackingRecorder:
     def __init__(self):
         self._ingestion_run_controller_cls = IngestionRunController
@@ -88,9 +98,64 @@ class TrackingRecorder:
             except Exception:
                 pass
 
+    def _run_session(self):
+        """Session for the buffered rows and the change gate of a run and
+        whether it is owned (and closed) by the run."""
+        legacy = getattr(self, "source_record_ctrl", None)
+        if legacy is not None:
+            return legacy._service._repository._session, False
+        return TrackingServiceFactory._session(), True
+
+    def _buffer(self) -> Optional[TrackingBuffer]:
+        """Buffer for the rows recorded now. Inside a unit of work that stages
+        a session, writing on another connection would wait for its open
+        transaction (SQLite locks the whole database), so the rows go to a
+        buffer joined to it, a buffer of its own when the run is unbuffered."""
+        buffer = current_tracking_buffer.get()
+        uow = active_unit_of_work()
+        if uow is None:
+            return buffer
+        if buffer is None:
+            run_id = current_ingestion_run_id.get()
+            if not run_id:
+                return None
+            joined = [
+                participant
+                for participant in uow.participants
+                if isinstance(participant, TrackingBuffer)
+                and participant.ingestion_run_id == run_id
+            ]
+            if joined:
+                return joined[0]
+            buffer = TrackingBuffer(
+                uow.session,
+                ingestion_run_id=run_id,
+                flush_threshold=DEFAULT_TRACKING_FLUSH_THRESHOLD,
+            )
+        uow.join(buffer)
+        return buffer
+
+    @staticmethod
+    def _flush_buffer(buffer: Optional[TrackingBuffer], *, quiet: bool) -> None:
+        if buffer is None:
+            return
+        try:
+            buffer.flush()
+        except Exception as e:
+            if not quiet:
+                raise
+            logger.warning(f"Could not flush buffered tracking rows: {e}")
+
     @contextmanager
     def run_context(
-        self, *, source_system: str, flow_name: str, notes: Optional[str] = None
+        self,
+        *,
+        source_system: str,
+        flow_name: str,
+        notes: Optional[str] = None,
+        buffered: Optional[bool] = None,
+        flush_threshold: Optional[int] = None,
+        cdc: Optional[bool] = None,
     ):
         with self._controller(
             getattr(self, "_ingestion_run_controller_cls", IngestionRunController),
@@ -103,19 +168,46 @@ class TrackingRecorder:
             )
             run_id = run.id
 
+        buffered = DEFAULT_TRACKING_BUFFERED if buffered is None else buffered
+        cdc = DEFAULT_TRACKING_CDC if cdc is None else cdc
+        session, owns_session = None, False
+        if buffered or cdc:
+            session, owns_session = self._run_session()
+        buffer = None
+        if buffered:
+            buffer = TrackingBuffer(
+                session,
+                ingestion_run_id=run_id,
+                flush_threshold=flush_threshold or DEFAULT_TRACKING_FLUSH_THRESHOLD,
+            )
+        gate = ChangeGate(session, source_system=source_system) if cdc else None
+
         run_token = current_ingestion_run_id.set(run_id)
         source_token = current_source_system.set(source_system)
+        buffer_token = current_tracking_buffer.set(buffer)
+        gate_token = current_change_gate.set(gate)
         try:
             yield SimpleNamespace(
                 id=run_id, source_system=source_system, flow_name=flow_name
             )
+            self._flush_buffer(buffer, quiet=False)
+            cdc_summary = gate.summary() if gate else None
+            if gate:
+                gate.log_summary()
             with self._controller(
                 getattr(self, "_ingestion_run_controller_cls", IngestionRunController),
                 legacy_attr="ingestion_run_ctrl",
             ) as controller:
-                controller.finalize_run(run_id, status="success")
+                controller.finalize_run(
+                    run_id,
+                    status="success",
+                    notes="; ".join(filter(None, (notes, cdc_summary))) or None,
+                )
         except Exception as exc:
             self._rollback_legacy_sessions()
+            # Rows recorded before the failure are kept, as when every row
+            # was committed on its own.
+            self._flush_buffer(buffer, quiet=True)
             with self._controller(
                 getattr(self, "_ingestion_run_controller_cls", IngestionRunController),
                 legacy_attr="ingestion_run_ctrl",
@@ -125,10 +217,46 @@ class TrackingRecorder:
         finally:
             current_ingestion_run_id.reset(run_token)
             current_source_system.reset(source_token)
+            current_tracking_buffer.reset(buffer_token)
+            current_change_gate.reset(gate_token)
+            if owns_session:
+                session.close()
 
     def has_active_run(self) -> bool:
         return current_ingestion_run_id.get() is not None
 
+    def current_run_id(self) -> Optional[int]:
+        return current_ingestion_run_id.get()
+
+    def is_unchanged(
+        self,
+        *,
+        source_entity_type: str,
+        source_record_id: Optional[str],
+        payload: Any = None,
+        payload_hash: Optional[str] = None,
+    ) -> bool:
+        """CDC gate: True when `payload` has the fingerprint of the latest
+        applied source record with this key before the run. The caller then
+        skips parsing, matching and writes for it. `payload_hash` may be
+        given instead of a payload hashed elsewhere with stable_hash."""
+        gate = current_change_gate.get()
+        if gate is None or source_record_id is None:
+            return False
+        return gate.is_unchanged(
+            source_entity_type,
+            str(source_record_id),
+            payload_hash or stable_hash(payload),
+        )
+
+    def applied_fingerprints(self, source_entity_type: str) -> Dict[str, str]:
+        """Payload hashes of the latest applied records of the run's source
+        system, by source record id; empty when no CDC gate is active."""
+        gate = current_change_gate.get()
+        if gate is None:
+            return {}
+        return gate.applied_fingerprints(source_entity_type)
+
     def record_source_record(
         self,
         *,
@@ -137,45 +265,56 @@ class TrackingRecorder:
         source_record_id: Optional[str] = None,
         source_file: Optional[str] = None,
         source_path: Optional[str] = None,
+        store_payload: bool = True,
+        payload_hash: Optional[str] = None,
     ):
         run_id = current_ingestion_run_id.get()
         source_system = current_source_system.get()
         if not run_id or not source_system:
             return None
 
-        payload_hash = stable_hash(payload)
+        payload_hash = payload_hash or stable_hash(payload)
+        # PII never reaches the tracking store: the hash is taken from the
+        # original payload (stable dedup), the stored JSON is scrubbed
+        # (CPF/phones/emails).
+        raw_payload_json = (
+            scrub_source_record_payload(_json_safe(payload)) if store_payload else None
+        )
+        values = {
+            "ingestion_run_id": run_id,
+            "source_system": source_system,
+            "source_entity_type": source_entity_type,
+            "source_record_id": source_record_id,
+            "source_file": source_file,
+            "source_path": source_path,
+            "raw_payload_json": raw_payload_json,
+            "payload_hash": payload_hash,
+        }
+        buffer = self._buffer()
+        if buffer is not None:
+            return buffer.add_source_record(values)
+
         with self._controller(
             getattr(self, "_source_record_controller_cls", SourceRecordController),
             legacy_attr="source_record_ctrl",
         ) as controller:
-            try:
-                return controller.create_source_record(
-                    ingestion_run_id=run_id,
+            session = controller._service._repository._session
+            inserted_id = insert_if_absent(session, SourceRecord, values)
+            session.commit()
+            if inserted_id is not None:
+                return SimpleNamespace(id=inserted_id, **values)
+            # Stored by this or an earlier run; returned so the record can
+            # still be matched (an unmatched record is never applied).
+            return (
+                session.query(SourceRecord)
+                .filter_by(
                     source_system=source_system,
                     source_entity_type=source_entity_type,
                     source_record_id=source_record_id,
-                    source_file=source_file,
-                    source_path=source_path,
-                    # PII never reaches the tracking store: the hash is taken
-                    # from the original payload (stable dedup), the stored
-                    # JSON is scrubbed (CPF/phones/emails).
-                    raw_payload_json=scrub_source_record_payload(_json_safe(payload)),
                     payload_hash=payload_hash,
                 )
-            except IntegrityError:
-                session = controller._service._repository._session
-                session.rollback()
-                return (
-                    session.query(controller._service._repository._entity_type)
-                    .filter_by(
-                        ingestion_run_id=run_id,
-                        source_system=source_system,
-                        source_entity_type=source_entity_type,
-                        source_record_id=source_record_id,
-                        payload_hash=payload_hash,
-                    )
-                    .first()
-                )
+                .first()
+            )
 
     def record_entity_match(
         self,
@@ -189,22 +328,28 @@ class TrackingRecorder:
         if not source_record_id:
             return None
 
+        values = {
+            "source_record_id": source_record_id,
+            "canonical_entity_type": canonical_entity_type,
+            "canonical_entity_id": canonical_entity_id,
+            "match_strategy": match_strategy,
+            "match_confidence": match_confidence,
+        }
+        buffer = self._buffer()
+        if buffer is not None:
+            buffer.add_entity_match(values)
+            return None
+
         with self._controller(
             getattr(self, "_entity_match_controller_cls", EntityMatchController),
             legacy_attr="entity_match_ctrl",
         ) as controller:
-            try:
-                return controller.create_match(
-                    source_record_id=source_record_id,
-                    canonical_entity_type=canonical_entity_type,
-                    canonical_entity_id=canonical_entity_id,
-                    match_strategy=match_strategy,
-                    match_confidence=match_confidence,
-                )
-            except IntegrityError:
-                session = controller._service._repository._session
-                session.rollback()
+            session = controller._service._repository._session
+            inserted_id = insert_if_absent(session, EntityMatch, values)
+            session.commit()
+            if inserted_id is None:
                 return None
+            return SimpleNamespace(id=inserted_id, **values)
 
     def record_attribute_assertions(
         self,
@@ -218,29 +363,35 @@ class TrackingRecorder:
         if not source_record_id:
             return
 
-        for attribute_name, value in selected_attributes.items():
-            with self._controller(
-                getattr(
-                    self,
-                    "_attribute_assertion_controller_cls",
-                    AttributeAssertionController,
-                ),
-                legacy_attr="attribute_assertion_ctrl",
-            ) as controller:
-                try:
-                    controller.create_assertion(
-                        source_record_id=source_record_id,
-                        canonical_entity_type=canonical_entity_type,
-                        canonical_entity_id=canonical_entity_id,
-                        attribute_name=attribute_name,
-                        value_hash=stable_hash(value),
-                        value_json=_json_safe(value),
-                        is_selected=True,
-                        selection_reason=selection_reason,
-                    )
-                except IntegrityError:
-                    session = controller._service._repository._session
-                    session.rollback()
+        rows = [
+            {
+                "source_record_id": source_record_id,
+                "canonical_entity_type": canonical_entity_type,
+                "canonical_entity_id": canonical_entity_id,
+                "attribute_name": attribute_name,
+                "value_hash": stable_hash(value),
+                "value_json": _json_safe(value),
+                "is_selected": True,
+                "selection_reason": selection_reason,
+            }
+            for attribute_name, value in selected_attributes.items()
+        ]
+        buffer = self._buffer()
+        if buffer is not None:
+            buffer.add_attribute_assertions(rows)
+            return
+
+        with self._controller(
+            getattr(
+                self,
+                "_attribute_assertion_controller_cls",
+                AttributeAssertionController,
+            ),
+            legacy_attr="attribute_assertion_ctrl",
+        ) as controller:
+            session = controller._service._repository._session
+            insert_many_if_absent(session, AttributeAssertion, rows)
+            session.commit()
 
     def record_change(
         self,
@@ -258,6 +409,23 @@ class TrackingRecorder:
         if not run_id:
             return
 
+        buffer = self._buffer()
+        if buffer is not None:
+            buffer.add_change_log(
+                {
+                    "ingestion_run_id": run_id,
+                    "source_record_id": source_record_id,
+                    "canonical_entity_type": canonical_entity_type,
+                    "canonical_entity_id": canonical_entity_id,
+                    "operation": operation,
+                    "changed_fields_json": _json_safe(list(changed_fields)),
+                    "before_json": _json_safe(before),
+                    "after_json": _json_safe(after),
+                    "reason": reason,
+                }
+            )
+            return
+
         with self._controller(
             getattr(
                 self,
@@ -0,0 +1,87 @@
+"""
+Conflict-free inserts for the tracking tables.
+
+Tracking rows are unique per source record identity (see the
+UniqueConstraint of each entity). Inserting and catching IntegrityError
+costs a failed statement and a rollback per existing row, which is most
+rows when an unchanged corpus is ingested again. These helpers emit
+``INSERT ... ON CONFLICT (<unique columns>) DO NOTHING`` for SQLite and
+PostgreSQL instead, and report which rows were actually inserted;
+existing_ids() finds the rows that were already there.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import UniqueConstraint, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+
+_DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+# Keys per SELECT, well below SQLite's bound parameter limit.
+EXISTING_IDS_CHUNK = 500
+
+
+def unique_columns(entity: Any) -> Tuple[str, ...]:
+    """Columns of the (single) unique constraint of a tracking entity."""
+    for constraint in entity.__table__.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            return tuple(column.name for column in constraint.columns)
+    raise ValueError(f"{entity.__name__} has no unique constraint")
+
+
+def _insert_ignoring_conflicts(session: Any, entity: Any):
+    dialect = session.get_bind().dialect.name
+    try:
+        dialect_insert = _DIALECT_INSERTS[dialect]
+    except KeyError:
+        raise NotImplementedError(
+            f"ON CONFLICT inserts are not supported for {dialect}"
+        ) from None
+    return dialect_insert(entity.__table__).on_conflict_do_nothing(
+        index_elements=list(unique_columns(entity))
+    )
+
+
+def insert_if_absent(
+    session: Any, entity: Any, values: Dict[str, Any]
+) -> Optional[int]:
+    """Inserts one row unless it conflicts with an existing one. Returns the
+    new id, or None when the row already existed."""
+    table = entity.__table__
+    statement = _insert_ignoring_conflicts(session, entity).returning(table.c.id)
+    return session.execute(statement, [values]).scalar()
+
+
+def insert_many_if_absent(
+    session: Any,
+    entity: Any,
+    rows: List[Dict[str, Any]],
+    returning: Sequence[str] = ("id",),
+) -> List[Any]:
+    """Inserts `rows` in bulk, skipping the ones that conflict. Returns the
+    `returning` columns of the inserted rows only, in no particular order."""
+    if not rows:
+        return []
+    table = entity.__table__
+    statement = _insert_ignoring_conflicts(session, entity).returning(
+        *(table.c[column] for column in returning)
+    )
+    return session.execute(statement, rows).all()
+
+
+def existing_ids(
+    session: Any, entity: Any, rows: List[Dict[str, Any]]
+) -> Dict[Tuple, int]:
+    """Ids of the stored rows with the unique keys of `rows`, by key."""
+    key_columns = unique_columns(entity)
+    table = entity.__table__
+    keys = list(dict.fromkeys(tuple(row[c] for c in key_columns) for row in rows))
+    found: Dict[Tuple, int] = {}
+    for start in range(0, len(keys), EXISTING_IDS_CHUNK):
+        statement = select(table.c.id, *(table.c[c] for c in key_columns)).where(
+            tuple_(*(table.c[c] for c in key_columns)).in_(
+                keys[start : start + EXISTING_IDS_CHUNK]
+            )
+        )
+        for row in session.execute(statement):
+            found[tuple(row[1:])] = row.id
+    return found
@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import Column, DateTime, Integer
+from sqlalchemy.orm import declarative_base
+
+from src.core.logic import sigpesq_sheet_cache, team_membership_sync
+
+TestBase = declarative_base()
+
+
+class TeamMember(TestBase):
+    """Stands in for eo_lib's mapped TeamMember."""
+
+    __tablename__ = "team_members"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    person_id = Column(Integer, nullable=False)
+    team_id = Column(Integer, nullable=False)
+    role_id = Column(Integer)
+    start_date = Column(DateTime)
+    end_date = Column(DateTime)
+
+
+@pytest.fixture(autouse=True)
+def isolated_sigpesq_sheet_cache(tmp_path, monkeypatch):
+    """Keeps the SigPesq Parquet sheet cache out of the working tree."""
+    cache_dir = tmp_path / "sigpesq_sheets"
+    monkeypatch.setenv("SIGPESQ_SHEET_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(
+        sigpesq_sheet_cache, "DEFAULT_SIGPESQ_SHEET_CACHE_DIR", str(cache_dir)
+    )
+    return cache_dir
+
+
+@pytest.fixture
+def team_member_entity(monkeypatch):
+    """Maps TeamMembershipBatch onto the TeamMember above."""
+    monkeypatch.setattr(team_membership_sync, "_team_member_entity", lambda: TeamMember)
+    return TeamMember
@@ -0,0 +1,132 @@
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from eo_lib.domain.base import Base
+from libbase.infrastructure.sql_repository import GenericSqlRepository
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.core.logic.project_loader import ProjectLoader
+from src.core.logic.team_membership_sync import TeamMembershipBatch
+from src.tracking.controllers import (
+    EntityMatchController,
+    IngestionRunController,
+    SourceRecordController,
+)
+from src.tracking.entities import EntityMatch, IngestionRun, SourceRecord
+from src.tracking.recorder import TrackingRecorder
+from src.tracking.services import (
+    EntityMatchService,
+    IngestionRunService,
+    SourceRecordService,
+)
+
+
+def _loader_and_recorder(tmp_path):
+    # The loader's unit of work holds a write transaction on the domain
+    # connection; the recorder's own connection would be locked out.
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'etl.db'}", connect_args={"timeout": 0.1}
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    domain_session = Session()
+    domain_session.execute(text("CREATE TABLE items (name TEXT PRIMARY KEY)"))
+    domain_session.commit()
+
+    tracking_session = Session()
+    recorder = TrackingRecorder()
+    recorder.ingestion_run_ctrl = IngestionRunController(
+        IngestionRunService(GenericSqlRepository(tracking_session, IngestionRun))
+    )
+    recorder.source_record_ctrl = SourceRecordController(
+        SourceRecordService(GenericSqlRepository(tracking_session, SourceRecord))
+    )
+    recorder.entity_match_ctrl = EntityMatchController(
+        EntityMatchService(GenericSqlRepository(tracking_session, EntityMatch))
+    )
+
+    loader = ProjectLoader.__new__(ProjectLoader)
+    loader.batch_size = 2
+    loader.reuse_caches = False
+    loader.mapping_strategy = None
+    domain_controller = SimpleNamespace(
+        _service=SimpleNamespace(_repository=SimpleNamespace(_session=domain_session)),
+        get_all=lambda: [],
+    )
+    loader.controller = domain_controller
+    loader.person_controller = domain_controller
+    loader.team_controller = domain_controller
+    loader.rg_controller = domain_controller
+    loader.adv_controller = domain_controller
+    loader.person_matcher = MagicMock()
+    loader.person_matcher._persons_cache = {}
+    loader.team_synchronizer = MagicMock()
+    loader.memberships = None
+
+    def process_row(row, existing_by_name, existing_by_identity, stats, source_file):
+        domain_session.execute(text("INSERT INTO items VALUES (:name)"), {"name": row})
+        record = recorder.record_source_record(
+            source_entity_type="item", payload={"name": row}, source_record_id=row
+        )
+        recorder.record_entity_match(
+            source_record_id=record.id,
+            canonical_entity_type="item",
+            canonical_entity_id=1,
+            match_strategy="name",
+        )
+        if loader.memberships is not None:
+            loader.memberships.add(1, len(row), 1)
+        if row == "falha":
+            raise ValueError("boom")
+        domain_session.commit()
+        stats["created"] += 1
+
+    loader._process_row = process_row
+    return Session, domain_session, recorder, loader
+
+
+def test_process_records_inside_a_tracking_run_on_a_file_database(tmp_path):
+    Session, _domain_session, recorder, loader = _loader_and_recorder(tmp_path)
+
+    with recorder.run_context(
+        source_system="sigpesq", flow_name="load", buffered=False, cdc=False
+    ):
+        stats = loader.process_records(["a", "falha", "b", "c"], source_file="x")
+
+    assert (stats["created"], stats["failed"]) == (3, 1)
+    with Session() as session:
+        assert session.scalars(text("SELECT name FROM items ORDER BY name")).all() == [
+            "a",
+            "b",
+            "c",
+        ]
+        assert sorted(r.source_record_id for r in session.query(SourceRecord)) == [
+            "a",
+            "b",
+            "c",
+        ]
+        assert session.query(EntityMatch).count() == 3
+
+
+def test_failed_membership_flush_leaves_the_batch_uncommitted_and_untracked(
+    tmp_path, team_member_entity
+):
+    # team_members is never created, so applying the memberships fails.
+    Session, domain_session, recorder, loader = _loader_and_recorder(tmp_path)
+    loader.memberships = TeamMembershipBatch(domain_session)
+    loader.team_synchronizer.batch.return_value = nullcontext(loader.memberships)
+
+    with pytest.raises(OperationalError):
+        with recorder.run_context(
+            source_system="sigpesq", flow_name="load", buffered=False, cdc=False
+        ):
+            loader.process_records(["a", "b"], source_file="x")
+
+    with Session() as session:
+        assert session.scalars(text("SELECT name FROM items")).all() == []
+        assert session.query(SourceRecord).count() == 0
+        assert session.query(EntityMatch).count() == 0
@@ -0,0 +1,81 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.core.logic.article_index import (
+    ArticleIndex,
+    article_index_scope,
+    get_article_index,
+    normalize_doi,
+)
+from src.core.logic.reference_data_cache import QueryCounter
+
+
+def _session():
+    engine = create_engine("sqlite:///:memory:")
+    session = Session(engine)
+    session.execute(
+        text(
+            "CREATE TABLE articles (id INTEGER PRIMARY KEY, doi TEXT, title TEXT, year INTEGER)"
+        )
+    )
+    session.execute(
+        text("CREATE TABLE article_authors (article_id INTEGER, researcher_id INTEGER)")
+    )
+    session.execute(
+        text(
+            "INSERT INTO articles (id, doi, title, year) VALUES "
+            "(1, '10.1000/ABC', 'Redes Neurais', 2020), "
+            "(2, NULL, 'Análise de Dados', 2021), "
+            "(3, NULL, 'Analise de dados', 2021)"
+        )
+    )
+    session.execute(text("INSERT INTO article_authors VALUES (1, 7)"))
+    return session
+
+
+def test_normalize_doi():
+    assert normalize_doi(" https://doi.org/10.1000/ABC ") == "10.1000/abc"
+    assert normalize_doi("doi: 10.1000/abc") == "10.1000/abc"
+    assert normalize_doi("  ") is None
+    assert normalize_doi(None) is None
+
+
+def test_index_resolves_articles_and_authors_without_per_article_queries():
+    session = _session()
+    with QueryCounter() as queries:
+        index = ArticleIndex().load(session)
+        assert index.find(doi="HTTPS://DOI.ORG/10.1000/abc", title="x", year=1) == 1
+        assert index.find(doi="10.1/unknown", title="redes neurais", year=2020) == 1
+        # First row wins for duplicated (title, year), as the DB lookup did.
+        assert index.find(doi=None, title="ANALISE DE DADOS", year=2021) == 2
+        assert index.find(doi=None, title="Redes Neurais", year=2019) is None
+        assert index.has_author(1, 7) and not index.has_author(2, 7)
+
+        index.add(10, doi="10.2/new", title="Novo Artigo", year=2024)
+        index.add_author(10, 7)
+        assert index.find(doi="10.2/NEW", title=None, year=None) == 10
+        assert index.find(doi=None, title="novo artigo", year=2024) == 10
+        assert index.has_author(10, 7)
+        index.load(session)  # already loaded
+
+    assert queries.count == 2
+    assert index.counts["loaded"] == 3
+    assert index.counts["added"] == 1
+
+
+def test_scope_shares_one_index_and_invalidate_reloads():
+    session = _session()
+    with article_index_scope("test") as scoped:
+        assert get_article_index(session) is scoped
+        with QueryCounter() as queries:
+            assert get_article_index(session) is scoped
+        assert queries.count == 0
+
+        scoped.invalidate()
+        assert not scoped.loaded
+        assert (
+            get_article_index(session).find(doi="10.1000/abc", title=None, year=None)
+            == 1
+        )
+
+    assert get_article_index(session) is not scoped
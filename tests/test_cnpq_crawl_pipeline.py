@@ -0,0 +1,147 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.adapters.sources.cnpq_crawler import CnpqCrawlerAdapter
+from src.adapters.sources.cnpq_http_cache import CACHE_MODE_OFF, CnpqHttpCache
+from src.core.logic.cnpq_crawl_pipeline import RateLimiter, RetryPolicy, crawl_groups
+from src.flows.cnpq.groups import _thread_local_fetcher
+
+FIXTURES = Path(__file__).parent / "fixtures" / "cnpq"
+
+
+class _MirrorHandler(BaseHTTPRequestHandler):
+    """Serves saved DGP mirror pages; ``?fail=N`` answers 503 N times first."""
+
+    failures = {}
+    requests = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        path, _, query = self.path.partition("?")
+        with self.lock:
+            self.requests.append((path, time.monotonic()))
+            remaining = self.failures.get(
+                self.path, int(query[5:] or 0) if query else 0
+            )
+            self.failures[self.path] = remaining - 1
+        if remaining > 0:
+            self.send_error(503)
+            return
+
+        fixture = FIXTURES / f"{Path(path).name}.html"
+        if not fixture.exists():
+            self.send_error(404)
+            return
+        body = fixture.read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def mirror():
+    _MirrorHandler.failures = {}
+    _MirrorHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MirrorHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fetch(tmp_path):
+    """The flow's fetcher: one real CnpqCrawlerAdapter per worker thread."""
+    return _thread_local_fetcher(CnpqHttpCache(str(tmp_path), mode=CACHE_MODE_OFF))
+
+
+def test_crawl_fetches_concurrently_and_writes_on_a_single_thread(mirror, fetch):
+    groups = [
+        {"id": 1, "name": "A", "url": f"{mirror}/dgp/espelhogrupo_0001"},
+        {"id": 2, "name": "B", "url": f"{mirror}/dgp/espelhogrupo_0002?fail=1"},
+        {"id": 3, "name": "C", "url": f"{mirror}/dgp/espelhogrupo_9999"},
+    ]
+    writer_threads = set()
+    adapter = CnpqCrawlerAdapter(cache=CnpqHttpCache(mode=CACHE_MODE_OFF))
+
+    def write(group, data):
+        writer_threads.add(threading.get_ident())
+        return {
+            "success": bool(data),
+            "group_id": group["id"],
+            "leaders": data and adapter.extract_leaders(data),
+            "members": data
+            and sorted(member["name"] for member in adapter.extract_members(data)),
+        }
+
+    results = crawl_groups(
+        groups,
+        fetch=fetch,
+        write=write,
+        max_workers=3,
+        requests_per_second=0,
+        retry_policy=RetryPolicy(max_attempts=2, backoff_seconds=0.01),
+    )
+
+    assert writer_threads == {threading.get_ident()}
+    assert results == [
+        {
+            "success": True,
+            "group_id": 1,
+            "leaders": ["Maria Silva"],
+            "members": ["Ana Pesquisadora", "Bruno Souza"],
+        },
+        {
+            "success": True,
+            "group_id": 2,
+            "leaders": ["João Pedro Almeida"],
+            "members": ["Carla Técnica"],
+        },
+        {"success": False, "group_id": 3, "leaders": None, "members": None},
+    ]
+    # The 503 was retried once; the missing page was tried max_attempts times.
+    paths = [path for path, _ in _MirrorHandler.requests]
+    assert paths.count("/dgp/espelhogrupo_0002") == 2
+    assert paths.count("/dgp/espelhogrupo_9999") == 2
+
+
+def test_rate_limit_spaces_requests_across_workers(mirror, fetch):
+    groups = [
+        {"id": i, "name": str(i), "url": f"{mirror}/dgp/espelhogrupo_0001"}
+        for i in range(4)
+    ]
+
+    crawl_groups(
+        groups,
+        fetch=fetch,
+        write=lambda group, data: {"success": bool(data)},
+        max_workers=4,
+        requests_per_second=20,
+    )
+
+    times = sorted(t for _, t in _MirrorHandler.requests)
+    assert len(times) == 4
+    assert times[-1] - times[0] >= 3 * 0.05 * 0.9
+
+
+def test_rate_limiter_without_rate_does_not_wait():
+    limiter = RateLimiter(0)
+    started = time.monotonic()
+    for _ in range(100):
+        limiter.wait()
+    assert time.monotonic() - started < 0.05
+
+
+def test_crawl_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        crawl_groups([{"url": "x"}], fetch=lambda url: None, write=dict, max_workers=0)
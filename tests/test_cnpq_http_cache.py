@@ -0,0 +1,176 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.adapters.sources.cnpq_http_cache import (
+    CACHE_MODE_REPLAY,
+    CnpqCacheMiss,
+    CnpqHttpCache,
+)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "cnpq" / "espelhogrupo_0001.html"
+
+
+class _MirrorHandler(BaseHTTPRequestHandler):
+    """Serves one saved mirror page with an ETag and honours If-None-Match."""
+
+    body = FIXTURE.read_bytes()
+    etag = '"v1"'
+    conditional_requests = 0
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match"):
+            type(self).conditional_requests += 1
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def mirror():
+    _MirrorHandler.etag = '"v1"'
+    _MirrorHandler.conditional_requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MirrorHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/dgp/espelhogrupo/0001"
+    server.shutdown()
+    server.server_close()
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Crawler:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"identificacao": {"nome_grupo": f"Grupo v{self.calls}"}}
+
+
+class _CountingLimiter:
+    def __init__(self):
+        self.waits = 0
+
+    def wait(self):
+        self.waits += 1
+
+
+def test_fresh_entries_are_served_and_stale_ones_revalidated(tmp_path, mirror):
+    clock = _Clock()
+    limiter = _CountingLimiter()
+    cache = CnpqHttpCache(
+        str(tmp_path), ttl_seconds=60, clock=clock, rate_limiter=limiter
+    )
+    crawl = _Crawler()
+
+    # A cold cache crawls the page without any other request.
+    first = cache.get(mirror, crawl)
+    assert cache.get(mirror, crawl) == first
+    assert crawl.calls == 1
+    assert limiter.waits == 0
+
+    # Expired with no validators yet: parsed again, validators recorded.
+    clock.now += 120
+    assert cache.get(mirror, crawl)["identificacao"]["nome_grupo"] == "Grupo v2"
+    assert crawl.calls == 2
+    assert _MirrorHandler.conditional_requests == 0
+
+    # Expired again: the server answers 304 and the page is not parsed.
+    clock.now += 120
+    assert cache.get(mirror, crawl) == {"identificacao": {"nome_grupo": "Grupo v2"}}
+    assert crawl.calls == 2
+    assert _MirrorHandler.conditional_requests == 1
+
+    # The page changed: parsed again.
+    _MirrorHandler.etag = '"v3"'
+    _MirrorHandler.body = FIXTURE.read_bytes() + b"<!-- changed -->"
+    clock.now += 120
+    assert cache.get(mirror, crawl)["identificacao"]["nome_grupo"] == "Grupo v3"
+    _MirrorHandler.body = FIXTURE.read_bytes()
+
+    assert cache.stats["fresh_hits"] == 1
+    assert cache.stats["revalidated"] == 1
+    assert cache.stats["fetched"] == 3
+    # Every GET of the cache went through the shared rate limiter.
+    assert limiter.waits == 3
+
+
+def test_body_hash_ignores_per_request_jsf_tokens(tmp_path):
+    clock = _Clock()
+    requests_made = []
+
+    def jsf_page(url, headers, timeout):
+        requests_made.append(url)
+        token = len(requests_made)
+        body = (
+            f'<form action="/dgp/espelhogrupo;jsessionid=S{token}">'
+            f'<input type="hidden" name="javax.faces.ViewState" value="-{token}:1" />'
+            "<td>Grupo</td></form>"
+        ).encode()
+        return SimpleNamespace(status_code=200, headers={}, content=body)
+
+    cache = CnpqHttpCache(str(tmp_path), ttl_seconds=60, clock=clock, http_get=jsf_page)
+    crawl = _Crawler()
+    cache.get("http://dgp/0003", crawl)
+    for _ in range(3):
+        clock.now += 120
+        cache.get("http://dgp/0003", crawl)
+
+    # Only the first revalidation has no recorded body hash to compare.
+    assert len(requests_made) == 3
+    assert crawl.calls == 2
+    assert cache.stats["revalidated"] == 2
+
+
+def test_replay_serves_recorded_payloads_without_network(tmp_path):
+    recorder = CnpqHttpCache(str(tmp_path), http_get=_raise)
+    url = "http://dgp.cnpq.br/dgp/espelhogrupo/0002"
+    payload = recorder.get(url, lambda: {"nome": "Grupo"}, params={"crawler": "x"})
+
+    replay = CnpqHttpCache(str(tmp_path), mode=CACHE_MODE_REPLAY, http_get=pytest.fail)
+
+    def no_network():
+        raise AssertionError("replay must not crawl")
+
+    assert replay.get(url, no_network, params={"crawler": "x"}) == payload
+    with pytest.raises(CnpqCacheMiss):
+        replay.get(url, no_network, params={"crawler": "y"})
+
+
+def test_identical_payloads_share_one_blob_and_stale_entry_survives_errors(
+    tmp_path,
+):
+    clock = _Clock()
+    cache = CnpqHttpCache(str(tmp_path), ttl_seconds=1, clock=clock, http_get=_raise)
+    cache.get("http://a", lambda: {"same": True})
+    cache.get("http://b", lambda: {"same": True})
+
+    assert len(list((tmp_path / "entries").rglob("*.json"))) == 2
+    assert len(list((tmp_path / "blobs").rglob("*.json"))) == 1
+
+    clock.now += 10
+    assert cache.get("http://a", _raise) == {"same": True}
+    assert cache.stats["stale_on_error"] == 1
+
+
+def _raise(*_args, **_kwargs):
+    raise ConnectionError("offline")
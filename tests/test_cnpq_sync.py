@@ -5,7 +5,7 @@ import src.core.logic.strategies.cnpq_sync as cnpq_sync_module
 from src.core.logic.strategies.cnpq_sync import CnpqSyncLogic
 
 
-def test_sync_members_uses_resume_fallback_for_new_researcher():
+def test_sync_members_uses_resume_fallback_for_new_researcher(team_member_entity):
     logic = CnpqSyncLogic()
 
     session = MagicMock()
@@ -59,13 +59,23 @@ def test_sync_members_uses_resume_fallback_for_new_researcher():
         emails=None,
     )
     assert session.commit.called
-    logic.rg_ctrl._service.add_member.assert_called_once_with(
-        team_id=10,
-        person_id=123,
-        role_id=7,
-        start_date=None,
-        end_date=None,
-    )
+    logic.rg_ctrl._service.add_member.assert_not_called()
+    inserts = [
+        c.args[1]
+        for c in session.execute.call_args_list
+        if "INSERT INTO team_members" in str(c.args[0])
+    ]
+    assert inserts == [
+        [
+            {
+                "team_id": 10,
+                "person_id": 123,
+                "role_id": 7,
+                "start_date": None,
+                "end_date": None,
+            }
+        ]
+    ]
 
 
 def test_sync_group_coerces_dict_description_before_update():
@@ -2,6 +2,7 @@ import sqlite3
 from pathlib import Path
 
 from src.core.logic.duplicate_auditor import DuplicateAuditor
+from src.core.logic.person_name_keys import sync_person_name_keys
 
 
 def test_duplicate_auditor_reports_canonical_duplicates(tmp_path: Path):
@@ -28,3 +29,17 @@ def test_duplicate_auditor_reports_canonical_duplicates(tmp_path: Path):
 
     assert len(report["persons_by_canonical_name"]) == 1
     assert report["persons_by_canonical_name"][0]["canonical"] == "gustavo maia de almeida"
+
+    # The audit is read-only: without current keys nothing is created.
+    conn = sqlite3.connect(db_path)
+    tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    assert "person_name_keys" not in {row[0] for row in tables}
+
+    # With current stored keys the groups come from the table.
+    sync_person_name_keys(conn)
+    conn.close()
+    report = DuplicateAuditor(str(db_path)).run()
+    assert [m["id"] for m in report["persons_by_canonical_name"][0]["members"]] == [
+        1,
+        2,
+    ]
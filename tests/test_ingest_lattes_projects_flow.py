@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+from src.core.logic.researcher_resolution import ResearcherResolutionIndex
 from src.flows.lattes.projects import _resolve_sqlalchemy_engine, ingest_file_task
 
 
@@ -61,8 +62,60 @@ def test_ingest_file_creates_researcher_when_lattes_match_is_missing(
             entity_manager,
         )
 
-    mock_resolve_or_create.assert_called_once_with(
-        researcher_ctrl,
-        [],
-        name="Leonardo Azevedo Scardua",
+    mock_resolve_or_create.assert_called_once()
+    args, kwargs = mock_resolve_or_create.call_args
+    assert args[0] is researcher_ctrl
+    assert isinstance(args[1], ResearcherResolutionIndex)
+    assert list(args[1]) == []
+    assert kwargs == {"name": "Leonardo Azevedo Scardua"}
+
+
+@patch("src.flows.lattes.projects.tracking_recorder")
+@patch("src.flows.lattes.projects.ingest_awards_task")
+@patch("src.flows.lattes.projects.ProjectLoader")
+@patch("src.flows.lattes.projects.resolve_researcher_from_lattes")
+def test_cv_with_failed_rows_is_not_reported_as_ingested(
+    mock_resolve_from_lattes, MockProjectLoader, mock_awards, mock_recorder
+):
+    from src.core.logic.lattes_parse_pipeline import ParsedLattesCV
+    from src.flows.lattes.projects import _write_researcher_cv
+
+    mock_recorder.is_unchanged.return_value = False
+    researcher = MagicMock(id=77)
+    researcher.name = "Ana Souza"
+    mock_resolve_from_lattes.return_value = researcher
+    parsed_cv = ParsedLattesCV(
+        file_path="data/lattes_json/ana.json",
+        lattes_id="3651077981942079",
+        payload_hash="hash",
+        projects=[{"name": "Projeto"}],
+        sections={"awards": [{"title": "Prêmio"}]},
     )
+
+    def write():
+        return _write_researcher_cv(
+            parsed_cv, MagicMock(), MagicMock(), MagicMock(), MagicMock()
+        )
+
+    MockProjectLoader.return_value.process_records.return_value = {"failed": 0}
+    mock_awards.return_value = 0
+
+    def recorded_types():
+        return [
+            call.kwargs["source_entity_type"]
+            for call in mock_recorder.record_source_record.call_args_list
+        ]
+
+    assert write() is True
+    assert "lattes_cv" in recorded_types()
+
+    # One failed project row: the CV is neither fingerprinted nor marked.
+    mock_recorder.reset_mock()
+    mock_recorder.is_unchanged.return_value = False
+    MockProjectLoader.return_value.process_records.return_value = {"failed": 1}
+    assert write() is False
+    assert "lattes_cv" not in recorded_types()
+
+    MockProjectLoader.return_value.process_records.return_value = {"failed": 0}
+    mock_awards.side_effect = RuntimeError("boom")
+    assert write() is False
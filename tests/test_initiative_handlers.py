@@ -298,3 +298,44 @@ def test_advisorship_handler_sets_cancelled_on_created_advisorship(
     assert created.cancelled is True
     assert created.cancellation_date is None
     MockAdvisorshipController.return_value.create.assert_called_once_with(created)
+
+
+@patch("src.core.logic.initiative_handlers.FellowshipController")
+@patch("src.core.logic.initiative_handlers.AdvisorshipController")
+def test_advisorship_handler_checks_titles_against_the_run_name_index(
+    MockAdvisorshipController,
+    MockFellowshipController,
+):
+    from src.core.logic.initiative_name_index import initiative_name_index_scope
+
+    initiative_controller = MagicMock()
+    person_matcher = MagicMock()
+    entity_manager = MagicMock()
+
+    MockFellowshipController.return_value.get_all.return_value = []
+    session = MagicMock()
+    # Initiative names, then advisorship ids.
+    session.execute.side_effect = [iter([(258, "Bancada Didática")]), iter([(258,)])]
+    initiative_controller._service._repository._session = session
+    person_matcher.person_controller._service._repository._session = session
+
+    handler = AdvisorshipHandler(
+        initiative_controller=initiative_controller,
+        person_matcher=person_matcher,
+        entity_manager=entity_manager,
+    )
+
+    with initiative_name_index_scope("test"):
+        title = handler._resolve_persisted_title(
+            "Bancada Didática",
+            {"student_names": ["Ana Estudante"], "start_date": datetime(2019, 8, 1)},
+        )
+        assert title == "Bancada Didática | Orientacao Ana Estudante | 2019"
+        assert not handler._initiative_name_in_use(title)
+        assert not handler._initiative_name_in_use("Bancada Didática", current_id=258)
+
+        handler._find_existing_advisorship_by_title("Bancada Didática")
+        assert handler._find_existing_advisorship_by_title(title) is None
+
+    assert session.execute.call_count == 2
+    MockAdvisorshipController.return_value.get_by_id.assert_called_once_with(258)
@@ -0,0 +1,62 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.core.logic.initiative_name_index import (
+    InitiativeNameIndex,
+    active_initiative_name_index,
+    initiative_name_index_scope,
+)
+from src.core.logic.reference_data_cache import QueryCounter
+
+
+def _session():
+    session = Session(create_engine("sqlite:///:memory:"))
+    session.execute(
+        text("CREATE TABLE initiatives (id INTEGER PRIMARY KEY, name TEXT)")
+    )
+    session.execute(text("CREATE TABLE advisorships (id INTEGER PRIMARY KEY)"))
+    session.execute(
+        text(
+            "INSERT INTO initiatives VALUES "
+            "(1, 'Projeto Guarda-chuva'), (2, 'Plano de Trabalho'), "
+            "(3, 'Plano de Trabalho'), (4, NULL)"
+        )
+    )
+    session.execute(text("INSERT INTO advisorships VALUES (3)"))
+    return session
+
+
+def test_index_answers_name_checks_without_per_row_queries():
+    session = _session()
+    with QueryCounter() as queries:
+        index = InitiativeNameIndex().load(session)
+        assert index.name_in_use("Projeto Guarda-chuva")
+        assert not index.name_in_use("Projeto Guarda-chuva", current_id=1)
+        assert not index.name_in_use("projeto guarda-chuva")
+        assert index.name_in_use("Plano de Trabalho", current_id=2)
+        assert index.first_id("Plano de Trabalho") == 2
+        assert not index.is_advisorship(2) and index.is_advisorship(3)
+
+        index.add(10, "Plano de Trabalho | Orientacao Ana", advisorship=True)
+        index.rename(1, "Projeto Guarda-chuva", "Projeto Renomeado")
+        assert index.first_id("Plano de Trabalho | Orientacao Ana") == 10
+        assert index.is_advisorship(10)
+        assert not index.name_in_use("Projeto Guarda-chuva")
+        assert index.first_id("Projeto Renomeado") == 1
+        index.load(session)  # already loaded
+    assert queries.count == 2
+
+
+def test_index_is_only_active_inside_a_scope():
+    session = _session()
+    assert active_initiative_name_index(session) is None
+    with initiative_name_index_scope("test") as scoped:
+        with initiative_name_index_scope("nested") as nested:
+            assert nested is scoped
+        assert active_initiative_name_index(session) is scoped
+        assert active_initiative_name_index(None) is None
+
+        scoped.invalidate()
+        assert not scoped.loaded
+        assert active_initiative_name_index(session).first_id("Plano de Trabalho") == 2
+    assert active_initiative_name_index(session) is None
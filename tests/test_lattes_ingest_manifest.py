@@ -0,0 +1,102 @@
+import json
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.core.logic.lattes_ingest_manifest import (
+    LattesIngestManifest,
+    cv_updated_at,
+    file_sha256,
+)
+
+
+def _write_cv(path, updated_at, extra=None):
+    data = {"informacoes_pessoais": {"data_atualizacao": updated_at}}
+    data.update(extra or {})
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def _ingest(manifest_path, files, flow_name="lattes_projects", force_full=False):
+    manifest = LattesIngestManifest(flow_name, path=str(manifest_path))
+    selected = manifest.select(files, force_full=force_full)
+    for file_path in selected:
+        with open(file_path, encoding="utf-8") as file_handle:
+            updated_at = cv_updated_at(json.load(file_handle))
+        manifest.mark_ingested(file_path, cv_updated_at=updated_at, ingestion_run_id=7)
+    manifest.save()
+    return selected
+
+
+def test_only_new_or_changed_cvs_are_selected(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    first = _write_cv(tmp_path / "01_A_1111.json", "01/02/2026")
+    second = _write_cv(tmp_path / "02_B_2222.json", "03/04/2026")
+
+    assert _ingest(manifest_path, [first, second]) == [first, second]
+    assert _ingest(manifest_path, [first, second]) == []
+
+    # Same CV update date, different bytes (e.g. a new download): skipped.
+    _write_cv(tmp_path / "01_A_1111.json", "01/02/2026", {"downloaded": "now"})
+    # Updated CV and a brand new one: selected.
+    _write_cv(tmp_path / "02_B_2222.json", "05/06/2026")
+    third = _write_cv(tmp_path / "03_C_3333.json", "01/01/2026")
+    assert _ingest(manifest_path, [first, second, third]) == [second, third]
+
+    stored = json.loads(manifest_path.read_text())["flows"]["lattes_projects"]
+    assert stored["1111"]["file_hash"] == file_sha256(first)
+    assert stored["2222"]["cv_updated_at"] == "05/06/2026"
+    assert stored["3333"]["ingestion_run_id"] == 7
+
+
+def test_flows_are_tracked_separately_and_force_full_selects_all(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    cv = _write_cv(tmp_path / "01_A_1111.json", "01/02/2026")
+
+    assert _ingest(manifest_path, [cv]) == [cv]
+    assert _ingest(manifest_path, [cv], flow_name="lattes_advisorships") == [cv]
+    assert _ingest(manifest_path, [cv], force_full=True) == [cv]
+
+
+def test_unmarked_cvs_are_selected_again(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    cv = _write_cv(tmp_path / "01_A_1111.json", "01/02/2026")
+
+    manifest = LattesIngestManifest("lattes_projects", path=str(manifest_path))
+    assert manifest.select([cv]) == [cv]
+    manifest.save()  # the CV failed to ingest and was never marked
+
+    assert _ingest(manifest_path, [cv]) == [cv]
+
+
+def test_unreadable_manifest_starts_empty(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("{", encoding="utf-8")
+    cv = _write_cv(tmp_path / "01_A_1111.json", "01/02/2026")
+
+    assert _ingest(manifest_path, [cv]) == [cv]
+    assert _ingest(manifest_path, [cv]) == []
+
+
+def test_fresh_database_with_an_existing_manifest_selects_every_file(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    cv = _write_cv(tmp_path / "01_A_1111.json", "01/02/2026")
+    assert _ingest(manifest_path, [cv]) == [cv]
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'horizon.db'}")
+    with Session(engine) as session:
+        manifest = LattesIngestManifest("lattes_projects", path=str(manifest_path))
+        # No tracking schema at all, as right after a reset.
+        assert manifest.forget_unknown_runs(session) == 1
+        assert manifest.select([cv]) == [cv]
+        manifest.save()
+
+        session.execute(text("CREATE TABLE ingestion_runs (id INTEGER PRIMARY KEY)"))
+        session.execute(text("INSERT INTO ingestion_runs (id) VALUES (7)"))
+        session.commit()
+    assert _ingest(manifest_path, [cv]) == [cv]
+
+    with Session(engine) as session:
+        manifest = LattesIngestManifest("lattes_projects", path=str(manifest_path))
+        assert manifest.forget_unknown_runs(session) == 0
+        assert manifest.select([cv]) == []
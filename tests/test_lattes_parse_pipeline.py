@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from src.adapters.sources.lattes_parser import LattesParser
+from src.core.logic.lattes_parse_pipeline import parse_lattes_file, parse_lattes_files
+
+
+def _cv(index):
+    return {
+        "informacoes_pessoais": {"nome_completo": f"Pesquisador {index}"},
+        "projetos_pesquisa": [
+            {
+                "nome": f"Projeto {index}",
+                "ano_inicio": "2020",
+                "situacao": "EM_ANDAMENTO",
+                "descricao": "",
+            },
+            {
+                "nome": f"Projeto {index} ",
+                "ano_inicio": "2021",
+                "situacao": "EM_ANDAMENTO",
+                "descricao": "",
+            },
+        ],
+        "producao_bibliografica": {
+            "artigos_periodicos": [
+                {"titulo": f"Artigo {index}", "ano": "2022", "doi": f"10.1/{index}"}
+            ]
+        },
+    }
+
+
+@pytest.fixture
+def lattes_dir(tmp_path):
+    paths = []
+    for index in range(7):
+        path = tmp_path / f"{index:02d}_Pesquisador-{index}_{1000 + index}.json"
+        path.write_text(json.dumps(_cv(index)), encoding="utf-8")
+        paths.append(str(path))
+    (tmp_path / "broken_2000.json").write_text("{", encoding="utf-8")
+    (tmp_path / "no_id.json").write_text("{}", encoding="utf-8")
+    paths.insert(3, str(tmp_path / "broken_2000.json"))
+    paths.append(str(tmp_path / "no_id.json"))
+    return paths
+
+
+def test_parallel_parsing_matches_sequential_in_file_order(lattes_dir):
+    sequential = list(parse_lattes_files(lattes_dir, max_workers=1))
+    parallel = list(parse_lattes_files(lattes_dir, max_workers=3, prefetch=2))
+
+    assert parallel == sequential
+    assert [cv.lattes_id for cv in parallel] == [str(1000 + i) for i in range(7)]
+    first = parallel[0]
+    assert first.json_name == "Pesquisador 0"
+    assert [p["name"] for p in first.projects] == ["Projeto 0"]
+    assert first.articles[0]["doi"] == "10.1/0"
+    assert set(first.sections) == {
+        "awards",
+        "languages",
+        "professional_activities",
+        "technical_productions",
+    }
+
+
+def test_known_fingerprint_skips_parsing(lattes_dir):
+    parsed = parse_lattes_file(lattes_dir[0], LattesParser())
+
+    known = {parsed.lattes_id: parsed.payload_hash, "1001": "stale"}
+    results = list(
+        parse_lattes_files(lattes_dir[:3], max_workers=2, known_fingerprints=known)
+    )
+
+    assert results[0].unchanged and results[0].projects == []
+    assert results[0].payload_hash == parsed.payload_hash
+    assert not results[1].unchanged and results[1].projects
+
+
+def test_parse_lattes_files_rejects_zero_workers(lattes_dir):
+    with pytest.raises(ValueError):
+        list(parse_lattes_files(lattes_dir, max_workers=0))
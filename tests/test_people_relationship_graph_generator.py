@@ -3,6 +3,11 @@ import json
 from src.core.logic.people_relationship_graph_generator import (
     PeopleRelationshipGraphGenerator,
 )
+from src.core.logic.relationship_graph_index import (
+    INDEX_DIRECTORY,
+    RelationshipGraphIndex,
+    query_ego_network,
+)
 
 
 def _write_sample_inputs(tmp_path, include_null_person: bool = False):
@@ -288,3 +293,59 @@ def test_people_relationship_graph_generator_exports_filtered_graph_files(tmp_pa
     assert nodes_by_id[1]["is_advisorship_neighbor"] is False
     assert nodes_by_id[3]["is_group_member"] is False
     assert nodes_by_id[3]["is_advisorship_neighbor"] is True
+
+
+def test_people_relationship_graph_generator_writes_queryable_adjacency_index(
+    tmp_path,
+):
+    paths = _write_sample_inputs(tmp_path, include_null_person=True)
+    output_dir = tmp_path / "exports"
+
+    generator = PeopleRelationshipGraphGenerator()
+    result = generator.generate_all(
+        researchers_path=str(paths["researchers.json"]),
+        initiatives_path=str(paths["initiatives.json"]),
+        research_groups_path=str(paths["research_groups.json"]),
+        advisorships_path=str(paths["advisorships.json"]),
+        output_dir=str(output_dir),
+    )
+
+    index_dir = output_dir / INDEX_DIRECTORY
+    assert result["adjacency_index"]["index_directory"] == str(index_dir)
+    assert result["adjacency_index"]["nodes"] == 4
+    assert result["adjacency_index"]["edges"] == 3
+
+    with RelationshipGraphIndex(str(index_dir)) as index:
+        assert index.neighbors(2) == [
+            {"id": 1, "weight": 2, "relation_types": ["initiative", "research_group"]},
+            {"id": 3, "weight": 1, "relation_types": ["initiative"]},
+        ]
+        assert index.neighbors(4) == []
+        assert index.neighbors(999) == []
+
+    one_hop = query_ego_network(str(index_dir), 3, hops=1)
+    assert one_hop["nodes"] == [
+        {"id": 3, "hop": 0},
+        {"id": 1, "hop": 1},
+        {"id": 2, "hop": 1},
+    ]
+    assert one_hop["edges"] == [
+        {
+            "source": 1,
+            "target": 2,
+            "weight": 2,
+            "relation_types": ["initiative", "research_group"],
+        },
+        {
+            "source": 1,
+            "target": 3,
+            "weight": 2,
+            "relation_types": ["initiative", "advisorship"],
+        },
+        {"source": 2, "target": 3, "weight": 1, "relation_types": ["initiative"]},
+    ]
+
+    isolated = query_ego_network(str(index_dir), 4, hops=2)
+    assert isolated["nodes"] == [{"id": 4, "hop": 0}]
+    assert isolated["edges"] == []
+    assert query_ego_network(str(index_dir), 999)["nodes"] == []
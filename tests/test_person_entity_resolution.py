@@ -0,0 +1,152 @@
+import sqlite3
+from pathlib import Path
+
+from src.core.logic.person_entity_resolution import PersonEntityResolver
+
+SCHEMA_SQL = """
+CREATE TABLE persons (
+    id INTEGER PRIMARY KEY,
+    name VARCHAR NOT NULL,
+    identification_id VARCHAR,
+    birthday DATE
+);
+CREATE TABLE researchers (
+    id INTEGER PRIMARY KEY,
+    cnpq_url VARCHAR(255),
+    google_scholar_url VARCHAR(255),
+    resume VARCHAR,
+    citation_names VARCHAR(500)
+);
+CREATE TABLE person_emails (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    person_id INTEGER NOT NULL,
+    email VARCHAR NOT NULL
+);
+CREATE TABLE advisorships (
+    id INTEGER PRIMARY KEY,
+    fellowship_id INTEGER,
+    institution_id INTEGER
+);
+CREATE TABLE advisorship_members (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    advisorship_id INTEGER NOT NULL,
+    person_id INTEGER NOT NULL,
+    role_id INTEGER,
+    role_name VARCHAR(50),
+    start_date DATETIME,
+    end_date DATETIME
+);
+CREATE TABLE academic_educations (
+    id INTEGER PRIMARY KEY,
+    researcher_id INTEGER NOT NULL,
+    education_type_id INTEGER NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    start_year INTEGER NOT NULL,
+    end_year INTEGER,
+    thesis_title VARCHAR(500),
+    institution_id INTEGER NOT NULL,
+    advisor_id INTEGER,
+    co_advisor_id INTEGER
+);
+CREATE TABLE article_authors (
+    article_id INTEGER NOT NULL,
+    researcher_id INTEGER NOT NULL,
+    PRIMARY KEY (article_id, researcher_id)
+);
+CREATE TABLE researcher_knowledge_areas (
+    researcher_id INTEGER NOT NULL,
+    area_id INTEGER NOT NULL,
+    PRIMARY KEY (researcher_id, area_id)
+);
+CREATE TABLE initiative_persons (
+    initiative_id INTEGER NOT NULL,
+    person_id INTEGER NOT NULL,
+    PRIMARY KEY (initiative_id, person_id)
+);
+CREATE TABLE organization_persons (
+    organization_id INTEGER NOT NULL,
+    person_id INTEGER NOT NULL,
+    PRIMARY KEY (organization_id, person_id)
+);
+CREATE TABLE team_members (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    person_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    role_id INTEGER,
+    start_date DATETIME,
+    end_date DATETIME
+);
+"""
+
+
+def _build_db(tmp_path: Path, persons) -> Path:
+    db_path = tmp_path / "resolution.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA_SQL)
+    conn.executemany(
+        "INSERT INTO persons (id, name, identification_id) VALUES (?, ?, ?)",
+        persons,
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def test_resolver_clusters_fuzzy_and_reordered_names_transitively(tmp_path: Path):
+    db_path = _build_db(
+        tmp_path,
+        [
+            (1, "Joana Pereira Lima", None),
+            (2, "Joana Pereira Limma", None),
+            (3, "Joana Lima Pereira", None),
+            (4, "Carlos Alberto Souza", None),
+            (5, "Marcos Vinicius Rocha", None),
+        ],
+    )
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO team_members (person_id, team_id) VALUES (2, 10)")
+    conn.commit()
+    conn.close()
+
+    report = PersonEntityResolver(str(db_path)).run()
+
+    assert report["clusters"] == 1
+    assert report["cluster_sizes"] == {"3": 1}
+    assert report["largest_clusters"][0]["winner_id"] == 2
+    assert sorted(report["largest_clusters"][0]["loser_ids"]) == [1, 3]
+    assert report["merged_records"] == 2
+    assert set(report["timings_seconds"]) >= {"load", "scoring", "merge", "total"}
+
+    conn = sqlite3.connect(db_path)
+    assert [row[0] for row in conn.execute("SELECT id FROM persons ORDER BY id")] == [
+        2,
+        4,
+        5,
+    ]
+    conn.close()
+
+
+def test_resolver_refuses_links_between_distinct_identifiers(tmp_path: Path):
+    db_path = _build_db(
+        tmp_path,
+        [
+            (1, "Ana Paula Souza", "11111111111"),
+            (2, "Ana Paula Sousa", None),
+            (3, "Ana Paula Souza", "22222222222"),
+        ],
+    )
+
+    report = PersonEntityResolver(str(db_path)).run(dry_run=True)
+
+    assert report["rejected_links"] >= 1
+    assert report["merged_records"] == 0
+    for cluster in report["largest_clusters"]:
+        ids = {member["id"] for member in cluster["members"]}
+        assert not {1, 3} <= ids
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM persons").fetchone()[0] == 3
+    # The dry run did not create or fill the name keys table either.
+    tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    assert "person_name_keys" not in {row[0] for row in tables}
+    conn.close()
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import pytest
 
@@ -101,6 +101,165 @@ def test_match_or_create_prefers_richer_duplicate_for_same_canonical_name(matche
     matcher.person_controller.get_all.return_value = [duplicate_plain, duplicate_rich]
     matcher.preload_cache()
 
-    result = matcher.match_or_create("Paulo Sérgio dos Santos Júnior", strict_match=True)
+    result = matcher.match_or_create(
+        "Paulo Sérgio dos Santos Júnior", strict_match=True
+    )
     assert result.id == 2
     matcher.person_controller.create_person.assert_not_called()
+
+
+def test_match_or_create_fuzzy_matches_reordered_surnames(matcher):
+    person = MockPerson(1, "Maria Santos Oliveira")
+    matcher.person_controller.get_all.return_value = [person]
+    matcher.preload_cache()
+
+    result = matcher.match_or_create("Maria Oliveira Santos")
+    assert result.id == 1
+    matcher.person_controller.create_person.assert_not_called()
+
+
+def test_fuzzy_candidates_are_limited_to_shared_blocks(matcher):
+    matcher.person_controller.get_all.return_value = [
+        MockPerson(1, "Paulo Sergio Junior"),
+        MockPerson(2, "Carla Mendes"),
+        MockPerson(3, "Ana Paula Mendes"),
+    ]
+    matcher.preload_cache()
+
+    candidates = [
+        matcher._normalized_names[position]
+        for position in matcher._fuzzy_candidates("CARLA MENDEZ")
+    ]
+    assert candidates == ["CARLA MENDES"]
+
+
+def test_name_index_is_updated_when_persons_are_created(matcher):
+    matcher.person_controller.get_all.return_value = []
+    matcher.preload_cache()
+    matcher.person_controller.create_person.return_value = MockPerson(
+        7, "Joana Pereira Lima"
+    )
+
+    created = matcher.match_or_create("Joana Pereira Lima")
+    matched = matcher.match_or_create("Joana Pereira Limma")
+
+    assert created.id == matched.id == 7
+    matcher.person_controller.create_person.assert_called_once()
+    assert matcher._normalized_to_name["JOANA PEREIRA LIMMA"] == "Joana Pereira Limma"
+
+
+def test_preload_cache_uses_current_persisted_name_keys(matcher, monkeypatch):
+    stored = MockPerson(1, "Ana Souza")
+    renamed = MockPerson(2, "Bruno Lima")
+    matcher.person_controller.get_all.return_value = [stored, renamed]
+    monkeypatch.setattr(
+        "src.core.logic.person_matcher.load_person_name_keys",
+        lambda session, key_types: {
+            1: {
+                "name": "Ana Souza",
+                "normalized": "ANA SOUZA",
+                "canonical": "ANA SOUZA",
+            },
+            2: {"name": "Bruno", "normalized": "BRUNO", "canonical": "BRUNO"},
+        },
+    )
+    normalized = []
+    original_normalize = matcher.normalize_name
+    monkeypatch.setattr(
+        matcher,
+        "normalize_name",
+        lambda name: normalized.append(name) or original_normalize(name),
+    )
+
+    matcher.preload_cache()
+
+    assert "Ana Souza" not in normalized
+    assert "Bruno Lima" in normalized
+    assert matcher._canonical_cache["ANA SOUZA"] is stored
+    assert matcher._canonical_cache["BRUNO LIMA"] is renamed
+
+
+@pytest.fixture
+def bulk_matcher(matcher):
+    matcher.person_controller.get_all.return_value = [
+        MockPerson(1, "Paulo Sergio"),
+        MockPerson(2, "Persona A Alpha"),
+    ]
+    matcher.person_controller.create_person.side_effect = lambda name, emails: (
+        MockPerson(100 + matcher.person_controller.create_person.call_count - 1, name)
+    )
+    matcher.preload_cache()
+    return matcher
+
+
+def test_match_many_creates_each_new_person_once_through_the_controller(
+    bulk_matcher,
+):
+    results = bulk_matcher.match_many(
+        [
+            {"name": "Paulo Sergio"},
+            {"name": "Persona Alpha"},
+            {"name": "Joana Pereira Lima", "email": "joana@example.com"},
+            {"name": "Joana Pereira Limma"},
+            ("Joana Pereira Lima", "joana@example.com"),
+            {"name": "  "},
+            {"name": "Marcos Vieira"},
+        ]
+    )
+
+    assert [person.id if person else None for person in results] == [
+        1,
+        2,
+        100,
+        100,
+        100,
+        None,
+        101,
+    ]
+    # Same calls as match_or_create: the controller stores (and the session
+    # hook anonymizes) the raw email.
+    assert bulk_matcher.person_controller.create_person.call_args_list == [
+        call(name="Joana Pereira Lima", emails=["joana@example.com"]),
+        call(name="Marcos Vieira", emails=[]),
+    ]
+
+    # Created persons are cached for later calls.
+    assert bulk_matcher.match_or_create("Marcos Vieira").id == 101
+    assert bulk_matcher.match_or_create("Other", email="joana@example.com").id == 100
+
+
+def test_match_many_matches_sequential_calls(bulk_matcher):
+    names = [
+        "Jose da Silva",
+        "Jose Silva",
+        "Maria Santos Oliveira",
+        "Maria Oliveira Santos",
+        "Jose Silva",
+    ]
+    sequential = PersonMatcher(MagicMock())
+    sequential.person_controller.get_all.return_value = [
+        MockPerson(1, "Paulo Sergio"),
+        MockPerson(2, "Persona A Alpha"),
+    ]
+    sequential.preload_cache()
+    sequential.person_controller.create_person.side_effect = (
+        lambda name, emails: MockPerson(None, name)
+    )
+
+    batch = bulk_matcher.match_many([(name, None) for name in names], strict_match=True)
+    one_by_one = [sequential.match_or_create(name, strict_match=True) for name in names]
+
+    assert [person.name for person in batch] == [person.name for person in one_by_one]
+
+
+def test_match_many_returns_none_for_persons_that_fail_to_be_created(
+    bulk_matcher,
+):
+    bulk_matcher.person_controller.create_person.side_effect = RuntimeError("boom")
+
+    results = bulk_matcher.match_many([("Nova Pessoa", None), ("Paulo Sergio", None)])
+
+    assert results[0] is None
+    assert results[1].id == 1
+    # The failed person is not cached: a later call tries to create it again.
+    assert "Nova Pessoa" not in bulk_matcher._persons_cache
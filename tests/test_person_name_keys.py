@@ -0,0 +1,151 @@
+import sqlite3
+from pathlib import Path
+
+from sqlalchemy import Column, Integer, String, create_engine, text
+from sqlalchemy.orm import Session, declarative_base
+
+from src.core.logic import person_name_keys
+from src.core.logic.person_name_keys import (
+    CREATE_INDEX_SQL,
+    CREATE_TABLE_SQL,
+    PERSON_NAME_KEYS_VERSION,
+    compute_person_name_keys,
+    person_name_keys_current,
+    sync_person_name_keys,
+)
+from src.db.migrations import run_migrations
+
+Base = declarative_base()
+
+
+class _Person(Base):
+    __tablename__ = "persons"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+
+
+def _stored_keys(conn, person_id):
+    return dict(
+        conn.execute(
+            "SELECT key_type, key FROM person_name_keys WHERE person_id = ?",
+            (person_id,),
+        ).fetchall()
+    )
+
+
+def test_compute_person_name_keys_covers_every_consumer():
+    assert compute_person_name_keys("José da Silva-Júnior") == {
+        "name": "José da Silva-Júnior",
+        "normalized": "JOSE DA SILVA JUNIOR",
+        "canonical": "JOSE da SILVA JUNIOR",
+        "text": "jose da silva junior",
+        "version": PERSON_NAME_KEYS_VERSION,
+    }
+    assert compute_person_name_keys("") == {
+        "name": "",
+        "version": PERSON_NAME_KEYS_VERSION,
+    }
+
+
+def test_sync_person_name_keys_only_refreshes_missing_or_stale_rows(tmp_path: Path):
+    conn = sqlite3.connect(tmp_path / "keys.db")
+    conn.execute("CREATE TABLE persons (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute("INSERT INTO persons (id, name) VALUES (1, 'Ana Souza')")
+    conn.execute("INSERT INTO persons (id, name) VALUES (2, 'Bruno Lima')")
+    conn.commit()
+
+    assert sync_person_name_keys(conn) == 2
+    assert sync_person_name_keys(conn) == 0
+
+    conn.execute("UPDATE persons SET name = 'Bruno Lima Filho' WHERE id = 2")
+    conn.execute("DELETE FROM persons WHERE id = 1")
+    conn.commit()
+
+    assert sync_person_name_keys(conn) == 1
+    assert _stored_keys(conn, 1) == {}
+    assert _stored_keys(conn, 2)["normalized"] == "BRUNO LIMA FILHO"
+    conn.close()
+
+
+def test_a_new_normalization_version_makes_every_key_stale(tmp_path, monkeypatch):
+    conn = sqlite3.connect(tmp_path / "keys.db")
+    conn.execute("CREATE TABLE persons (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute("INSERT INTO persons (id, name) VALUES (1, 'Ana Souza')")
+    conn.commit()
+    assert not person_name_keys_current(conn)
+    sync_person_name_keys(conn)
+    assert person_name_keys_current(conn)
+
+    session = Session(create_engine(f"sqlite:///{tmp_path / 'keys.db'}"))
+    assert set(person_name_keys.load_person_name_keys(session, ["normalized"])) == {1}
+
+    monkeypatch.setattr(person_name_keys, "PERSON_NAME_KEYS_VERSION", "2")
+    assert not person_name_keys_current(conn)
+    assert person_name_keys.load_person_name_keys(session, ["normalized"]) == {}
+    assert sync_person_name_keys(conn) == 1
+    assert _stored_keys(conn, 1)["version"] == "2"
+    session.close()
+    conn.close()
+
+
+def test_migrations_backfill_keys_of_existing_persons(tmp_path):
+    conn = sqlite3.connect(tmp_path / "keys.db")
+    conn.execute("CREATE TABLE initiatives (id INTEGER PRIMARY KEY)")
+    conn.execute("CREATE TABLE persons (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute("INSERT INTO persons (id, name) VALUES (1, 'Ana Souza')")
+    conn.commit()
+
+    with Session(create_engine(f"sqlite:///{tmp_path / 'keys.db'}")) as session:
+        run_migrations(session)
+
+    assert person_name_keys_current(conn)
+    assert _stored_keys(conn, 1)["normalized"] == "ANA SOUZA"
+    conn.close()
+
+
+def test_after_flush_hook_writes_keys_on_insert_update_and_delete(monkeypatch):
+    monkeypatch.setattr(person_name_keys, "_installed", False)
+    person_name_keys.install_person_name_key_hooks()
+    try:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(text(CREATE_TABLE_SQL))
+            connection.execute(text(CREATE_INDEX_SQL))
+
+        with Session(engine) as session:
+            person = _Person(name="Maria Pereira")
+            session.add(person)
+            session.commit()
+
+            keys = session.execute(
+                text(
+                    "SELECT key FROM person_name_keys "
+                    "WHERE person_id = :id AND key_type = 'canonical'"
+                ),
+                {"id": person.id},
+            ).scalar()
+            assert keys == "MARIA PEREIRA"
+
+            person.name = "Maria da Pereira"
+            session.commit()
+            keys = session.execute(
+                text(
+                    "SELECT key FROM person_name_keys "
+                    "WHERE person_id = :id AND key_type = 'canonical'"
+                ),
+                {"id": person.id},
+            ).scalar()
+            assert keys == "MARIA da PEREIRA"
+
+            session.delete(person)
+            session.commit()
+            remaining = session.execute(
+                text("SELECT COUNT(*) FROM person_name_keys")
+            ).scalar()
+            assert remaining == 0
+    finally:
+        from sqlalchemy import event
+
+        event.remove(Session, "after_flush", person_name_keys._after_flush)
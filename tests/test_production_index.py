@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.core.logic.production_index import (
+    ProductionIndex,
+    get_production_index,
+    production_index_scope,
+)
+from src.core.logic.reference_data_cache import QueryCounter
+
+
+def _session():
+    session = Session(create_engine("sqlite:///:memory:"))
+    session.execute(
+        text(
+            "CREATE TABLE research_productions "
+            "(id INTEGER PRIMARY KEY, production_type_id INTEGER, title TEXT, year INTEGER)"
+        )
+    )
+    session.execute(
+        text(
+            "CREATE TABLE production_authors (production_id INTEGER, researcher_id INTEGER)"
+        )
+    )
+    session.execute(
+        text(
+            "INSERT INTO research_productions VALUES "
+            "(1, 10, 'Software X', 2020), (2, 11, 'Software X', 2020)"
+        )
+    )
+    session.execute(text("INSERT INTO production_authors VALUES (1, 7)"))
+    return session
+
+
+def test_index_resolves_natural_keys_and_authors_with_constant_queries():
+    session = _session()
+    type_ctrl = MagicMock()
+    type_ctrl.get_all.return_value = [
+        SimpleNamespace(id=10, name="softwares_sem_patente"),
+        SimpleNamespace(id=11, name="patentes"),
+    ]
+
+    with QueryCounter() as queries:
+        index = ProductionIndex().load(session)
+        assert index.find((10, "Software X", 2020)) == 1
+        assert index.find((11, "Software X", 2020)) == 2
+        assert index.find((10, "Software X", 2021)) is None
+        assert index.has_author(1, 7) and not index.has_author(2, 7)
+
+        index.add(3, (10, "Software X", 2021))
+        index.add_author(3, 7)
+        assert index.find((10, "Software X", 2021)) == 3
+        assert index.has_author(3, 7)
+    assert queries.count == 2
+
+    assert index.production_type_ids(type_ctrl) == {
+        "softwares_sem_patente": 10,
+        "patentes": 11,
+    }
+    index.production_type_ids(type_ctrl)["marcas"] = 12
+    assert index.production_type_ids(type_ctrl)["marcas"] == 12
+    type_ctrl.get_all.assert_called_once()
+
+
+def test_scope_shares_the_index_and_counts_outcomes_per_type():
+    session = _session()
+    with production_index_scope("test") as scoped:
+        assert get_production_index(session) is scoped
+        scoped.count("patentes", "inserted")
+        scoped.count("patentes", "deduplicated", 3)
+        scoped.count("softwares_sem_patente", "deduplicated")
+
+        assert scoped.summary() == {
+            "patentes": {"inserted": 1, "deduplicated": 3},
+            "softwares_sem_patente": {"inserted": 0, "deduplicated": 1},
+        }
+
+    assert get_production_index(session) is not scoped
@@ -64,3 +64,236 @@ def test_register_existing_initiative_keeps_parent_mapping_when_child_shares_tit
         ]
         is parent_project
     )
+
+
+def test_reused_caches_are_loaded_once_and_strategy_is_swapped_per_call():
+    loader = ProjectLoader.__new__(ProjectLoader)
+    loader.batch_size = 0
+    loader.reuse_caches = True
+    loader._existing_initiatives = None
+    loader._persons_preloaded = False
+    loader.mapping_strategy = None
+    loader.controller = MagicMock()
+    existing = MagicMock()
+    existing.name = "Projeto Existente"
+    loader.controller.get_all.return_value = [existing]
+    loader.person_matcher = MagicMock()
+    loader.person_matcher._persons_cache = {}
+    loader.team_synchronizer = MagicMock()
+
+    seen = []
+
+    def process_row(row, existing_by_name, existing_by_identity, stats, source_file):
+        seen.append((loader.mapping_strategy, row, dict(existing_by_name)))
+        existing_by_name[row] = MagicMock()
+
+    loader._process_row = process_row
+    first_strategy, second_strategy = MagicMock(), MagicMock()
+
+    loader.process_records(["A"], source_file="a.json", mapping_strategy=first_strategy)
+    loader.process_records(
+        ["B"], source_file="b.json", mapping_strategy=second_strategy
+    )
+
+    loader.controller.get_all.assert_called_once()
+    loader.person_matcher.preload_cache.assert_called_once()
+    assert seen[0][0] is first_strategy and seen[1][0] is second_strategy
+    # Initiatives registered while loading the first CV are visible to the next.
+    assert set(seen[1][2]) == {"Projeto Existente", "A"}
+
+
+def test_failed_row_is_counted_and_reloads_the_reused_caches():
+    loader = ProjectLoader.__new__(ProjectLoader)
+    loader.batch_size = 0
+    loader.reuse_caches = True
+    loader._existing_initiatives = None
+    loader._persons_preloaded = False
+    loader.mapping_strategy = None
+    loader.controller = MagicMock()
+    loader.controller.get_all.return_value = []
+    loader.person_matcher = MagicMock()
+    loader.person_matcher._persons_cache = {}
+    loader.team_synchronizer = MagicMock()
+
+    seen = []
+
+    def process_row(row, existing_by_name, existing_by_identity, stats, source_file):
+        seen.append(dict(existing_by_name))
+        existing_by_name[row] = MagicMock()
+        if row == "falha":
+            raise ValueError("boom")
+        stats["created"] += 1
+
+    loader._process_row = process_row
+
+    stats = loader.process_records(["A", "falha", "B"], source_file="a.json")
+
+    assert (stats["created"], stats["skipped"], stats["failed"]) == (2, 1, 1)
+    # The rolled back "falha" is dropped by reloading the caches.
+    assert "falha" not in seen[2]
+    assert loader.controller.get_all.call_count == 2
+    assert loader.person_matcher.preload_cache.call_count == 2
+    # The failed row's staged memberships are dropped too.
+    memberships = loader.team_synchronizer.batch.return_value.__enter__.return_value
+    memberships.rollback_to.assert_called_once_with(memberships.checkpoint.return_value)
+
+
+def test_recalculate_all_parent_statuses_widens_dates_in_one_bulk_update():
+    from types import SimpleNamespace
+
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session
+
+    session = Session(create_engine("sqlite:///:memory:"))
+    session.execute(
+        text(
+            "CREATE TABLE initiatives (id INTEGER PRIMARY KEY, parent_id INTEGER, "
+            "status TEXT, start_date DATETIME, end_date DATETIME)"
+        )
+    )
+    session.execute(text("CREATE TABLE advisorships (id INTEGER PRIMARY KEY)"))
+    session.execute(
+        text(
+            "INSERT INTO initiatives VALUES "
+            "(1, NULL, 'Aprovado', '2021-01-01 00:00:00.000000', NULL), "
+            "(2, NULL, 'Recusado', NULL, NULL), "
+            "(3, NULL, 'Active', '2019-01-01 00:00:00.000000', "
+            "'2999-01-01 00:00:00.000000'), "
+            "(11, 1, 'Active', '2020-03-01 00:00:00.000000', "
+            "'2020-12-31 00:00:00.000000'), "
+            "(12, 1, 'Active', '2022-03-01 00:00:00.000000', NULL), "
+            "(21, 2, 'Active', '2020-03-01 00:00:00.000000', "
+            "'2020-12-31 00:00:00.000000'), "
+            "(31, 3, 'Active', '2020-03-01 00:00:00.000000', "
+            "'2020-12-31 00:00:00.000000'), "
+            "(41, NULL, 'Active', NULL, NULL)"
+        )
+    )
+    session.execute(
+        text("INSERT INTO advisorships VALUES (11), (12), (21), (31), (41)")
+    )
+
+    loader = ProjectLoader.__new__(ProjectLoader)
+    loader.controller = MagicMock()
+    loader.controller._service._repository._session = session
+    loader.recalculate_all_parent_statuses()
+
+    rows = {
+        row.id: SimpleNamespace(**row._mapping)
+        for row in session.execute(
+            text("SELECT id, status, start_date, end_date FROM initiatives")
+        )
+    }
+    assert (rows[1].status, rows[1].start_date, rows[1].end_date) == (
+        "Concluded",
+        "2020-03-01 00:00:00.000000",
+        "2020-12-31 00:00:00.000000",
+    )
+    # Non date-derived statuses are kept; dates still widen.
+    assert (rows[2].status, rows[2].start_date) == (
+        "Recusado",
+        "2020-03-01 00:00:00.000000",
+    )
+    # Already covering its children: nothing to change.
+    assert (rows[3].status, rows[3].start_date, rows[3].end_date) == (
+        "Active",
+        "2019-01-01 00:00:00.000000",
+        "2999-01-01 00:00:00.000000",
+    )
+    loader.controller.update.assert_not_called()
+
+
+def test_project_shared_by_two_cvs_is_linked_for_the_second_researcher(monkeypatch):
+    from types import SimpleNamespace
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from eo_lib.domain.base import Base
+    from libbase.infrastructure.sql_repository import GenericSqlRepository
+    from src.core.logic import project_loader
+    from src.core.logic.strategies.lattes_projects import (
+        LattesProjectMappingStrategy,
+    )
+    from src.tracking.controllers import (
+        AttributeAssertionController,
+        EntityChangeLogController,
+        EntityMatchController,
+        IngestionRunController,
+        SourceRecordController,
+    )
+    from src.tracking.entities import (
+        AttributeAssertion,
+        EntityChangeLog,
+        EntityMatch,
+        IngestionRun,
+        SourceRecord,
+    )
+    from src.tracking.recorder import TrackingRecorder
+    from src.tracking.services import (
+        AttributeAssertionService,
+        EntityChangeLogService,
+        EntityMatchService,
+        IngestionRunService,
+        SourceRecordService,
+    )
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    recorder = TrackingRecorder()
+    recorder.ingestion_run_ctrl = IngestionRunController(
+        IngestionRunService(GenericSqlRepository(session, IngestionRun))
+    )
+    recorder.source_record_ctrl = SourceRecordController(
+        SourceRecordService(GenericSqlRepository(session, SourceRecord))
+    )
+    recorder.entity_match_ctrl = EntityMatchController(
+        EntityMatchService(GenericSqlRepository(session, EntityMatch))
+    )
+    recorder.attribute_assertion_ctrl = AttributeAssertionController(
+        AttributeAssertionService(GenericSqlRepository(session, AttributeAssertion))
+    )
+    recorder.entity_change_log_ctrl = EntityChangeLogController(
+        EntityChangeLogService(GenericSqlRepository(session, EntityChangeLog))
+    )
+    monkeypatch.setattr(project_loader, "tracking_recorder", recorder)
+
+    loader = ProjectLoader.__new__(ProjectLoader)
+    loader.controller = MagicMock()
+    loader.controller.get_by_id.return_value = None
+    loader.adv_controller = MagicMock()
+    loader.adv_controller.get_by_id.return_value = None
+    loader.linker = MagicMock()
+    loader.initiative_type = SimpleNamespace(id=1, name="Research Project")
+    loader.org_id = 1
+    handler = MagicMock()
+    handler.create_or_update.return_value = SimpleNamespace(
+        id=5, name="Projeto Comum", metadata={}
+    )
+    loader.handlers = {project_loader.Initiative: handler}
+
+    # The same project, with both researchers, in each one's CV.
+    row = {
+        "name": "Projeto Comum",
+        "start_year": "2020",
+        "raw_members": [
+            {"nome": "Ana Souza", "papel": "Coordenador"},
+            {"nome": "Bruno Lima", "papel": "Integrante"},
+        ],
+    }
+
+    def ingest(*owners):
+        stats = {"created": 0, "updated": 0, "skipped": 0, "unchanged": 0, "teams": 0}
+        with recorder.run_context(
+            source_system="lattes", flow_name="projects", buffered=False
+        ):
+            for owner in owners:
+                loader.mapping_strategy = LattesProjectMappingStrategy(owner)
+                loader._process_row(dict(row), {}, {}, stats)
+        return stats
+
+    assert ingest("Ana Souza")["teams"] == 1
+    # Bruno's CV arrives in a later run: his row is not skipped as unchanged.
+    assert ingest("Bruno Lima")["teams"] == 1
+    assert ingest("Ana Souza", "Bruno Lima")["unchanged"] == 2
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine, text
+
+from src.core.logic.reference_data_cache import (
+    CAMPUSES,
+    ORGANIZATIONS,
+    ROLES,
+    QueryCounter,
+    get_reference_data,
+    reference_data_scope,
+)
+
+
+def _controller(*entities):
+    controller = MagicMock()
+    controller.get_all.return_value = list(entities)
+    return controller
+
+
+def test_scope_loads_each_table_once_and_finds_by_normalized_name():
+    ifes = SimpleNamespace(id=1, name="Instituto Federal do Espírito Santo")
+    other = SimpleNamespace(id=2, name="Outra", short_name="IFES")
+    org_ctrl = _controller(ifes, other)
+    serra_a = {"id": 10, "name": "Serra", "organization_id": 2}
+    serra_b = {"id": 11, "name": "SERRA", "organization_id": 1}
+    campus_ctrl = _controller(serra_a, serra_b)
+
+    with reference_data_scope("test") as cache:
+        found = get_reference_data().find(
+            ORGANIZATIONS,
+            org_ctrl,
+            name=("IFES", "instituto federal do espirito santo"),
+            short_name="IFES",
+        )
+        assert found is ifes
+        assert get_reference_data().find(ORGANIZATIONS, org_ctrl, name="nope") is None
+        assert (
+            get_reference_data().find(
+                CAMPUSES,
+                campus_ctrl,
+                where=lambda c: c["organization_id"] == 1,
+                name="serra",
+            )
+            is serra_b
+        )
+        assert get_reference_data().get_by_id(CAMPUSES, campus_ctrl, 10) is serra_a
+
+    assert org_ctrl.get_all.call_count == 1
+    assert campus_ctrl.get_all.call_count == 1
+    assert cache.stats()[ORGANIZATIONS] == {
+        "loads": 1,
+        "cached_lookups": 1,
+        "added": 0,
+    }
+
+
+def test_added_rows_are_visible_to_later_lookups():
+    role_ctrl = _controller(SimpleNamespace(id=1, name="Líder"))
+
+    with reference_data_scope():
+        cache = get_reference_data()
+        assert cache.find(ROLES, role_ctrl, key=str.lower, name="Member") is None
+        created = SimpleNamespace(id=2, name="Member")
+        cache.add(ROLES, created)
+        assert cache.find(ROLES, role_ctrl, key=str.lower, name="member") is created
+        with reference_data_scope() as nested:
+            assert nested is cache
+
+    assert role_ctrl.get_all.call_count == 1
+
+
+def test_lookups_outside_a_scope_read_the_table_every_time():
+    role_ctrl = _controller(SimpleNamespace(id=1, name="Member"))
+
+    get_reference_data().find(ROLES, role_ctrl, name="Member")
+    get_reference_data().find(ROLES, role_ctrl, name="Member")
+
+    assert role_ctrl.get_all.call_count == 2
+
+
+def test_query_counter_counts_statements():
+    engine = create_engine("sqlite://")
+
+    with QueryCounter() as queries:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 3"))
+
+    assert queries.count == 2
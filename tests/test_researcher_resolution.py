@@ -0,0 +1,119 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.core.logic.pii_anonymizer import anonymize_email
+from src.core.logic.researcher_resolution import (
+    ResearcherResolutionIndex,
+    resolve_or_create_researcher,
+    resolve_researcher_by_name,
+    resolve_researcher_from_lattes,
+)
+
+
+def _researcher(id, name, **attrs):
+    defaults = {
+        "brand_id": None,
+        "identification_id": None,
+        "cnpq_url": None,
+        "resume": None,
+        "citation_names": None,
+        "emails": [],
+    }
+    defaults.update(attrs)
+    return SimpleNamespace(id=id, name=name, **defaults)
+
+
+def _session_with_linked_counts(rows):
+    session = MagicMock()
+    session.execute.return_value.fetchall.return_value = rows
+    return session
+
+
+def test_resolution_index_prefers_lattes_id_then_linked_data_with_one_query():
+    researchers = [
+        _researcher(1, "Ana Souza"),
+        _researcher(2, "Ána Souza"),
+        _researcher(3, "Bruno Lima", cnpq_url="http://lattes.cnpq.br/1234567890123456"),
+        _researcher(4, "Carla Dias"),
+    ]
+    session = _session_with_linked_counts([(2, 3), (4, 1)])
+    index = ResearcherResolutionIndex(researchers, session=session)
+
+    by_lattes_id = resolve_researcher_from_lattes(
+        index, lattes_id="1234567890123456", json_name="Outro Nome"
+    )
+    by_linked_data = resolve_researcher_from_lattes(
+        index, lattes_id="9999999999999999", json_name="ANA SOUZA"
+    )
+    missing = resolve_researcher_from_lattes(
+        index, lattes_id="8888888888888888", json_name="Desconhecido"
+    )
+
+    assert by_lattes_id.id == 3
+    assert by_linked_data.id == 2
+    assert missing is None
+    assert session.execute.call_count == 1
+
+
+def test_resolve_researcher_by_name_falls_back_to_anonymized_email():
+    stored = _researcher(
+        5,
+        "Maria Pereira",
+        emails=[SimpleNamespace(email=anonymize_email("maria@ifes.edu.br"))],
+    )
+    index = ResearcherResolutionIndex([stored])
+
+    assert (
+        resolve_researcher_by_name(
+            index, name="Maria P. da Silva", emails=["maria@ifes.edu.br"]
+        )
+        is stored
+    )
+    assert resolve_researcher_by_name(index, name="Maria P. da Silva") is None
+
+
+def test_resolve_or_create_researcher_registers_created_researcher_in_index(
+    monkeypatch,
+):
+    created = _researcher(9, "Novo Pesquisador")
+    create = MagicMock(return_value=created)
+    monkeypatch.setattr(
+        "src.core.logic.researcher_resolution.create_researcher_with_resume_fallback",
+        create,
+    )
+    index = ResearcherResolutionIndex([])
+
+    first = resolve_or_create_researcher(MagicMock(), index, name="Novo Pesquisador")
+    second = resolve_or_create_researcher(MagicMock(), index, name="novo pesquisador")
+
+    assert first is second is created
+    assert create.call_count == 1
+    assert list(index) == [created]
+
+
+def test_reindexed_researcher_resolves_by_its_new_cnpq_url_only_exactly():
+    researcher = _researcher(7, "Davi Rocha")
+    other = _researcher(
+        8, "Eva Melo", cnpq_url="http://lattes.cnpq.br/11112222333344445"
+    )
+    index = ResearcherResolutionIndex([researcher, other])
+
+    researcher.cnpq_url = "http://lattes.cnpq.br/5555666677778888"
+    researcher.name = "Davi R. Rocha"
+    index.reindex(researcher)
+
+    assert (
+        resolve_researcher_from_lattes(
+            index, lattes_id="5555666677778888", json_name="Outro Nome"
+        )
+        is researcher
+    )
+    assert resolve_researcher_by_name(index, name="Davi Rocha") is None
+    assert list(index) == [researcher, other]
+    # A Lattes id that is only a substring of a stored cnpq_url is no match.
+    assert (
+        resolve_researcher_from_lattes(
+            index, lattes_id="1111222233334444", json_name="Outro Nome"
+        )
+        is None
+    )
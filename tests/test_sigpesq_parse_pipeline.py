@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+from src.core.logic.sigpesq_parse_pipeline import (
+    order_by_year,
+    parse_sigpesq_workbooks,
+    sigpesq_workbook_year,
+)
+
+
+@pytest.fixture
+def workbooks(tmp_path):
+    paths = []
+    for year in (2018, 2016, 2017):
+        directory = tmp_path / "advisorships" / str(year)
+        directory.mkdir(parents=True)
+        path = directory / "Relatorio.xlsx"
+        pd.DataFrame(
+            {"Titulo": [f"Plano {year}", f"Plano {year} B"], "Sigla": [None, "X"]}
+        ).to_excel(path, index=False)
+        paths.append(str(path))
+    broken = tmp_path / "advisorships" / "2016" / "broken.xlsx"
+    broken.write_text("not a workbook")
+    paths.append(str(broken))
+    return paths
+
+
+def test_workbooks_are_yielded_in_year_order_with_blank_cells(workbooks):
+    ordered = order_by_year(workbooks)
+    assert [sigpesq_workbook_year(path) for path in ordered] == [
+        2016,
+        2016,
+        2017,
+        2018,
+    ]
+
+    sequential = list(parse_sigpesq_workbooks(ordered, max_workers=1))
+    parallel = list(parse_sigpesq_workbooks(ordered, max_workers=3))
+
+    assert parallel == sequential
+    assert [workbook.file_path for workbook in parallel] == ordered
+    assert parallel[1].error and parallel[1].records == []
+    assert parallel[0].records == [
+        {"Titulo": "Plano 2016", "Sigla": ""},
+        {"Titulo": "Plano 2016 B", "Sigla": "X"},
+    ]
+    assert sigpesq_workbook_year("data/raw/sigpesq/Relatorio.xlsx") is None
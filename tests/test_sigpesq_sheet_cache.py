@@ -0,0 +1,55 @@
+import os
+from unittest.mock import patch
+
+import pandas as pd
+
+from src.core.logic import sigpesq_sheet_cache
+from src.core.logic.sigpesq_sheet_cache import (
+    clear_sigpesq_sheet_cache,
+    read_sigpesq_excel,
+)
+
+
+def _workbook(path, titles):
+    pd.DataFrame(
+        {
+            "Titulo": titles,
+            "Ano": [2020 + i for i in range(len(titles))],
+            "Inicio": pd.to_datetime(["2020-03-01"] * len(titles)),
+            "Sigla": [None] * len(titles),
+        }
+    ).to_excel(path, index=False)
+
+
+def test_unchanged_workbook_is_read_from_the_parquet_cache(tmp_path):
+    workbook = str(tmp_path / "Relatorio.xlsx")
+    cache_dir = str(tmp_path / "cache")
+    _workbook(workbook, ["Projeto A", "Projeto B"])
+
+    parsed = read_sigpesq_excel(workbook, cache_dir=cache_dir, use_cache=True)
+    with patch.object(sigpesq_sheet_cache.pd, "read_excel") as read_excel:
+        cached = read_sigpesq_excel(workbook, cache_dir=cache_dir, use_cache=True)
+    read_excel.assert_not_called()
+    pd.testing.assert_frame_equal(cached, parsed)
+
+    # A changed workbook is a cache miss.
+    _workbook(workbook, ["Projeto C"])
+    changed = read_sigpesq_excel(workbook, cache_dir=cache_dir, use_cache=True)
+    assert changed["Titulo"].tolist() == ["Projeto C"]
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_clear_removes_one_workbook_stale_versions_or_everything(tmp_path):
+    first, second = str(tmp_path / "a.xlsx"), str(tmp_path / "b.xlsx")
+    cache_dir = str(tmp_path / "cache")
+    _workbook(first, ["Projeto A"])
+    _workbook(second, ["Projeto B"])
+    read_sigpesq_excel(first, cache_dir=cache_dir, use_cache=True)
+    read_sigpesq_excel(second, cache_dir=cache_dir, use_cache=True)
+    stale = os.path.join(cache_dir, "0123.0.v0.parquet")
+    open(stale, "wb").close()
+
+    assert clear_sigpesq_sheet_cache(cache_dir, stale_only=True) == 1
+    assert clear_sigpesq_sheet_cache(cache_dir, file_path=first) == 1
+    assert clear_sigpesq_sheet_cache(cache_dir) == 1
+    assert os.listdir(cache_dir) == []
@@ -0,0 +1,155 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.core.logic.team_membership_sync import TeamMembershipBatch
+from src.core.logic.unit_of_work import UnitOfWork
+
+
+def _session(team_member_entity):
+    engine = create_engine("sqlite://")
+    team_member_entity.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO team_members (id, team_id, person_id, role_id, start_date) "
+                "VALUES (1, 10, 100, 1, '2020-01-01 00:00:00.000000'), "
+                "(2, 10, 101, 1, NULL), (3, 10, 102, 2, NULL), "
+                "(4, 20, 200, 1, NULL)"
+            )
+        )
+    return engine, Session(engine)
+
+
+def _members(session, team_id):
+    return session.execute(
+        text(
+            "SELECT id, person_id, role_id, end_date FROM team_members "
+            "WHERE team_id = :t ORDER BY id"
+        ),
+        {"t": team_id},
+    ).fetchall()
+
+
+def test_replace_and_add_apply_net_delta_with_one_membership_query(
+    team_member_entity,
+):
+    engine, session = _session(team_member_entity)
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda _c, _cur, statement, *_a: statements.append(statement),
+    )
+    batch = TeamMembershipBatch(session)
+
+    # 100 kept (same start date), 101 changes role, 102 dropped, 103 new.
+    batch.replace(
+        10,
+        [(100, 1, datetime(2020, 1, 1)), (101, 2, None), (103, 1, None)],
+    )
+    batch.add(10, 103, 1, None)
+    batch.add(20, 201, 1, date(2021, 5, 1))
+
+    delta = batch.flush()
+    selects = [s for s in statements if s.lstrip().startswith("SELECT")]
+
+    assert len(selects) == 1
+    assert delta.counts() == {
+        "inserted": 2,
+        "role_changed": 1,
+        "end_dated": 0,
+        "removed": 1,
+    }
+    assert _members(session, 10) == [
+        (1, 100, 1, None),
+        (2, 101, 2, None),
+        (5, 103, 1, None),
+    ]
+    assert [row[1] for row in _members(session, 20)] == [200, 201]
+    assert len(batch) == 0
+
+
+def test_associate_inserts_new_people_and_end_dates_known_ones(team_member_entity):
+    _engine, session = _session(team_member_entity)
+    batch = TeamMembershipBatch(session)
+
+    batch.associate(10, 101, 1, end_date=date(2023, 12, 31), tag="egresso")
+    batch.associate(10, 104, 3, tag="novo")
+    # Second role for the same person is not a new association.
+    batch.associate(10, 104, 4, tag="lider")
+
+    delta = batch.flush()
+
+    assert [row.tag for row in delta.inserted] == ["novo"]
+    assert [(row.id, row.before_end_date, row.tag) for row in delta.end_dated] == [
+        (2, None, "egresso")
+    ]
+    assert _members(session, 10)[1][3].startswith("2023-12-31")
+    assert [row[1] for row in _members(session, 10)] == [100, 101, 102, 104]
+
+
+def test_rollback_to_drops_the_operations_of_a_failed_row(team_member_entity):
+    _engine, session = _session(team_member_entity)
+    batch = TeamMembershipBatch(session)
+
+    batch.add(20, 201, 1)
+    checkpoint = batch.checkpoint()
+    batch.add(20, 202, 1)
+    batch.associate(10, 105, 1)
+    batch.rollback_to(checkpoint)
+
+    delta = batch.flush()
+
+    assert [row.person_id for row in delta.inserted] == [201]
+    assert [row[1] for row in _members(session, 20)] == [200, 201]
+    assert [row[1] for row in _members(session, 10)] == [100, 101, 102]
+
+
+def test_failed_flush_raises_and_keeps_the_operations(team_member_entity):
+    _engine, session = _session(team_member_entity)
+    batch = TeamMembershipBatch(session)
+    batch.add(20, 201, 1)
+    session.execute(text("ALTER TABLE team_members RENAME TO moved_members"))
+    session.commit()
+
+    with pytest.raises(OperationalError):
+        batch.flush()
+    assert len(batch) == 1
+
+    session.execute(text("ALTER TABLE moved_members RENAME TO team_members"))
+    session.commit()
+    assert [row.person_id for row in batch.flush().inserted] == [201]
+
+
+def test_joined_batch_is_applied_with_each_unit_of_work_commit(team_member_entity):
+    _engine, session = _session(team_member_entity)
+    batch = TeamMembershipBatch(session)
+
+    with UnitOfWork([session], batch_size=1) as uow:
+        uow.join(batch)
+        with uow.row():
+            batch.add(20, 201, 1)
+        assert [row[1] for row in _members(session, 20)] == [200, 201]
+        with pytest.raises(ValueError):
+            with uow.row():
+                batch.add(20, 202, 1)
+                raise ValueError("boom")
+    assert len(batch) == 0
+    assert [row[1] for row in _members(session, 20)] == [200, 201]
+
+    # A failing membership write fails the batch commit instead of being
+    # dropped after the batch's rows were committed.
+    session.execute(text("CREATE TABLE items (name TEXT)"))
+    session.commit()
+    with pytest.raises(OperationalError):
+        with UnitOfWork([session], batch_size=1) as uow:
+            uow.join(batch)
+            with uow.row():
+                session.execute(text("INSERT INTO items VALUES ('a')"))
+                batch.add(20, 203, 1)
+                session.execute(text("DROP TABLE team_members"))
+    assert session.execute(text("SELECT COUNT(*) FROM items")).scalar() == 0
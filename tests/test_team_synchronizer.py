@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock
 
+from src.core.logic.reference_data_cache import reference_data_scope
 from src.core.logic.team_synchronizer import TeamSynchronizer
 
 
@@ -18,3 +19,37 @@ def test_ensure_team_matches_canonical_name():
 
     assert team.id == 1
     team_controller.create_team.assert_not_called()
+
+
+def test_ensure_team_finds_a_team_created_after_the_teams_were_cached():
+    team_controller = MagicMock()
+    team_controller.get_all.side_effect = [[], [MockTeam(7, "Conecta FAPES")]]
+    synchronizer = TeamSynchronizer(team_controller, roles_cache={})
+
+    with reference_data_scope("teams"):
+        team = synchronizer.ensure_team("Conecta FAPES", "desc")
+        assert synchronizer.ensure_team("Conecta FAPES", "desc") is team
+
+    assert team.id == 7
+    assert team_controller.get_all.call_count == 2
+    team_controller.create_team.assert_not_called()
+
+
+def test_batch_stages_members_and_applies_them_on_exit(team_member_entity):
+    team_controller = MagicMock()
+    session = team_controller._service._repository._session
+    session.execute.return_value = iter([(1, 5, 100, 1, None, None)])
+    role = MagicMock(id=1)
+    synchronizer = TeamSynchronizer(team_controller, roles_cache={"Researcher": role})
+    person = MagicMock(id=101)
+
+    with synchronizer.batch():
+        synchronizer.synchronize_members(5, [(person, "Researcher", None)])
+        team_controller.get_members.assert_not_called()
+
+    team_controller.add_member.assert_not_called()
+    statements = [str(c.args[0]) for c in session.execute.call_args_list]
+    assert statements[0].startswith("SELECT")
+    assert any(s.startswith("INSERT INTO team_members") for s in statements)
+    assert any(s.startswith("DELETE FROM team_members") for s in statements)
+    session.commit.assert_called_once()
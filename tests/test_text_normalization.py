@@ -0,0 +1,40 @@
+from src.core.logic import text_normalization
+from src.core.logic.text_normalization import (
+    fold_to_ascii,
+    match_key,
+    normalize_ascii_lower,
+    normalize_group_name,
+    normalize_person_name,
+    normalize_title,
+    strip_accents,
+)
+
+
+def test_accent_folding_matches_unicodedata_forms():
+    assert strip_accents("Conceição Ñandú") == "Conceicao Nandu"
+    assert strip_accents("plain ascii") == "plain ascii"
+    assert fold_to_ascii("ﬁm ² Ação") == "fim 2 Acao"
+    assert fold_to_ascii("ﬁm ² Ação", "NFD") == "m  Acao"
+
+
+def test_name_and_title_keys():
+    assert normalize_person_name("José da Silva-Júnior") == "JOSE DA SILVA JUNIOR"
+    assert normalize_person_name(None) == ""
+    assert normalize_title("  Análise: Redes (5G)! ") == "analise redes 5g"
+    assert match_key("  João   PEDRO ") == "joao pedro"
+    assert normalize_ascii_lower(" Revista   Brasileira de Informática ") == (
+        "revista brasileira de informatica"
+    )
+    assert normalize_group_name(" Núcleo de Estudos ") == "NUCLEO DE ESTUDOS"
+
+
+def test_cache_stats_report_hits_and_misses():
+    text_normalization.clear_caches()
+
+    for _ in range(3):
+        normalize_title("Estudo sobre Ação")
+
+    stats = text_normalization.cache_stats()["normalize_title"]
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["hit_rate"] == round(2 / 3, 4)
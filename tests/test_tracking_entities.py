@@ -1,7 +1,7 @@
 from datetime import date, datetime
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from eo_lib.domain.base import Base
@@ -146,7 +146,10 @@ def test_tracking_recorder_serializes_temporal_json_values():
             canonical_entity_id=1,
             operation="update",
             changed_fields=["observed_at", "end_date"],
-            before={"observed_at": observed_at, "end_date": datetime(2026, 3, 29, 0, 0)},
+            before={
+                "observed_at": observed_at,
+                "end_date": datetime(2026, 3, 29, 0, 0),
+            },
             after={"observed_at": observed_at, "end_date": ended_on},
             reason="Normalize temporal fields",
         )
@@ -189,3 +192,354 @@ def test_tracking_recorder_finalizes_failed_run_after_session_error():
     persisted_run = session.query(IngestionRun).one()
     assert persisted_run.status == "failed"
     assert "not JSON serializable" in persisted_run.notes
+
+
+def test_buffered_recorder_bulk_writes_rows_with_per_row_semantics():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    recorder = _build_tracking_recorder(session)
+    inserts = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_inserts(_conn, _cursor, statement, _params, _context, executemany):
+        if statement.startswith("INSERT"):
+            inserts.append(statement.split()[2])
+
+    with recorder.run_context(source_system="lattes", flow_name="first"):
+        old = recorder.record_source_record(
+            source_entity_type="article", payload={"t": "A"}, source_record_id="a"
+        )
+    inserts.clear()
+
+    with recorder.run_context(
+        source_system="lattes", flow_name="second", buffered=True, flush_threshold=8
+    ) as run:
+        records = [
+            recorder.record_source_record(
+                source_entity_type="article",
+                payload={"t": title},
+                source_record_id=title.lower(),
+            )
+            for title in ("B", "C", "A")
+        ]
+        again = recorder.record_source_record(
+            source_entity_type="article", payload={"t": "B"}, source_record_id="b"
+        )
+        assert again is records[0]
+        assert records[0].id < 0
+
+        for record in records:
+            for _ in range(2):
+                recorder.record_entity_match(
+                    source_record_id=record.id,
+                    canonical_entity_type="article",
+                    canonical_entity_id=7,
+                    match_strategy="doi",
+                )
+        # The threshold flushed the source records: handles now hold real ids.
+        assert records[0].id > old.id
+        recorder.record_attribute_assertions(
+            source_record_id=records[1].id,
+            canonical_entity_type="article",
+            canonical_entity_id=7,
+            selected_attributes={"title": "C", "year": 2024},
+            selection_reason="lattes",
+        )
+        for record in records:
+            recorder.record_change(
+                source_record_id=record.id,
+                canonical_entity_type="article",
+                canonical_entity_id=7,
+                operation="update",
+                changed_fields=["title"],
+            )
+
+    # A record of an earlier run resolves to that record, which the
+    # run's match is attached to.
+    assert records[2].id == old.id
+    assert [
+        r.source_record_id
+        for r in session.query(SourceRecord).order_by(SourceRecord.id)
+    ] == ["a", "b", "c"]
+    assert {m.source_record_id for m in session.query(EntityMatch)} == {
+        records[0].id,
+        records[1].id,
+        old.id,
+    }
+    assert session.query(EntityMatch).count() == 3
+    assert session.query(AttributeAssertion).count() == 2
+    assert [
+        c.source_record_id
+        for c in session.query(EntityChangeLog).order_by(EntityChangeLog.id)
+    ] == [records[0].id, records[1].id, old.id]
+    assert session.get(IngestionRun, run.id).status == "success"
+    # One INSERT per table and flush, instead of one per row; rows that
+    # already exist are skipped by ON CONFLICT DO NOTHING.
+    assert inserts.count("source_records") == 1
+    assert inserts.count("entity_matches") == 2
+    assert inserts.count("attribute_assertions") == 1
+    assert inserts.count("entity_change_logs") == 1
+
+
+def test_recorder_skips_existing_rows_without_integrity_errors():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    recorder = _build_tracking_recorder(session)
+    rollbacks = []
+    event.listen(engine, "rollback", lambda _conn: rollbacks.append(1))
+
+    def ingest(flow_name):
+        with recorder.run_context(
+            source_system="lattes", flow_name=flow_name, buffered=False
+        ):
+            record = recorder.record_source_record(
+                source_entity_type="article", payload={"t": "A"}, source_record_id="a"
+            )
+            repeated = recorder.record_source_record(
+                source_entity_type="article", payload={"t": "A"}, source_record_id="a"
+            )
+            assert getattr(repeated, "id", None) == getattr(record, "id", None)
+            for _ in range(2):
+                recorder.record_entity_match(
+                    source_record_id=getattr(record, "id", None),
+                    canonical_entity_type="article",
+                    canonical_entity_id=7,
+                    match_strategy="doi",
+                )
+                recorder.record_attribute_assertions(
+                    source_record_id=getattr(record, "id", None),
+                    canonical_entity_type="article",
+                    canonical_entity_id=7,
+                    selected_attributes={"title": "A"},
+                    selection_reason="lattes",
+                )
+            return record
+
+    first = ingest("first")
+    # Unchanged re-ingestion: the record of the first run is returned.
+    assert ingest("second").id == first.id
+    assert session.query(SourceRecord).count() == 1
+    assert session.query(EntityMatch).count() == 1
+    assert session.query(AttributeAssertion).count() == 1
+    assert rollbacks == []
+
+
+def test_change_gate_skips_payloads_applied_unchanged_in_earlier_runs():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    recorder = _build_tracking_recorder(session)
+
+    def ingest(payloads):
+        decisions = {}
+        with recorder.run_context(source_system="lattes", flow_name="ingest") as run:
+            for key, payload, applied in payloads:
+                decisions[key] = recorder.is_unchanged(
+                    source_entity_type="lattes_cv",
+                    source_record_id=key,
+                    payload=payload,
+                )
+                if decisions[key]:
+                    continue
+                record = recorder.record_source_record(
+                    source_entity_type="lattes_cv",
+                    payload=payload,
+                    source_record_id=key,
+                    store_payload=False,
+                )
+                if applied:
+                    recorder.record_entity_match(
+                        source_record_id=record.id,
+                        canonical_entity_type="researcher",
+                        canonical_entity_id=1,
+                        match_strategy="lattes_id_exact",
+                    )
+        return decisions, session.get(IngestionRun, run.id)
+
+    decisions, _run = ingest(
+        [("1", {"v": 1}, True), ("2", {"v": 1}, True), ("3", {"v": 1}, False)]
+    )
+    assert decisions == {"1": False, "2": False, "3": False}
+    assert (
+        session.query(SourceRecord)
+        .filter_by(source_record_id="1")
+        .one()
+        .raw_payload_json
+        is None
+    )
+
+    decisions, run = ingest(
+        [
+            ("1", {"v": 1}, True),
+            ("2", {"v": 2}, True),
+            ("3", {"v": 1}, True),
+            ("4", {"v": 1}, True),
+        ]
+    )
+    # "3" was recorded but never applied (no match), so it is processed again.
+    assert decisions == {"1": True, "2": False, "3": False, "4": False}
+    assert run.notes == "cdc lattes_cv: 1 unchanged, 2 changed, 1 new"
+
+    # "3" kept its payload: the match was attached to the stored record.
+    decisions, _run = ingest([("3", {"v": 1}, True)])
+    assert decisions == {"3": True}
+
+    with recorder.run_context(source_system="lattes", flow_name="forced", cdc=False):
+        assert not recorder.is_unchanged(
+            source_entity_type="lattes_cv", source_record_id="1", payload={"v": 1}
+        )
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_rows_recorded_in_a_unit_of_work_commit_with_its_batches(tmp_path, buffered):
+    from sqlalchemy import text
+
+    from src.core.logic.unit_of_work import UnitOfWork
+
+    # A file database: the unit of work keeps a write transaction open on
+    # its connection, which locks every other connection out.
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'etl.db'}", connect_args={"timeout": 0.1}
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    domain_session = Session()
+    domain_session.execute(text("CREATE TABLE items (name TEXT PRIMARY KEY)"))
+    domain_session.commit()
+    recorder = _build_tracking_recorder(Session())
+
+    # The run's buffer reaches its threshold mid-batch, but waits for the
+    # batch commits.
+    with recorder.run_context(
+        source_system="lattes",
+        flow_name="ingest",
+        buffered=buffered,
+        flush_threshold=2,
+    ):
+        with UnitOfWork([domain_session], batch_size=2) as uow:
+            for name in ("a", "falha", "b"):
+                try:
+                    with uow.row():
+                        domain_session.execute(
+                            text("INSERT INTO items VALUES (:name)"), {"name": name}
+                        )
+                        record = recorder.record_source_record(
+                            source_entity_type="item",
+                            payload={"name": name},
+                            source_record_id=name,
+                        )
+                        recorder.record_entity_match(
+                            source_record_id=record.id,
+                            canonical_entity_type="item",
+                            canonical_entity_id=1,
+                            match_strategy="name",
+                        )
+                        if name == "falha":
+                            raise ValueError("boom")
+                        domain_session.commit()
+                except ValueError:
+                    pass
+
+    with Session() as session:
+        assert session.scalars(text("SELECT name FROM items ORDER BY name")).all() == [
+            "a",
+            "b",
+        ]
+        # The failed row's tracking rows were dropped with its canonical rows.
+        assert sorted(r.source_record_id for r in session.query(SourceRecord)) == [
+            "a",
+            "b",
+        ]
+        assert session.query(EntityMatch).count() == 2
+
+
+def test_failed_flush_keeps_the_rows_pending():
+    from src.tracking.buffer import TrackingBuffer
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    buffer = TrackingBuffer(session, ingestion_run_id=1, flush_threshold=100)
+    record = buffer.add_source_record(
+        {
+            "ingestion_run_id": 1,
+            "source_system": "lattes",
+            "source_entity_type": "article",
+            "source_record_id": "a",
+            "source_file": None,
+            "source_path": None,
+            "raw_payload_json": None,
+            "payload_hash": "hash-a",
+        }
+    )
+    buffer.add_entity_match(
+        {
+            "source_record_id": record.id,
+            "canonical_entity_type": "article",
+            "canonical_entity_id": 7,
+            "match_strategy": "doi",
+            "match_confidence": None,
+        }
+    )
+
+    def _failing_commit():
+        raise RuntimeError("disk full")
+
+    session.commit = _failing_commit
+    with pytest.raises(RuntimeError, match="disk full"):
+        buffer.flush()
+    assert buffer.pending() == 2
+    assert record.id < 0
+    assert buffer.stats["source_records"] == 0
+
+    del session.commit
+    buffer.flush()
+    assert buffer.pending() == 0
+    assert record.id == session.query(SourceRecord).one().id
+    assert session.query(EntityMatch).one().source_record_id == record.id
+    assert buffer.stats["source_records"] == buffer.stats["entity_matches"] == 1
+
+
+def test_change_gate_ignores_matches_to_missing_canonical_entities():
+    from sqlalchemy import text
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.execute(text("CREATE TABLE researchers (id INTEGER PRIMARY KEY)"))
+    session.execute(text("INSERT INTO researchers VALUES (1)"))
+    session.commit()
+    recorder = _build_tracking_recorder(session)
+
+    def ingest():
+        decisions = {}
+        with recorder.run_context(source_system="lattes", flow_name="ingest"):
+            for key, researcher_id in (("1", 1), ("2", 2)):
+                decisions[key] = recorder.is_unchanged(
+                    source_entity_type="lattes_cv",
+                    source_record_id=key,
+                    payload={"v": 1},
+                )
+                if decisions[key]:
+                    continue
+                record = recorder.record_source_record(
+                    source_entity_type="lattes_cv",
+                    payload={"v": 1},
+                    source_record_id=key,
+                )
+                # Researcher 2 was rolled back after its match was written.
+                recorder.record_entity_match(
+                    source_record_id=record.id,
+                    canonical_entity_type="researcher",
+                    canonical_entity_id=researcher_id,
+                    match_strategy="lattes_id_exact",
+                )
+        return decisions
+
+    assert ingest() == {"1": False, "2": False}
+    assert ingest() == {"1": True, "2": False}
@@ -0,0 +1,56 @@
+import hashlib
+import json
+from datetime import date, datetime
+
+import pytest
+
+from src.tracking.fingerprint import FAST_HASH_PREFIX, stable_hash
+
+
+def _legacy_hash(value):
+    def default(nested):
+        return nested.isoformat() if hasattr(nested, "isoformat") else str(nested)
+
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+VALUES = [
+    "Fulano de Tal",
+    "Ação e reação",
+    1,
+    1.0,
+    True,
+    None,
+    date(2026, 3, 29),
+    ["b", "a", {"z": 1, "a": [1, 2]}],
+    {
+        "nome": "Pesquisadora",
+        "atualizado_em": datetime(2026, 3, 29, 12, 34, 56),
+        "artigos": [{"titulo": "Título", "ano": 2024, "doi": None}],
+        "tags": ("x", "y"),
+    },
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_compat_mode_keeps_stored_hashes(value):
+    assert stable_hash(value, mode="compat") == _legacy_hash(value)
+    # Memoized scalars give the same answer on the second call.
+    assert stable_hash(value, mode="compat") == _legacy_hash(value)
+
+
+def test_fast_mode_is_canonical_and_distinct_from_compat():
+    first = {"b": [1, 2], "a": {"y": "ç", "x": date(2026, 1, 1)}}
+    reordered = {"a": {"x": date(2026, 1, 1), "y": "ç"}, "b": [1, 2]}
+
+    assert stable_hash(first, mode="fast") == stable_hash(reordered, mode="fast")
+    assert stable_hash(first, mode="fast").startswith(FAST_HASH_PREFIX)
+    assert stable_hash(first, mode="fast") != stable_hash({"b": [2, 1]}, mode="fast")
+    assert stable_hash(1, mode="fast") != stable_hash(True, mode="fast")
+    assert stable_hash(2**70, mode="fast").startswith(FAST_HASH_PREFIX)
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        stable_hash({"a": 1}, mode="md5")
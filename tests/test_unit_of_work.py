@@ -0,0 +1,116 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, declarative_base
+
+from src.core.logic.unit_of_work import UnitOfWork
+
+Base = declarative_base()
+
+
+class _Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+
+
+class _Controller:
+    """Writes and commits immediately, like the domain controllers."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def create(self, name):
+        try:
+            self.session.add(_Item(name=name))
+            self.session.commit()
+        except IntegrityError:
+            self.session.rollback()
+            raise
+
+
+def _setup():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    commits = []
+    event.listen(engine, "commit", lambda _conn: commits.append(1))
+    return engine, Session(engine), commits
+
+
+def _names(engine):
+    with Session(engine) as session:
+        return sorted(session.scalars(select(_Item.name)))
+
+
+def test_batches_commits_and_isolates_failing_rows():
+    engine, session, commits = _setup()
+    controller = _Controller(session)
+
+    with UnitOfWork([session, session], batch_size=2) as uow:
+        for names in (["a", "a2"], ["b", "a"], ["c"], ["d"], ["e"]):
+            try:
+                with uow.row():
+                    for name in names:
+                        controller.create(name)
+            except IntegrityError:
+                pass
+
+    # Row ["b", "a"] also loses "b", committed by the controller before the
+    # failure: the row is rolled back to its start.
+    assert _names(engine) == ["a", "a2", "c", "d", "e"]
+    assert uow.rows == 5
+    assert uow.failed_rows == 1
+    assert len(commits) == 3
+    assert "commit" not in vars(session)
+
+
+def test_exception_outside_rows_discards_uncommitted_work():
+    engine, session, _commits = _setup()
+    controller = _Controller(session)
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork([session], batch_size=10) as uow:
+            with uow.row():
+                controller.create("lost")
+            raise RuntimeError("boom")
+
+    assert _names(engine) == []
+
+
+class _Participant:
+    def __init__(self):
+        self.rows = []
+
+    def checkpoint(self):
+        return len(self.rows)
+
+    def rollback_to(self, checkpoint):
+        del self.rows[checkpoint:]
+
+    def before_commit(self, session):
+        pass
+
+
+def test_failing_row_reverts_sessions_and_participants_to_the_row_start():
+    engine, session, _commits = _setup()
+    controller = _Controller(session)
+    participant = _Participant()
+
+    with UnitOfWork([session], batch_size=10) as uow:
+        uow.join(participant)
+        with uow.row():
+            controller.create("kept")
+            participant.rows.append("kept")
+        with pytest.raises(IntegrityError):
+            with uow.row():
+                controller.create("first")
+                participant.rows.append("first")
+                session.add(_Item(name="kept"))
+                session.flush()
+        with uow.row():
+            controller.create("last")
+            participant.rows.append("last")
+
+    assert _names(engine) == ["kept", "last"]
+    assert participant.rows == ["kept", "last"]